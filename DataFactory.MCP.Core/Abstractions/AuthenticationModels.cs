@@ -83,16 +83,22 @@ public class AuthenticationResult
     /// </summary>
     public Models.McpAuthenticationResult? AuthenticationDetails { get; set; }
 
+    /// <summary>
+    /// Acquires a fresh token for the same account without user interaction, when the provider can
+    /// </summary>
+    public Func<Task<Models.McpAuthenticationResult?>>? Renewal { get; set; }
+
     /// <summary>
     /// Creates a successful authentication result
     /// </summary>
-    public static AuthenticationResult Success(string message, Models.McpAuthenticationResult authDetails)
+    public static AuthenticationResult Success(string message, Models.McpAuthenticationResult authDetails, Func<Task<Models.McpAuthenticationResult?>>? renewal = null)
     {
         return new AuthenticationResult
         {
             IsSuccess = true,
             Message = message,
-            AuthenticationDetails = authDetails
+            AuthenticationDetails = authDetails,
+            Renewal = renewal
         };
     }
 
@@ -113,6 +113,36 @@ public abstract class FabricServiceBase
         return await response.ReadAsBytesAsync();
     }
 
+    /// <summary>
+    /// Posts a request and returns the response once its headers arrive, so the body can be streamed.
+    /// The caller owns (and must dispose) the returned response.
+    /// </summary>
+    protected async Task<HttpResponseMessage> PostForStreamAsync(string endpoint, object request, CancellationToken cancellationToken = default)
+    {
+        var url = FabricUrlBuilder.ForFabricApi()
+            .WithLiteralPath(endpoint)
+            .Build();
+        Logger.LogInformation("Posting to: {Url}", url);
+
+        var jsonContent = SerializeRequest(request);
+        var httpRequest = new HttpRequestMessage(HttpMethod.Post, url)
+        {
+            Content = new StringContent(jsonContent, Encoding.UTF8, "application/json")
+        };
+
+        var response = await HttpClient.SendAsync(httpRequest, HttpCompletionOption.ResponseHeadersRead, cancellationToken);
+        try
+        {
+            await response.EnsureSuccessOrThrowAsync();
+            return response;
+        }
+        catch
+        {
+            response.Dispose();
+            throw;
+        }
+    }
+
     /// <summary>
     /// Posts a request expecting a 202 Accepted response with a Location header.
     /// Returns the Location header value for tracking the async operation.
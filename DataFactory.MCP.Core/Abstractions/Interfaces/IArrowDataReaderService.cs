@@ -13,4 +13,13 @@ public interface IArrowDataReaderService
     /// <param name="arrowData">The Apache Arrow binary data</param>
     /// <returns>Query result summary for dataflow responses</returns>
     Task<QueryResultSummary> ReadArrowStreamAsync(byte[] arrowData);
+
+    /// <summary>
+    /// Reads an Apache Arrow stream batch by batch, keeping only the first rows plus per-column statistics
+    /// </summary>
+    /// <param name="arrowStream">The Apache Arrow IPC stream (typically the HTTP response body)</param>
+    /// <param name="maxSampleRows">Maximum number of rows to keep in the sample</param>
+    /// <param name="cancellationToken">Cancellation token</param>
+    /// <returns>Query result summary with row sample and column statistics</returns>
+    Task<QueryResultSummary> SummarizeArrowStreamAsync(Stream arrowStream, int maxSampleRows, CancellationToken cancellationToken = default);
 }
\ No newline at end of file
@@ -16,7 +16,8 @@ public interface IAuthenticationStateManager
     /// Sets the current authentication state
     /// </summary>
     /// <param name="result">The authentication result to store</param>
-    void SetAuthentication(McpAuthenticationResult result);
+    /// <param name="renewal">Optional callback that renews the token without the user (client credentials, or silent MSAL refresh); without one the token is served until it expires</param>
+    void SetAuthentication(McpAuthenticationResult result, Func<Task<McpAuthenticationResult?>>? renewal = null);
 
     /// <summary>
     /// Clears the current authentication state
@@ -16,6 +16,11 @@ public interface IBackgroundJob
     /// </summary>
     string JobType { get; }
 
+    /// <summary>
+    /// Identifier of the item the job runs on (e.g., the dataflow ID).
+    /// </summary>
+    string ItemId { get; }
+
     /// <summary>
     /// User-friendly display name for notifications.
     /// </summary>
@@ -42,6 +42,21 @@ public interface IFabricDataflowService
         string dataflowId,
         ExecuteDataflowQueryRequest request);
 
+    /// <summary>
+    /// Executes a query against a dataflow and streams the Arrow result into a bounded summary:
+    /// the first rows plus per-column statistics. The raw result is not retained.
+    /// </summary>
+    /// <param name="workspaceId">The workspace ID containing the dataflow</param>
+    /// <param name="dataflowId">The dataflow ID to execute the query against</param>
+    /// <param name="request">The execute query request containing the M query</param>
+    /// <param name="maxSampleRows">Maximum number of rows to keep in the summary</param>
+    /// <returns>The query execution summary (Data is null)</returns>
+    Task<ExecuteDataflowQueryResponse> ExecuteQuerySummaryAsync(
+        string workspaceId,
+        string dataflowId,
+        ExecuteDataflowQueryRequest request,
+        int maxSampleRows);
+
     /// <summary>
     /// Gets the raw definition of a dataflow from the API
     /// </summary>
@@ -1,14 +1,18 @@
+using ModelContextProtocol;
+
 namespace DataFactory.MCP.Abstractions.Interfaces;
 
 /// <summary>
 /// A queue for organizing and spacing out notifications.
-/// Prevents notification overlap when multiple background tasks complete close together.
+/// Prevents notification overlap when multiple background tasks complete close together:
+/// notifications that arrive together are delivered as one batch, coalesced per session.
 /// </summary>
 public interface INotificationQueue
 {
     /// <summary>
     /// Enqueues a notification to be shown.
-    /// Notifications are processed in order with a delay between them.
+    /// Notifications are processed in order, in batches, with a delay between batches where the
+    /// notification service needs one.
     /// </summary>
     /// <param name="notification">The notification to enqueue</param>
     void Enqueue(QueuedNotification notification);
@@ -43,4 +47,10 @@ public record QueuedNotification
     /// When the notification was queued (for ordering and timeout).
     /// </summary>
     public DateTime QueuedAt { get; init; } = DateTime.UtcNow;
+
+    /// <summary>
+    /// The MCP session the notification is for (the session that started the job).
+    /// Null when the notification isn't tied to a session.
+    /// </summary>
+    public McpSession? Session { get; init; }
 }
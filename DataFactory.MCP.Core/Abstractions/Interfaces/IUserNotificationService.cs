@@ -13,6 +13,12 @@ public interface IUserNotificationService
     /// <param name="message">The notification message</param>
     /// <param name="level">The notification level (Info, Success, Warning, Error)</param>
     Task NotifyAsync(string title, string message, NotificationLevel level = NotificationLevel.Info);
+
+    /// <summary>
+    /// Minimum delay between consecutive notifications so they don't overlap
+    /// (e.g. OS toasts). Zero, the default, when notifications can be delivered back to back.
+    /// </summary>
+    TimeSpan NotificationSpacing => TimeSpan.Zero;
 }
 
 /// <summary>
@@ -0,0 +1,96 @@
+using Microsoft.Extensions.Logging;
+
+namespace DataFactory.MCP.Configuration;
+
+/// <summary>
+/// Benchmark mode for the load and latency tools in evals/perf. Off unless DATAFACTORY_MCP_BENCHMARK_MODE is set
+/// to 1 or true. When on, FABRIC_API_BASE_URL and POWERBI_API_BASE_URL replace the public Fabric and Power BI base URLs
+/// and the stand-in authentication in <c>AddFabricStandinAuthentication</c> may be registered.
+/// Both URLs must point at a loopback address, so bearer tokens never leave the machine.
+/// </summary>
+public static class BenchmarkMode
+{
+    /// <summary>
+    /// Environment variable that turns benchmark mode on
+    /// </summary>
+    public const string EnabledVariable = "DATAFACTORY_MCP_BENCHMARK_MODE";
+
+    /// <summary>
+    /// Environment variable that replaces <see cref="ApiVersions.Fabric.V1BaseUrl"/> in benchmark mode
+    /// </summary>
+    public const string FabricBaseUrlVariable = "FABRIC_API_BASE_URL";
+
+    /// <summary>
+    /// Environment variable that replaces <see cref="ApiVersions.PowerBi.V2BaseUrl"/> in benchmark mode
+    /// </summary>
+    public const string PowerBiBaseUrlVariable = "POWERBI_API_BASE_URL";
+
+    private static readonly Settings Current = ReadSettings();
+
+    /// <summary>
+    /// True when benchmark mode was requested and both base URLs point at a loopback stand-in
+    /// </summary>
+    public static bool Enabled => Current.Enabled;
+
+    /// <summary>
+    /// Fabric API base URL: the stand-in in benchmark mode, otherwise <see cref="ApiVersions.Fabric.V1BaseUrl"/>
+    /// </summary>
+    public static string FabricBaseUrl => Current.FabricBaseUrl;
+
+    /// <summary>
+    /// Power BI API base URL: the stand-in in benchmark mode, otherwise <see cref="ApiVersions.PowerBi.V2BaseUrl"/>
+    /// </summary>
+    public static string PowerBiBaseUrl => Current.PowerBiBaseUrl;
+
+    /// <summary>
+    /// Logs a warning while benchmark mode is on, or an error when it was requested but refused.
+    /// </summary>
+    /// <param name="logger">Startup logger</param>
+    public static void LogStatus(ILogger logger)
+    {
+        if (Current.Enabled)
+        {
+            logger.LogWarning(
+                "BENCHMARK MODE ({Variable}): Fabric requests go to {FabricBaseUrl} and {PowerBiBaseUrl}, not the public APIs. Never enable this in production.",
+                EnabledVariable, Current.FabricBaseUrl, Current.PowerBiBaseUrl);
+        }
+        else if (Current.Problem != null)
+        {
+            logger.LogError("Benchmark mode refused: {Problem}", Current.Problem);
+        }
+    }
+
+    private static Settings ReadSettings()
+    {
+        var requested = Environment.GetEnvironmentVariable(EnabledVariable)?.Trim();
+        var publicEndpoints = new Settings(false, ApiVersions.Fabric.V1BaseUrl, ApiVersions.PowerBi.V2BaseUrl, null);
+        if (requested != "1" && !string.Equals(requested, "true", StringComparison.OrdinalIgnoreCase))
+        {
+            return publicEndpoints;
+        }
+
+        var fabric = ReadLoopbackUrl(FabricBaseUrlVariable);
+        var powerBi = ReadLoopbackUrl(PowerBiBaseUrlVariable);
+        if (fabric == null || powerBi == null)
+        {
+            return publicEndpoints with
+            {
+                Problem = $"{EnabledVariable} is set, but {FabricBaseUrlVariable} and {PowerBiBaseUrlVariable} must both be loopback URLs. Using the public APIs without stand-in authentication."
+            };
+        }
+
+        return new Settings(true, fabric, powerBi, null);
+    }
+
+    private static string? ReadLoopbackUrl(string variable)
+    {
+        var value = Environment.GetEnvironmentVariable(variable)?.Trim().TrimEnd('/');
+        return Uri.TryCreate(value, UriKind.Absolute, out var uri)
+               && (uri.Scheme == Uri.UriSchemeHttp || uri.Scheme == Uri.UriSchemeHttps)
+               && uri.IsLoopback
+            ? value
+            : null;
+    }
+
+    private sealed record Settings(bool Enabled, string FabricBaseUrl, string PowerBiBaseUrl, string? Problem);
+}
@@ -19,4 +19,11 @@ public static class FeatureFlags
     /// </summary>
     public const string InteractiveAuth = "interactive-auth";
 
+    /// <summary>
+    /// Feature flag for compact tool responses (see McpResponseFormat)
+    /// Command line: --compact-responses
+    /// Disabled by default for both stdio and HTTP
+    /// </summary>
+    public const string CompactResponses = "compact-responses";
+
 }
\ No newline at end of file
@@ -47,6 +47,16 @@ public static class JsonSerializerOptionsProvider
         PropertyNamingPolicy = JsonNamingPolicy.CamelCase
     };
 
+    /// <summary>
+    /// Options for MCP tool responses in compact mode (<see cref="McpResponseFormat.Compact"/>).
+    /// Uses camelCase naming, no indentation, and omits null properties.
+    /// </summary>
+    public static JsonSerializerOptions McpCompactResponse { get; } = new()
+    {
+        PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
+        DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull
+    };
+
     /// <summary>
     /// Options for pretty-printing JSON (indented output only).
     /// Useful for logging or debugging purposes.
@@ -0,0 +1,75 @@
+using System.Text.Json;
+using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.Logging;
+
+namespace DataFactory.MCP.Configuration;
+
+/// <summary>
+/// Shape of MCP tool responses. Tool output is fed straight back into the model's context,
+/// so compact mode trims it: no indentation or null properties, no derived or echoed metadata,
+/// and abbreviated descriptions in list items. Lists are never truncated.
+/// Registered as a singleton (see ServiceCollectionExtensions.AddMcpResponseFormat) and injected into the tools.
+/// Measured by evals/perf/tool_footprint.py.
+/// </summary>
+public sealed class McpResponseFormat
+{
+    /// <summary>
+    /// Descriptions in list items longer than this are abbreviated in compact mode
+    /// </summary>
+    public const int MaxDescriptionLength = 120;
+
+    /// <summary>
+    /// The default format: indented responses with all metadata
+    /// </summary>
+    public static McpResponseFormat Default { get; } = new(compact: false);
+
+    /// <summary>
+    /// Creates a response format.
+    /// </summary>
+    /// <param name="compact">True to use the compact shape</param>
+    public McpResponseFormat(bool compact)
+    {
+        Compact = compact;
+    }
+
+    /// <summary>
+    /// True when tool responses use the compact shape
+    /// </summary>
+    public bool Compact { get; }
+
+    /// <summary>
+    /// Serializer options for tool responses in this format
+    /// </summary>
+    public JsonSerializerOptions SerializerOptions => Compact
+        ? JsonSerializerOptionsProvider.McpCompactResponse
+        : JsonSerializerOptionsProvider.McpResponse;
+
+    /// <summary>
+    /// Reads the compact-responses feature flag (configuration or --compact-responses).
+    /// </summary>
+    /// <param name="configuration">The application configuration containing feature flag values</param>
+    /// <param name="args">Command line arguments to check for the feature flag</param>
+    /// <param name="logger">Logger for outputting the selected response format</param>
+    /// <returns>The configured response format</returns>
+    public static McpResponseFormat FromConfiguration(IConfiguration configuration, string[] args, ILogger logger)
+    {
+        var compact = configuration.GetValue<bool>(FeatureFlags.CompactResponses) ||
+                      args.Contains($"--{FeatureFlags.CompactResponses}");
+
+        logger.LogInformation("Feature flag '{FeatureFlag}' is {Status}", FeatureFlags.CompactResponses, compact ? "ENABLED" : "DISABLED");
+
+        return compact ? new McpResponseFormat(compact: true) : Default;
+    }
+
+    /// <summary>
+    /// Returns null in compact mode, so the property is left out of the response.
+    /// Use for metadata the model can derive or already has (echoed arguments, continuation URIs).
+    /// </summary>
+    public object? Verbose(object? value) => Compact ? null : value;
+
+    /// <summary>
+    /// Abbreviates long descriptions in compact mode. Use for list items only; single items keep their full description.
+    /// </summary>
+    public string? Abbreviate(string? text) =>
+        Compact && text is { Length: > MaxDescriptionLength } ? text[..MaxDescriptionLength] + "…" : text;
+}
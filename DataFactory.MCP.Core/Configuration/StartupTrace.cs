@@ -0,0 +1,35 @@
+using System.Diagnostics;
+using Microsoft.Extensions.Logging;
+
+namespace DataFactory.MCP.Configuration;
+
+/// <summary>
+/// Startup phase timings for evals/perf/bench_startup.py. Off unless MCP_STARTUP_TRACE is set.
+/// Each mark logs the milliseconds since the process started, so runtime startup before Main is included.
+/// </summary>
+public static class StartupTrace
+{
+    /// <summary>
+    /// Environment variable that turns the phase marks on
+    /// </summary>
+    public const string EnabledVariable = "MCP_STARTUP_TRACE";
+
+    private static readonly bool Enabled = !string.IsNullOrWhiteSpace(Environment.GetEnvironmentVariable(EnabledVariable));
+
+    /// <summary>
+    /// Logs that a startup phase finished ("Startup phase {Phase} at {ElapsedMs} ms").
+    /// </summary>
+    /// <param name="phase">Short phase name (e.g. "services", "host-built")</param>
+    /// <param name="logger">Startup logger</param>
+    public static void Mark(string phase, ILogger logger)
+    {
+        if (!Enabled)
+        {
+            return;
+        }
+
+        using var process = Process.GetCurrentProcess();
+        var elapsed = DateTime.Now - process.StartTime;
+        logger.LogInformation("Startup phase {Phase} at {ElapsedMs:F1} ms", phase, elapsed.TotalMilliseconds);
+    }
+}
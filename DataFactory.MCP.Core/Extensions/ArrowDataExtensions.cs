@@ -13,6 +13,9 @@ public static class ArrowDataExtensions
         var columns = data?.Keys.ToList() ?? new List<string>();
         var rowCount = data?.Values.FirstOrDefault()?.Count ?? 0;
 
+        if (response.Summary?.ColumnStatistics is { } statistics)
+            return CreateSampledReport(response, data, columns, rowCount, statistics);
+
         return new
         {
             table = new
@@ -39,6 +42,50 @@ public static class ArrowDataExtensions
         };
     }
 
+    /// <summary>
+    /// Report for a streamed (summarized) result: the first rows plus statistics over every row.
+    /// </summary>
+    private static object CreateSampledReport(
+        ExecuteDataflowQueryResponse response,
+        Dictionary<string, List<object>>? data,
+        List<string> columns,
+        int rowCount,
+        Dictionary<string, ColumnStatistics> statistics)
+    {
+        var totalRowCount = response.Summary!.EstimatedRowCount;
+
+        return new
+        {
+            table = new
+            {
+                format = "Table",
+                rowCount = rowCount,
+                totalRowCount = totalRowCount,
+                sampled = response.Summary.IsSampled,
+                columnCount = columns.Count,
+                summary = response.Summary.IsSampled
+                    ? $"First {rowCount} of {totalRowCount} rows × {columns.Count} columns"
+                    : $"{rowCount} rows × {columns.Count} columns",
+                columns = columns.Select(col => new
+                {
+                    name = col,
+                    dataType = statistics.GetValueOrDefault(col)?.DataType
+                        ?? InferDataType(data?.GetValueOrDefault(col) ?? new List<object>())
+                }).ToArray(),
+                rows = CreateRows(data, columns, rowCount),
+                columnStatistics = statistics
+            },
+            executionSummary = new
+            {
+                success = response.Success,
+                contentType = response.ContentType,
+                contentLength = response.ContentLength,
+                dataSize = FormatBytes(response.ContentLength),
+                executionMetadata = response.Metadata
+            }
+        };
+    }
+
     private static object[] CreateRows(Dictionary<string, List<object>>? data, List<string> columns, int rowCount)
     {
         if (data == null || rowCount == 0) return Array.Empty<object>();
@@ -1,3 +1,4 @@
+using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Models.Capacity;
 
 namespace DataFactory.MCP.Extensions;
@@ -12,19 +13,20 @@ public static class CapacityExtensions
     /// Provides consistent output format and human-readable information.
     /// </summary>
     /// <param name="capacity">The capacity object to format</param>
+    /// <param name="format">The tool response format</param>
     /// <returns>Formatted object ready for JSON serialization</returns>
-    public static object ToFormattedInfo(this Capacity capacity)
+    public static object ToFormattedInfo(this Capacity capacity, McpResponseFormat format)
     {
         return new
         {
             Id = capacity.Id,
             DisplayName = capacity.DisplayName,
             Sku = capacity.Sku,
-            SkuDescription = GetSkuDescription(capacity.Sku),
+            SkuDescription = format.Verbose(GetSkuDescription(capacity.Sku)),
             Region = capacity.Region,
             State = capacity.State.ToString(),
-            Status = GetStatusDescription(capacity.State),
-            IsActive = capacity.State == CapacityState.Active
+            Status = format.Verbose(GetStatusDescription(capacity.State)),
+            IsActive = format.Verbose(capacity.State == CapacityState.Active)
         };
     }
 
@@ -32,8 +34,9 @@ public static class CapacityExtensions
     /// Formats a list of capacities for MCP API responses with summary information.
     /// </summary>
     /// <param name="capacities">The list of capacities to format</param>
+    /// <param name="format">The tool response format</param>
     /// <returns>Formatted response with capacities and summary</returns>
-    public static object ToFormattedList(this IEnumerable<Capacity> capacities)
+    public static object ToFormattedList(this IEnumerable<Capacity> capacities, McpResponseFormat format)
     {
         var capacityList = capacities.ToList();
 
@@ -43,15 +46,15 @@ public static class CapacityExtensions
 
         return new
         {
-            Capacities = capacityList.Select(c => c.ToFormattedInfo()),
+            Capacities = capacityList.Select(c => c.ToFormattedInfo(format)),
             Summary = new
             {
-                TotalCount = capacityList.Count,
+                TotalCount = format.Verbose(capacityList.Count),
                 ByState = groupedByState,
                 BySku = groupedBySku,
                 ByRegion = groupedByRegion,
-                ActiveCount = capacityList.Count(c => c.State == CapacityState.Active),
-                InactiveCount = capacityList.Count(c => c.State == CapacityState.Inactive)
+                ActiveCount = format.Verbose(capacityList.Count(c => c.State == CapacityState.Active)),
+                InactiveCount = format.Verbose(capacityList.Count(c => c.State == CapacityState.Inactive))
             }
         };
     }
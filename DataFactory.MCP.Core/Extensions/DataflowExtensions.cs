@@ -1,3 +1,4 @@
+using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Models.Dataflow;
 using DataFactory.MCP.Models.Dataflow.Definition;
 
@@ -14,13 +15,24 @@ public static class DataflowExtensions
     /// </summary>
     /// <param name="dataflow">The dataflow object to format</param>
     /// <returns>Formatted object ready for JSON serialization</returns>
-    public static object ToFormattedInfo(this Dataflow dataflow)
+    public static object ToFormattedInfo(this Dataflow dataflow) => dataflow.ToFormattedInfo(dataflow.Description);
+
+    /// <summary>
+    /// Formats a Dataflow object as an item of a list response, abbreviating its description in compact mode.
+    /// </summary>
+    /// <param name="dataflow">The dataflow object to format</param>
+    /// <param name="format">The tool response format</param>
+    /// <returns>Formatted object ready for JSON serialization</returns>
+    public static object ToFormattedListItem(this Dataflow dataflow, McpResponseFormat format) =>
+        dataflow.ToFormattedInfo(format.Abbreviate(dataflow.Description));
+
+    private static object ToFormattedInfo(this Dataflow dataflow, string? description)
     {
         var formattedInfo = new
         {
             Id = dataflow.Id,
             DisplayName = dataflow.DisplayName,
-            Description = dataflow.Description,
+            Description = description,
             Type = dataflow.Type,
             WorkspaceId = dataflow.WorkspaceId,
             FolderId = dataflow.FolderId,
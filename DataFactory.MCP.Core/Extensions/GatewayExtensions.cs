@@ -1,3 +1,4 @@
+using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Models.Gateway;
 
 namespace DataFactory.MCP.Extensions;
@@ -13,8 +14,9 @@ public static class GatewayExtensions
     /// and handles different gateway types appropriately.
     /// </summary>
     /// <param name="gateway">The gateway object to format</param>
+    /// <param name="format">The tool response format</param>
     /// <returns>Formatted object ready for JSON serialization</returns>
-    public static object ToFormattedInfo(this Gateway gateway)
+    public static object ToFormattedInfo(this Gateway gateway, McpResponseFormat format)
     {
         var baseInfo = new
         {
@@ -34,28 +36,28 @@ public static class GatewayExtensions
                 LoadBalancing = onPrem.LoadBalancingSetting,
                 AllowCloudRefresh = onPrem.AllowCloudConnectionRefresh,
                 AllowCustomConnectors = onPrem.AllowCustomConnectors,
-                PublicKey = new
+                PublicKey = format.Verbose(new
                 {
                     Exponent = onPrem.PublicKey.Exponent,
                     // Truncate sensitive cryptographic data for security
                     Modulus = onPrem.PublicKey.Modulus.Length > 20
                         ? onPrem.PublicKey.Modulus[..20] + "..."
                         : onPrem.PublicKey.Modulus
-                }
+                })
             },
             OnPremisesGatewayPersonal personal => new
             {
                 baseInfo.Id,
                 baseInfo.Type,
                 Version = personal.Version,
-                PublicKey = new
+                PublicKey = format.Verbose(new
                 {
                     Exponent = personal.PublicKey.Exponent,
                     // Truncate sensitive cryptographic data for security
                     Modulus = personal.PublicKey.Modulus.Length > 20
                         ? personal.PublicKey.Modulus[..20] + "..."
                         : personal.PublicKey.Modulus
-                }
+                })
             },
             VirtualNetworkGateway vnet => new
             {
@@ -10,14 +10,15 @@ namespace DataFactory.MCP.Extensions;
 public static class JsonExtensions
 {
     /// <summary>
-    /// Serializes an object to JSON using consistent MCP formatting.
+    /// Serializes an object to JSON using consistent MCP formatting in the given response format.
     /// Uses reflection-based serialization to support anonymous types and dynamic MCP responses.
     /// </summary>
     /// <param name="obj">The object to serialize</param>
+    /// <param name="format">The tool response format</param>
     /// <returns>The JSON string representation</returns>
     [RequiresUnreferencedCode("MCP response serialization may use reflection for formatting")]
-    public static string ToMcpJson(this object obj)
+    public static string ToMcpJson(this object obj, McpResponseFormat format)
     {
-        return JsonSerializer.Serialize(obj, JsonSerializerOptionsProvider.McpResponse);
+        return JsonSerializer.Serialize(obj, format.SerializerOptions);
     }
 }
\ No newline at end of file
@@ -1,3 +1,4 @@
+using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Models.Pipeline;
 
 namespace DataFactory.MCP.Extensions;
@@ -10,13 +11,21 @@ public static class PipelineExtensions
     /// <summary>
     /// Formats a Pipeline object for MCP API responses.
     /// </summary>
-    public static object ToFormattedInfo(this Pipeline pipeline)
+    public static object ToFormattedInfo(this Pipeline pipeline) => pipeline.ToFormattedInfo(pipeline.Description);
+
+    /// <summary>
+    /// Formats a Pipeline object as an item of a list response, abbreviating its description in compact mode.
+    /// </summary>
+    public static object ToFormattedListItem(this Pipeline pipeline, McpResponseFormat format) =>
+        pipeline.ToFormattedInfo(format.Abbreviate(pipeline.Description));
+
+    private static object ToFormattedInfo(this Pipeline pipeline, string? description)
     {
         return new
         {
             Id = pipeline.Id,
             DisplayName = pipeline.DisplayName,
-            Description = pipeline.Description,
+            Description = description,
             Type = pipeline.Type,
             WorkspaceId = pipeline.WorkspaceId,
             FolderId = pipeline.FolderId
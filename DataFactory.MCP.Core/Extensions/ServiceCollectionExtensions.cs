@@ -41,20 +41,24 @@ public static class ServiceCollectionExtensions
         // Register named HttpClients with authentication handlers
         services.AddHttpClient(HttpClientNames.FabricApi, client =>
         {
-            client.BaseAddress = new Uri(ApiVersions.Fabric.V1BaseUrl + "/");
+            client.BaseAddress = new Uri(BenchmarkMode.FabricBaseUrl + "/");
             client.Timeout = TimeSpan.FromSeconds(30);
         }).AddHttpMessageHandler<FabricAuthenticationHandler>();
 
         services.AddHttpClient(HttpClientNames.PowerBiV2Api, client =>
         {
-            client.BaseAddress = new Uri(ApiVersions.PowerBi.V2BaseUrl + "/");
+            client.BaseAddress = new Uri(BenchmarkMode.PowerBiBaseUrl + "/");
             client.Timeout = TimeSpan.FromSeconds(30);
         }).AddHttpMessageHandler<FabricAuthenticationHandler>();
 
         // Register core services
         services.AddSingleton<IValidationService, ValidationService>();
 
+        // Tool response format (indented by default; hosts opt into compact responses with AddMcpResponseFormat)
+        services.TryAddSingleton(McpResponseFormat.Default);
+
         // Authentication system with providers (needed for standalone mode)
+        services.TryAddSingleton<AccessTokenCache>();
         services.AddSingleton<IAuthenticationStateManager, AuthenticationStateManager>();
         services.AddSingleton<IAuthenticationProvider, InteractiveAuthenticationProvider>();
         services.AddSingleton<IAuthenticationProvider, DeviceCodeAuthenticationProvider>();
@@ -68,7 +72,7 @@ public static class ServiceCollectionExtensions
             if (credential != null)
             {
                 var logger = sp.GetRequiredService<ILogger<TokenCredentialAuthenticationService>>();
-                return new TokenCredentialAuthenticationService(credential, logger);
+                return new TokenCredentialAuthenticationService(credential, logger, sp.GetRequiredService<AccessTokenCache>());
             }
             return ActivatorUtilities.CreateInstance<AuthenticationService>(sp);
         });
@@ -79,6 +83,8 @@ public static class ServiceCollectionExtensions
             .AddSingleton<IGatewayClusterDatasourceService, GatewayClusterDatasourceService>()
             .AddSingleton<IDataTransformationService, DataTransformationService>()
             .AddSingleton<IDataflowDefinitionProcessor, DataflowDefinitionProcessor>()
+            // Read-mostly lookups (workspaces, capacities, gateways, connection types) shared by the services below
+            .AddSingleton<FabricMetadataCache>()
             .AddSingleton<IFabricGatewayService, FabricGatewayService>()
             .AddSingleton<IFabricConnectionService, FabricConnectionService>()
             .AddSingleton<IFabricWorkspaceService, FabricWorkspaceService>()
@@ -107,6 +113,78 @@ public static class ServiceCollectionExtensions
         return services;
     }
 
+    /// <summary>
+    /// Selects the tool response format from the compact-responses feature flag (configuration or --compact-responses).
+    /// Call after <see cref="AddDataFactoryMcpServices"/>.
+    /// </summary>
+    /// <param name="services">The service collection to register services with</param>
+    /// <param name="configuration">The application configuration containing feature flag values</param>
+    /// <param name="args">Command line arguments to check for the feature flag</param>
+    /// <param name="logger">Logger for outputting the selected response format</param>
+    /// <returns>The service collection for fluent chaining</returns>
+    public static IServiceCollection AddMcpResponseFormat(
+        this IServiceCollection services,
+        IConfiguration configuration,
+        string[] args,
+        ILogger logger)
+    {
+        services.Replace(ServiceDescriptor.Singleton(McpResponseFormat.FromConfiguration(configuration, args, logger)));
+        return services;
+    }
+
+    /// <summary>
+    /// Load testing in <see cref="BenchmarkMode"/>, against a local stand-in (evals/perf/fabric_standin.py):
+    /// FABRIC_STANDIN_TOKEN supplies a fixed bearer token so sessions skip sign-in, or FABRIC_STANDIN_TOKEN_URL
+    /// points at a local token endpoint (evals/perf/identity_standin.py) to exercise token acquisition.
+    /// FABRIC_STANDIN_TOKEN_CACHE=off bypasses the access token cache and FABRIC_METADATA_CACHE=off the Fabric
+    /// metadata cache, to measure their effect.
+    /// Does nothing unless benchmark mode is enabled, so no stand-in token is ever sent to the public APIs.
+    /// Call after <see cref="AddDataFactoryMcpServices"/>, and only from hosts that check <see cref="BenchmarkMode.Enabled"/>.
+    /// </summary>
+    /// <param name="services">The service collection to register services with</param>
+    /// <param name="logger">Logger for outputting which stand-in authentication is used</param>
+    /// <returns>The service collection for fluent chaining</returns>
+    public static IServiceCollection AddFabricStandinAuthentication(this IServiceCollection services, ILogger logger)
+    {
+        if (!BenchmarkMode.Enabled)
+        {
+            return services;
+        }
+
+        var standinToken = Environment.GetEnvironmentVariable("FABRIC_STANDIN_TOKEN");
+        var standinTokenUrl = Environment.GetEnvironmentVariable("FABRIC_STANDIN_TOKEN_URL");
+        if (!string.IsNullOrWhiteSpace(standinTokenUrl))
+        {
+            logger.LogWarning("Using token endpoint {TokenUrl} against {BaseUrl} - for local load testing only", standinTokenUrl, BenchmarkMode.FabricBaseUrl);
+            services.AddSingleton<TokenCredential>(new StandinTokenCredential(
+                new Uri(standinTokenUrl),
+                Environment.GetEnvironmentVariable("FABRIC_STANDIN_CLIENT_ID") ?? "standin-client",
+                Environment.GetEnvironmentVariable("FABRIC_STANDIN_CLIENT_SECRET") ?? "standin-secret"));
+        }
+        else if (!string.IsNullOrWhiteSpace(standinToken))
+        {
+            logger.LogWarning("Using FABRIC_STANDIN_TOKEN against {BaseUrl} - for local load testing only", BenchmarkMode.FabricBaseUrl);
+            services.AddSingleton<TokenCredential>(DelegatedTokenCredential.Create(
+                (_, _) => new AccessToken(standinToken, DateTimeOffset.UtcNow.AddHours(1))));
+        }
+
+        if (string.Equals(Environment.GetEnvironmentVariable("FABRIC_STANDIN_TOKEN_CACHE"), "off", StringComparison.OrdinalIgnoreCase))
+        {
+            logger.LogWarning("Access token cache disabled - every request acquires a token");
+            services.Replace(ServiceDescriptor.Singleton(sp =>
+                AccessTokenCache.CreateDisabled(sp.GetRequiredService<ILogger<AccessTokenCache>>())));
+        }
+
+        if (string.Equals(Environment.GetEnvironmentVariable("FABRIC_METADATA_CACHE"), "off", StringComparison.OrdinalIgnoreCase))
+        {
+            logger.LogWarning("Fabric metadata cache disabled - every lookup goes upstream");
+            services.Replace(ServiceDescriptor.Singleton(sp => FabricMetadataCache.CreateDisabled(
+                sp.GetRequiredService<IAuthenticationService>(), sp.GetRequiredService<ILogger<FabricMetadataCache>>())));
+        }
+
+        return services;
+    }
+
     /// <summary>
     /// Registers all core DataFactory MCP tools with the MCP server builder
     /// </summary>
@@ -1,3 +1,4 @@
+using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Models.Workspace;
 
 namespace DataFactory.MCP.Extensions;
@@ -13,13 +14,24 @@ public static class WorkspaceExtensions
     /// </summary>
     /// <param name="workspace">The workspace object to format</param>
     /// <returns>Formatted object ready for JSON serialization</returns>
-    public static object ToFormattedInfo(this Workspace workspace)
+    public static object ToFormattedInfo(this Workspace workspace) => workspace.ToFormattedInfo(workspace.Description);
+
+    /// <summary>
+    /// Formats a Workspace object as an item of a list response, abbreviating its description in compact mode.
+    /// </summary>
+    /// <param name="workspace">The workspace object to format</param>
+    /// <param name="format">The tool response format</param>
+    /// <returns>Formatted object ready for JSON serialization</returns>
+    public static object ToFormattedListItem(this Workspace workspace, McpResponseFormat format) =>
+        workspace.ToFormattedInfo(format.Abbreviate(workspace.Description));
+
+    private static object ToFormattedInfo(this Workspace workspace, string? description)
     {
         var formattedInfo = new
         {
             Id = workspace.Id,
             DisplayName = workspace.DisplayName,
-            Description = workspace.Description,
+            Description = description,
             Type = workspace.Type.ToString(),
             CapacityId = workspace.CapacityId,
             DomainId = workspace.DomainId,
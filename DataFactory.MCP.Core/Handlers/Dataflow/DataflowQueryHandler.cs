@@ -16,7 +16,8 @@ public class DataflowQueryHandler(IFabricDataflowService dataflowService)
         string workspaceId,
         string dataflowId,
         string queryName,
-        string customMashupDocument)
+        string customMashupDocument,
+        int? maxRows = null)
     {
         if (string.IsNullOrWhiteSpace(workspaceId))
             return ToolResult<ExecuteQueryResult>.Failure(Messages.InvalidParameterEmpty("workspaceId"), "validation");
@@ -26,6 +27,8 @@ public class DataflowQueryHandler(IFabricDataflowService dataflowService)
             return ToolResult<ExecuteQueryResult>.Failure(Messages.InvalidParameterEmpty("queryName"), "validation");
         if (string.IsNullOrWhiteSpace(customMashupDocument))
             return ToolResult<ExecuteQueryResult>.Failure(Messages.InvalidParameterEmpty("customMashupDocument"), "validation");
+        if (maxRows is <= 0)
+            return ToolResult<ExecuteQueryResult>.Failure("maxRows must be greater than 0 when specified", "validation");
 
         try
         {
@@ -38,7 +41,10 @@ public class DataflowQueryHandler(IFabricDataflowService dataflowService)
                 CustomMashupDocument = wrappedQuery
             };
 
-            var response = await dataflowService.ExecuteQueryAsync(workspaceId, dataflowId, request);
+            // With maxRows the result is streamed into a bounded summary instead of buffered in full
+            var response = maxRows is { } sampleRows
+                ? await dataflowService.ExecuteQuerySummaryAsync(workspaceId, dataflowId, request, sampleRows)
+                : await dataflowService.ExecuteQueryAsync(workspaceId, dataflowId, request);
 
             if (!response.Success)
             {
@@ -22,14 +22,14 @@ public class FabricUrlBuilder
     }
 
     /// <summary>
-    /// Creates a URL builder using the default Fabric API base URL
+    /// Creates a URL builder using the default Fabric API base URL (a local stand-in in <see cref="BenchmarkMode"/>)
     /// </summary>
-    public static FabricUrlBuilder ForFabricApi() => new(ApiVersions.Fabric.V1BaseUrl);
+    public static FabricUrlBuilder ForFabricApi() => new(BenchmarkMode.FabricBaseUrl);
 
     /// <summary>
     /// Creates a URL builder using the Power BI API v2 base URL
     /// </summary>
-    public static FabricUrlBuilder ForPowerBiV2Api() => new(ApiVersions.PowerBi.V2BaseUrl);
+    public static FabricUrlBuilder ForPowerBiV2Api() => new(BenchmarkMode.PowerBiBaseUrl);
 
     /// <summary>
     /// Appends path segments to the URL. Segments are automatically URL-encoded.
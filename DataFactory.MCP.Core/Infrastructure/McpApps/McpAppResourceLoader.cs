@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using System.Reflection;
 using System.Text;
 using System.Text.RegularExpressions;
@@ -7,12 +8,17 @@ namespace DataFactory.MCP.Infrastructure.McpApps;
 /// <summary>
 /// Utility for loading and bundling MCP Apps UI resources.
 /// Combines separate HTML, CSS, and JS files into a single inline HTML document.
+/// Each resource is read and bundled on its first request and served from memory afterwards,
+/// so nothing is loaded at startup and repeated resource reads don't re-read the assembly.
 /// </summary>
 public static partial class McpAppResourceLoader
 {
     private static readonly Assembly ResourceAssembly = typeof(McpAppResourceLoader).Assembly;
     private const string ResourceBasePath = "DataFactory.MCP.Core.Resources.McpApps";
 
+    // PublicationOnly: a failed load (resource not built) isn't cached, the next request retries
+    private static readonly ConcurrentDictionary<string, Lazy<string>> Loaded = new();
+
     /// <summary>
     /// Loads a pre-bundled MCP App UI resource from the monorepo dist folder.
     /// The monorepo builds all apps into McpApps/dist/{appName}.html
@@ -23,10 +29,13 @@ public static partial class McpAppResourceLoader
     {
         // Load from monorepo dist folder: McpApps/dist/{appName}.html
         var resourceName = $"{ResourceBasePath}.dist.{appName}.html";
-        using var stream = ResourceAssembly.GetManifestResourceStream(resourceName)
-            ?? throw new InvalidOperationException($"MCP App resource not found: {resourceName}. Run 'npm run build' in the McpApps folder.");
-        using var reader = new StreamReader(stream);
-        return reader.ReadToEnd();
+        return LoadOnce(resourceName, () =>
+        {
+            using var stream = ResourceAssembly.GetManifestResourceStream(resourceName)
+                ?? throw new InvalidOperationException($"MCP App resource not found: {resourceName}. Run 'npm run build' in the McpApps folder.");
+            using var reader = new StreamReader(stream);
+            return reader.ReadToEnd();
+        });
     }
 
     /// <summary>
@@ -40,10 +49,13 @@ public static partial class McpAppResourceLoader
     {
         // Load from dist subfolder (Vite output)
         var resourceName = $"{ResourceBasePath}.{resourceFolder}.dist.{baseName}.html";
-        using var stream = ResourceAssembly.GetManifestResourceStream(resourceName)
-            ?? throw new InvalidOperationException($"Pre-bundled resource not found: {resourceName}. Run 'npm run build' in the {resourceFolder} folder.");
-        using var reader = new StreamReader(stream);
-        return reader.ReadToEnd();
+        return LoadOnce(resourceName, () =>
+        {
+            using var stream = ResourceAssembly.GetManifestResourceStream(resourceName)
+                ?? throw new InvalidOperationException($"Pre-bundled resource not found: {resourceName}. Run 'npm run build' in the {resourceFolder} folder.");
+            using var reader = new StreamReader(stream);
+            return reader.ReadToEnd();
+        });
     }
 
     /// <summary>
@@ -54,13 +66,22 @@ public static partial class McpAppResourceLoader
     /// <returns>Complete HTML with inlined CSS and JS</returns>
     public static string LoadAndBundle(string resourceFolder, string baseName)
     {
-        var html = LoadResource(resourceFolder, $"{baseName}.html");
-        var css = LoadResourceOrDefault(resourceFolder, $"{baseName}.css");
-        var js = LoadResourceOrDefault(resourceFolder, $"{baseName}.js");
+        return LoadOnce($"{ResourceBasePath}.{resourceFolder}.{baseName}.bundle", () =>
+        {
+            var html = LoadResource(resourceFolder, $"{baseName}.html");
+            var css = LoadResourceOrDefault(resourceFolder, $"{baseName}.css");
+            var js = LoadResourceOrDefault(resourceFolder, $"{baseName}.js");
 
-        return BundleHtml(html, css, js);
+            return BundleHtml(html, css, js);
+        });
     }
 
+    /// <summary>
+    /// Returns the cached content for a key, loading it on the first request.
+    /// </summary>
+    private static string LoadOnce(string key, Func<string> load) =>
+        Loaded.GetOrAdd(key, _ => new Lazy<string>(load, LazyThreadSafetyMode.PublicationOnly)).Value;
+
     /// <summary>
     /// Loads a resource file content.
     /// </summary>
@@ -0,0 +1,51 @@
+using System.Text.Json.Serialization;
+
+namespace DataFactory.MCP.Models.Dataflow.Query;
+
+/// <summary>
+/// Per-column statistics computed over every row of a streamed query result
+/// </summary>
+public class ColumnStatistics
+{
+    /// <summary>
+    /// Arrow data type name (e.g., "int64", "utf8", "timestamp")
+    /// </summary>
+    [JsonPropertyName("dataType")]
+    public string DataType { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Number of null values
+    /// </summary>
+    [JsonPropertyName("nullCount")]
+    public long NullCount { get; set; }
+
+    /// <summary>
+    /// Smallest value (numeric, temporal or ordinal string comparison), formatted as text
+    /// </summary>
+    [JsonPropertyName("min")]
+    public string? Min { get; set; }
+
+    /// <summary>
+    /// Largest value (numeric, temporal or ordinal string comparison), formatted as text
+    /// </summary>
+    [JsonPropertyName("max")]
+    public string? Max { get; set; }
+
+    /// <summary>
+    /// Mean of non-null values for numeric columns (share of true values for boolean columns)
+    /// </summary>
+    [JsonPropertyName("mean")]
+    public double? Mean { get; set; }
+
+    /// <summary>
+    /// Shortest string length for text columns
+    /// </summary>
+    [JsonPropertyName("minLength")]
+    public int? MinLength { get; set; }
+
+    /// <summary>
+    /// Longest string length for text columns
+    /// </summary>
+    [JsonPropertyName("maxLength")]
+    public int? MaxLength { get; set; }
+}
@@ -42,4 +42,22 @@ public class QueryResultSummary
     /// </summary>
     [JsonPropertyName("arrowParsingError")]
     public string? ArrowParsingError { get; set; }
+
+    /// <summary>
+    /// True when only the first rows were kept (streaming summary mode)
+    /// </summary>
+    [JsonPropertyName("isSampled")]
+    public bool IsSampled { get; set; }
+
+    /// <summary>
+    /// Number of rows kept in the sample (streaming summary mode)
+    /// </summary>
+    [JsonPropertyName("sampleRowCount")]
+    public int? SampleRowCount { get; set; }
+
+    /// <summary>
+    /// Per-column statistics over all rows (streaming summary mode)
+    /// </summary>
+    [JsonPropertyName("columnStatistics")]
+    public Dictionary<string, ColumnStatistics>? ColumnStatistics { get; set; }
 }
\ No newline at end of file
@@ -1,3 +1,5 @@
+using System.Globalization;
+using System.Numerics;
 using Apache.Arrow;
 using Apache.Arrow.Ipc;
 using DataFactory.MCP.Abstractions.Interfaces;
@@ -87,6 +89,102 @@ public class ArrowDataReaderService : IArrowDataReaderService
         }
     }
 
+    /// <summary>
+    /// Reads an Apache Arrow stream batch by batch, keeping only the first rows and per-column statistics.
+    /// Memory is bounded by the sample size and one record batch, regardless of the result size.
+    /// Malformed Arrow data is reported in the summary; I/O and transport errors while reading propagate,
+    /// since the statistics would only cover part of the result.
+    /// </summary>
+    public async Task<QueryResultSummary> SummarizeArrowStreamAsync(
+        Stream arrowStream,
+        int maxSampleRows,
+        CancellationToken cancellationToken = default)
+    {
+        try
+        {
+            using var reader = new ArrowStreamReader(arrowStream, leaveOpen: true);
+
+            List<string>? columns = null;
+            Dictionary<string, List<object>>? sample = null;
+            ColumnAccumulator[] accumulators = [];
+            var totalRows = 0;
+            var batchCount = 0;
+            var sampledRows = 0;
+
+            while (await reader.ReadNextRecordBatchAsync(cancellationToken) is { } batch)
+            {
+                using (batch)
+                {
+                    if (columns == null)
+                    {
+                        columns = batch.Schema.FieldsList.Select(f => f.Name).ToList();
+                        sample = columns.ToDictionary(c => c, _ => new List<object>());
+                        accumulators = batch.Schema.FieldsList.Select(f => new ColumnAccumulator(f.DataType.Name)).ToArray();
+                    }
+
+                    batchCount++;
+                    totalRows += batch.Length;
+                    var take = Math.Min(batch.Length, maxSampleRows - sampledRows);
+
+                    for (int colIndex = 0; colIndex < Math.Min(batch.ColumnCount, columns.Count); colIndex++)
+                    {
+                        var column = batch.Column(colIndex);
+                        accumulators[colIndex].Add(column);
+
+                        var values = sample![columns[colIndex]];
+                        for (int rowIndex = 0; rowIndex < take; rowIndex++)
+                        {
+                            try
+                            {
+                                values.Add(ExtractValueFromArray(column, rowIndex) ?? "");
+                            }
+                            catch
+                            {
+                                values.Add("");
+                            }
+                        }
+                    }
+
+                    sampledRows += take;
+                }
+            }
+
+            columns ??= reader.Schema?.FieldsList.Select(f => f.Name).ToList() ?? new List<string>();
+            sample ??= columns.ToDictionary(c => c, _ => new List<object>());
+
+            _logger.LogInformation("Summarized Arrow stream: {Rows} rows in {Batches} batches, {Sampled} sampled",
+                totalRows, batchCount, sampledRows);
+
+            return new QueryResultSummary
+            {
+                ArrowParsingSuccess = true,
+                Columns = columns,
+                EstimatedRowCount = totalRows,
+                BatchCount = batchCount,
+                StructuredSampleData = sample,
+                IsSampled = sampledRows < totalRows,
+                SampleRowCount = sampledRows,
+                ColumnStatistics = columns
+                    .Select((name, index) => (name, index))
+                    .Where(c => c.index < accumulators.Length)
+                    .ToDictionary(c => c.name, c => accumulators[c.index].ToStatistics())
+            };
+        }
+        catch (Exception ex) when (ex is not (OperationCanceledException or IOException or HttpRequestException))
+        {
+            _logger.LogWarning(ex, "Arrow stream summarization failed");
+            return new QueryResultSummary
+            {
+                ArrowParsingSuccess = false,
+                ArrowParsingError = ex.Message,
+                Columns = new List<string>(),
+                EstimatedRowCount = 0,
+                BatchCount = 0,
+                StructuredSampleData = new Dictionary<string, List<object>>()
+            };
+        }
+    }
+
     private static object? ExtractValueFromArray(IArrowArray array, int index) =>
         array.IsNull(index) ? null : array switch
         {
@@ -98,7 +196,7 @@ public class ArrowDataReaderService : IArrowDataReaderService
             TimestampArray ts => ts.GetTimestamp(index)?.ToString("yyyy-MM-dd HH:mm:ss"),
             Date32Array dt32 => DateTimeOffset.FromUnixTimeSeconds(dt32.GetValue(index) ?? 0).ToString("yyyy-MM-dd"),
             Date64Array dt64 => DateTimeOffset.FromUnixTimeMilliseconds(dt64.GetValue(index) ?? 0).ToString("yyyy-MM-dd"),
-            Decimal128Array dec => dec.GetValue(index)?.ToString(),
+            Decimal128Array dec => DecimalText(dec, index),
             Decimal256Array dec256 => dec256.GetValue(index)?.ToString(),
             FloatArray flt => flt.GetValue(index),
             Int8Array i8 => i8.GetValue(index),
@@ -111,5 +209,154 @@ public class ArrowDataReaderService : IArrowDataReaderService
             _ => $"[{array.GetType().Name}] - Unsupported type"
         };
 
+    /// <summary>
+    /// Decimal128 values beyond System.Decimal's 28-29 digits overflow GetValue; their text form is exact.
+    /// </summary>
+    private static string? DecimalText(Decimal128Array array, int index)
+    {
+        try
+        {
+            return array.GetValue(index)?.ToString();
+        }
+        catch (OverflowException)
+        {
+            return array.GetString(index);
+        }
+    }
+
+    /// <summary>
+    /// Running statistics for one column; holds a handful of scalars, never the values themselves.
+    /// </summary>
+    private sealed class ColumnAccumulator(string dataType)
+    {
+        private long _nullCount;
+        private long _numericCount;
+        private double _sum;
+        private double? _minNumber;
+        private double? _maxNumber;
+        private DateTimeOffset? _minTime;
+        private DateTimeOffset? _maxTime;
+        private string? _minText;
+        private string? _maxText;
+        private int? _minLength;
+        private int? _maxLength;
+        private bool _decimalOverflow;
+
+        public void Add(IArrowArray array)
+        {
+            _nullCount += array.NullCount;
+            switch (array)
+            {
+                case Int8Array a: AddNumbers(a); break;
+                case Int16Array a: AddNumbers(a); break;
+                case Int32Array a: AddNumbers(a); break;
+                case Int64Array a: AddNumbers(a); break;
+                case UInt8Array a: AddNumbers(a); break;
+                case UInt16Array a: AddNumbers(a); break;
+                case UInt32Array a: AddNumbers(a); break;
+                case UInt64Array a: AddNumbers(a); break;
+                case FloatArray a: AddNumbers(a); break;
+                case DoubleArray a: AddNumbers(a); break;
+                case Decimal128Array a:
+                    for (int i = 0; i < a.Length; i++)
+                        if (a.IsValid(i)) AddDecimal(a, i);
+                    break;
+                case BooleanArray a:
+                    for (int i = 0; i < a.Length; i++)
+                        if (a.GetValue(i) is { } b) AddNumber(b ? 1 : 0);
+                    break;
+                case StringArray a:
+                    for (int i = 0; i < a.Length; i++)
+                        if (a.IsValid(i)) AddText(a.GetString(i));
+                    break;
+                case TimestampArray a:
+                    for (int i = 0; i < a.Length; i++)
+                        if (a.GetTimestamp(i) is { } t) AddTime(t);
+                    break;
+                case Date32Array a:
+                    for (int i = 0; i < a.Length; i++)
+                        if (a.GetDateTimeOffset(i) is { } t) AddTime(t);
+                    break;
+                case Date64Array a:
+                    for (int i = 0; i < a.Length; i++)
+                        if (a.GetDateTimeOffset(i) is { } t) AddTime(t);
+                    break;
+            }
+        }
+
+        private void AddNumbers<T>(PrimitiveArray<T> array) where T : struct, IEquatable<T>, INumberBase<T>
+        {
+            var values = array.Values;
+            for (int i = 0; i < array.Length; i++)
+            {
+                if (array.IsValid(i))
+                    AddNumber(double.CreateTruncating(values[i]));
+            }
+        }
+
+        private void AddDecimal(Decimal128Array array, int index)
+        {
+            if (!_decimalOverflow)
+            {
+                try
+                {
+                    AddNumber((double)array.GetValue(index)!.Value);
+                    return;
+                }
+                catch (OverflowException)
+                {
+                    // Precision beyond System.Decimal: read this column's values as text from now on
+                    _decimalOverflow = true;
+                }
+            }
+
+            if (double.TryParse(array.GetString(index), NumberStyles.Float, CultureInfo.InvariantCulture, out var value))
+            {
+                AddNumber(value);
+            }
+        }
+
+        private void AddNumber(double value)
+        {
+            // NaN would make the sum, min and max NaN for the rest of the column
+            if (double.IsNaN(value))
+            {
+                return;
+            }
+
+            _numericCount++;
+            _sum += value;
+            _minNumber = _minNumber is { } min && min <= value ? min : value;
+            _maxNumber = _maxNumber is { } max && max >= value ? max : value;
+        }
+
+        private void AddTime(DateTimeOffset value)
+        {
+            _minTime = _minTime is { } min && min <= value ? min : value;
+            _maxTime = _maxTime is { } max && max >= value ? max : value;
+        }
 
-}
\ No newline at end of file
+        private void AddText(string value)
+        {
+            if (_minText == null || string.CompareOrdinal(value, _minText) < 0) _minText = value;
+            if (_maxText == null || string.CompareOrdinal(value, _maxText) > 0) _maxText = value;
+            _minLength = Math.Min(_minLength ?? int.MaxValue, value.Length);
+            _maxLength = Math.Max(_maxLength ?? 0, value.Length);
+        }
+
+        public ColumnStatistics ToStatistics() => new()
+        {
+            DataType = dataType,
+            NullCount = _nullCount,
+            Min = _minNumber?.ToString(CultureInfo.InvariantCulture)
+                ?? _minTime?.ToString("yyyy-MM-dd HH:mm:ss", CultureInfo.InvariantCulture)
+                ?? _minText,
+            Max = _maxNumber?.ToString(CultureInfo.InvariantCulture)
+                ?? _maxTime?.ToString("yyyy-MM-dd HH:mm:ss", CultureInfo.InvariantCulture)
+                ?? _maxText,
+            Mean = _numericCount > 0 ? _sum / _numericCount : null,
+            MinLength = _minLength,
+            MaxLength = _maxLength
+        };
+    }
+}
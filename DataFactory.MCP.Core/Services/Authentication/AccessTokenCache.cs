@@ -0,0 +1,190 @@
+using System.Collections.Concurrent;
+using Azure.Core;
+using Microsoft.Extensions.Logging;
+
+namespace DataFactory.MCP.Services.Authentication;
+
+/// <summary>
+/// In-process access token cache shared by every outgoing Fabric / Power BI request.
+/// Tokens are refreshed ahead of expiry in the background while the cached token keeps being served,
+/// and concurrent callers share a single in-flight acquisition per key (single-flight).
+/// </summary>
+public sealed class AccessTokenCache
+{
+    /// <summary>
+    /// Refresh this long before expiry (or halfway through the lifetime, for short-lived tokens).
+    /// </summary>
+    public static readonly TimeSpan RefreshAhead = TimeSpan.FromMinutes(5);
+
+    /// <summary>
+    /// Tokens this close to expiry are treated as expired, to absorb clock skew and request time.
+    /// </summary>
+    public static readonly TimeSpan ExpiryMargin = TimeSpan.FromSeconds(30);
+
+    /// <summary>
+    /// After a failed background refresh, the cached token is served this long before the next attempt.
+    /// </summary>
+    public static readonly TimeSpan RetryAfterFailedRefresh = TimeSpan.FromSeconds(30);
+
+    private readonly ConcurrentDictionary<string, CachedToken> _tokens = new();
+    private readonly ConcurrentDictionary<string, Lazy<Task<AccessToken>>> _inFlight = new();
+    private readonly ILogger<AccessTokenCache> _logger;
+    private readonly TimeProvider _timeProvider;
+    private readonly bool _enabled;
+    private long _hits;
+    private long _acquisitions;
+    private long _sharedWaits;
+    private long _backgroundRefreshes;
+
+    public AccessTokenCache(ILogger<AccessTokenCache> logger)
+        : this(logger, TimeProvider.System, enabled: true)
+    {
+    }
+
+    /// <summary>
+    /// A cache that reads the time from <paramref name="timeProvider"/> (for tests).
+    /// </summary>
+    internal AccessTokenCache(ILogger<AccessTokenCache> logger, TimeProvider timeProvider)
+        : this(logger, timeProvider, enabled: true)
+    {
+    }
+
+    private AccessTokenCache(ILogger<AccessTokenCache> logger, TimeProvider timeProvider, bool enabled)
+    {
+        _logger = logger;
+        _timeProvider = timeProvider;
+        _enabled = enabled;
+    }
+
+    /// <summary>
+    /// A cache that calls the token source on every request (baseline for benchmarks).
+    /// </summary>
+    public static AccessTokenCache CreateDisabled(ILogger<AccessTokenCache> logger) => new(logger, TimeProvider.System, enabled: false);
+
+    /// <summary>Requests answered from the cache without waiting</summary>
+    public long Hits => Interlocked.Read(ref _hits);
+
+    /// <summary>Calls made to the token source (foreground and background)</summary>
+    public long Acquisitions => Interlocked.Read(ref _acquisitions);
+
+    /// <summary>Requests that joined an acquisition already in flight</summary>
+    public long SharedWaits => Interlocked.Read(ref _sharedWaits);
+
+    /// <summary>Acquisitions started ahead of expiry while the cached token was still served</summary>
+    public long BackgroundRefreshes => Interlocked.Read(ref _backgroundRefreshes);
+
+    /// <summary>
+    /// Returns the cached token for <paramref name="key"/>, acquiring it through <paramref name="acquire"/>
+    /// when missing or expired. A token inside its refresh window is returned immediately and renewed in the background.
+    /// </summary>
+    public async Task<AccessToken> GetTokenAsync(
+        string key,
+        Func<CancellationToken, Task<AccessToken>> acquire,
+        CancellationToken cancellationToken = default)
+    {
+        if (!_enabled)
+        {
+            Interlocked.Increment(ref _acquisitions);
+            return await acquire(cancellationToken);
+        }
+
+        var now = _timeProvider.GetUtcNow();
+        if (_tokens.TryGetValue(key, out var cached) && now < cached.Token.ExpiresOn - ExpiryMargin)
+        {
+            Interlocked.Increment(ref _hits);
+            if (now >= cached.RefreshAt)
+            {
+                _ = RefreshInBackgroundAsync(key, acquire);
+            }
+            return cached.Token;
+        }
+
+        return await AcquireOnceAsync(key, acquire, background: false).WaitAsync(cancellationToken);
+    }
+
+    /// <summary>
+    /// Seeds or replaces the token for a key (e.g. right after sign-in).
+    /// </summary>
+    public void Set(string key, AccessToken token)
+    {
+        if (_enabled)
+        {
+            _tokens[key] = CachedToken.Create(token, _timeProvider.GetUtcNow());
+        }
+    }
+
+    /// <summary>
+    /// Drops the token for a key (e.g. on sign-out).
+    /// </summary>
+    public void Remove(string key) => _tokens.TryRemove(key, out _);
+
+    private async Task RefreshInBackgroundAsync(string key, Func<CancellationToken, Task<AccessToken>> acquire)
+    {
+        try
+        {
+            await AcquireOnceAsync(key, acquire, background: true);
+        }
+        catch (Exception ex)
+        {
+            // The cached token is still valid; retry later rather than on every request until it expires
+            if (_tokens.TryGetValue(key, out var cached))
+            {
+                _tokens.TryUpdate(key, cached with { RefreshAt = _timeProvider.GetUtcNow() + RetryAfterFailedRefresh }, cached);
+            }
+            _logger.LogWarning(ex, "Background token refresh failed for {Key}; retrying in {Delay}", key, RetryAfterFailedRefresh);
+        }
+    }
+
+    private Task<AccessToken> AcquireOnceAsync(string key, Func<CancellationToken, Task<AccessToken>> acquire, bool background)
+    {
+        Lazy<Task<AccessToken>>? created = null;
+        created = new Lazy<Task<AccessToken>>(() => AcquireAndStoreAsync(key, acquire, created!));
+        var flight = _inFlight.GetOrAdd(key, created);
+
+        if (!ReferenceEquals(flight, created))
+        {
+            if (!background)
+            {
+                Interlocked.Increment(ref _sharedWaits);
+            }
+            return flight.Value;
+        }
+
+        Interlocked.Increment(ref _acquisitions);
+        if (background)
+        {
+            Interlocked.Increment(ref _backgroundRefreshes);
+        }
+        return flight.Value;
+    }
+
+    private async Task<AccessToken> AcquireAndStoreAsync(string key, Func<CancellationToken, Task<AccessToken>> acquire, Lazy<Task<AccessToken>> flight)
+    {
+        try
+        {
+            // Shared by every waiting caller, so one caller's cancellation must not cancel it
+            var token = await acquire(CancellationToken.None);
+            _tokens[key] = CachedToken.Create(token, _timeProvider.GetUtcNow());
+
+            _logger.LogDebug("Acquired token for {Key}, expires {ExpiresOn:u} ({Acquisitions} acquisitions, {Hits} hits)",
+                key, token.ExpiresOn, Acquisitions, Hits);
+            return token;
+        }
+        finally
+        {
+            _inFlight.TryRemove(new KeyValuePair<string, Lazy<Task<AccessToken>>>(key, flight));
+        }
+    }
+
+    private sealed record CachedToken(AccessToken Token, DateTimeOffset RefreshAt)
+    {
+        public static CachedToken Create(AccessToken token, DateTimeOffset acquiredAt)
+        {
+            var lifetime = token.ExpiresOn - acquiredAt;
+            var refreshAt = lifetime > RefreshAhead * 2
+                ? token.ExpiresOn - RefreshAhead
+                : acquiredAt + lifetime / 2;
+            return new CachedToken(token, refreshAt);
+        }
+    }
+}
@@ -12,7 +12,8 @@ namespace DataFactory.MCP.Services.Authentication;
 public class DeviceCodeAuthenticationProvider : IAuthenticationProvider
 {
     private readonly ILogger<DeviceCodeAuthenticationProvider> _logger;
-    private readonly IPublicClientApplication _publicClientApp;
+    // Built when a device code flow starts; most sessions never start one
+    private readonly Lazy<IPublicClientApplication> _publicClientApp = new(CreatePublicClientApp);
     private Task<Microsoft.Identity.Client.AuthenticationResult>? _pendingDeviceAuth;
     private string? _pendingDeviceInstructions;
     private DateTime? _deviceAuthStartTime;
@@ -21,7 +22,6 @@ public class DeviceCodeAuthenticationProvider : IAuthenticationProvider
     public DeviceCodeAuthenticationProvider(ILogger<DeviceCodeAuthenticationProvider> logger)
     {
         _logger = logger;
-        _publicClientApp = CreatePublicClientApp();
     }
 
     public string ProviderType => "DeviceCode";
@@ -75,7 +75,7 @@ public class DeviceCodeAuthenticationProvider : IAuthenticationProvider
             var scopes = request.Scopes ?? AzureAdConfiguration.PowerBIScopes;
 
             // Start the device code flow but don't await it
-            _pendingDeviceAuth = _publicClientApp
+            _pendingDeviceAuth = _publicClientApp.Value
                 .AcquireTokenWithDeviceCode(scopes, callback =>
                 {
                     deviceInstructions = $@"🔐 **Device Code Authentication Started**
@@ -159,7 +159,8 @@ You have {callback.ExpiresOn.Subtract(DateTimeOffset.Now).Minutes} minutes to co
 Signed in as: {result.Account.Username}
 Tenant: {result.TenantId}";
 
-            return Abstractions.Interfaces.AuthenticationResult.Success(message, authDetails);
+            return Abstractions.Interfaces.AuthenticationResult.Success(message, authDetails,
+                MsalSilentRenewal.For(_publicClientApp.Value, result.Account, request.Scopes ?? AzureAdConfiguration.PowerBIScopes, _logger));
         }
         catch (OperationCanceledException)
         {
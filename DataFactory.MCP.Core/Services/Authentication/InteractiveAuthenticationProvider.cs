@@ -12,12 +12,12 @@ namespace DataFactory.MCP.Services.Authentication;
 public class InteractiveAuthenticationProvider : IAuthenticationProvider
 {
     private readonly ILogger<InteractiveAuthenticationProvider> _logger;
-    private readonly IPublicClientApplication _publicClientApp;
+    // Built on first sign-in, not whenever the authentication service is resolved
+    private readonly Lazy<IPublicClientApplication> _publicClientApp = new(CreatePublicClientApp);
 
     public InteractiveAuthenticationProvider(ILogger<InteractiveAuthenticationProvider> logger)
     {
         _logger = logger;
-        _publicClientApp = CreatePublicClientApp();
     }
 
     public string ProviderType => "Interactive";
@@ -39,7 +39,7 @@ public class InteractiveAuthenticationProvider : IAuthenticationProvider
             _logger.LogInformation(Messages.StartingInteractiveAuthentication);
 
             var scopes = request.Scopes ?? AzureAdConfiguration.PowerBIScopes;
-            var result = await _publicClientApp
+            var result = await _publicClientApp.Value
                 .AcquireTokenInteractive(scopes)
                 .ExecuteAsync();
 
@@ -54,7 +54,8 @@ public class InteractiveAuthenticationProvider : IAuthenticationProvider
             _logger.LogInformation("Interactive authentication completed successfully for user: {Username}", result.Account.Username);
 
             var message = string.Format(Messages.InteractiveAuthenticationSuccessTemplate, result.Account.Username);
-            return Abstractions.Interfaces.AuthenticationResult.Success(message, authDetails);
+            return Abstractions.Interfaces.AuthenticationResult.Success(message, authDetails,
+                MsalSilentRenewal.For(_publicClientApp.Value, result.Account, scopes, _logger));
         }
         catch (MsalException msalEx)
         {
@@ -0,0 +1,34 @@
+using DataFactory.MCP.Models;
+using Microsoft.Extensions.Logging;
+using Microsoft.Identity.Client;
+
+namespace DataFactory.MCP.Services.Authentication;
+
+/// <summary>
+/// Renews an interactive or device code sign-in through the MSAL application that performed it,
+/// whose token cache holds the account's refresh token.
+/// </summary>
+internal static class MsalSilentRenewal
+{
+    public static Func<Task<McpAuthenticationResult?>> For(IPublicClientApplication app, IAccount account, string[] scopes, ILogger logger)
+        => async () =>
+        {
+            try
+            {
+                var result = await app.AcquireTokenSilent(scopes, account).ExecuteAsync();
+
+                logger.LogInformation("Token refreshed successfully for user: {UserName}", result.Account.Username);
+                return McpAuthenticationResult.Success(
+                    result.AccessToken,
+                    result.Account.Username,
+                    result.TenantId,
+                    result.ExpiresOn.UtcDateTime,
+                    string.Join(", ", result.Scopes));
+            }
+            catch (MsalUiRequiredException)
+            {
+                logger.LogInformation("Silent token refresh failed, UI interaction required");
+                throw new TokenRenewalFailedException(Messages.AccessTokenExpiredCannotRefresh);
+            }
+        };
+}
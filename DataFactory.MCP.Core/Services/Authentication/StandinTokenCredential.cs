@@ -0,0 +1,52 @@
+using System.Text.Json;
+using Azure.Core;
+
+namespace DataFactory.MCP.Services.Authentication;
+
+/// <summary>
+/// Client credentials grant against a local OAuth2 token endpoint (evals/perf/identity_standin.py).
+/// MSAL only talks to HTTPS authorities, so load tests reach the stand-in through this credential;
+/// every call is a token round-trip, leaving caching to <see cref="AccessTokenCache"/>.
+/// </summary>
+internal sealed class StandinTokenCredential : TokenCredential
+{
+    private static readonly HttpClient Http = new() { Timeout = TimeSpan.FromSeconds(30) };
+
+    private readonly Uri _tokenEndpoint;
+    private readonly string _clientId;
+    private readonly string _clientSecret;
+
+    public StandinTokenCredential(Uri tokenEndpoint, string clientId, string clientSecret)
+    {
+        _tokenEndpoint = tokenEndpoint;
+        _clientId = clientId;
+        _clientSecret = clientSecret;
+    }
+
+    public override AccessToken GetToken(TokenRequestContext requestContext, CancellationToken cancellationToken) =>
+        GetTokenAsync(requestContext, cancellationToken).AsTask().GetAwaiter().GetResult();
+
+    public override async ValueTask<AccessToken> GetTokenAsync(TokenRequestContext requestContext, CancellationToken cancellationToken)
+    {
+        using var content = new FormUrlEncodedContent(new Dictionary<string, string>
+        {
+            ["grant_type"] = "client_credentials",
+            ["client_id"] = _clientId,
+            ["client_secret"] = _clientSecret,
+            ["scope"] = string.Join(' ', requestContext.Scopes)
+        });
+
+        using var response = await Http.PostAsync(_tokenEndpoint, content, cancellationToken);
+        var body = await response.Content.ReadAsStringAsync(cancellationToken);
+        if (!response.IsSuccessStatusCode)
+        {
+            throw new HttpRequestException($"Token endpoint returned {(int)response.StatusCode}: {body}");
+        }
+
+        using var json = JsonDocument.Parse(body);
+        var token = json.RootElement.GetProperty("access_token").GetString()
+            ?? throw new InvalidOperationException("Token endpoint response has no access_token");
+        var expiresIn = json.RootElement.TryGetProperty("expires_in", out var value) ? value.GetInt32() : 3600;
+        return new AccessToken(token, DateTimeOffset.UtcNow.AddSeconds(expiresIn));
+    }
+}
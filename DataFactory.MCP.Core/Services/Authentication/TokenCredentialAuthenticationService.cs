@@ -2,6 +2,7 @@ using Azure.Core;
 using DataFactory.MCP.Abstractions.Interfaces;
 using DataFactory.MCP.Models;
 using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Logging.Abstractions;
 
 namespace DataFactory.MCP.Services.Authentication;
 
@@ -9,18 +10,30 @@ namespace DataFactory.MCP.Services.Authentication;
 /// An IAuthenticationService implementation that delegates token acquisition to an Azure.Core TokenCredential.
 /// Used when DataFactory.MCP.Core is hosted inside a system that already provides authentication
 /// (e.g., Fabric MCP Server with DefaultAzureCredential).
+/// Tokens are cached per scope set in <see cref="AccessTokenCache"/>, so the credential is only called
+/// once per token lifetime rather than once per request.
 /// </summary>
 public class TokenCredentialAuthenticationService : IAuthenticationService
 {
     private readonly TokenCredential _credential;
     private readonly ILogger<TokenCredentialAuthenticationService> _logger;
+    private readonly AccessTokenCache _tokenCache;
 
     public TokenCredentialAuthenticationService(
         TokenCredential credential,
         ILogger<TokenCredentialAuthenticationService> logger)
+        : this(credential, logger, new AccessTokenCache(NullLogger<AccessTokenCache>.Instance))
+    {
+    }
+
+    public TokenCredentialAuthenticationService(
+        TokenCredential credential,
+        ILogger<TokenCredentialAuthenticationService> logger,
+        AccessTokenCache tokenCache)
     {
         _credential = credential;
         _logger = logger;
+        _tokenCache = tokenCache;
     }
 
     public Task<string> GetAccessTokenAsync()
@@ -30,8 +43,9 @@ public class TokenCredentialAuthenticationService : IAuthenticationService
 
     public async Task<string> GetAccessTokenAsync(string[] scopes)
     {
-        var context = new TokenRequestContext(scopes);
-        var token = await _credential.GetTokenAsync(context, CancellationToken.None).ConfigureAwait(false);
+        var token = await _tokenCache.GetTokenAsync(
+            string.Join(' ', scopes),
+            ct => _credential.GetTokenAsync(new TokenRequestContext(scopes), ct).AsTask()).ConfigureAwait(false);
         return token.Token;
     }
 
@@ -0,0 +1,6 @@
+namespace DataFactory.MCP.Services.Authentication;
+
+/// <summary>
+/// Renewal failed in a way the caller should see as a message rather than an error.
+/// </summary>
+internal sealed class TokenRenewalFailedException(string message) : Exception(message);
@@ -33,7 +33,7 @@ public class AuthenticationService : IAuthenticationService
 
         if (result.IsSuccess && result.AuthenticationDetails != null)
         {
-            _stateManager.SetAuthentication(result.AuthenticationDetails);
+            _stateManager.SetAuthentication(result.AuthenticationDetails, result.Renewal);
         }
 
         return result.Message;
@@ -59,7 +59,7 @@ public class AuthenticationService : IAuthenticationService
 
         if (result.IsSuccess && result.AuthenticationDetails != null)
         {
-            _stateManager.SetAuthentication(result.AuthenticationDetails);
+            _stateManager.SetAuthentication(result.AuthenticationDetails, result.Renewal);
         }
 
         return result.Message;
@@ -81,7 +81,10 @@ public class AuthenticationService : IAuthenticationService
 
         if (result.IsSuccess && result.AuthenticationDetails != null)
         {
-            _stateManager.SetAuthentication(result.AuthenticationDetails);
+            // Client credentials can be re-run without the user, so the token is renewed before it expires
+            _stateManager.SetAuthentication(
+                result.AuthenticationDetails,
+                renewal: async () => (await ExecuteAuthenticationAsync(request)).AuthenticationDetails);
         }
 
         return result.Message;
@@ -1,8 +1,8 @@
+using Azure.Core;
 using DataFactory.MCP.Abstractions.Interfaces;
-using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Models;
+using DataFactory.MCP.Services.Authentication;
 using Microsoft.Extensions.Logging;
-using Microsoft.Identity.Client;
 
 namespace DataFactory.MCP.Services;
 
@@ -12,24 +12,34 @@ namespace DataFactory.MCP.Services;
 /// <remarks>
 /// This service is registered as singleton and shares authentication state across all requests.
 /// For HTTP deployments, ensure the endpoint is protected by external authentication.
+/// When the sign-in can be renewed without the user, the current token is served from <see cref="AccessTokenCache"/>,
+/// which renews it once, ahead of expiry, however many requests are in flight. Otherwise it is served until it expires.
 /// </remarks>
 public class AuthenticationStateManager : IAuthenticationStateManager
 {
+    private const string CurrentTokenKey = "current";
+
     private readonly ILogger<AuthenticationStateManager> _logger;
+    private readonly AccessTokenCache _tokenCache;
     private McpAuthenticationResult? _currentAuth;
-    private IPublicClientApplication? _publicClientApp;
+    private Func<Task<McpAuthenticationResult?>>? _renewal;
 
-    public AuthenticationStateManager(ILogger<AuthenticationStateManager> logger)
+    public AuthenticationStateManager(ILogger<AuthenticationStateManager> logger, AccessTokenCache tokenCache)
     {
         _logger = logger;
-        InitializePublicClient();
+        _tokenCache = tokenCache;
     }
 
     public McpAuthenticationResult? CurrentAuthentication => _currentAuth;
 
-    public void SetAuthentication(McpAuthenticationResult result)
+    public void SetAuthentication(McpAuthenticationResult result, Func<Task<McpAuthenticationResult?>>? renewal = null)
     {
         _currentAuth = result;
+        _renewal = renewal;
+        if (result.IsSuccess && !string.IsNullOrEmpty(result.AccessToken))
+        {
+            _tokenCache.Set(CurrentTokenKey, ToAccessToken(result));
+        }
         _logger.LogInformation("Authentication state updated for user: {UserName}", result.UserName);
     }
 
@@ -37,6 +47,8 @@ public class AuthenticationStateManager : IAuthenticationStateManager
     {
         var userName = _currentAuth?.UserName;
         _currentAuth = null;
+        _renewal = null;
+        _tokenCache.Remove(CurrentTokenKey);
         _logger.LogInformation("Authentication state cleared for user: {UserName}", userName);
     }
 
@@ -67,27 +79,23 @@ public class AuthenticationStateManager : IAuthenticationStateManager
                 return Messages.NoAuthenticationFound;
             }
 
-            var targetScopes = scopes ?? AzureAdConfiguration.PowerBIScopes;
+            if (!_currentAuth.ExpiresOn.HasValue || string.IsNullOrEmpty(_currentAuth.AccessToken))
+            {
+                return _currentAuth.AccessToken ?? Messages.TokenNotAvailable;
+            }
 
-            // Check if current token is expired
-            if (_currentAuth.ExpiresOn.HasValue && _currentAuth.ExpiresOn <= DateTime.UtcNow)
+            if (_renewal == null)
             {
-                // Try to refresh the token silently for non-service principal accounts
-                if (_publicClientApp != null && !_currentAuth.UserName?.StartsWith("ServicePrincipal-") == true)
-                {
-                    var refreshResult = await TryRefreshTokenAsync(targetScopes);
-                    if (!string.IsNullOrEmpty(refreshResult))
-                    {
-                        return refreshResult;
-                    }
-                }
-                else
-                {
-                    return Messages.AccessTokenExpired;
-                }
+                // Nothing can renew this sign-in without the user, so there is nothing to refresh ahead of time
+                return _currentAuth.ExpiresOn <= DateTime.UtcNow ? Messages.AccessTokenExpired : _currentAuth.AccessToken;
             }
 
-            return _currentAuth.AccessToken ?? Messages.TokenNotAvailable;
+            var token = await _tokenCache.GetTokenAsync(CurrentTokenKey, _ => RenewTokenAsync());
+            return token.Token;
+        }
+        catch (TokenRenewalFailedException ex)
+        {
+            return ex.Message;
         }
         catch (Exception ex)
         {
@@ -96,94 +104,52 @@ public class AuthenticationStateManager : IAuthenticationStateManager
         }
     }
 
-    public async Task<string> SignOutAsync()
+    public Task<string> SignOutAsync()
     {
-        try
-        {
-            _logger.LogInformation(Messages.SigningOutCurrentUser);
-
-            if (_currentAuth == null)
-            {
-                return Messages.NoActiveAuthenticationSession;
-            }
-
-            var userName = _currentAuth.UserName;
-
-            // Clear cached tokens if using interactive authentication
-            if (_publicClientApp != null && !userName?.StartsWith("ServicePrincipal-") == true)
-            {
-                var accounts = await _publicClientApp.GetAccountsAsync();
-                foreach (var account in accounts)
-                {
-                    await _publicClientApp.RemoveAsync(account);
-                }
-            }
+        _logger.LogInformation(Messages.SigningOutCurrentUser);
 
-            ClearAuthentication();
-            _logger.LogInformation("Successfully signed out user: {UserName}", userName);
-            return string.Format(Messages.SignOutSuccessTemplate, userName);
-        }
-        catch (Exception ex)
+        if (_currentAuth == null)
         {
-            _logger.LogError(ex, "Error during sign out");
-            return string.Format(Messages.SignOutErrorTemplate, ex.Message);
+            return Task.FromResult(Messages.NoActiveAuthenticationSession);
         }
-    }
 
-    private void InitializePublicClient()
-    {
-        try
-        {
-            _publicClientApp = PublicClientApplicationBuilder
-                .Create(AzureAdConfiguration.ClientId)
-                .WithAuthority(new Uri(AzureAdConfiguration.Authority))
-                .WithRedirectUri(AzureAdConfiguration.RedirectUri)
-                .Build();
+        var userName = _currentAuth.UserName;
 
-            _logger.LogInformation("Public client application initialized for token refresh");
-        }
-        catch (Exception ex)
-        {
-            _logger.LogError(ex, "Failed to initialize public client application");
-        }
+        ClearAuthentication();
+        _logger.LogInformation("Successfully signed out user: {UserName}", userName);
+        return Task.FromResult(string.Format(Messages.SignOutSuccessTemplate, userName));
     }
 
-    private async Task<string?> TryRefreshTokenAsync(string[] scopes)
+    /// <summary>
+    /// Acquires a fresh token for the signed-in account; called by the token cache, at most once at a time.
+    /// Service principals re-run client credentials; interactive and device code accounts refresh silently
+    /// through the MSAL application that signed them in.
+    /// </summary>
+    private async Task<AccessToken> RenewTokenAsync()
     {
-        try
-        {
-            if (_publicClientApp == null)
-                return null;
+        var current = _currentAuth;
+        var renewal = _renewal;
+        if (current == null)
+            throw new TokenRenewalFailedException(Messages.NoAuthenticationFound);
+        if (renewal == null)
+            throw new TokenRenewalFailedException(Messages.AccessTokenExpired);
 
-            var accounts = await _publicClientApp.GetAccountsAsync();
-            if (accounts.Any())
-            {
-                var result = await _publicClientApp
-                    .AcquireTokenSilent(scopes, accounts.First())
-                    .ExecuteAsync();
-
-                _currentAuth = McpAuthenticationResult.Success(
-                    result.AccessToken,
-                    result.Account.Username,
-                    result.TenantId,
-                    result.ExpiresOn.DateTime,
-                    string.Join(", ", result.Scopes)
-                );
-
-                _logger.LogInformation("Token refreshed successfully for user: {UserName}", result.Account.Username);
-                return result.AccessToken;
-            }
-        }
-        catch (MsalUiRequiredException)
-        {
-            _logger.LogInformation("Silent token refresh failed, UI interaction required");
-            return Messages.AccessTokenExpiredCannotRefresh;
-        }
-        catch (Exception ex)
-        {
-            _logger.LogError(ex, "Token refresh failed");
-        }
+        var renewed = await renewal();
+
+        if (renewed?.IsSuccess != true || string.IsNullOrEmpty(renewed.AccessToken))
+            throw new TokenRenewalFailedException(Messages.AccessTokenExpired);
 
-        return null;
+        // Don't resurrect a session that was signed out or replaced while renewing
+        if (Interlocked.CompareExchange(ref _currentAuth, renewed, current) != current)
+            throw new TokenRenewalFailedException(Messages.NoAuthenticationFound);
+
+        _logger.LogInformation("Token renewed for user: {UserName}, expires {ExpiresOn:u}", renewed.UserName, renewed.ExpiresOn);
+        return ToAccessToken(renewed);
     }
+
+    private static AccessToken ToAccessToken(McpAuthenticationResult result) => new(
+        result.AccessToken!,
+        result.ExpiresOn is { } expiresOn
+            ? new DateTimeOffset(DateTime.SpecifyKind(expiresOn, DateTimeKind.Utc))
+            : DateTimeOffset.MaxValue);
 }
\ No newline at end of file
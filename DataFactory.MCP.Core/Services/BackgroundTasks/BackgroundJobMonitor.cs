@@ -7,40 +7,42 @@ namespace DataFactory.MCP.Services.BackgroundTasks;
 
 /// <summary>
 /// Manages the complete lifecycle of background jobs: start, track, monitor, and notify.
-/// Uses a single timer-based polling loop for efficiency.
+/// Uses a single timer-based polling loop for efficiency: each tick checks only the jobs that are due
+/// (see <see cref="JobPollSchedule"/>), with a cap on concurrent status requests.
 /// Thread-safe for concurrent operations.
 /// </summary>
 public class BackgroundJobMonitor : IBackgroundJobMonitor, IDisposable
 {
-    private static readonly TimeSpan PollInterval = TimeSpan.FromSeconds(3);
+    private static readonly TimeSpan TickInterval = JobPollSchedule.MinInterval;
+    private static readonly TimeSpan DueSlack = TimeSpan.FromMilliseconds(100); // Timer ticks can fire slightly early
     private static readonly TimeSpan MaxJobAge = TimeSpan.FromHours(4);
     private const int MaxHistoryCount = 20;
+    private const int MaxConcurrentStatusChecks = 8;
 
     private readonly ConcurrentDictionary<string, MonitoredJob> _activeJobs = new();
     private readonly ConcurrentDictionary<string, TrackedTask> _taskHistory = new();
     private readonly ConcurrentQueue<string> _historyOrder = new(); // Track insertion order for eviction
-    private readonly IMcpSessionAccessor _sessionAccessor;
+    private readonly ConcurrentDictionary<string, TimeSpan> _expectedDurations = new(); // Learned from completed runs
     private readonly INotificationQueue _notificationQueue;
     private readonly ILogger<BackgroundJobMonitor> _logger;
     private readonly Timer _pollTimer;
     private readonly SemaphoreSlim _pollLock = new(1, 1);
+    private readonly SemaphoreSlim _statusCheckLimiter = new(MaxConcurrentStatusChecks, MaxConcurrentStatusChecks);
     private readonly object _historyLock = new(); // For atomic history operations
     private bool _disposed;
 
     public BackgroundJobMonitor(
-        IMcpSessionAccessor sessionAccessor,
         INotificationQueue notificationQueue,
         ILogger<BackgroundJobMonitor> logger)
     {
-        _sessionAccessor = sessionAccessor;
         _notificationQueue = notificationQueue;
         _logger = logger;
 
         // Start timer but don't poll until we have jobs
         _pollTimer = new Timer(OnPollTimerElapsed, null, Timeout.Infinite, Timeout.Infinite);
 
-        _logger.LogDebug("BackgroundJobMonitor initialized with {Interval}s poll interval",
-            PollInterval.TotalSeconds);
+        _logger.LogDebug("BackgroundJobMonitor initialized with {Min}-{Max}s adaptive poll interval",
+            JobPollSchedule.MinInterval.TotalSeconds, JobPollSchedule.MaxInterval.TotalSeconds);
     }
 
     public async Task<BackgroundJobResult> StartJobAsync(IBackgroundJob job, McpSession session)
@@ -48,9 +50,6 @@ public class BackgroundJobMonitor : IBackgroundJobMonitor, IDisposable
         ArgumentNullException.ThrowIfNull(job);
         ArgumentNullException.ThrowIfNull(session);
 
-        // Store session for notifications
-        _sessionAccessor.CurrentSession = session;
-
         _logger.LogInformation("Starting background job {JobType}: {DisplayName} (ID: {JobId})",
             job.JobType, job.DisplayName, job.JobId);
 
@@ -76,15 +75,20 @@ public class BackgroundJobMonitor : IBackgroundJobMonitor, IDisposable
             trackedTask.CompletedAt = startResult.CompletedAt ?? DateTime.UtcNow;
             trackedTask.FailureReason = startResult.ErrorMessage;
 
-            EnqueueNotification(job, startResult);
+            EnqueueNotification(job, session, startResult);
             return startResult;
         }
 
-        // Register for monitoring
+        // Register for monitoring; the first check is scheduled like any other
+        var now = DateTime.UtcNow;
+        var expectedDuration = _expectedDurations.TryGetValue(DurationKey(job), out var expected) ? expected : (TimeSpan?)null;
         var monitoredJob = new MonitoredJob
         {
             Job = job,
-            RegisteredAt = DateTime.UtcNow
+            Session = session,
+            RegisteredAt = now,
+            ExpectedDuration = expectedDuration,
+            NextCheckAt = now + JobPollSchedule.NextDelay(TimeSpan.Zero, expectedDuration)
         };
 
         if (_activeJobs.TryAdd(job.JobId, monitoredJob))
@@ -109,7 +113,7 @@ public class BackgroundJobMonitor : IBackgroundJobMonitor, IDisposable
     private void StartPolling()
     {
         _logger.LogDebug("Starting poll timer");
-        _pollTimer.Change(PollInterval, PollInterval);
+        _pollTimer.Change(TickInterval, TickInterval);
     }
 
     private void StopPolling()
@@ -147,12 +151,21 @@ public class BackgroundJobMonitor : IBackgroundJobMonitor, IDisposable
             return;
         }
 
-        _logger.LogDebug("Polling {Count} active job(s)", _activeJobs.Count);
-
         var now = DateTime.UtcNow;
+        var dueJobs = _activeJobs.Values
+            .Where(job => job.NextCheckAt <= now + DueSlack || now - job.RegisteredAt > MaxJobAge)
+            .OrderBy(job => job.NextCheckAt)
+            .ToList();
+
+        if (dueJobs.Count == 0)
+        {
+            return;
+        }
+
+        _logger.LogDebug("Polling {Due} of {Count} active job(s)", dueJobs.Count, _activeJobs.Count);
 
-        // Check all jobs in parallel
-        var checkTasks = _activeJobs.Values.Select(async monitoredJob =>
+        // Check due jobs in parallel, at most MaxConcurrentStatusChecks requests in flight
+        var checkTasks = dueJobs.Select(async monitoredJob =>
         {
             try
             {
@@ -162,7 +175,7 @@ public class BackgroundJobMonitor : IBackgroundJobMonitor, IDisposable
                     _logger.LogWarning("Job {JobId} timed out after {Duration}",
                         monitoredJob.Job.JobId, MaxJobAge);
 
-                    HandleJobCompletion(monitoredJob.Job, new BackgroundJobResult
+                    HandleJobCompletion(monitoredJob, new BackgroundJobResult
                     {
                         IsComplete = true,
                         IsSuccess = false,
@@ -175,19 +188,37 @@ public class BackgroundJobMonitor : IBackgroundJobMonitor, IDisposable
                     return monitoredJob.Job.JobId;
                 }
 
-                var result = await monitoredJob.Job.CheckStatusAsync();
+                BackgroundJobResult result;
+                await _statusCheckLimiter.WaitAsync();
+                try
+                {
+                    result = await monitoredJob.Job.CheckStatusAsync();
+                }
+                finally
+                {
+                    _statusCheckLimiter.Release();
+                }
 
                 if (result.IsComplete)
                 {
                     _logger.LogInformation("Job {JobId} completed with status {Status}",
                         monitoredJob.Job.JobId, result.Status);
 
-                    HandleJobCompletion(monitoredJob.Job, result);
+                    if (result.IsSuccess)
+                    {
+                        RecordDuration(monitoredJob, result);
+                    }
+
+                    HandleJobCompletion(monitoredJob, result);
                     return monitoredJob.Job.JobId;
                 }
 
-                _logger.LogDebug("Job {JobId} still in progress: {Status}",
-                    monitoredJob.Job.JobId, result.Status);
+                // Scheduled from the tick that sent the check, so the response time doesn't push it a tick later
+                var nextDelay = JobPollSchedule.NextDelay(now - monitoredJob.RegisteredAt, monitoredJob.ExpectedDuration);
+                monitoredJob.NextCheckAt = now + nextDelay;
+
+                _logger.LogDebug("Job {JobId} still in progress: {Status}, next check in {Delay}s",
+                    monitoredJob.Job.JobId, result.Status, nextDelay.TotalSeconds);
 
                 return null; // Not completed
             }
@@ -195,7 +226,7 @@ public class BackgroundJobMonitor : IBackgroundJobMonitor, IDisposable
             {
                 _logger.LogError(ex, "Error checking job {JobId}", monitoredJob.Job.JobId);
 
-                HandleJobCompletion(monitoredJob.Job, new BackgroundJobResult
+                HandleJobCompletion(monitoredJob, new BackgroundJobResult
                 {
                     IsComplete = true,
                     IsSuccess = false,
@@ -224,8 +255,30 @@ public class BackgroundJobMonitor : IBackgroundJobMonitor, IDisposable
         }
     }
 
-    private void HandleJobCompletion(IBackgroundJob job, BackgroundJobResult result)
+    /// <summary>
+    /// Remembers how long a successful run took so later runs of the same job are polled around that time.
+    /// </summary>
+    private void RecordDuration(MonitoredJob monitoredJob, BackgroundJobResult result)
+    {
+        var observed = result.CompletedAt is { } completedAt && completedAt > result.StartedAt && result.StartedAt != default
+            ? completedAt - result.StartedAt
+            : DateTime.UtcNow - monitoredJob.RegisteredAt;
+
+        _expectedDurations.AddOrUpdate(
+            DurationKey(monitoredJob.Job),
+            observed,
+            (_, current) => JobPollSchedule.UpdateExpectedDuration(current, observed));
+    }
+
+    /// <summary>
+    /// Runs of the same type on the same item are treated as the same job (e.g. one dataflow's refreshes).
+    /// </summary>
+    private static string DurationKey(IBackgroundJob job) => $"{job.JobType}|{job.ItemId}";
+
+    private void HandleJobCompletion(MonitoredJob monitoredJob, BackgroundJobResult result)
     {
+        var job = monitoredJob.Job;
+
         // Update tracked task in history
         if (_taskHistory.TryGetValue(job.JobId, out var task))
         {
@@ -234,8 +287,8 @@ public class BackgroundJobMonitor : IBackgroundJobMonitor, IDisposable
             task.FailureReason = result.ErrorMessage;
         }
 
-        // Queue notification
-        EnqueueNotification(job, result);
+        // Queue notification for the session that started the job
+        EnqueueNotification(job, monitoredJob.Session, result);
     }
 
     /// <summary>
@@ -260,7 +313,7 @@ public class BackgroundJobMonitor : IBackgroundJobMonitor, IDisposable
         }
     }
 
-    private void EnqueueNotification(IBackgroundJob job, BackgroundJobResult result)
+    private void EnqueueNotification(IBackgroundJob job, McpSession session, BackgroundJobResult result)
     {
         var title = $"{job.JobType} {result.Status}";
         var duration = result.DurationFormatted ?? "unknown duration";
@@ -273,7 +326,8 @@ public class BackgroundJobMonitor : IBackgroundJobMonitor, IDisposable
             {
                 Title = title,
                 Message = $"'{job.DisplayName}' completed successfully in {duration}",
-                Level = NotificationLevel.Success
+                Level = NotificationLevel.Success,
+                Session = session
             };
         }
         else if (result.Status == "Timeout")
@@ -282,7 +336,8 @@ public class BackgroundJobMonitor : IBackgroundJobMonitor, IDisposable
             {
                 Title = title,
                 Message = $"'{job.DisplayName}' timed out",
-                Level = NotificationLevel.Warning
+                Level = NotificationLevel.Warning,
+                Session = session
             };
         }
         else
@@ -291,7 +346,8 @@ public class BackgroundJobMonitor : IBackgroundJobMonitor, IDisposable
             {
                 Title = title,
                 Message = $"'{job.DisplayName}' failed: {result.ErrorMessage ?? "Unknown error"}",
-                Level = NotificationLevel.Error
+                Level = NotificationLevel.Error,
+                Session = session
             };
         }
 
@@ -305,11 +361,15 @@ public class BackgroundJobMonitor : IBackgroundJobMonitor, IDisposable
 
         _pollTimer.Dispose();
         _pollLock.Dispose();
+        _statusCheckLimiter.Dispose();
     }
 
     private class MonitoredJob
     {
         public required IBackgroundJob Job { get; init; }
+        public required McpSession Session { get; init; }
         public required DateTime RegisteredAt { get; init; }
+        public TimeSpan? ExpectedDuration { get; init; }
+        public DateTime NextCheckAt { get; set; }
     }
 }
@@ -0,0 +1,37 @@
+namespace DataFactory.MCP.Services.BackgroundTasks;
+
+/// <summary>
+/// Decides when a monitored job is next checked, based on its age and, when known,
+/// how long earlier runs of the same job took.
+/// Mirrored by evals/perf/refresh_simulator.py; keep the two in sync.
+/// </summary>
+internal static class JobPollSchedule
+{
+    public static readonly TimeSpan MinInterval = TimeSpan.FromSeconds(1);
+    public static readonly TimeSpan MaxInterval = TimeSpan.FromSeconds(3);
+
+    /// <summary>
+    /// Without history: a tenth of the job's age, so short jobs are noticed within a second or two
+    /// and long ones settle at <see cref="MaxInterval"/>.
+    /// With history: a quarter of the time left until the expected finish, then a tenth of the overrun.
+    /// The cap matches the previous fixed 3 s poll, so no job is noticed later than it used to be,
+    /// including long first runs and runs that finish well before their expected time.
+    /// </summary>
+    public static TimeSpan NextDelay(TimeSpan age, TimeSpan? expectedDuration)
+    {
+        var delay = expectedDuration is { } expected
+            ? (age < expected ? (expected - age) / 4 : (age - expected) / 10)
+            : age / 10;
+
+        return Clamp(delay);
+    }
+
+    /// <summary>
+    /// Folds a completed run into the expected duration (exponentially weighted).
+    /// </summary>
+    public static TimeSpan UpdateExpectedDuration(TimeSpan? current, TimeSpan observed) =>
+        current is { } previous ? previous * 0.7 + observed * 0.3 : observed;
+
+    private static TimeSpan Clamp(TimeSpan delay) =>
+        delay < MinInterval ? MinInterval : delay > MaxInterval ? MaxInterval : delay;
+}
@@ -25,6 +25,7 @@ public class DataflowRefreshJob : IBackgroundJob
 
     public string JobId { get; }
     public string JobType => "Dataflow Refresh";
+    public string ItemId => _dataflowId;
     public string DisplayName { get; }
 
     public DataflowRefreshJob(
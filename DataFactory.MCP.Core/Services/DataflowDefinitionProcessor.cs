@@ -206,6 +206,12 @@ public class DataflowDefinitionProcessor : IDataflowDefinitionProcessor
             // Extract destination query name from [DataDestinations] attribute if present
             var referencedDestinationQuery = ExtractDestinationQueryNameFromAttribute(attribute);
 
+            // Updating the code of an already registered query leaves its metadata as it is
+            if (referencedDestinationQuery == null && IsQueryRegistered(metadata, queryName))
+            {
+                return definition;
+            }
+
             var updatedMetadata = CreateUpdatedQueryMetadataWithQuery(metadata, queryName, referencedDestinationQuery);
 
             var updatedMetadataJson = JsonSerializer.Serialize(updatedMetadata, JsonSerializerOptionsProvider.Indented);
@@ -216,6 +222,18 @@ public class DataflowDefinitionProcessor : IDataflowDefinitionProcessor
         return definition;
     }
 
+    /// <summary>
+    /// Whether queryMetadata.json already holds everything AddOrUpdateQueryInDefinition would add for the query.
+    /// </summary>
+    private static bool IsQueryRegistered(JsonElement metadata, string queryName) =>
+        metadata.ValueKind == JsonValueKind.Object &&
+        metadata.TryGetProperty("documentLocale", out _) &&
+        metadata.TryGetProperty("queriesMetadata", out var queries) &&
+        queries.ValueKind == JsonValueKind.Object &&
+        queries.TryGetProperty(queryName, out var entry) &&
+        entry.ValueKind == JsonValueKind.Object &&
+        entry.TryGetProperty("loadEnabled", out _);
+
     /// <summary>
     /// Extracts the destination query name from a [DataDestinations] attribute.
     /// Example: [DataDestinations = {[Definition = [Kind = "Reference", QueryName = "Customers_DataDestination", ...]]}]
@@ -241,103 +259,17 @@ public class DataflowDefinitionProcessor : IDataflowDefinitionProcessor
         var normalizedQueryName = NormalizeQueryName(queryName);
         var sharedDeclaration = $"shared {normalizedQueryName} =";
 
-        // Check if query already exists - also check for attribute prefix
-        var lines = currentMashup.Split(new[] { "\r\n", "\n" }, StringSplitOptions.None).ToList();
-        var queryStartIndex = -1;
-        var queryEndIndex = -1;
-
-        for (int i = 0; i < lines.Count; i++)
-        {
-            var trimmedLine = lines[i].TrimStart();
-
-            // Check if this line contains the shared declaration directly
-            if (trimmedLine.StartsWith(sharedDeclaration, StringComparison.OrdinalIgnoreCase))
-            {
-                // Look back to see if there's an attribute on a previous line
-                queryStartIndex = i;
-                for (int k = i - 1; k >= 0; k--)
-                {
-                    var prevTrimmed = lines[k].TrimStart();
-                    // If we hit another shared declaration or section, stop looking back
-                    if (prevTrimmed.StartsWith("shared ", StringComparison.OrdinalIgnoreCase) ||
-                        prevTrimmed.StartsWith("section ", StringComparison.OrdinalIgnoreCase) ||
-                        string.IsNullOrWhiteSpace(prevTrimmed))
-                    {
-                        break;
-                    }
-                    // If we find an attribute (starts with [ and not [StagingDefinition), include it
-                    if (prevTrimmed.StartsWith("[") && !prevTrimmed.StartsWith("[StagingDefinition", StringComparison.OrdinalIgnoreCase))
-                    {
-                        queryStartIndex = k;
-                        // Continue looking back in case of multi-line attributes
-                    }
-                    // Also handle continuation lines of multi-line attributes (lines that don't start with [ or shared)
-                    else if (prevTrimmed.Contains("]]]}]") || prevTrimmed.Contains("]]") ||
-                             prevTrimmed.StartsWith("Settings") || prevTrimmed.StartsWith("Definition"))
-                    {
-                        queryStartIndex = k;
-                    }
-                }
-
-                // Find the end of this query (next attribute/shared or end of file)
-                for (int j = i + 1; j < lines.Count; j++)
-                {
-                    var nextTrimmed = lines[j].TrimStart();
-                    if (nextTrimmed.StartsWith("shared ", StringComparison.OrdinalIgnoreCase) ||
-                        (nextTrimmed.StartsWith("[") && !nextTrimmed.StartsWith("[StagingDefinition", StringComparison.OrdinalIgnoreCase)))
-                    {
-                        queryEndIndex = j - 1;
-                        break;
-                    }
-                }
-                if (queryEndIndex == -1) queryEndIndex = lines.Count - 1;
-                break;
-            }
-
-            // Also check if this line starts an attribute and a subsequent line has the shared declaration
-            // (to handle multi-line attributes where shared is not on line i+1)
-            if (trimmedLine.StartsWith("[") && !trimmedLine.StartsWith("[StagingDefinition", StringComparison.OrdinalIgnoreCase))
-            {
-                // Look ahead for the shared declaration (up to 10 lines for multi-line attributes)
-                for (int lookAhead = 1; lookAhead <= 10 && i + lookAhead < lines.Count; lookAhead++)
-                {
-                    var aheadTrimmed = lines[i + lookAhead].TrimStart();
-                    if (aheadTrimmed.StartsWith(sharedDeclaration, StringComparison.OrdinalIgnoreCase))
-                    {
-                        queryStartIndex = i;
-
-                        // Find the end of this query
-                        for (int j = i + lookAhead + 1; j < lines.Count; j++)
-                        {
-                            var nextTrimmed = lines[j].TrimStart();
-                            if (nextTrimmed.StartsWith("shared ", StringComparison.OrdinalIgnoreCase) ||
-                                (nextTrimmed.StartsWith("[") && !nextTrimmed.StartsWith("[StagingDefinition", StringComparison.OrdinalIgnoreCase)))
-                            {
-                                queryEndIndex = j - 1;
-                                break;
-                            }
-                        }
-                        if (queryEndIndex == -1) queryEndIndex = lines.Count - 1;
-                        break;
-                    }
-                    // If we hit another shared declaration, stop looking
-                    if (aheadTrimmed.StartsWith("shared ", StringComparison.OrdinalIgnoreCase))
-                    {
-                        break;
-                    }
-                }
-                if (queryStartIndex >= 0) break;
-            }
-        }
-
         // Build the new query declaration with attribute
         var newQueryCode = BuildQueryDeclaration(normalizedQueryName, mCode, attribute);
 
-        if (queryStartIndex >= 0)
+        string result;
+        if (FindQueryMember(currentMashup, sharedDeclaration) is { } member)
         {
-            // Replace existing query
-            lines.RemoveRange(queryStartIndex, queryEndIndex - queryStartIndex + 1);
-            lines.Insert(queryStartIndex, newQueryCode);
+            // Replace existing query; the rest of the document is copied through untouched
+            result = string.Concat(
+                currentMashup.AsSpan(0, member.Start),
+                newQueryCode.AsSpan(),
+                currentMashup.AsSpan(member.End));
         }
         else
         {
@@ -350,11 +282,10 @@ public class DataflowDefinitionProcessor : IDataflowDefinitionProcessor
                     : "section Section1;";
                 return $"{sectionDecl}\r\n{newQueryCode}";
             }
-            lines.Add(newQueryCode);
+            result = string.Concat(currentMashup, "\r\n", newQueryCode);
         }
 
         // Handle section-level attribute if provided and not already present
-        var result = string.Join("\r\n", lines);
         if (!string.IsNullOrEmpty(sectionAttribute) && !result.Contains("[StagingDefinition"))
         {
             // Insert section attribute before "section Section1;"
@@ -364,6 +295,102 @@ public class DataflowDefinitionProcessor : IDataflowDefinitionProcessor
         return result;
     }
 
+    /// <summary>
+    /// Locates a shared member, including the attribute lines above it, without splitting the document into lines.
+    /// Returns the character range to replace; the end excludes the line break after the member.
+    /// </summary>
+    private static (int Start, int End)? FindQueryMember(string mashup, string sharedDeclaration)
+    {
+        var declarationLine = FindDeclarationLine(mashup, sharedDeclaration);
+        if (declarationLine < 0)
+            return null;
+
+        // Look back for attribute lines; a line ending in ';' closes the previous member
+        var start = declarationLine;
+        for (var lineStart = PreviousLineStart(mashup, declarationLine); lineStart >= 0; lineStart = PreviousLineStart(mashup, lineStart))
+        {
+            var line = LineAt(mashup, lineStart);
+            var trimmed = line.TrimStart();
+            if (trimmed.IsWhiteSpace() ||
+                trimmed.StartsWith("shared ", StringComparison.OrdinalIgnoreCase) ||
+                trimmed.StartsWith("section ", StringComparison.OrdinalIgnoreCase) ||
+                line.TrimEnd().EndsWith(";"))
+            {
+                break;
+            }
+
+            if (IsMemberAttribute(trimmed) ||
+                trimmed.Contains("]]", StringComparison.Ordinal) ||
+                trimmed.StartsWith("Settings", StringComparison.Ordinal) ||
+                trimmed.StartsWith("Definition", StringComparison.Ordinal))
+            {
+                start = lineStart;
+            }
+        }
+
+        // The member ends before the next shared declaration, or before the next attribute once its ';' was seen
+        var terminated = LineAt(mashup, declarationLine).TrimEnd().EndsWith(";");
+        for (var lineStart = NextLineStart(mashup, declarationLine); lineStart >= 0; lineStart = NextLineStart(mashup, lineStart))
+        {
+            var line = LineAt(mashup, lineStart);
+            var trimmed = line.TrimStart();
+            if (trimmed.StartsWith("shared ", StringComparison.OrdinalIgnoreCase) ||
+                (terminated && IsMemberAttribute(trimmed)))
+            {
+                return (start, LineBreakBefore(mashup, lineStart));
+            }
+
+            if (!trimmed.IsWhiteSpace())
+            {
+                terminated = line.TrimEnd().EndsWith(";");
+            }
+        }
+
+        return (start, mashup.Length);
+    }
+
+    /// <summary>
+    /// Start of the first line whose content begins with the declaration (after indentation), or -1.
+    /// </summary>
+    private static int FindDeclarationLine(string mashup, string sharedDeclaration)
+    {
+        for (var index = mashup.IndexOf(sharedDeclaration, StringComparison.OrdinalIgnoreCase);
+             index >= 0;
+             index = mashup.IndexOf(sharedDeclaration, index + 1, StringComparison.OrdinalIgnoreCase))
+        {
+            var lineStart = index == 0 ? 0 : mashup.LastIndexOf('\n', index - 1) + 1;
+            if (mashup.AsSpan(lineStart, index - lineStart).IsWhiteSpace())
+                return lineStart;
+        }
+
+        return -1;
+    }
+
+    private static bool IsMemberAttribute(ReadOnlySpan<char> trimmedLine) =>
+        trimmedLine.StartsWith("[") && !trimmedLine.StartsWith("[StagingDefinition", StringComparison.OrdinalIgnoreCase);
+
+    /// <summary>
+    /// Line content starting at <paramref name="lineStart"/>, without its "\n" or "\r\n".
+    /// </summary>
+    private static ReadOnlySpan<char> LineAt(string text, int lineStart)
+    {
+        var newline = text.IndexOf('\n', lineStart);
+        var line = text.AsSpan(lineStart, (newline < 0 ? text.Length : newline) - lineStart);
+        return line.EndsWith("\r") ? line[..^1] : line;
+    }
+
+    private static int NextLineStart(string text, int lineStart)
+    {
+        var newline = text.IndexOf('\n', lineStart);
+        return newline < 0 ? -1 : newline + 1;
+    }
+
+    private static int PreviousLineStart(string text, int lineStart) =>
+        lineStart == 0 ? -1 : lineStart == 1 ? 0 : text.LastIndexOf('\n', lineStart - 2) + 1;
+
+    private static int LineBreakBefore(string text, int lineStart) =>
+        lineStart >= 2 && text[lineStart - 2] == '\r' ? lineStart - 2 : lineStart - 1;
+
     private string NormalizeQueryName(string queryName)
     {
         // If query name contains spaces or special characters, wrap in #""
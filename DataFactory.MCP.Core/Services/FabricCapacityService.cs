@@ -11,21 +11,27 @@ namespace DataFactory.MCP.Services;
 /// </summary>
 public class FabricCapacityService : FabricServiceBase, IFabricCapacityService
 {
+    private readonly FabricMetadataCache _metadataCache;
+
     public FabricCapacityService(
         IHttpClientFactory httpClientFactory,
         ILogger<FabricCapacityService> logger,
-        IValidationService validationService)
+        IValidationService validationService,
+        FabricMetadataCache metadataCache)
         : base(httpClientFactory, logger, validationService)
     {
+        _metadataCache = metadataCache;
     }
 
     public async Task<ListCapacitiesResponse> ListCapacitiesAsync(string? continuationToken = null)
     {
         try
         {
-            var capacitiesResponse = await GetAsync<ListCapacitiesResponse>("capacities", continuationToken);
-            Logger.LogInformation("Successfully retrieved {Count} capacities", capacitiesResponse?.Value?.Count ?? 0);
-            return capacitiesResponse ?? new ListCapacitiesResponse();
+            var capacitiesResponse = await _metadataCache.GetOrLoadAsync(
+                FabricMetadataCache.Capacities, continuationToken ?? string.Empty, FabricMetadataCache.DefaultTtl,
+                async () => await GetAsync<ListCapacitiesResponse>("capacities", continuationToken) ?? new ListCapacitiesResponse());
+            Logger.LogInformation("Successfully retrieved {Count} capacities", capacitiesResponse.Value?.Count ?? 0);
+            return capacitiesResponse;
         }
         catch (Exception ex)
         {
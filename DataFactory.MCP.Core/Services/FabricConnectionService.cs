@@ -12,12 +12,16 @@ namespace DataFactory.MCP.Services;
 /// </summary>
 public class FabricConnectionService : FabricServiceBase, IFabricConnectionService
 {
+    private readonly FabricMetadataCache _metadataCache;
+
     public FabricConnectionService(
         IHttpClientFactory httpClientFactory,
         ILogger<FabricConnectionService> logger,
-        IValidationService validationService)
+        IValidationService validationService,
+        FabricMetadataCache metadataCache)
         : base(httpClientFactory, logger, validationService)
     {
+        _metadataCache = metadataCache;
     }
 
     public async Task<ListConnectionsResponse> ListConnectionsAsync(string? continuationToken = null)
@@ -62,6 +66,9 @@ public class FabricConnectionService : FabricServiceBase, IFabricConnectionServi
 
             var connection = await PostAsync<ShareableCloudConnection>("connections", request);
 
+            // Gateway connections change what the gateway serves, and the types offered for it
+            _metadataCache.Invalidate(FabricMetadataCache.ConnectionTypes, FabricMetadataCache.Gateways);
+
             if (connection != null)
             {
                 Logger.LogInformation("Successfully created connection '{DisplayName}' with ID '{Id}'",
@@ -81,29 +88,13 @@ public class FabricConnectionService : FabricServiceBase, IFabricConnectionServi
     {
         try
         {
-            var allValues = new List<ConnectionCreationMetadata>();
-            string? continuationToken = null;
-
-            do
-            {
-                var endpoint = "connections/supportedConnectionTypes";
-                if (!string.IsNullOrWhiteSpace(gatewayId))
-                {
-                    endpoint += $"?gatewayId={Uri.EscapeDataString(gatewayId)}";
-                }
-
-                var page = await GetAsync<ListSupportedConnectionTypesResponse>(endpoint, continuationToken);
-                if (page?.Value != null)
-                {
-                    allValues.AddRange(page.Value);
-                }
-                continuationToken = page?.ContinuationToken;
-            }
-            while (!string.IsNullOrEmpty(continuationToken));
+            var response = await _metadataCache.GetOrLoadAsync(
+                FabricMetadataCache.ConnectionTypes, gatewayId ?? string.Empty, FabricMetadataCache.ConnectionTypesTtl,
+                () => FetchSupportedConnectionTypesAsync(gatewayId));
 
-            Logger.LogInformation("Successfully retrieved {Count} supported connection types", allValues.Count);
+            Logger.LogInformation("Successfully retrieved {Count} supported connection types", response.Value.Count);
 
-            return new ListSupportedConnectionTypesResponse { Value = allValues };
+            return response;
         }
         catch (Exception ex)
         {
@@ -111,4 +102,29 @@ public class FabricConnectionService : FabricServiceBase, IFabricConnectionServi
             throw;
         }
     }
+
+    private async Task<ListSupportedConnectionTypesResponse> FetchSupportedConnectionTypesAsync(string? gatewayId)
+    {
+        var allValues = new List<ConnectionCreationMetadata>();
+        string? continuationToken = null;
+
+        do
+        {
+            var endpoint = "connections/supportedConnectionTypes";
+            if (!string.IsNullOrWhiteSpace(gatewayId))
+            {
+                endpoint += $"?gatewayId={Uri.EscapeDataString(gatewayId)}";
+            }
+
+            var page = await GetAsync<ListSupportedConnectionTypesResponse>(endpoint, continuationToken);
+            if (page?.Value != null)
+            {
+                allValues.AddRange(page.Value);
+            }
+            continuationToken = page?.ContinuationToken;
+        }
+        while (!string.IsNullOrEmpty(continuationToken));
+
+        return new ListSupportedConnectionTypesResponse { Value = allValues };
+    }
 }
\ No newline at end of file
@@ -127,13 +127,7 @@ public class FabricDataflowService : FabricServiceBase, IFabricDataflowService
                 ContentLength = contentLength,
                 Success = true,
                 Summary = summary,
-                Metadata = new Dictionary<string, object>
-                {
-                    { "executedAt", DateTime.UtcNow },
-                    { "workspaceId", workspaceId },
-                    { "dataflowId", dataflowId },
-                    { "queryName", request.QueryName }
-                }
+                Metadata = QueryMetadata(workspaceId, dataflowId, request.QueryName)
             };
         }
         catch (Exception ex)
@@ -150,6 +144,66 @@ public class FabricDataflowService : FabricServiceBase, IFabricDataflowService
         }
     }
 
+    public async Task<ExecuteDataflowQueryResponse> ExecuteQuerySummaryAsync(
+        string workspaceId,
+        string dataflowId,
+        ExecuteDataflowQueryRequest request,
+        int maxSampleRows)
+    {
+        try
+        {
+            ValidateGuids(
+                (workspaceId, nameof(workspaceId)),
+                (dataflowId, nameof(dataflowId)));
+            ValidationService.ValidateAndThrow(request, nameof(request));
+
+            var endpoint = FabricUrlBuilder.ForFabricApi()
+                .WithLiteralPath($"workspaces/{workspaceId}/dataflows/{dataflowId}/executeQuery")
+                .BuildEndpoint();
+
+            Logger.LogInformation("Executing query '{QueryName}' on dataflow {DataflowId} in workspace {WorkspaceId} (summary, {MaxRows} rows)",
+                request.QueryName, dataflowId, workspaceId, maxSampleRows);
+
+            // Stream the body straight into the Arrow reader instead of buffering the whole result
+            using var response = await PostForStreamAsync(endpoint, request);
+            await using var body = new CountingReadStream(await response.Content.ReadAsStreamAsync());
+            var summary = await _arrowDataReaderService.SummarizeArrowStreamAsync(body, maxSampleRows);
+
+            Logger.LogInformation("Successfully executed query '{QueryName}' on dataflow {DataflowId}. Streamed: {ContentLength} bytes",
+                request.QueryName, dataflowId, body.BytesRead);
+
+            return new ExecuteDataflowQueryResponse
+            {
+                Data = null,
+                ContentType = ArrowContentType,
+                ContentLength = body.BytesRead,
+                Success = true,
+                Summary = summary,
+                Metadata = QueryMetadata(workspaceId, dataflowId, request.QueryName)
+            };
+        }
+        catch (Exception ex)
+        {
+            Logger.LogError(ex, "Error executing query '{QueryName}' on dataflow {DataflowId} in workspace {WorkspaceId}",
+                request?.QueryName, dataflowId, workspaceId);
+
+            return new ExecuteDataflowQueryResponse
+            {
+                Success = false,
+                Error = $"Query execution error: {ex.Message}",
+                ContentLength = 0
+            };
+        }
+    }
+
+    private static Dictionary<string, object> QueryMetadata(string workspaceId, string dataflowId, string queryName) => new()
+    {
+        { "executedAt", DateTime.UtcNow },
+        { "workspaceId", workspaceId },
+        { "dataflowId", dataflowId },
+        { "queryName", queryName }
+    };
+
     public async Task<DataflowDefinition> GetDataflowDefinitionAsync(
         string workspaceId,
         string dataflowId)
@@ -12,21 +12,27 @@ namespace DataFactory.MCP.Services;
 /// </summary>
 public class FabricGatewayService : FabricServiceBase, IFabricGatewayService
 {
+    private readonly FabricMetadataCache _metadataCache;
+
     public FabricGatewayService(
         IHttpClientFactory httpClientFactory,
         ILogger<FabricGatewayService> logger,
-        IValidationService validationService)
+        IValidationService validationService,
+        FabricMetadataCache metadataCache)
         : base(httpClientFactory, logger, validationService)
     {
+        _metadataCache = metadataCache;
     }
 
     public async Task<ListGatewaysResponse> ListGatewaysAsync(string? continuationToken = null)
     {
         try
         {
-            var gatewaysResponse = await GetAsync<ListGatewaysResponse>("gateways", continuationToken);
-            Logger.LogInformation("Successfully retrieved {Count} gateways", gatewaysResponse?.Value?.Count ?? 0);
-            return gatewaysResponse ?? new ListGatewaysResponse();
+            var gatewaysResponse = await _metadataCache.GetOrLoadAsync(
+                FabricMetadataCache.Gateways, continuationToken ?? string.Empty, FabricMetadataCache.DefaultTtl,
+                async () => await GetAsync<ListGatewaysResponse>("gateways", continuationToken) ?? new ListGatewaysResponse());
+            Logger.LogInformation("Successfully retrieved {Count} gateways", gatewaysResponse.Value?.Count ?? 0);
+            return gatewaysResponse;
         }
         catch (Exception ex)
         {
@@ -63,6 +69,7 @@ public class FabricGatewayService : FabricServiceBase, IFabricGatewayService
                 request.DisplayName, request.CapacityId);
 
             var response = await PostAsync<CreateVirtualnetworkGatewayResponse>("gateways", request);
+            _metadataCache.Invalidate(FabricMetadataCache.Gateways);
 
             Logger.LogInformation("Successfully created virtual network gateway '{DisplayName}' with ID '{Id}'",
                 response?.DisplayName, response?.Id);
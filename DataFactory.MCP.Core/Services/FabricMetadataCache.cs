@@ -0,0 +1,289 @@
+using System.Collections.Concurrent;
+using System.Text;
+using System.Text.Json;
+using DataFactory.MCP.Abstractions.Interfaces;
+using Microsoft.Extensions.Logging;
+
+namespace DataFactory.MCP.Services;
+
+/// <summary>
+/// In-process cache for read-mostly Fabric lookups (workspaces, capacities, gateways, supported connection types)
+/// that agents repeat many times per session. Entries are scoped to the signed-in tenant and identity, expire
+/// after a per-kind TTL, and the least recently used entry is evicted past <see cref="MaxEntries"/>.
+/// Concurrent misses for the same entry share one upstream request, and write operations invalidate the kinds they change.
+/// Callers share the cached response objects and must not modify them.
+/// </summary>
+public sealed class FabricMetadataCache
+{
+    public const string Workspaces = "workspaces";
+    public const string Capacities = "capacities";
+    public const string Gateways = "gateways";
+    public const string ConnectionTypes = "connectionTypes";
+
+    /// <summary>
+    /// Lifetime of cached workspaces, capacities and gateways, which users can change outside the session.
+    /// </summary>
+    public static readonly TimeSpan DefaultTtl = TimeSpan.FromMinutes(5);
+
+    /// <summary>
+    /// Lifetime of cached supported connection types, which only change when Fabric adds connectors.
+    /// </summary>
+    public static readonly TimeSpan ConnectionTypesTtl = TimeSpan.FromMinutes(30);
+
+    /// <summary>
+    /// Entries kept across all tenants (each entry is one response page).
+    /// </summary>
+    public const int MaxEntries = 256;
+
+    private readonly ConcurrentDictionary<string, CachedEntry> _entries = new();
+    private readonly ConcurrentDictionary<string, Lazy<Task<object>>> _inFlight = new();
+    private readonly IAuthenticationService _authService;
+    private readonly ILogger<FabricMetadataCache> _logger;
+    private readonly TimeProvider _timeProvider;
+    private readonly bool _enabled;
+    private ScopeForToken? _lastScope;
+    private long _generation;
+    private long _hits;
+    private long _misses;
+    private long _sharedWaits;
+    private long _evictions;
+    private long _invalidations;
+
+    public FabricMetadataCache(IAuthenticationService authService, ILogger<FabricMetadataCache> logger)
+        : this(authService, logger, TimeProvider.System, enabled: true)
+    {
+    }
+
+    /// <summary>
+    /// A cache that reads the time from <paramref name="timeProvider"/> (for tests).
+    /// </summary>
+    internal FabricMetadataCache(IAuthenticationService authService, ILogger<FabricMetadataCache> logger, TimeProvider timeProvider)
+        : this(authService, logger, timeProvider, enabled: true)
+    {
+    }
+
+    private FabricMetadataCache(IAuthenticationService authService, ILogger<FabricMetadataCache> logger, TimeProvider timeProvider, bool enabled)
+    {
+        _authService = authService;
+        _logger = logger;
+        _timeProvider = timeProvider;
+        _enabled = enabled;
+    }
+
+    /// <summary>
+    /// A cache that sends every lookup upstream (baseline for benchmarks).
+    /// </summary>
+    public static FabricMetadataCache CreateDisabled(IAuthenticationService authService, ILogger<FabricMetadataCache> logger)
+        => new(authService, logger, TimeProvider.System, enabled: false);
+
+    /// <summary>Lookups answered from the cache</summary>
+    public long Hits => Interlocked.Read(ref _hits);
+
+    /// <summary>Lookups sent upstream</summary>
+    public long Misses => Interlocked.Read(ref _misses);
+
+    /// <summary>Lookups that joined an upstream request already in flight</summary>
+    public long SharedWaits => Interlocked.Read(ref _sharedWaits);
+
+    /// <summary>Entries dropped to stay within <see cref="MaxEntries"/></summary>
+    public long Evictions => Interlocked.Read(ref _evictions);
+
+    /// <summary>Entries dropped by write operations</summary>
+    public long Invalidations => Interlocked.Read(ref _invalidations);
+
+    /// <summary>Entries currently cached</summary>
+    public int Count => _entries.Count;
+
+    /// <summary>
+    /// Returns the cached response for <paramref name="kind"/> and <paramref name="arguments"/> in the caller's tenant,
+    /// loading it through <paramref name="load"/> when missing or expired. Failed loads are not cached.
+    /// Without a usable access token the lookup goes straight to <paramref name="load"/>, which reports the auth error.
+    /// </summary>
+    public async Task<T> GetOrLoadAsync<T>(string kind, string arguments, TimeSpan ttl, Func<Task<T>> load)
+        where T : class
+    {
+        var scope = _enabled ? await GetScopeAsync() : null;
+        if (scope == null)
+        {
+            Interlocked.Increment(ref _misses);
+            return await load();
+        }
+
+        var key = $"{kind}|{scope}|{arguments}";
+        var now = _timeProvider.GetUtcNow();
+        if (_entries.TryGetValue(key, out var cached) && now < cached.ExpiresAt)
+        {
+            Interlocked.Increment(ref _hits);
+            cached.Touch(now);
+            return (T)cached.Value;
+        }
+
+        return (T)await LoadOnceAsync(key, ttl, async () => await load());
+    }
+
+    /// <summary>
+    /// Drops every cached entry of the given kinds, in all tenants. Called after writes that change them.
+    /// </summary>
+    public void Invalidate(params string[] kinds)
+    {
+        Interlocked.Increment(ref _generation);
+        var removed = 0;
+        foreach (var key in _entries.Keys)
+        {
+            if (kinds.Any(kind => key.StartsWith(kind + "|", StringComparison.Ordinal)) && _entries.TryRemove(key, out _))
+            {
+                removed++;
+            }
+        }
+
+        Interlocked.Add(ref _invalidations, removed);
+        _logger.LogDebug("Invalidated {Count} cached {Kinds} entries", removed, string.Join(", ", kinds));
+    }
+
+    private Task<object> LoadOnceAsync(string key, TimeSpan ttl, Func<Task<object>> load)
+    {
+        Lazy<Task<object>>? created = null;
+        created = new Lazy<Task<object>>(() => LoadAndStoreAsync(key, ttl, load, created!));
+        var flight = _inFlight.GetOrAdd(key, created);
+
+        if (ReferenceEquals(flight, created))
+        {
+            Interlocked.Increment(ref _misses);
+        }
+        else
+        {
+            Interlocked.Increment(ref _sharedWaits);
+        }
+        return flight.Value;
+    }
+
+    private async Task<object> LoadAndStoreAsync(string key, TimeSpan ttl, Func<Task<object>> load, Lazy<Task<object>> flight)
+    {
+        try
+        {
+            var generation = Interlocked.Read(ref _generation);
+            var value = await load();
+
+            // A write that finished while this load was in flight may have changed the response; serve it once, don't keep it
+            if (generation == Interlocked.Read(ref _generation))
+            {
+                var now = _timeProvider.GetUtcNow();
+                _entries[key] = new CachedEntry(value, now + ttl, now);
+                EvictOverflow();
+                _logger.LogDebug("Cached {Key} for {Ttl} ({Misses} misses, {Hits} hits)", key, ttl, Misses, Hits);
+            }
+
+            return value;
+        }
+        finally
+        {
+            _inFlight.TryRemove(new KeyValuePair<string, Lazy<Task<object>>>(key, flight));
+        }
+    }
+
+    private void EvictOverflow()
+    {
+        if (_entries.Count <= MaxEntries)
+        {
+            return;
+        }
+
+        // Expired entries go first, then the least recently used
+        var now = _timeProvider.GetUtcNow();
+        var victims = _entries
+            .OrderBy(e => e.Value.ExpiresAt > now)
+            .ThenBy(e => e.Value.LastUsed)
+            .Take(_entries.Count - MaxEntries)
+            .Select(e => e.Key)
+            .ToList();
+
+        foreach (var key in victims)
+        {
+            if (_entries.TryRemove(key, out _))
+            {
+                Interlocked.Increment(ref _evictions);
+            }
+        }
+    }
+
+    /// <summary>
+    /// The tenant and identity the current access token was issued for ("tid" and "oid", or "sub" when there is no oid).
+    /// Listings are filtered by the caller's permissions, so entries are never shared between identities.
+    /// </summary>
+    private async Task<string?> GetScopeAsync()
+    {
+        string token;
+        try
+        {
+            token = await _authService.GetAccessTokenAsync();
+        }
+        catch (Exception ex)
+        {
+            _logger.LogDebug(ex, "No access token for the metadata cache scope; bypassing the cache");
+            return null;
+        }
+
+        var last = _lastScope;
+        if (last != null && string.Equals(last.Token, token, StringComparison.Ordinal))
+        {
+            return last.Scope;
+        }
+
+        var scope = ReadScope(token);
+        _lastScope = new ScopeForToken(token, scope);
+        return scope;
+    }
+
+    private static string? ReadScope(string token)
+    {
+        var parts = token.Split('.');
+        if (parts.Length < 2 || !token.StartsWith("eyJ", StringComparison.Ordinal))
+        {
+            return null;
+        }
+
+        try
+        {
+            var payload = parts[1].Replace('-', '+').Replace('_', '/');
+            payload = payload.PadRight(payload.Length + (4 - payload.Length % 4) % 4, '=');
+            using var claims = JsonDocument.Parse(Encoding.UTF8.GetString(Convert.FromBase64String(payload)));
+
+            var tenant = ReadClaim(claims.RootElement, "tid");
+            var identity = ReadClaim(claims.RootElement, "oid") ?? ReadClaim(claims.RootElement, "sub");
+            return identity == null ? null : $"{tenant}/{identity}";
+        }
+        catch (Exception ex) when (ex is FormatException or JsonException)
+        {
+            return null;
+        }
+    }
+
+    private static string? ReadClaim(JsonElement claims, string name)
+        => claims.ValueKind == JsonValueKind.Object
+           && claims.TryGetProperty(name, out var value)
+           && value.ValueKind == JsonValueKind.String
+            ? value.GetString()
+            : null;
+
+    private sealed record ScopeForToken(string Token, string? Scope);
+
+    private sealed class CachedEntry
+    {
+        private long _lastUsed;
+
+        public CachedEntry(object value, DateTimeOffset expiresAt, DateTimeOffset storedAt)
+        {
+            Value = value;
+            ExpiresAt = expiresAt;
+            _lastUsed = storedAt.UtcTicks;
+        }
+
+        public object Value { get; }
+
+        public DateTimeOffset ExpiresAt { get; }
+
+        public long LastUsed => Interlocked.Read(ref _lastUsed);
+
+        public void Touch(DateTimeOffset now) => Interlocked.Exchange(ref _lastUsed, now.UtcTicks);
+    }
+}
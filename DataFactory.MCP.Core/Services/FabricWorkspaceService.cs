@@ -13,12 +13,16 @@ namespace DataFactory.MCP.Services;
 /// </summary>
 public class FabricWorkspaceService : FabricServiceBase, IFabricWorkspaceService
 {
+    private readonly FabricMetadataCache _metadataCache;
+
     public FabricWorkspaceService(
         IHttpClientFactory httpClientFactory,
         ILogger<FabricWorkspaceService> logger,
-        IValidationService validationService)
+        IValidationService validationService,
+        FabricMetadataCache metadataCache)
         : base(httpClientFactory, logger, validationService)
     {
+        _metadataCache = metadataCache;
     }
 
     public async Task<ListWorkspacesResponse> ListWorkspacesAsync(
@@ -35,13 +39,19 @@ public class FabricWorkspaceService : FabricServiceBase, IFabricWorkspaceService
                 .WithQueryParam("preferWorkspaceSpecificEndpoints", preferWorkspaceSpecificEndpoints)
                 .Build();
 
-            Logger.LogInformation("Fetching workspaces from: {Url}", url);
+            // The request URL carries every argument, so it keys the cache entry
+            var workspacesResponse = await _metadataCache.GetOrLoadAsync(
+                FabricMetadataCache.Workspaces, url, FabricMetadataCache.DefaultTtl,
+                async () =>
+                {
+                    Logger.LogInformation("Fetching workspaces from: {Url}", url);
 
-            var response = await HttpClient.GetAsync(url);
-            var workspacesResponse = await response.ReadAsJsonAsync<ListWorkspacesResponse>(JsonOptions);
+                    var response = await HttpClient.GetAsync(url);
+                    return await response.ReadAsJsonAsync<ListWorkspacesResponse>(JsonOptions) ?? new ListWorkspacesResponse();
+                });
 
-            Logger.LogInformation("Successfully retrieved {Count} workspaces", workspacesResponse?.Value?.Count ?? 0);
-            return workspacesResponse ?? new ListWorkspacesResponse();
+            Logger.LogInformation("Successfully retrieved {Count} workspaces", workspacesResponse.Value?.Count ?? 0);
+            return workspacesResponse;
         }
         catch (Exception ex)
         {
@@ -7,7 +7,7 @@ namespace DataFactory.MCP.Services;
 
 /// <summary>
 /// User notification service that sends notifications via MCP protocol.
-/// Uses the session accessor to get the current session.
+/// Uses the session accessor to get the current session (set per notification by <see cref="Notifications.NotificationQueue"/>).
 /// Best for HTTP mode where OS toasts aren't available.
 /// </summary>
 public class McpUserNotificationService : IUserNotificationService
@@ -5,15 +5,19 @@ using Microsoft.Extensions.Logging;
 namespace DataFactory.MCP.Services.Notifications;
 
 /// <summary>
-/// Processes notifications sequentially with spacing to prevent overlap.
-/// 
+/// Processes notifications in batches, coalescing each batch per session, so a burst of job
+/// completions turns into one notification per session instead of a long drip of them.
+///
 /// <para><b>Why a queue?</b></para>
 /// <para>
 /// When multiple background jobs complete around the same time, their notifications
-/// would overlap if shown simultaneously. This queue ensures notifications are
-/// displayed one at a time with a configurable delay between them.
+/// would overlap if shown simultaneously. This queue collects them into a batch and
+/// shows one notification per session for the batch ("3 background jobs finished"),
+/// keeping the notification service's spacing between batches rather than between
+/// individual notifications. With a fixed spacing per notification, a burst of N
+/// completions took 3·(N−1) seconds to drain and kept every later notification waiting.
 /// </para>
-/// 
+///
 /// <para><b>Why System.Threading.Channels?</b></para>
 /// <para>
 /// Channel provides a thread-safe async producer/consumer queue in a single API.
@@ -22,48 +26,74 @@ namespace DataFactory.MCP.Services.Notifications;
 /// Channel combines both: thread-safe writes AND efficient async waiting.
 /// </para>
 /// <para>
-/// Key benefit: The consumer uses <c>ReadAllAsync()</c> which sleeps when empty
+/// Key benefit: The consumer uses <c>WaitToReadAsync()</c> which sleeps when empty
 /// and wakes automatically when items are added - no polling, no busy loops.
 /// </para>
-/// 
+///
 /// <para><b>Architecture:</b></para>
 /// <list type="bullet">
 ///   <item>Uses System.Threading.Channels for efficient async producer/consumer pattern</item>
-///   <item>Single background task processes notifications sequentially</item>
+///   <item>Single background task drains the channel in batches of up to <see cref="MaxBatchSize"/></item>
+///   <item>Each batch is grouped by session; groups are delivered concurrently, each in its own session</item>
 ///   <item>Thread-safe: multiple producers can enqueue concurrently</item>
 ///   <item>Graceful shutdown: completes pending notifications before disposing</item>
 /// </list>
-/// 
+///
 /// <para><b>Flow:</b></para>
 /// <code>
 /// Producer(s)                    Consumer (single)
 ///     │                              │
 ///     ├── Enqueue(notification) ───► Channel ───► ProcessNotificationsAsync()
 ///     │                              │                    │
-///     │                              │             Show notification
+///     │                              │             Others pending? Wait for the rest of the burst (250 ms)
 ///     │                              │                    │
-///     │                              │             Wait 3 seconds
+///     │                              │             Take a batch, group it by session
 ///     │                              │                    │
-///     │                              │             Next notification...
+///     │                              │             One notification per session, in parallel
+///     │                              │                    │
+///     │                              │             Wait the service's spacing (if more pending)
+///     │                              │                    │
+///     │                              │             Next batch...
 /// </code>
 /// </summary>
 public class NotificationQueue : INotificationQueue, IDisposable
 {
     /// <summary>
-    /// Delay between showing consecutive notifications.
-    /// Prevents overlap when multiple jobs complete close together.
+    /// Most notifications taken from the channel in one batch.
+    /// </summary>
+    public const int MaxBatchSize = 100;
+
+    /// <summary>
+    /// Lines listed in a coalesced notification before the rest are summarized as "... and N more".
+    /// </summary>
+    public const int MaxCoalescedLines = 10;
+
+    /// <summary>
+    /// Sessions notified at the same time while delivering a batch.
+    /// </summary>
+    private const int MaxConcurrentDeliveries = 16;
+
+    /// <summary>
+    /// How long to wait after the first notification of a batch for the rest of a burst, when others are already pending.
+    /// The job monitor completes the jobs of one poll tick within a few hundred milliseconds.
+    /// </summary>
+    private static readonly TimeSpan BatchWindow = TimeSpan.FromMilliseconds(250);
+
+    /// <summary>
+    /// A session that doesn't take its notification within this time is skipped,
+    /// so one stalled client can't hold up the rest of the batch.
     /// </summary>
-    private static readonly TimeSpan NotificationSpacing = TimeSpan.FromSeconds(3);
+    private static readonly TimeSpan DefaultDeliveryTimeout = TimeSpan.FromSeconds(10);
 
     /// <summary>
     /// The Channel - a thread-safe async producer/consumer queue.
-    /// 
+    ///
     /// Why Channel instead of a simple Queue or List?
     /// - Thread-safe writes without explicit locking
-    /// - Built-in async waiting (ReadAllAsync sleeps when empty, wakes on item added)
+    /// - Built-in async waiting (WaitToReadAsync sleeps when empty, wakes on item added)
     /// - No busy loops or polling needed
     /// - Combines queue + signaling in one clean API
-    /// 
+    ///
     /// Unbounded because notifications are lightweight and we don't want to block producers.
     /// </summary>
     private readonly Channel<QueuedNotification> _channel;
@@ -73,8 +103,20 @@ public class NotificationQueue : INotificationQueue, IDisposable
     /// </summary>
     private readonly IUserNotificationService _notificationService;
 
+    /// <summary>
+    /// Session accessor the notification service reads; set to each notification's session while it is delivered.
+    /// </summary>
+    private readonly IMcpSessionAccessor _sessionAccessor;
+
     private readonly ILogger<NotificationQueue> _logger;
 
+    private readonly TimeSpan _deliveryTimeout;
+
+    /// <summary>
+    /// Caps concurrent deliveries within a batch.
+    /// </summary>
+    private readonly SemaphoreSlim _deliveryLimiter = new(MaxConcurrentDeliveries, MaxConcurrentDeliveries);
+
     /// <summary>
     /// Background task that processes the queue.
     /// Started in constructor, runs until disposal.
@@ -94,10 +136,25 @@ public class NotificationQueue : INotificationQueue, IDisposable
 
     public NotificationQueue(
         IUserNotificationService notificationService,
+        IMcpSessionAccessor sessionAccessor,
         ILogger<NotificationQueue> logger)
+        : this(notificationService, sessionAccessor, logger, DefaultDeliveryTimeout)
+    {
+    }
+
+    /// <summary>
+    /// A queue that skips a session after <paramref name="deliveryTimeout"/> (for tests).
+    /// </summary>
+    internal NotificationQueue(
+        IUserNotificationService notificationService,
+        IMcpSessionAccessor sessionAccessor,
+        ILogger<NotificationQueue> logger,
+        TimeSpan deliveryTimeout)
     {
         _notificationService = notificationService;
+        _sessionAccessor = sessionAccessor;
         _logger = logger;
+        _deliveryTimeout = deliveryTimeout;
 
         // Create unbounded channel with performance hints:
         // - SingleReader: true - Only one consumer (our processor task), enables optimizations
@@ -109,10 +166,10 @@ public class NotificationQueue : INotificationQueue, IDisposable
         });
 
         // Start the background processor immediately.
-        // It uses ReadAllAsync which is event-driven:
+        // It uses WaitToReadAsync which is event-driven:
         // - Sleeps when queue is empty (no CPU usage)
         // - Wakes automatically when TryWrite adds an item
-        // - Completes when Writer.Complete() is called
+        // - Returns false when Writer.Complete() is called and the queue is drained
         _processingTask = ProcessNotificationsAsync(_cts.Token);
     }
 
@@ -146,54 +203,62 @@ public class NotificationQueue : INotificationQueue, IDisposable
     public int PendingCount => _pendingCount;
 
     /// <summary>
-    /// Background processor that reads from the channel and shows notifications.
-    /// 
-    /// Uses <c>ReadAllAsync</c> which is the magic of Channel:
+    /// Background processor that reads batches from the channel and shows them.
+    ///
+    /// Uses <c>WaitToReadAsync</c> + <c>TryRead</c> instead of <c>ReadAllAsync</c>
+    /// so everything that arrived together is taken at once:
     /// - When queue is empty: awaits internally (no CPU usage, no polling)
-    /// - When item is added: wakes up immediately to process it
-    /// - When channel is completed: exits the foreach cleanly
-    /// 
-    /// This is more efficient than polling with Task.Delay because it's event-driven.
+    /// - When item is added: wakes up, lets the burst arrive if others are pending, then drains up to a batch
+    /// - When channel is completed: WaitToReadAsync returns false and the loop exits
     /// </summary>
     private async Task ProcessNotificationsAsync(CancellationToken cancellationToken)
     {
         _logger.LogDebug("Notification queue processor started");
 
+        var batch = new List<QueuedNotification>(MaxBatchSize);
+
         try
         {
-            // ReadAllAsync is the key Channel feature:
-            // - Yields items as they become available
-            // - Awaits efficiently when queue is empty (no busy loop!)
-            // - Completes when _channel.Writer.Complete() is called
-            await foreach (var notification in _channel.Reader.ReadAllAsync(cancellationToken))
+            while (await _channel.Reader.WaitToReadAsync(cancellationToken))
             {
+                // A lone notification goes out at once. When others are already waiting, a completion burst
+                // is arriving over a few hundred milliseconds; wait for the rest of it unless a full batch is waiting
+                var pending = Volatile.Read(ref _pendingCount);
+                if (pending > 1 && pending < MaxBatchSize)
+                {
+                    await Task.Delay(BatchWindow, cancellationToken);
+                }
+
+                while (batch.Count < MaxBatchSize && _channel.Reader.TryRead(out var notification))
+                {
+                    batch.Add(notification);
+                }
+
                 try
                 {
-                    _logger.LogDebug("Processing notification: {Title}", notification.Title);
-
-                    // Delegate to platform-specific notification service
-                    await _notificationService.NotifyAsync(
-                        notification.Title,
-                        notification.Message,
-                        notification.Level);
-
-                    // Decrement AFTER showing (notification is no longer pending)
-                    Interlocked.Decrement(ref _pendingCount);
-
-                    // Add spacing delay if more notifications are waiting
-                    // This prevents overlapping toast notifications
-                    if (_pendingCount > 0)
-                    {
-                        _logger.LogDebug("Waiting {Spacing} before next notification, {Count} pending",
-                            NotificationSpacing, _pendingCount);
-                        await Task.Delay(NotificationSpacing, cancellationToken);
-                    }
+                    _logger.LogDebug("Processing {Count} notification(s)", batch.Count);
+                    await DeliverBatchAsync(batch, cancellationToken);
                 }
                 catch (Exception ex) when (ex is not OperationCanceledException)
                 {
-                    // Don't let one failed notification stop the processor
-                    _logger.LogWarning(ex, "Failed to show notification: {Title}", notification.Title);
-                    Interlocked.Decrement(ref _pendingCount);
+                    // Don't let one failed batch stop the processor
+                    _logger.LogWarning(ex, "Failed to show {Count} notification(s)", batch.Count);
+                }
+                finally
+                {
+                    // Decrement AFTER showing (the batch is no longer pending)
+                    Interlocked.Add(ref _pendingCount, -batch.Count);
+                    batch.Clear();
+                }
+
+                // Add spacing delay if more notifications are waiting and the service needs it
+                // This prevents overlapping toast notifications
+                var spacing = _notificationService.NotificationSpacing;
+                if (spacing > TimeSpan.Zero && _pendingCount > 0)
+                {
+                    _logger.LogDebug("Waiting {Spacing} before next batch, {Count} pending",
+                        spacing, _pendingCount);
+                    await Task.Delay(spacing, cancellationToken);
                 }
             }
         }
@@ -207,6 +272,83 @@ public class NotificationQueue : INotificationQueue, IDisposable
         }
     }
 
+    /// <summary>
+    /// Shows one notification per session in the batch, sessions in parallel.
+    /// </summary>
+    private Task DeliverBatchAsync(List<QueuedNotification> batch, CancellationToken cancellationToken)
+    {
+        var deliveries = batch
+            .GroupBy(notification => notification.Session)
+            .Select(group => DeliverAsync(Coalesce(group.ToList()), cancellationToken));
+
+        return Task.WhenAll(deliveries);
+    }
+
+    private async Task DeliverAsync(QueuedNotification notification, CancellationToken cancellationToken)
+    {
+        await _deliveryLimiter.WaitAsync(cancellationToken);
+        try
+        {
+            // The session accessor is AsyncLocal: setting it here only affects this delivery
+            _sessionAccessor.CurrentSession = notification.Session;
+
+            // Delegate to platform-specific notification service
+            await _notificationService
+                .NotifyAsync(notification.Title, notification.Message, notification.Level)
+                .WaitAsync(_deliveryTimeout, cancellationToken);
+        }
+        catch (TimeoutException)
+        {
+            _logger.LogWarning("Notification not delivered within {Timeout}: {Title}",
+                _deliveryTimeout, notification.Title);
+        }
+        catch (Exception ex) when (ex is not OperationCanceledException)
+        {
+            _logger.LogWarning(ex, "Failed to show notification: {Title}", notification.Title);
+        }
+        finally
+        {
+            _deliveryLimiter.Release();
+        }
+    }
+
+    /// <summary>
+    /// Merges the notifications of one session into one.
+    /// The merged notification lists up to <see cref="MaxCoalescedLines"/> "Title: Message" lines,
+    /// most severe first, and takes the most severe level.
+    /// </summary>
+    /// <param name="notifications">Notifications for the same session, in queue order</param>
+    /// <returns>The single notification, or a merged one</returns>
+    public static QueuedNotification Coalesce(IReadOnlyList<QueuedNotification> notifications)
+    {
+        if (notifications.Count == 1)
+        {
+            return notifications[0];
+        }
+
+        // NotificationLevel is ordered by severity (Info < Success < Warning < Error); OrderBy is stable
+        var lines = notifications
+            .OrderByDescending(notification => notification.Level)
+            .Take(MaxCoalescedLines)
+            .Select(notification => $"{notification.Title}: {notification.Message}")
+            .ToList();
+
+        var more = notifications.Count - lines.Count;
+        if (more > 0)
+        {
+            lines.Add($"... and {more} more");
+        }
+
+        return new QueuedNotification
+        {
+            Title = $"{notifications.Count} background jobs finished",
+            Message = string.Join("\n", lines),
+            Level = notifications.Max(notification => notification.Level),
+            QueuedAt = notifications[0].QueuedAt,
+            Session = notifications[0].Session
+        };
+    }
+
     /// <summary>
     /// Gracefully shuts down the notification queue.
     /// Signals the channel to complete and waits for pending notifications.
@@ -214,10 +356,10 @@ public class NotificationQueue : INotificationQueue, IDisposable
     public void Dispose()
     {
         // Signal that no more items will be written
-        // This causes ReadAllAsync to complete after processing remaining items
+        // This causes WaitToReadAsync to return false after processing remaining items
         _channel.Writer.TryComplete();
 
-        // Cancel the processor (interrupts any spacing delay)
+        // Cancel the processor (interrupts any batch window or spacing delay)
         _cts.Cancel();
 
         try
@@ -232,5 +374,6 @@ public class NotificationQueue : INotificationQueue, IDisposable
         }
 
         _cts.Dispose();
+        _deliveryLimiter.Dispose();
     }
 }
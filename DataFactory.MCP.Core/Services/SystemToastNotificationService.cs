@@ -30,6 +30,11 @@ public class SystemToastNotificationService : IUserNotificationService
         }
     }
 
+    /// <summary>
+    /// Toasts stay on screen for a few seconds; showing the next one sooner would cover it.
+    /// </summary>
+    public TimeSpan NotificationSpacing => TimeSpan.FromSeconds(3);
+
     public async Task NotifyAsync(string title, string message, NotificationLevel level = NotificationLevel.Info)
     {
         if (_provider == null)
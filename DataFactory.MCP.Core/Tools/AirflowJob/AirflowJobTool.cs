@@ -3,6 +3,7 @@ using System.ComponentModel;
 using System.Text;
 using System.Text.Json;
 using DataFactory.MCP.Abstractions.Interfaces;
+using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Extensions;
 using DataFactory.MCP.Models.AirflowJob;
 using DataFactory.MCP.Models.AirflowJob.Definition;
@@ -18,13 +19,16 @@ public class AirflowJobTool
 {
     private readonly IFabricAirflowJobService _airflowJobService;
     private readonly IValidationService _validationService;
+    private readonly McpResponseFormat _responseFormat;
 
     public AirflowJobTool(
         IFabricAirflowJobService airflowJobService,
-        IValidationService validationService)
+        IValidationService validationService,
+        McpResponseFormat responseFormat)
     {
         _airflowJobService = airflowJobService;
         _validationService = validationService;
+        _responseFormat = responseFormat;
     }
 
     [McpServerTool, Description(@"Returns a list of Apache Airflow Jobs from the specified workspace. This API supports pagination.")]
@@ -53,23 +57,23 @@ public class AirflowJobTool
                 AirflowJobs = response.Value.Select(j => j.ToFormattedInfo())
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("listing Apache Airflow Jobs").ToMcpJson();
+            return ex.ToOperationError("listing Apache Airflow Jobs").ToMcpJson(_responseFormat);
         }
     }
 
@@ -107,23 +111,23 @@ public class AirflowJobTool
                 CreatedAt = DateTime.UtcNow.ToString("yyyy-MM-ddTHH:mm:ssZ")
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("creating Apache Airflow Job").ToMcpJson();
+            return ex.ToOperationError("creating Apache Airflow Job").ToMcpJson(_responseFormat);
         }
     }
 
@@ -139,23 +143,23 @@ public class AirflowJobTool
 
             var airflowJob = await _airflowJobService.GetAirflowJobAsync(workspaceId, airflowJobId);
 
-            return airflowJob.ToFormattedInfo().ToMcpJson();
+            return airflowJob.ToFormattedInfo().ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("getting Apache Airflow Job").ToMcpJson();
+            return ex.ToOperationError("getting Apache Airflow Job").ToMcpJson(_responseFormat);
         }
     }
 
@@ -191,23 +195,23 @@ public class AirflowJobTool
                 AirflowJob = updated.ToFormattedInfo()
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("updating Apache Airflow Job").ToMcpJson();
+            return ex.ToOperationError("updating Apache Airflow Job").ToMcpJson(_responseFormat);
         }
     }
 
@@ -233,23 +237,23 @@ public class AirflowJobTool
                 HardDelete = hardDelete
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("deleting Apache Airflow Job").ToMcpJson();
+            return ex.ToOperationError("deleting Apache Airflow Job").ToMcpJson(_responseFormat);
         }
     }
 
@@ -281,23 +285,23 @@ public class AirflowJobTool
                 })
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("getting Apache Airflow Job definition").ToMcpJson();
+            return ex.ToOperationError("getting Apache Airflow Job definition").ToMcpJson(_responseFormat);
         }
     }
 
@@ -351,23 +355,23 @@ public class AirflowJobTool
                 Message = "Apache Airflow Job definition updated successfully"
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("updating Apache Airflow Job definition").ToMcpJson();
+            return ex.ToOperationError("updating Apache Airflow Job definition").ToMcpJson(_responseFormat);
         }
     }
 
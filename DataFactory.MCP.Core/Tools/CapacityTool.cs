@@ -1,6 +1,7 @@
 using ModelContextProtocol.Server;
 using System.ComponentModel;
 using DataFactory.MCP.Abstractions.Interfaces;
+using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Extensions;
 
 namespace DataFactory.MCP.Tools;
@@ -9,10 +10,12 @@ namespace DataFactory.MCP.Tools;
 public class CapacityTool
 {
     private readonly IFabricCapacityService _capacityService;
+    private readonly McpResponseFormat _responseFormat;
 
-    public CapacityTool(IFabricCapacityService capacityService)
+    public CapacityTool(IFabricCapacityService capacityService, McpResponseFormat responseFormat)
     {
         _capacityService = capacityService;
+        _responseFormat = responseFormat;
     }
 
     [McpServerTool, Description(@"Lists all capacities the user has permission for (either administrator or contributor)")]
@@ -33,22 +36,22 @@ public class CapacityTool
                 TotalCount = response.Value.Count,
                 ContinuationToken = response.ContinuationToken,
                 HasMoreResults = !string.IsNullOrEmpty(response.ContinuationToken),
-                FormattedResults = response.Value.ToFormattedList()
+                FormattedResults = response.Value.ToFormattedList(_responseFormat)
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("listing capacities").ToMcpJson();
+            return ex.ToOperationError("listing capacities").ToMcpJson(_responseFormat);
         }
     }
 }
\ No newline at end of file
@@ -2,6 +2,7 @@ using Microsoft.Extensions.Logging;
 using ModelContextProtocol.Server;
 using System.ComponentModel;
 using DataFactory.MCP.Abstractions.Interfaces;
+using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Extensions;
 using DataFactory.MCP.Models;
 using DataFactory.MCP.Models.Connection;
@@ -14,15 +15,18 @@ public class ConnectionsTool
     private readonly IFabricConnectionService _connectionService;
     private readonly IValidationService _validationService;
     private readonly ILogger<ConnectionsTool> _logger;
+    private readonly McpResponseFormat _responseFormat;
 
     public ConnectionsTool(
         IFabricConnectionService connectionService,
         IValidationService validationService,
-        ILogger<ConnectionsTool> logger)
+        ILogger<ConnectionsTool> logger,
+        McpResponseFormat responseFormat)
     {
         _connectionService = connectionService;
         _validationService = validationService;
         _logger = logger;
+        _responseFormat = responseFormat;
     }
 
     [McpServerTool, Description(@"Lists supported connection types with their creation methods, parameters, and supported credential types. Used to populate the Create Connection form.")]
@@ -35,7 +39,7 @@ public class ConnectionsTool
 
             if (!response.Value.Any())
             {
-                return new { Error = "No supported connection types found." }.ToMcpJson();
+                return new { Error = "No supported connection types found." }.ToMcpJson(_responseFormat);
             }
 
             // Log the first few types to verify casing from the API
@@ -65,19 +69,19 @@ public class ConnectionsTool
                 })
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("listing supported connection types").ToMcpJson();
+            return ex.ToOperationError("listing supported connection types").ToMcpJson(_responseFormat);
         }
     }
 
@@ -102,19 +106,19 @@ public class ConnectionsTool
                 Connections = response.Value.Select(c => c.ToFormattedInfo())
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("listing connections").ToMcpJson();
+            return ex.ToOperationError("listing connections").ToMcpJson(_responseFormat);
         }
     }
 
@@ -130,23 +134,23 @@ public class ConnectionsTool
 
             if (connection == null)
             {
-                return ResponseExtensions.ToNotFoundError("Connection", connectionId).ToMcpJson();
+                return ResponseExtensions.ToNotFoundError("Connection", connectionId).ToMcpJson(_responseFormat);
             }
 
             var result = connection.ToFormattedInfo();
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("retrieving connection").ToMcpJson();
+            return ex.ToOperationError("retrieving connection").ToMcpJson(_responseFormat);
         }
     }
 
@@ -173,7 +177,7 @@ public class ConnectionsTool
             var needsGateway = connectivityType is "OnPremisesGateway" or "VirtualNetworkGateway";
             if (needsGateway && string.IsNullOrWhiteSpace(gatewayId))
             {
-                return new { Error = "gatewayId is required for OnPremisesGateway and VirtualNetworkGateway connectivity types" }.ToMcpJson();
+                return new { Error = "gatewayId is required for OnPremisesGateway and VirtualNetworkGateway connectivity types" }.ToMcpJson(_responseFormat);
             }
 
             // Build connection parameters from JSON
@@ -235,7 +239,7 @@ public class ConnectionsTool
 
             if (connection == null)
             {
-                return new { Error = "Failed to create connection. The API returned no response." }.ToMcpJson();
+                return new { Error = "Failed to create connection. The API returned no response." }.ToMcpJson(_responseFormat);
             }
 
             var result = new
@@ -244,23 +248,23 @@ public class ConnectionsTool
                 Connection = connection.ToFormattedInfo()
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("creating connection").ToMcpJson();
+            return ex.ToOperationError("creating connection").ToMcpJson(_responseFormat);
         }
     }
 }
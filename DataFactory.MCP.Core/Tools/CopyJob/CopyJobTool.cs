@@ -3,6 +3,7 @@ using System.ComponentModel;
 using System.Text;
 using System.Text.Json;
 using DataFactory.MCP.Abstractions.Interfaces;
+using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Extensions;
 using DataFactory.MCP.Models.CopyJob;
 using DataFactory.MCP.Models.CopyJob.Definition;
@@ -19,13 +20,16 @@ public class CopyJobTool
 {
     private readonly IFabricCopyJobService _copyJobService;
     private readonly IValidationService _validationService;
+    private readonly McpResponseFormat _responseFormat;
 
     public CopyJobTool(
         IFabricCopyJobService copyJobService,
-        IValidationService validationService)
+        IValidationService validationService,
+        McpResponseFormat responseFormat)
     {
         _copyJobService = copyJobService;
         _validationService = validationService;
+        _responseFormat = responseFormat;
     }
 
     [McpServerTool, Description(@"Returns a list of Copy Jobs from the specified workspace. This API supports pagination.")]
@@ -54,23 +58,23 @@ public class CopyJobTool
                 CopyJobs = response.Value.Select(c => c.ToFormattedInfo())
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("listing copy jobs").ToMcpJson();
+            return ex.ToOperationError("listing copy jobs").ToMcpJson(_responseFormat);
         }
     }
 
@@ -105,23 +109,23 @@ public class CopyJobTool
                 CreatedAt = DateTime.UtcNow.ToString("yyyy-MM-ddTHH:mm:ssZ")
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("creating copy job").ToMcpJson();
+            return ex.ToOperationError("creating copy job").ToMcpJson(_responseFormat);
         }
     }
 
@@ -137,23 +141,23 @@ public class CopyJobTool
 
             var copyJob = await _copyJobService.GetCopyJobAsync(workspaceId, copyJobId);
 
-            return copyJob.ToFormattedInfo().ToMcpJson();
+            return copyJob.ToFormattedInfo().ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("getting copy job").ToMcpJson();
+            return ex.ToOperationError("getting copy job").ToMcpJson(_responseFormat);
         }
     }
 
@@ -183,23 +187,23 @@ public class CopyJobTool
                 })
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("getting copy job definition").ToMcpJson();
+            return ex.ToOperationError("getting copy job definition").ToMcpJson(_responseFormat);
         }
     }
 
@@ -235,23 +239,23 @@ public class CopyJobTool
                 CopyJob = copyJob.ToFormattedInfo()
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("updating copy job").ToMcpJson();
+            return ex.ToOperationError("updating copy job").ToMcpJson(_responseFormat);
         }
     }
 
@@ -303,23 +307,23 @@ public class CopyJobTool
                 Message = $"Copy job definition updated successfully"
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("updating copy job definition").ToMcpJson();
+            return ex.ToOperationError("updating copy job definition").ToMcpJson(_responseFormat);
         }
     }
 
@@ -368,23 +372,23 @@ public class CopyJobTool
                 Hint = "Use the 'get_copy_job_run_status' MCP tool with the jobInstanceId to check the run status"
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("running copy job").ToMcpJson();
+            return ex.ToOperationError("running copy job").ToMcpJson(_responseFormat);
         }
     }
 
@@ -416,23 +420,23 @@ public class CopyJobTool
                 FailureReason = jobInstance.FailureReason
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("getting copy job run status").ToMcpJson();
+            return ex.ToOperationError("getting copy job run status").ToMcpJson(_responseFormat);
         }
     }
 
@@ -484,23 +488,23 @@ public class CopyJobTool
                 Owner = schedule.Owner
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("creating copy job schedule").ToMcpJson();
+            return ex.ToOperationError("creating copy job schedule").ToMcpJson(_responseFormat);
         }
     }
 
@@ -540,23 +544,23 @@ public class CopyJobTool
                 })
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("listing copy job schedules").ToMcpJson();
+            return ex.ToOperationError("listing copy job schedules").ToMcpJson(_responseFormat);
         }
     }
 
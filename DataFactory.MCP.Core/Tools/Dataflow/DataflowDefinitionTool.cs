@@ -1,6 +1,7 @@
 using ModelContextProtocol.Server;
 using System.ComponentModel;
 using DataFactory.MCP.Abstractions.Interfaces;
+using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Extensions;
 using DataFactory.MCP.Validation;
 using DataFactory.MCP.Parsing;
@@ -18,13 +19,15 @@ public class DataflowDefinitionTool
     private readonly IValidationService _validationService;
     private readonly Validation.MDocumentValidator _validator;
     private readonly Parsing.MDocumentParser _parser;
+    private readonly McpResponseFormat _responseFormat;
 
-    public DataflowDefinitionTool(IFabricDataflowService dataflowService, IValidationService validationService)
+    public DataflowDefinitionTool(IFabricDataflowService dataflowService, IValidationService validationService, McpResponseFormat responseFormat)
     {
         _dataflowService = dataflowService ?? throw new ArgumentNullException(nameof(dataflowService));
         _validationService = validationService ?? throw new ArgumentNullException(nameof(validationService));
         _validator = new Validation.MDocumentValidator();
         _parser = new Parsing.MDocumentParser();
+        _responseFormat = responseFormat ?? throw new ArgumentNullException(nameof(responseFormat));
     }
 
     [McpServerTool(Name = "get_dataflow_definition"), Description(@"Gets the definition of a dataflow with human-readable content (queryMetadata.json, mashup.pq M code, and .platform metadata).")]
@@ -56,23 +59,23 @@ public class DataflowDefinitionTool
                 })
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("getting dataflow definition").ToMcpJson();
+            return ex.ToOperationError("getting dataflow definition").ToMcpJson(_responseFormat);
         }
     }
 
@@ -109,7 +112,7 @@ If validation fails, it returns detailed error information to help fix the docum
                     Warnings = validationResult.Warnings,
                     Suggestions = validationResult.Suggestions,
                     Document = mDocument
-                }.ToMcpJson();
+                }.ToMcpJson(_responseFormat);
             }
 
             // Step 2: Parse queries from the document using the parser service
@@ -122,7 +125,7 @@ If validation fails, it returns detailed error information to help fix the docum
                     Stage = "Parsing",
                     Errors = new[] { "No valid queries found in the document" },
                     Suggestions = new[] { "Ensure queries are declared with 'shared QueryName = ...' syntax" }
-                }.ToMcpJson();
+                }.ToMcpJson(_responseFormat);
             }
 
             // If validate only, return success with parsed info
@@ -138,7 +141,7 @@ If validation fails, it returns detailed error information to help fix the docum
                     QueryCount = queries.Count,
                     Warnings = validationResult.Warnings,
                     Suggestions = validationResult.Suggestions
-                }.ToMcpJson();
+                }.ToMcpJson(_responseFormat);
             }
 
             // Step 3: Sync the entire M document to the dataflow
@@ -162,7 +165,7 @@ If validation fails, it returns detailed error information to help fix the docum
                     TotalQueries = queries.Count,
                     ErrorMessage = result.ErrorMessage,
                     Message = "Failed to save queries to dataflow"
-                }.ToMcpJson();
+                }.ToMcpJson(_responseFormat);
             }
 
             return new
@@ -175,23 +178,23 @@ If validation fails, it returns detailed error information to help fix the docum
                 TotalQueries = queries.Count,
                 SavedQueries = queries.Count,
                 Message = $"Successfully saved all {queries.Count} queries to dataflow"
-            }.ToMcpJson();
+            }.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("saving dataflow definition").ToMcpJson();
+            return ex.ToOperationError("saving dataflow definition").ToMcpJson(_responseFormat);
         }
     }
 }
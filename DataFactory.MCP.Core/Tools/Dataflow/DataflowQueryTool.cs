@@ -1,5 +1,6 @@
 using ModelContextProtocol.Server;
 using System.ComponentModel;
+using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Extensions;
 using DataFactory.MCP.Handlers;
 using DataFactory.MCP.Handlers.Dataflow;
@@ -13,10 +14,12 @@ namespace DataFactory.MCP.Tools.Dataflow;
 public class DataflowQueryTool
 {
     private readonly DataflowQueryHandler _handler;
+    private readonly McpResponseFormat _responseFormat;
 
-    public DataflowQueryTool(DataflowQueryHandler handler)
+    public DataflowQueryTool(DataflowQueryHandler handler, McpResponseFormat responseFormat)
     {
         _handler = handler ?? throw new ArgumentNullException(nameof(handler));
+        _responseFormat = responseFormat ?? throw new ArgumentNullException(nameof(responseFormat));
     }
 
     [McpServerTool, Description(@"Executes a query against a dataflow and returns the complete results (all data) in Apache Arrow format. This allows you to run M (Power Query) language queries against data sources connected through the dataflow and get the full dataset.
@@ -26,13 +29,14 @@ FORMATTING INSTRUCTION: When displaying results to users, please format the 'tab
         [Description("The workspace ID containing the dataflow (required)")] string workspaceId,
         [Description("The dataflow ID to execute the query against (required)")] string dataflowId,
         [Description("The name of the query to execute (required)")] string queryName,
-        [Description("The M (Power Query) language query to execute. Can be either a raw M expression (which will be auto-wrapped) or a complete section document. Results will be returned as structured data - format the table.rows as a markdown table for user display.")] string customMashupDocument)
+        [Description("The M (Power Query) language query to execute. Can be either a raw M expression (which will be auto-wrapped) or a complete section document. Results will be returned as structured data - format the table.rows as a markdown table for user display.")] string customMashupDocument,
+        [Description("Optional. Return only the first N rows plus per-column statistics (null count, min, max, mean) computed over all rows, streaming the result with bounded memory. Use for large results; omit to return the complete results.")] int? maxRows = null)
     {
-        var result = await _handler.ExecuteQueryAsync(workspaceId, dataflowId, queryName, customMashupDocument);
+        var result = await _handler.ExecuteQueryAsync(workspaceId, dataflowId, queryName, customMashupDocument, maxRows);
 
         if (result.IsSuccess)
-            return result.Value!.Data!.ToMcpJson();
+            return result.Value!.Data!.ToMcpJson(_responseFormat);
 
-        return result.ToErrorResponse("executing dataflow query").ToMcpJson();
+        return result.ToErrorResponse("executing dataflow query").ToMcpJson(_responseFormat);
     }
 }
@@ -1,6 +1,7 @@
 using ModelContextProtocol.Server;
 using System.ComponentModel;
 using DataFactory.MCP.Abstractions.Interfaces;
+using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Extensions;
 using DataFactory.MCP.Models.Dataflow.BackgroundTask;
 
@@ -15,13 +16,16 @@ public class DataflowRefreshTool
 {
     private readonly IDataflowRefreshService _dataflowRefreshService;
     private readonly IValidationService _validationService;
+    private readonly McpResponseFormat _responseFormat;
 
     public DataflowRefreshTool(
         IDataflowRefreshService dataflowRefreshService,
-        IValidationService validationService)
+        IValidationService validationService,
+        McpResponseFormat responseFormat)
     {
         _dataflowRefreshService = dataflowRefreshService;
         _validationService = validationService;
+        _responseFormat = responseFormat;
     }
 
     [McpServerTool, Description(@"Start a dataflow refresh in the background. Returns immediately with task info.
@@ -71,23 +75,23 @@ Use this for long-running refresh operations. For quick status checks, use Refre
                       "Use RefreshDataflowStatus to manually check progress if needed."
             };
 
-            return response.ToMcpJson();
+            return response.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("starting dataflow refresh").ToMcpJson();
+            return ex.ToOperationError("starting dataflow refresh").ToMcpJson(_responseFormat);
         }
     }
 
@@ -132,23 +136,23 @@ Returns the current status including whether it's complete and any error informa
                     : $"Refresh still in progress (status: {result.Status})"
             };
 
-            return response.ToMcpJson();
+            return response.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("checking refresh status").ToMcpJson();
+            return ex.ToOperationError("checking refresh status").ToMcpJson(_responseFormat);
         }
     }
 }
@@ -1,6 +1,7 @@
 using ModelContextProtocol.Server;
 using System.ComponentModel;
 using DataFactory.MCP.Abstractions.Interfaces;
+using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Extensions;
 using DataFactory.MCP.Handlers;
 using DataFactory.MCP.Handlers.Dataflow;
@@ -19,17 +20,20 @@ public class DataflowTool
     private readonly IFabricConnectionService _connectionService;
     private readonly IValidationService _validationService;
     private readonly DataflowHandler _dataflowHandler;
+    private readonly McpResponseFormat _responseFormat;
 
     public DataflowTool(
         IFabricDataflowService dataflowService,
         IFabricConnectionService connectionService,
         IValidationService validationService,
-        DataflowHandler dataflowHandler)
+        DataflowHandler dataflowHandler,
+        McpResponseFormat responseFormat)
     {
         _dataflowService = dataflowService;
         _connectionService = connectionService;
         _validationService = validationService;
         _dataflowHandler = dataflowHandler;
+        _responseFormat = responseFormat;
     }
 
     [McpServerTool, Description(@"Returns a list of Dataflows from the specified workspace. This API supports pagination.")]
@@ -46,12 +50,12 @@ public class DataflowTool
                 value.WorkspaceId,
                 value.DataflowCount,
                 value.ContinuationToken,
-                value.ContinuationUri,
+                ContinuationUri = _responseFormat.Verbose(value.ContinuationUri),
                 value.HasMoreResults,
-                Dataflows = value.Dataflows.Select(d => d.ToFormattedInfo())
-            }.ToMcpJson();
+                Dataflows = value.Dataflows.Select(d => d.ToFormattedListItem(_responseFormat))
+            }.ToMcpJson(_responseFormat);
         }
-        return result.ToErrorResponse("listing dataflows").ToMcpJson();
+        return result.ToErrorResponse("listing dataflows").ToMcpJson(_responseFormat);
     }
 
     [McpServerTool, Description(@"Creates a Dataflow in the specified workspace. The workspace must be on a supported Fabric capacity.")]
@@ -76,9 +80,9 @@ public class DataflowTool
                 WorkspaceId = response.WorkspaceId,
                 FolderId = response.FolderId,
                 CreatedAt = DateTime.UtcNow.ToString("yyyy-MM-ddTHH:mm:ssZ")
-            }.ToMcpJson();
+            }.ToMcpJson(_responseFormat);
         }
-        return result.ToErrorResponse("creating dataflow").ToMcpJson();
+        return result.ToErrorResponse("creating dataflow").ToMcpJson(_responseFormat);
     }
 
     [McpServerTool, Description(@"Adds or replaces connections in an existing dataflow, or clears all connections. When clearExisting is true with no connectionIds, all connections are removed. When clearExisting is true with connectionIds, existing connections are replaced. When clearExisting is false (default), connections are appended.")]
@@ -105,7 +109,7 @@ public class DataflowTool
                     WorkspaceId = workspaceId,
                     Message = "At least one connection ID is required when not clearing connections"
                 };
-                return errorResponse.ToMcpJson();
+                return errorResponse.ToMcpJson(_responseFormat);
             }
 
             // Get connection details for all connection IDs
@@ -135,7 +139,7 @@ public class DataflowTool
                     ConnectionIds = notFoundIds,
                     Message = $"Connection(s) not found: {string.Join(", ", notFoundIds)}"
                 };
-                return errorResponse.ToMcpJson();
+                return errorResponse.ToMcpJson(_responseFormat);
             }
 
 
@@ -158,23 +162,23 @@ public class DataflowTool
                     : result.ErrorMessage
             };
 
-            return response.ToMcpJson();
+            return response.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("adding/clearing connection(s) to dataflow").ToMcpJson();
+            return ex.ToOperationError("adding/clearing connection(s) to dataflow").ToMcpJson(_responseFormat);
         }
     }
 
@@ -259,23 +263,23 @@ public class DataflowTool
                     : result.ErrorMessage
             };
 
-            return response.ToMcpJson();
+            return response.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("adding/updating query in dataflow").ToMcpJson();
+            return ex.ToOperationError("adding/updating query in dataflow").ToMcpJson(_responseFormat);
         }
     }
 }
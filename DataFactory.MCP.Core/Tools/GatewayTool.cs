@@ -1,6 +1,7 @@
 using ModelContextProtocol.Server;
 using System.ComponentModel;
 using DataFactory.MCP.Abstractions.Interfaces;
+using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Extensions;
 using DataFactory.MCP.Models;
 using DataFactory.MCP.Models.Gateway;
@@ -12,11 +13,13 @@ public class GatewayTool
 {
     private readonly IFabricGatewayService _gatewayService;
     private readonly IValidationService _validationService;
+    private readonly McpResponseFormat _responseFormat;
 
-    public GatewayTool(IFabricGatewayService gatewayService, IValidationService validationService)
+    public GatewayTool(IFabricGatewayService gatewayService, IValidationService validationService, McpResponseFormat responseFormat)
     {
         _gatewayService = gatewayService;
         _validationService = validationService;
+        _responseFormat = responseFormat;
     }
 
     [McpServerTool, Description(@"Lists all gateways the user has permission for, including on-premises, on-premises (personal mode), and virtual network gateways")]
@@ -37,22 +40,22 @@ public class GatewayTool
                 TotalCount = response.Value.Count,
                 ContinuationToken = response.ContinuationToken,
                 HasMoreResults = !string.IsNullOrEmpty(response.ContinuationToken),
-                Gateways = response.Value.Select(g => g.ToFormattedInfo())
+                Gateways = response.Value.Select(g => g.ToFormattedInfo(_responseFormat))
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("listing gateways").ToMcpJson();
+            return ex.ToOperationError("listing gateways").ToMcpJson(_responseFormat);
         }
     }
 
@@ -68,23 +71,23 @@ public class GatewayTool
 
             if (gateway == null)
             {
-                return ResponseExtensions.ToNotFoundError("Gateway", gatewayId).ToMcpJson();
+                return ResponseExtensions.ToNotFoundError("Gateway", gatewayId).ToMcpJson(_responseFormat);
             }
 
-            var result = gateway.ToFormattedInfo();
-            return result.ToMcpJson();
+            var result = gateway.ToFormattedInfo(_responseFormat);
+            return result.ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("retrieving gateway").ToMcpJson();
+            return ex.ToOperationError("retrieving gateway").ToMcpJson(_responseFormat);
         }
     }
 
@@ -155,19 +158,19 @@ public class GatewayTool
                 }
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError($"creating virtual network gateway '{displayName}'").ToMcpJson();
+            return ex.ToOperationError($"creating virtual network gateway '{displayName}'").ToMcpJson(_responseFormat);
         }
     }
 }
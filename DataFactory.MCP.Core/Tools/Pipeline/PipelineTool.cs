@@ -3,6 +3,7 @@ using System.ComponentModel;
 using System.Text;
 using System.Text.Json;
 using DataFactory.MCP.Abstractions.Interfaces;
+using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Extensions;
 using DataFactory.MCP.Handlers;
 using DataFactory.MCP.Handlers.Pipeline;
@@ -22,15 +23,18 @@ public class PipelineTool
     private readonly IFabricPipelineService _pipelineService;
     private readonly IValidationService _validationService;
     private readonly PipelineHandler _pipelineHandler;
+    private readonly McpResponseFormat _responseFormat;
 
     public PipelineTool(
         IFabricPipelineService pipelineService,
         IValidationService validationService,
-        PipelineHandler pipelineHandler)
+        PipelineHandler pipelineHandler,
+        McpResponseFormat responseFormat)
     {
         _pipelineService = pipelineService;
         _validationService = validationService;
         _pipelineHandler = pipelineHandler;
+        _responseFormat = responseFormat;
     }
 
     [McpServerTool, Description(@"Returns a list of Pipelines from the specified workspace. This API supports pagination.")]
@@ -47,12 +51,12 @@ public class PipelineTool
                 value.WorkspaceId,
                 value.PipelineCount,
                 value.ContinuationToken,
-                value.ContinuationUri,
+                ContinuationUri = _responseFormat.Verbose(value.ContinuationUri),
                 value.HasMoreResults,
-                Pipelines = value.Pipelines.Select(p => p.ToFormattedInfo())
-            }.ToMcpJson();
+                Pipelines = value.Pipelines.Select(p => p.ToFormattedListItem(_responseFormat))
+            }.ToMcpJson(_responseFormat);
         }
-        return result.ToErrorResponse("listing pipelines").ToMcpJson();
+        return result.ToErrorResponse("listing pipelines").ToMcpJson(_responseFormat);
     }
 
     [McpServerTool, Description(@"Creates a Pipeline in the specified workspace.")]
@@ -77,9 +81,9 @@ public class PipelineTool
                 WorkspaceId = response.WorkspaceId,
                 FolderId = response.FolderId,
                 CreatedAt = DateTime.UtcNow.ToString("yyyy-MM-ddTHH:mm:ssZ")
-            }.ToMcpJson();
+            }.ToMcpJson(_responseFormat);
         }
-        return result.ToErrorResponse("creating pipeline").ToMcpJson();
+        return result.ToErrorResponse("creating pipeline").ToMcpJson(_responseFormat);
     }
 
     [McpServerTool, Description(@"Gets the metadata of a Pipeline by ID.")]
@@ -90,9 +94,9 @@ public class PipelineTool
         var result = await _pipelineHandler.GetAsync(workspaceId, pipelineId);
         if (result.IsSuccess)
         {
-            return result.Value!.Pipeline.ToFormattedInfo().ToMcpJson();
+            return result.Value!.Pipeline.ToFormattedInfo().ToMcpJson(_responseFormat);
         }
-        return result.ToErrorResponse("getting pipeline").ToMcpJson();
+        return result.ToErrorResponse("getting pipeline").ToMcpJson(_responseFormat);
     }
 
     [McpServerTool, Description(@"Gets the definition of a Pipeline. The definition contains the pipeline JSON configuration with base64-encoded parts.")]
@@ -121,23 +125,23 @@ public class PipelineTool
                 })
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("getting pipeline definition").ToMcpJson();
+            return ex.ToOperationError("getting pipeline definition").ToMcpJson(_responseFormat);
         }
     }
 
@@ -173,23 +177,23 @@ public class PipelineTool
                 Pipeline = pipeline.ToFormattedInfo()
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("updating pipeline").ToMcpJson();
+            return ex.ToOperationError("updating pipeline").ToMcpJson(_responseFormat);
         }
     }
 
@@ -241,23 +245,23 @@ public class PipelineTool
                 Message = $"Pipeline definition updated successfully"
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("updating pipeline definition").ToMcpJson();
+            return ex.ToOperationError("updating pipeline definition").ToMcpJson(_responseFormat);
         }
     }
 
@@ -277,7 +281,7 @@ public class PipelineTool
             catch (JsonException ex)
             {
                 return ToolResult<object>.Failure($"Invalid executionData JSON format: {ex.Message}", "validation")
-                    .ToErrorResponse("running pipeline").ToMcpJson();
+                    .ToErrorResponse("running pipeline").ToMcpJson(_responseFormat);
             }
         }
 
@@ -294,9 +298,9 @@ public class PipelineTool
                 JobInstanceId = value.JobInstanceId,
                 LocationUrl = value.LocationUrl,
                 Hint = "Use GetPipelineRunStatusAsync with the jobInstanceId to check the run status"
-            }.ToMcpJson();
+            }.ToMcpJson(_responseFormat);
         }
-        return result.ToErrorResponse("running pipeline").ToMcpJson();
+        return result.ToErrorResponse("running pipeline").ToMcpJson(_responseFormat);
     }
 
     [McpServerTool, Description(@"Gets the status of a Pipeline run (job instance). Use the jobInstanceId returned from RunPipelineAsync to check the run status. Possible statuses: NotStarted, InProgress, Completed, Failed, Cancelled, Deduped.")]
@@ -327,23 +331,23 @@ public class PipelineTool
                 FailureReason = jobInstance.FailureReason
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("getting pipeline run status").ToMcpJson();
+            return ex.ToOperationError("getting pipeline run status").ToMcpJson(_responseFormat);
         }
     }
 
@@ -395,23 +399,23 @@ public class PipelineTool
                 Owner = schedule.Owner
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("creating pipeline schedule").ToMcpJson();
+            return ex.ToOperationError("creating pipeline schedule").ToMcpJson(_responseFormat);
         }
     }
 
@@ -451,23 +455,23 @@ public class PipelineTool
                 })
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("listing pipeline schedules").ToMcpJson();
+            return ex.ToOperationError("listing pipeline schedules").ToMcpJson(_responseFormat);
         }
     }
 
@@ -501,23 +505,23 @@ public class PipelineTool
                 Owner = schedule.Owner
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("updating pipeline schedule enabled state").ToMcpJson();
+            return ex.ToOperationError("updating pipeline schedule enabled state").ToMcpJson(_responseFormat);
         }
     }
 
@@ -1,6 +1,7 @@
 using ModelContextProtocol.Server;
 using System.ComponentModel;
 using DataFactory.MCP.Abstractions.Interfaces;
+using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Extensions;
 using DataFactory.MCP.Models;
 
@@ -10,10 +11,12 @@ namespace DataFactory.MCP.Tools;
 public class WorkspacesTool
 {
     private readonly IFabricWorkspaceService _workspaceService;
+    private readonly McpResponseFormat _responseFormat;
 
-    public WorkspacesTool(IFabricWorkspaceService workspaceService)
+    public WorkspacesTool(IFabricWorkspaceService workspaceService, McpResponseFormat responseFormat)
     {
         _workspaceService = workspaceService;
+        _responseFormat = responseFormat;
     }
 
     [McpServerTool, Description(@"Lists all workspaces the user has permission for. Returns workspaces filtered by the specified roles if provided.")]
@@ -35,27 +38,27 @@ public class WorkspacesTool
             {
                 TotalCount = response.Value.Count,
                 ContinuationToken = response.ContinuationToken,
-                ContinuationUri = response.ContinuationUri,
+                ContinuationUri = _responseFormat.Verbose(response.ContinuationUri),
                 HasMoreResults = !string.IsNullOrEmpty(response.ContinuationToken),
-                FilteredByRoles = !string.IsNullOrEmpty(roles),
-                Roles = roles,
-                IncludesApiEndpoints = preferWorkspaceSpecificEndpoints == true,
-                Workspaces = response.Value.Select(w => w.ToFormattedInfo())
+                FilteredByRoles = _responseFormat.Verbose(!string.IsNullOrEmpty(roles)),
+                Roles = _responseFormat.Verbose(roles),
+                IncludesApiEndpoints = _responseFormat.Verbose(preferWorkspaceSpecificEndpoints == true),
+                Workspaces = response.Value.Select(w => w.ToFormattedListItem(_responseFormat))
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("listing workspaces").ToMcpJson();
+            return ex.ToOperationError("listing workspaces").ToMcpJson(_responseFormat);
         }
     }
 }
\ No newline at end of file
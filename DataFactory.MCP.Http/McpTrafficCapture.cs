@@ -0,0 +1,237 @@
+using System.Diagnostics;
+using System.Text.Json;
+using System.Text.Json.Nodes;
+using System.Threading.Channels;
+
+namespace DataFactory.MCP.Http;
+
+/// <summary>
+/// Records the MCP JSON-RPC traffic the server receives as JSON lines, one per message:
+/// arrival offset, session, method, id, redacted params, latency, HTTP status and response size.
+/// The file is the input of evals/perf/mcp_replay.py. Off unless MCP_CAPTURE_PATH is set.
+/// </summary>
+internal static class McpTrafficCapture
+{
+    /// <summary>
+    /// Environment variable holding the capture file path
+    /// </summary>
+    public const string PathVariable = "MCP_CAPTURE_PATH";
+
+    private const string SessionHeader = "Mcp-Session-Id";
+    private const string Redacted = "***";
+
+    // Argument names that may carry credentials; paging state and credential kinds are kept
+    private static readonly string[] SecretKeyParts = ["secret", "password", "credential", "token", "key"];
+    private static readonly HashSet<string> KeptKeys = new(StringComparer.OrdinalIgnoreCase) { "continuationToken", "credentialType" };
+
+    /// <summary>
+    /// Adds the capture middleware when MCP_CAPTURE_PATH is set. Register before MapMcp.
+    /// </summary>
+    public static WebApplication UseMcpTrafficCapture(this WebApplication app, ILogger logger)
+    {
+        var path = Environment.GetEnvironmentVariable(PathVariable);
+        if (string.IsNullOrWhiteSpace(path))
+        {
+            return app;
+        }
+
+        var writer = new CaptureWriter(path);
+        app.Lifetime.ApplicationStopped.Register(writer.Complete);
+        logger.LogInformation("Capturing MCP traffic to {CapturePath}", path);
+
+        var clock = Stopwatch.StartNew();
+        app.Use(async (context, next) =>
+        {
+            if (!HttpMethods.IsPost(context.Request.Method))
+            {
+                await next(context);
+                return;
+            }
+
+            context.Request.EnableBuffering();
+            var requestBytes = context.Request.ContentLength ?? 0;
+            JsonNode? body;
+            try
+            {
+                body = await JsonNode.ParseAsync(context.Request.Body, cancellationToken: context.RequestAborted);
+            }
+            catch (JsonException)
+            {
+                body = null;
+            }
+            context.Request.Body.Position = 0;
+
+            var messages = body switch
+            {
+                JsonArray batch => batch.OfType<JsonObject>().ToList(),
+                JsonObject message => [message],
+                _ => []
+            };
+            messages.RemoveAll(m => m["method"] is null);
+            if (messages.Count == 0)
+            {
+                await next(context);
+                return;
+            }
+
+            var offset = clock.Elapsed.TotalSeconds;
+            var started = Stopwatch.GetTimestamp();
+            var originalBody = context.Response.Body;
+            var counting = new CountingStream(originalBody);
+            context.Response.Body = counting;
+            try
+            {
+                await next(context);
+            }
+            finally
+            {
+                context.Response.Body = originalBody;
+                var latency = Stopwatch.GetElapsedTime(started).TotalMilliseconds;
+                string? session = context.Response.Headers[SessionHeader].FirstOrDefault()
+                                  ?? context.Request.Headers[SessionHeader].FirstOrDefault();
+
+                foreach (var message in messages)
+                {
+                    var parameters = message["params"];
+                    Redact(parameters);
+                    var record = new JsonObject
+                    {
+                        ["t"] = Math.Round(offset, 4),
+                        ["transport"] = "http",
+                        ["session"] = session,
+                        ["method"] = message["method"]!.GetValue<string>(),
+                        ["id"] = message["id"]?.DeepClone(),
+                        ["params"] = parameters?.DeepClone(),
+                        ["latency_ms"] = Math.Round(latency, 2),
+                        ["status"] = context.Response.StatusCode,
+                        ["request_bytes"] = requestBytes,
+                        ["response_bytes"] = counting.BytesWritten
+                    };
+                    writer.Write(record.ToJsonString());
+                }
+            }
+        });
+
+        return app;
+    }
+
+    /// <summary>
+    /// Masks values whose property names look like credentials, at any depth.
+    /// </summary>
+    private static void Redact(JsonNode? node)
+    {
+        switch (node)
+        {
+            case JsonObject obj:
+                foreach (var name in obj.Select(p => p.Key).ToList())
+                {
+                    if (obj[name] is JsonValue && IsSecret(name))
+                    {
+                        obj[name] = Redacted;
+                    }
+                    else
+                    {
+                        Redact(obj[name]);
+                    }
+                }
+                break;
+            case JsonArray array:
+                foreach (var item in array)
+                {
+                    Redact(item);
+                }
+                break;
+        }
+    }
+
+    private static bool IsSecret(string name) =>
+        !KeptKeys.Contains(name) &&
+        SecretKeyParts.Any(part => name.Contains(part, StringComparison.OrdinalIgnoreCase));
+
+    /// <summary>
+    /// Appends records from a single background writer so request threads never touch the file.
+    /// </summary>
+    private sealed class CaptureWriter
+    {
+        private readonly Channel<string> _records = Channel.CreateUnbounded<string>(
+            new UnboundedChannelOptions { SingleReader = true });
+        private readonly Task _writer;
+
+        public CaptureWriter(string path)
+        {
+            _writer = Task.Run(() => WriteAllAsync(path));
+        }
+
+        public void Write(string record) => _records.Writer.TryWrite(record);
+
+        public void Complete()
+        {
+            _records.Writer.TryComplete();
+            _writer.Wait(TimeSpan.FromSeconds(5));
+        }
+
+        private async Task WriteAllAsync(string path)
+        {
+            await using var file = new StreamWriter(path, append: false);
+            var reader = _records.Reader;
+            while (await reader.WaitToReadAsync())
+            {
+                while (reader.TryRead(out var record))
+                {
+                    await file.WriteLineAsync(record);
+                }
+                await file.FlushAsync();
+            }
+        }
+    }
+
+    /// <summary>
+    /// Pass-through response stream that counts the bytes written (JSON or SSE).
+    /// </summary>
+    private sealed class CountingStream(Stream inner) : Stream
+    {
+        private long _bytesWritten;
+
+        public long BytesWritten => Interlocked.Read(ref _bytesWritten);
+
+        public override bool CanRead => false;
+        public override bool CanSeek => false;
+        public override bool CanWrite => true;
+        public override long Length => throw new NotSupportedException();
+        public override long Position
+        {
+            get => throw new NotSupportedException();
+            set => throw new NotSupportedException();
+        }
+
+        public override void Write(byte[] buffer, int offset, int count)
+        {
+            Interlocked.Add(ref _bytesWritten, count);
+            inner.Write(buffer, offset, count);
+        }
+
+        public override void Write(ReadOnlySpan<byte> buffer)
+        {
+            Interlocked.Add(ref _bytesWritten, buffer.Length);
+            inner.Write(buffer);
+        }
+
+        public override Task WriteAsync(byte[] buffer, int offset, int count, CancellationToken cancellationToken)
+        {
+            Interlocked.Add(ref _bytesWritten, count);
+            return inner.WriteAsync(buffer, offset, count, cancellationToken);
+        }
+
+        public override ValueTask WriteAsync(ReadOnlyMemory<byte> buffer, CancellationToken cancellationToken = default)
+        {
+            Interlocked.Add(ref _bytesWritten, buffer.Length);
+            return inner.WriteAsync(buffer, cancellationToken);
+        }
+
+        public override void Flush() => inner.Flush();
+        public override Task FlushAsync(CancellationToken cancellationToken) => inner.FlushAsync(cancellationToken);
+        public override int Read(byte[] buffer, int offset, int count) => throw new NotSupportedException();
+        public override long Seek(long offset, SeekOrigin origin) => throw new NotSupportedException();
+        public override void SetLength(long value) => throw new NotSupportedException();
+    }
+}
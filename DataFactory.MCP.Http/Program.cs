@@ -1,5 +1,7 @@
 using DataFactory.MCP.Abstractions.Interfaces;
+using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Extensions;
+using DataFactory.MCP.Http;
 using DataFactory.MCP.Services;
 using ModelContextProtocol.Protocol;
 using ModelContextProtocol.Server;
@@ -16,6 +18,13 @@ logger.LogInformation("Starting DataFactory MCP HTTP Server...");
 // Register all DataFactory MCP services (shared with stdio version)
 builder.Services.AddDataFactoryMcpServices();
 
+// Load testing against evals/perf stand-ins, only with DATAFACTORY_MCP_BENCHMARK_MODE set
+BenchmarkMode.LogStatus(logger);
+if (BenchmarkMode.Enabled)
+{
+    builder.Services.AddFabricStandinAuthentication(logger);
+}
+
 // Register user notification service - HTTP uses MCP protocol notifications
 builder.Services.AddSingleton<IUserNotificationService, McpUserNotificationService>();
 
@@ -39,15 +48,37 @@ mcpBuilder.AddDataFactoryMcpOptionalTools(
     args,
     logger);
 
+// Select the tool response format (--compact-responses trims responses for the model's context)
+builder.Services.AddMcpResponseFormat(builder.Configuration, args, logger);
+
 var app = builder.Build();
 
+// Record JSON-RPC traffic for evals/perf/mcp_replay.py (no-op unless MCP_CAPTURE_PATH is set)
+app.UseMcpTrafficCapture(logger);
+
 // Map MCP endpoints
 // SECURITY: This endpoint requires external authentication (e.g., Azure Easy Auth, API Management).
 // Do not expose this endpoint to untrusted networks without authentication.
 app.MapMcp();
 
-// Add a simple health check endpoint
-app.MapGet("/health", () => Results.Ok(new { status = "healthy", timestamp = DateTime.UtcNow }));
+// Add a simple health check endpoint (pendingNotifications is the notification queue depth,
+// metadataCache the hit/miss counters of the Fabric lookup cache, allocatedBytes the process's managed allocations so far)
+app.MapGet("/health", (INotificationQueue notificationQueue, FabricMetadataCache metadataCache) => Results.Ok(new
+{
+    status = "healthy",
+    timestamp = DateTime.UtcNow,
+    pendingNotifications = notificationQueue.PendingCount,
+    allocatedBytes = GC.GetTotalAllocatedBytes(),
+    metadataCache = new
+    {
+        hits = metadataCache.Hits,
+        misses = metadataCache.Misses,
+        sharedWaits = metadataCache.SharedWaits,
+        evictions = metadataCache.Evictions,
+        invalidations = metadataCache.Invalidations,
+        entries = metadataCache.Count
+    }
+}));
 
 logger.LogInformation("DataFactory MCP HTTP Server configured successfully");
 
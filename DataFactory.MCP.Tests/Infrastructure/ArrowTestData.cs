@@ -0,0 +1,97 @@
+using Apache.Arrow;
+using Apache.Arrow.Ipc;
+
+namespace DataFactory.MCP.Tests.Infrastructure;
+
+/// <summary>
+/// Builds Arrow IPC streams, like the executeQuery response body, for unit tests
+/// </summary>
+public static class ArrowTestData
+{
+    /// <summary>
+    /// A record batch with the given columns (all the same length)
+    /// </summary>
+    public static RecordBatch Batch(params (string Name, IArrowArray Values)[] columns)
+    {
+        var schema = new Schema.Builder();
+        foreach (var (name, values) in columns)
+        {
+            schema.Field(f => f.Name(name).DataType(values.Data.DataType).Nullable(true));
+        }
+
+        return new RecordBatch(schema.Build(), columns.Select(c => c.Values), columns[0].Values.Length);
+    }
+
+    /// <summary>
+    /// An Int32 column with the values first, first + 1, ... first + count - 1
+    /// </summary>
+    public static Int32Array Int32Range(int first, int count) =>
+        new Int32Array.Builder().AppendRange(Enumerable.Range(first, count)).Build();
+
+    /// <summary>
+    /// The Arrow IPC stream format of the batches (which must share one schema), positioned at the start
+    /// </summary>
+    public static MemoryStream Stream(params RecordBatch[] batches)
+    {
+        var stream = new MemoryStream();
+        using (var writer = new ArrowStreamWriter(stream, batches[0].Schema, leaveOpen: true))
+        {
+            foreach (var batch in batches)
+            {
+                writer.WriteRecordBatch(batch);
+            }
+            writer.WriteEnd();
+        }
+
+        stream.Position = 0;
+        return stream;
+    }
+}
+
+/// <summary>
+/// Read-only stream that fails with an IOException once <c>failAfterBytes</c> have been read,
+/// like a connection dropped in the middle of a response body
+/// </summary>
+public sealed class FailingReadStream(Stream inner, long failAfterBytes) : Stream
+{
+    private long _read;
+
+    public override bool CanRead => true;
+    public override bool CanSeek => false;
+    public override bool CanWrite => false;
+    public override long Length => throw new NotSupportedException();
+
+    public override long Position
+    {
+        get => _read;
+        set => throw new NotSupportedException();
+    }
+
+    public override int Read(byte[] buffer, int offset, int count) => Read(buffer.AsSpan(offset, count));
+
+    public override int Read(Span<byte> buffer)
+    {
+        if (_read >= failAfterBytes)
+        {
+            throw new IOException("The response ended prematurely.");
+        }
+
+        var read = inner.Read(buffer[..(int)Math.Min(buffer.Length, failAfterBytes - _read)]);
+        _read += read;
+        return read;
+    }
+
+    public override ValueTask<int> ReadAsync(Memory<byte> buffer, CancellationToken cancellationToken = default) =>
+        ValueTask.FromResult(Read(buffer.Span));
+
+    public override Task<int> ReadAsync(byte[] buffer, int offset, int count, CancellationToken cancellationToken) =>
+        Task.FromResult(Read(buffer.AsSpan(offset, count)));
+
+    public override void Flush()
+    {
+    }
+
+    public override long Seek(long offset, SeekOrigin origin) => throw new NotSupportedException();
+    public override void SetLength(long value) => throw new NotSupportedException();
+    public override void Write(byte[] buffer, int offset, int count) => throw new NotSupportedException();
+}
@@ -0,0 +1,18 @@
+namespace DataFactory.MCP.Tests.Infrastructure;
+
+/// <summary>
+/// TimeProvider whose clock only moves when a test advances it
+/// </summary>
+public sealed class ManualTimeProvider : TimeProvider
+{
+    private DateTimeOffset _utcNow;
+
+    public ManualTimeProvider(DateTimeOffset? start = null)
+    {
+        _utcNow = start ?? new DateTimeOffset(2025, 1, 1, 0, 0, 0, TimeSpan.Zero);
+    }
+
+    public override DateTimeOffset GetUtcNow() => _utcNow;
+
+    public void Advance(TimeSpan by) => _utcNow += by;
+}
@@ -74,12 +74,15 @@ public class McpTestFixture : IDisposable
 
                 // Register services
                 // Authentication system with providers (must be Singleton to persist tokens across scopes/requests)
+                services.AddSingleton<AccessTokenCache>();
                 services.AddSingleton<IAuthenticationStateManager, AuthenticationStateManager>();
                 services.AddSingleton<IAuthenticationProvider, InteractiveAuthenticationProvider>();
                 services.AddSingleton<IAuthenticationProvider, DeviceCodeAuthenticationProvider>();
                 services.AddSingleton<IAuthenticationProvider, ServicePrincipalAuthenticationProvider>();
                 services.AddSingleton<IAuthenticationService, AuthenticationService>();
+                services.AddSingleton<FabricMetadataCache>();
                 services.AddScoped<IValidationService, ValidationService>();
+                services.AddSingleton(McpResponseFormat.Default);
                 services.AddScoped<IArrowDataReaderService, ArrowDataReaderService>();
                 services.AddScoped<IDataTransformationService, DataTransformationService>();
                 services.AddScoped<IDataflowDefinitionProcessor, DataflowDefinitionProcessor>();
@@ -0,0 +1,39 @@
+namespace DataFactory.MCP.Tests.Infrastructure;
+
+/// <summary>
+/// IHttpClientFactory whose clients answer every request from a delegate, for unit testing services
+/// built on FabricServiceBase without network access. Records each request it receives.
+/// </summary>
+public sealed class StubHttpClientFactory : IHttpClientFactory
+{
+    private readonly Func<HttpRequestMessage, Task<HttpResponseMessage>> _respond;
+
+    public StubHttpClientFactory(Func<HttpRequestMessage, Task<HttpResponseMessage>> respond)
+    {
+        _respond = respond;
+    }
+
+    public StubHttpClientFactory(Func<HttpRequestMessage, HttpResponseMessage> respond)
+        : this(request => Task.FromResult(respond(request)))
+    {
+    }
+
+    /// <summary>
+    /// "METHOD path" of every request sent through the factory's clients, in order
+    /// </summary>
+    public List<string> Requests { get; } = new();
+
+    public HttpClient CreateClient(string name) => new(new StubHandler(this));
+
+    private sealed class StubHandler(StubHttpClientFactory factory) : HttpMessageHandler
+    {
+        protected override Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+        {
+            lock (factory.Requests)
+            {
+                factory.Requests.Add($"{request.Method} {request.RequestUri!.AbsolutePath}");
+            }
+            return factory._respond(request);
+        }
+    }
+}
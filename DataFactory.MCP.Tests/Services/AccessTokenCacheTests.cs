@@ -0,0 +1,210 @@
+using Azure.Core;
+using DataFactory.MCP.Services.Authentication;
+using DataFactory.MCP.Tests.Infrastructure;
+using Microsoft.Extensions.Logging.Abstractions;
+using Xunit;
+
+namespace DataFactory.MCP.Tests.Services;
+
+/// <summary>
+/// Unit tests for AccessTokenCache refresh-ahead and single-flight acquisition
+/// </summary>
+public class AccessTokenCacheTests
+{
+    private const string Key = "current";
+
+    private readonly ManualTimeProvider _clock = new();
+    private readonly AccessTokenCache _cache;
+    private int _acquireCalls;
+
+    public AccessTokenCacheTests()
+    {
+        _cache = new AccessTokenCache(NullLogger<AccessTokenCache>.Instance, _clock);
+    }
+
+    [Fact]
+    public async Task GetTokenAsync_BeforeRefreshPoint_ShouldServeCachedTokenWithoutAcquiring()
+    {
+        // Arrange - one-hour token, renewed five minutes before expiry
+        _cache.Set(Key, TokenExpiringIn("seeded", TimeSpan.FromHours(1)));
+        _clock.Advance(TimeSpan.FromMinutes(54));
+
+        // Act
+        var token = await _cache.GetTokenAsync(Key, Acquire("renewed", TimeSpan.FromHours(1)));
+
+        // Assert
+        Assert.Equal("seeded", token.Token);
+        Assert.Equal(0, _acquireCalls);
+        Assert.Equal(1, _cache.Hits);
+        Assert.Equal(0, _cache.BackgroundRefreshes);
+    }
+
+    [Fact]
+    public async Task GetTokenAsync_InsideRefreshWindow_ShouldServeCachedTokenAndRenewInBackground()
+    {
+        // Arrange
+        _cache.Set(Key, TokenExpiringIn("seeded", TimeSpan.FromHours(1)));
+        _clock.Advance(TimeSpan.FromMinutes(55) + TimeSpan.FromSeconds(1));
+        var acquire = Acquire("renewed", TimeSpan.FromHours(1));
+
+        // Act - the token source completes synchronously, so the renewal is stored before the call returns
+        var served = await _cache.GetTokenAsync(Key, acquire);
+        var next = await _cache.GetTokenAsync(Key, acquire);
+
+        // Assert
+        Assert.Equal("seeded", served.Token);
+        Assert.Equal("renewed", next.Token);
+        Assert.Equal(1, _acquireCalls);
+        Assert.Equal(1, _cache.BackgroundRefreshes);
+        Assert.Equal(2, _cache.Hits);
+    }
+
+    [Fact]
+    public async Task GetTokenAsync_ShortLivedToken_ShouldRenewHalfwayThroughLifetime()
+    {
+        // Arrange - four-minute token: shorter than twice the refresh-ahead window
+        _cache.Set(Key, TokenExpiringIn("seeded", TimeSpan.FromMinutes(4)));
+        var acquire = Acquire("renewed", TimeSpan.FromMinutes(4));
+
+        // Act
+        _clock.Advance(TimeSpan.FromSeconds(119));
+        await _cache.GetTokenAsync(Key, acquire);
+        var callsBeforeHalfway = _acquireCalls;
+        _clock.Advance(TimeSpan.FromSeconds(2));
+        await _cache.GetTokenAsync(Key, acquire);
+
+        // Assert
+        Assert.Equal(0, callsBeforeHalfway);
+        Assert.Equal(1, _acquireCalls);
+        Assert.Equal(1, _cache.BackgroundRefreshes);
+    }
+
+    [Fact]
+    public async Task GetTokenAsync_WithinExpiryMargin_ShouldAcquireInForeground()
+    {
+        // Arrange
+        _cache.Set(Key, TokenExpiringIn("seeded", TimeSpan.FromHours(1)));
+        _clock.Advance(TimeSpan.FromHours(1) - AccessTokenCache.ExpiryMargin);
+
+        // Act
+        var token = await _cache.GetTokenAsync(Key, Acquire("renewed", TimeSpan.FromHours(1)));
+
+        // Assert
+        Assert.Equal("renewed", token.Token);
+        Assert.Equal(0, _cache.Hits);
+        Assert.Equal(0, _cache.BackgroundRefreshes);
+        Assert.Equal(1, _cache.Acquisitions);
+    }
+
+    [Fact]
+    public async Task GetTokenAsync_ConcurrentMisses_ShouldShareOneAcquisition()
+    {
+        // Arrange
+        var release = new TaskCompletionSource<AccessToken>(TaskCreationOptions.RunContinuationsAsynchronously);
+        Func<CancellationToken, Task<AccessToken>> acquire = _ =>
+        {
+            Interlocked.Increment(ref _acquireCalls);
+            return release.Task;
+        };
+
+        // Act
+        var callers = Enumerable.Range(0, 10).Select(_ => _cache.GetTokenAsync(Key, acquire)).ToList();
+        release.SetResult(TokenExpiringIn("shared", TimeSpan.FromHours(1)));
+        var tokens = await Task.WhenAll(callers);
+
+        // Assert
+        Assert.Equal(1, _acquireCalls);
+        Assert.Equal(1, _cache.Acquisitions);
+        Assert.Equal(9, _cache.SharedWaits);
+        Assert.All(tokens, token => Assert.Equal("shared", token.Token));
+    }
+
+    [Fact]
+    public async Task GetTokenAsync_CancelledWaiter_ShouldNotCancelSharedAcquisition()
+    {
+        // Arrange
+        var release = new TaskCompletionSource<AccessToken>(TaskCreationOptions.RunContinuationsAsynchronously);
+        using var cancellation = new CancellationTokenSource();
+        Func<CancellationToken, Task<AccessToken>> acquire = _ => release.Task;
+
+        // Act
+        var cancelled = _cache.GetTokenAsync(Key, acquire, cancellation.Token);
+        var waiting = _cache.GetTokenAsync(Key, acquire);
+        cancellation.Cancel();
+        release.SetResult(TokenExpiringIn("shared", TimeSpan.FromHours(1)));
+
+        // Assert
+        await Assert.ThrowsAnyAsync<OperationCanceledException>(() => cancelled);
+        Assert.Equal("shared", (await waiting).Token);
+    }
+
+    [Fact]
+    public async Task GetTokenAsync_FailedAcquisition_ShouldNotBeCached()
+    {
+        // Arrange
+        var attempts = 0;
+        Func<CancellationToken, Task<AccessToken>> acquire = _ => ++attempts == 1
+            ? Task.FromException<AccessToken>(new InvalidOperationException("token endpoint down"))
+            : Task.FromResult(TokenExpiringIn("second", TimeSpan.FromHours(1)));
+
+        // Act
+        var failure = await Assert.ThrowsAsync<InvalidOperationException>(() => _cache.GetTokenAsync(Key, acquire));
+        var token = await _cache.GetTokenAsync(Key, acquire);
+
+        // Assert
+        Assert.Equal("token endpoint down", failure.Message);
+        Assert.Equal("second", token.Token);
+        Assert.Equal(2, attempts);
+    }
+
+    [Fact]
+    public async Task GetTokenAsync_FailedBackgroundRefresh_ShouldWaitBeforeRetrying()
+    {
+        // Arrange
+        _cache.Set(Key, TokenExpiringIn("seeded", TimeSpan.FromHours(1)));
+        _clock.Advance(TimeSpan.FromMinutes(56));
+        var attempts = 0;
+        Func<CancellationToken, Task<AccessToken>> acquire = _ =>
+        {
+            attempts++;
+            return Task.FromException<AccessToken>(new InvalidOperationException("silent refresh not possible"));
+        };
+
+        // Act
+        await _cache.GetTokenAsync(Key, acquire);
+        await _cache.GetTokenAsync(Key, acquire);
+        _clock.Advance(AccessTokenCache.RetryAfterFailedRefresh - TimeSpan.FromSeconds(1));
+        var beforeRetry = await _cache.GetTokenAsync(Key, acquire);
+        var attemptsBeforeRetry = attempts;
+        _clock.Advance(TimeSpan.FromSeconds(1));
+        await _cache.GetTokenAsync(Key, acquire);
+
+        // Assert
+        Assert.Equal("seeded", beforeRetry.Token);
+        Assert.Equal(1, attemptsBeforeRetry);
+        Assert.Equal(2, attempts);
+    }
+
+    [Fact]
+    public async Task Remove_ShouldForceNextRequestToAcquire()
+    {
+        // Arrange
+        _cache.Set(Key, TokenExpiringIn("seeded", TimeSpan.FromHours(1)));
+
+        // Act
+        _cache.Remove(Key);
+        var token = await _cache.GetTokenAsync(Key, Acquire("renewed", TimeSpan.FromHours(1)));
+
+        // Assert
+        Assert.Equal("renewed", token.Token);
+        Assert.Equal(1, _acquireCalls);
+    }
+
+    private AccessToken TokenExpiringIn(string value, TimeSpan lifetime) => new(value, _clock.GetUtcNow() + lifetime);
+
+    private Func<CancellationToken, Task<AccessToken>> Acquire(string value, TimeSpan lifetime) => _ =>
+    {
+        Interlocked.Increment(ref _acquireCalls);
+        return Task.FromResult(TokenExpiringIn(value, lifetime));
+    };
+}
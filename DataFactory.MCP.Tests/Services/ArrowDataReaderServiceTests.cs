@@ -0,0 +1,134 @@
+using System.Data.SqlTypes;
+using Apache.Arrow;
+using Apache.Arrow.Types;
+using DataFactory.MCP.Services;
+using DataFactory.MCP.Tests.Infrastructure;
+using Microsoft.Extensions.Logging.Abstractions;
+using Xunit;
+
+namespace DataFactory.MCP.Tests.Services;
+
+/// <summary>
+/// Unit tests for the streaming summary (maxRows) path of ArrowDataReaderService
+/// </summary>
+public class ArrowDataReaderServiceTests
+{
+    private readonly ArrowDataReaderService _service = new(NullLogger<ArrowDataReaderService>.Instance);
+
+    [Fact]
+    public async Task SummarizeArrowStreamAsync_KeepsFirstRowsAcrossBatches_AndStatisticsOverAllRows()
+    {
+        // Arrange - three batches of 10 rows
+        using var stream = ArrowTestData.Stream(
+            ArrowTestData.Batch(("Id", ArrowTestData.Int32Range(0, 10))),
+            ArrowTestData.Batch(("Id", ArrowTestData.Int32Range(10, 10))),
+            ArrowTestData.Batch(("Id", ArrowTestData.Int32Range(20, 10))));
+
+        // Act
+        var summary = await _service.SummarizeArrowStreamAsync(stream, maxSampleRows: 15);
+
+        // Assert
+        Assert.True(summary.ArrowParsingSuccess);
+        Assert.Equal(30, summary.EstimatedRowCount);
+        Assert.Equal(3, summary.BatchCount);
+        Assert.True(summary.IsSampled);
+        Assert.Equal(15, summary.SampleRowCount);
+        Assert.Equal(Enumerable.Range(0, 15).Cast<object>(), summary.StructuredSampleData!["Id"]);
+
+        var stats = summary.ColumnStatistics!["Id"];
+        Assert.Equal("0", stats.Min);
+        Assert.Equal("29", stats.Max);
+        Assert.Equal(14.5, stats.Mean);
+        Assert.Equal(0, stats.NullCount);
+    }
+
+    [Fact]
+    public async Task SummarizeArrowStreamAsync_WhenSampleCoversResult_ShouldNotBeSampled()
+    {
+        // Arrange
+        using var stream = ArrowTestData.Stream(ArrowTestData.Batch(("Id", ArrowTestData.Int32Range(0, 5))));
+
+        // Act
+        var summary = await _service.SummarizeArrowStreamAsync(stream, maxSampleRows: 100);
+
+        // Assert
+        Assert.False(summary.IsSampled);
+        Assert.Equal(5, summary.SampleRowCount);
+        Assert.Equal(5, summary.StructuredSampleData!["Id"].Count);
+    }
+
+    [Fact]
+    public async Task SummarizeArrowStreamAsync_WithNaN_ShouldSkipItInStatistics()
+    {
+        // Arrange
+        var values = new DoubleArray.Builder().Append(1).Append(double.NaN).AppendNull().Append(3).Build();
+        using var stream = ArrowTestData.Stream(ArrowTestData.Batch(("Value", values)));
+
+        // Act
+        var summary = await _service.SummarizeArrowStreamAsync(stream, maxSampleRows: 10);
+
+        // Assert
+        var stats = summary.ColumnStatistics!["Value"];
+        Assert.Equal("1", stats.Min);
+        Assert.Equal("3", stats.Max);
+        Assert.Equal(2, stats.Mean);
+        Assert.Equal(1, stats.NullCount);
+    }
+
+    [Fact]
+    public async Task SummarizeArrowStreamAsync_WithDecimalBeyondSystemDecimal_ShouldSummarizeEveryColumn()
+    {
+        // Arrange - 38 digits overflow System.Decimal (28-29 digits)
+        var huge = SqlDecimal.Parse("12345678901234567890123456789012345678");
+        var amounts = new Decimal128Array.Builder(new Decimal128Type(38, 0))
+            .Append(SqlDecimal.Parse("5"))
+            .Append(huge)
+            .Append(SqlDecimal.Parse("7"))
+            .Build();
+        var prices = new Decimal128Array.Builder(new Decimal128Type(10, 2)).Append(1.25m).Append(2.75m).Append(3m).Build();
+        using var stream = ArrowTestData.Stream(ArrowTestData.Batch(("Amount", amounts), ("Price", prices)));
+
+        // Act
+        var summary = await _service.SummarizeArrowStreamAsync(stream, maxSampleRows: 10);
+
+        // Assert - the overflowing column is summarized from its text form, the other one is unaffected
+        Assert.True(summary.ArrowParsingSuccess);
+        Assert.Equal("12345678901234567890123456789012345678", summary.StructuredSampleData!["Amount"][1]);
+
+        var amount = summary.ColumnStatistics!["Amount"];
+        Assert.Equal("5", amount.Min);
+        Assert.Equal(1.2345678901234568E+37, double.Parse(amount.Max!, System.Globalization.CultureInfo.InvariantCulture), 1e22);
+
+        var price = summary.ColumnStatistics!["Price"];
+        Assert.Equal("1.25", price.Min);
+        Assert.Equal("3", price.Max);
+        Assert.Equal(7.0 / 3, price.Mean!.Value, 10);
+    }
+
+    [Fact]
+    public async Task SummarizeArrowStreamAsync_WhenStreamFailsMidway_ShouldThrowInsteadOfPartialSummary()
+    {
+        // Arrange - the connection drops after the first batch
+        using var arrow = ArrowTestData.Stream(
+            ArrowTestData.Batch(("Id", ArrowTestData.Int32Range(0, 1000))),
+            ArrowTestData.Batch(("Id", ArrowTestData.Int32Range(1000, 1000))));
+        using var stream = new FailingReadStream(arrow, arrow.Length / 2 + 64);
+
+        // Act & Assert
+        await Assert.ThrowsAsync<IOException>(() => _service.SummarizeArrowStreamAsync(stream, maxSampleRows: 10));
+    }
+
+    [Fact]
+    public async Task SummarizeArrowStreamAsync_WithMalformedData_ShouldReportParsingError()
+    {
+        // Arrange - a continuation marker followed by an impossible metadata length
+        using var stream = new MemoryStream([0xFF, 0xFF, 0xFF, 0xFF, 0x10, 0x00, 0x00, 0x00, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16]);
+
+        // Act
+        var summary = await _service.SummarizeArrowStreamAsync(stream, maxSampleRows: 10);
+
+        // Assert
+        Assert.False(summary.ArrowParsingSuccess);
+        Assert.NotNull(summary.ArrowParsingError);
+    }
+}
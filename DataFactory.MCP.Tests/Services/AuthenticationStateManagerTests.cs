@@ -0,0 +1,203 @@
+using DataFactory.MCP.Models;
+using DataFactory.MCP.Services;
+using DataFactory.MCP.Services.Authentication;
+using Microsoft.Extensions.Logging.Abstractions;
+using Xunit;
+
+namespace DataFactory.MCP.Tests.Services;
+
+/// <summary>
+/// Unit tests for token renewal through AuthenticationStateManager and its AccessTokenCache
+/// </summary>
+public class AuthenticationStateManagerTests
+{
+    private const string ServicePrincipalUser = "ServicePrincipal-test-client";
+
+    private readonly AccessTokenCache _tokenCache = new(NullLogger<AccessTokenCache>.Instance);
+    private readonly AuthenticationStateManager _stateManager;
+
+    public AuthenticationStateManagerTests()
+    {
+        _stateManager = new AuthenticationStateManager(NullLogger<AuthenticationStateManager>.Instance, _tokenCache);
+    }
+
+    [Fact]
+    public async Task GetAccessTokenAsync_ValidToken_ShouldNotRenew()
+    {
+        // Arrange
+        var renewals = 0;
+        _stateManager.SetAuthentication(Authenticated("current-token", TimeSpan.FromHours(1)), () =>
+        {
+            renewals++;
+            return Task.FromResult<McpAuthenticationResult?>(Authenticated("renewed-token", TimeSpan.FromHours(1)));
+        });
+
+        // Act
+        var token = await _stateManager.GetAccessTokenAsync();
+
+        // Assert
+        Assert.Equal("current-token", token);
+        Assert.Equal(0, renewals);
+    }
+
+    [Fact]
+    public async Task GetAccessTokenAsync_ExpiredToken_ShouldRenewAndUpdateState()
+    {
+        // Arrange
+        _stateManager.SetAuthentication(Authenticated("expired-token", TimeSpan.FromMinutes(-1)),
+            () => Task.FromResult<McpAuthenticationResult?>(Authenticated("renewed-token", TimeSpan.FromHours(1))));
+
+        // Act
+        var token = await _stateManager.GetAccessTokenAsync();
+
+        // Assert
+        Assert.Equal("renewed-token", token);
+        Assert.Equal("renewed-token", _stateManager.CurrentAuthentication?.AccessToken);
+    }
+
+    [Fact]
+    public async Task GetAccessTokenAsync_ConcurrentRequestsWithExpiredToken_ShouldRenewOnce()
+    {
+        // Arrange
+        var renewals = 0;
+        var release = new TaskCompletionSource<McpAuthenticationResult?>(TaskCreationOptions.RunContinuationsAsynchronously);
+        _stateManager.SetAuthentication(Authenticated("expired-token", TimeSpan.FromMinutes(-1)), () =>
+        {
+            Interlocked.Increment(ref renewals);
+            return release.Task;
+        });
+
+        // Act
+        var requests = Enumerable.Range(0, 8).Select(_ => _stateManager.GetAccessTokenAsync()).ToList();
+        release.SetResult(Authenticated("renewed-token", TimeSpan.FromHours(1)));
+        var tokens = await Task.WhenAll(requests);
+
+        // Assert
+        Assert.Equal(1, renewals);
+        Assert.All(tokens, token => Assert.Equal("renewed-token", token));
+    }
+
+    [Fact]
+    public async Task GetAccessTokenAsync_RenewalReturnsNothing_ShouldReportExpiredToken()
+    {
+        // Arrange
+        _stateManager.SetAuthentication(Authenticated("expired-token", TimeSpan.FromMinutes(-1)),
+            () => Task.FromResult<McpAuthenticationResult?>(null));
+
+        // Act
+        var result = await _stateManager.GetAccessTokenAsync();
+
+        // Assert
+        Assert.Equal(Messages.AccessTokenExpired, result);
+    }
+
+    [Fact]
+    public async Task GetAccessTokenAsync_RenewalFails_ShouldReportExpiredToken()
+    {
+        // Arrange
+        _stateManager.SetAuthentication(Authenticated("expired-token", TimeSpan.FromMinutes(-1)),
+            () => Task.FromResult<McpAuthenticationResult?>(McpAuthenticationResult.Failure("invalid client secret")));
+
+        // Act
+        var result = await _stateManager.GetAccessTokenAsync();
+
+        // Assert
+        Assert.Equal(Messages.AccessTokenExpired, result);
+        Assert.Equal("expired-token", _stateManager.CurrentAuthentication?.AccessToken);
+    }
+
+    [Fact]
+    public async Task GetAccessTokenAsync_ServicePrincipalWithoutRenewal_ShouldReportExpiredToken()
+    {
+        // Arrange
+        _stateManager.SetAuthentication(Authenticated("expired-token", TimeSpan.FromMinutes(-1)));
+
+        // Act
+        var result = await _stateManager.GetAccessTokenAsync();
+
+        // Assert
+        Assert.Equal(Messages.AccessTokenExpired, result);
+    }
+
+    [Fact]
+    public async Task GetAccessTokenAsync_WithoutRenewalNearExpiry_ShouldServeTokenWithoutRefreshing()
+    {
+        // Arrange - inside both the refresh window and the expiry margin
+        _stateManager.SetAuthentication(Authenticated("current-token", TimeSpan.FromSeconds(20)));
+
+        // Act
+        var result = await _stateManager.GetAccessTokenAsync();
+
+        // Assert
+        Assert.Equal("current-token", result);
+        Assert.Equal(0, _tokenCache.Acquisitions);
+        Assert.Equal(0, _tokenCache.BackgroundRefreshes);
+    }
+
+    [Fact]
+    public async Task GetAccessTokenAsync_RenewalThrows_ShouldReportError()
+    {
+        // Arrange
+        _stateManager.SetAuthentication(Authenticated("expired-token", TimeSpan.FromMinutes(-1)),
+            () => throw new HttpRequestException("login endpoint unreachable"));
+
+        // Act
+        var result = await _stateManager.GetAccessTokenAsync();
+
+        // Assert
+        Assert.Equal(string.Format(Messages.ErrorRetrievingAccessTokenTemplate, "login endpoint unreachable"), result);
+    }
+
+    [Fact]
+    public async Task GetAccessTokenAsync_SignedOutDuringRenewal_ShouldNotRestoreSession()
+    {
+        // Arrange
+        var renewalStarted = new TaskCompletionSource(TaskCreationOptions.RunContinuationsAsynchronously);
+        var release = new TaskCompletionSource<McpAuthenticationResult?>(TaskCreationOptions.RunContinuationsAsynchronously);
+        _stateManager.SetAuthentication(Authenticated("expired-token", TimeSpan.FromMinutes(-1)), () =>
+        {
+            renewalStarted.SetResult();
+            return release.Task;
+        });
+
+        // Act
+        var request = _stateManager.GetAccessTokenAsync();
+        await renewalStarted.Task;
+        await _stateManager.SignOutAsync();
+        release.SetResult(Authenticated("renewed-token", TimeSpan.FromHours(1)));
+        var result = await request;
+
+        // Assert
+        Assert.Equal(Messages.NoAuthenticationFound, result);
+        Assert.Null(_stateManager.CurrentAuthentication);
+        Assert.Equal(Messages.NoAuthenticationFound, await _stateManager.GetAccessTokenAsync());
+    }
+
+    [Fact]
+    public async Task GetAccessTokenAsync_SignedInAgainDuringRenewal_ShouldKeepNewSession()
+    {
+        // Arrange
+        var renewalStarted = new TaskCompletionSource(TaskCreationOptions.RunContinuationsAsynchronously);
+        var release = new TaskCompletionSource<McpAuthenticationResult?>(TaskCreationOptions.RunContinuationsAsynchronously);
+        _stateManager.SetAuthentication(Authenticated("expired-token", TimeSpan.FromMinutes(-1)), () =>
+        {
+            renewalStarted.SetResult();
+            return release.Task;
+        });
+
+        // Act
+        var request = _stateManager.GetAccessTokenAsync();
+        await renewalStarted.Task;
+        _stateManager.SetAuthentication(Authenticated("new-session-token", TimeSpan.FromHours(1)));
+        release.SetResult(Authenticated("renewed-token", TimeSpan.FromHours(1)));
+        var result = await request;
+
+        // Assert
+        Assert.Equal(Messages.NoAuthenticationFound, result);
+        Assert.Equal("new-session-token", _stateManager.CurrentAuthentication?.AccessToken);
+        Assert.Equal("new-session-token", await _stateManager.GetAccessTokenAsync());
+    }
+
+    private static McpAuthenticationResult Authenticated(string accessToken, TimeSpan lifetime) =>
+        McpAuthenticationResult.Success(accessToken, ServicePrincipalUser, "test-tenant", DateTime.UtcNow + lifetime);
+}
@@ -0,0 +1,271 @@
+using System.Text;
+using System.Text.Json;
+using DataFactory.MCP.Models.Dataflow.Definition;
+using DataFactory.MCP.Services;
+using Microsoft.Extensions.Logging.Abstractions;
+using Xunit;
+
+namespace DataFactory.MCP.Tests.Services;
+
+/// <summary>
+/// Unit tests for AddOrUpdateQueryInDefinition: splicing one query into mashup.pq and registering it in queryMetadata.json.
+/// Where the result differs from the previous line-based rewrite, the test says how.
+/// </summary>
+public class DataflowDefinitionProcessorTests
+{
+    private const string Section = "section Section1;";
+    private const string NewCode = "let Source = 1 in Source";
+
+    private const string Destination = """[DataDestinations = {[Definition = [Kind = "Reference", QueryName = "Orders_DataDestination", IsNewTarget = true], Settings = [Kind = "Manual", AllowCreation = true, UpdateMethod = [Kind = "Replace"], TypeSettings = [Kind = "Table"]]]}]""";
+
+    private static readonly string MultiLineDestination = Lf(
+        """[DataDestinations = {[Definition = [Kind = "Reference", QueryName = "Orders_DataDestination", IsNewTarget = true],""",
+        """    Settings = [Kind = "Manual", AllowCreation = true, UpdateMethod = [Kind = "Replace"], TypeSettings = [Kind = "Table"]]]}]""");
+
+    private static readonly string Customers = Lf(
+        "shared Customers = let",
+        """    Source = Sql.Database("server", "db"),""",
+        """    Options = [Csv = [Delimiter = ";"]]""",
+        "in",
+        "    Source;");
+
+    private static readonly string Orders = Lf(
+        "shared Orders = let",
+        "    Source = Customers",
+        "in",
+        "    Source;");
+
+    private static readonly string OrdersDestination = Lf(
+        "shared Orders_DataDestination = let",
+        "    Pattern = Lakehouse.Contents(null),",
+        """    Navigation = Pattern{[workspaceId = "ws"]}[Data]""",
+        "in",
+        "    Navigation;");
+
+    private readonly DataflowDefinitionProcessor _processor = new(
+        NullLogger<DataflowDefinitionProcessor>.Instance,
+        new DataTransformationService(NullLogger<DataTransformationService>.Instance));
+
+    [Fact]
+    public void AddOrUpdateQuery_ReplaceFirstMember_ShouldLeaveOtherMembersUntouched()
+    {
+        // Arrange
+        var mashup = Crlf(Section, Customers, Destination, Orders, OrdersDestination);
+
+        // Act
+        var result = UpdateMashup(mashup, "Customers", NewCode);
+
+        // Assert - same as before
+        Assert.Equal(Crlf(Section, Replaced("Customers"), Destination, Orders, OrdersDestination), result);
+    }
+
+    [Fact]
+    public void AddOrUpdateQuery_MemberWithAttribute_ShouldReplaceAttributeWithMember()
+    {
+        // Arrange
+        var mashup = Crlf(Section, Customers, Destination, Orders, OrdersDestination);
+
+        // Act
+        var withAttribute = UpdateMashup(mashup, "Orders", NewCode, Destination);
+        var withoutAttribute = UpdateMashup(mashup, "Orders", NewCode);
+
+        // Assert - same as before
+        Assert.Equal(Crlf(Section, Customers, Destination, Replaced("Orders"), OrdersDestination), withAttribute);
+        Assert.Equal(Crlf(Section, Customers, Replaced("Orders"), OrdersDestination), withoutAttribute);
+    }
+
+    [Fact]
+    public void AddOrUpdateQuery_MultiLineDataDestinations_ShouldReplaceEveryAttributeLine()
+    {
+        // Arrange
+        var mashup = Crlf(Section, Customers, MultiLineDestination, Orders, OrdersDestination);
+
+        // Act
+        var result = UpdateMashup(mashup, "Orders", NewCode, Destination);
+
+        // Assert - same as before
+        Assert.Equal(Crlf(Section, Customers, Destination, Replaced("Orders"), OrdersDestination), result);
+    }
+
+    [Fact]
+    public void AddOrUpdateQuery_PreviousMemberWithNestedRecord_ShouldStopAtItsSemicolon()
+    {
+        // Arrange - Customers has a "]]" line and Orders has no attribute
+        var mashup = Crlf(Section, Customers, Orders, OrdersDestination);
+
+        // Act
+        var result = UpdateMashup(mashup, "Orders", NewCode);
+
+        // Assert - previously the look-back took Customers' "Options = [Csv = [...]]" line and everything after it
+        Assert.Equal(Crlf(Section, Customers, Replaced("Orders"), OrdersDestination), result);
+    }
+
+    [Fact]
+    public void AddOrUpdateQuery_RecordAndListLiteralsWithSemicolons_ShouldReplaceWholeMember()
+    {
+        // Arrange - a record literal starts a line inside the member body
+        var raw = Lf(
+            "shared Raw = let",
+            """    Source = Csv.Document(File.Contents("raw.csv"),""",
+            """        [Delimiter = ";", Columns = 3]),""",
+            """    Separators = {";", ","}""",
+            "in",
+            "    Source;");
+        var next = Lf("shared Next = let", "    Source = Raw", "in", "    Source;");
+        var mashup = Crlf(Section, raw, next);
+
+        // Act
+        var result = UpdateMashup(mashup, "Raw", NewCode);
+
+        // Assert - previously the member ended at the "[Delimiter" line, leaving the rest of its body behind
+        Assert.Equal(Crlf(Section, Replaced("Raw"), next), result);
+    }
+
+    [Fact]
+    public void AddOrUpdateQuery_LfDocument_ShouldKeepLineEndings()
+    {
+        // Arrange
+        var mashup = Lf(Section, Customers, Destination, Orders, OrdersDestination);
+
+        // Act
+        var replaced = UpdateMashup(mashup, "Orders", NewCode);
+        var added = UpdateMashup(mashup, "Products", NewCode);
+
+        // Assert - previously the whole document was rewritten with CRLF
+        Assert.Equal(Lf(Section, Customers, Replaced("Orders"), OrdersDestination), replaced);
+        Assert.Equal(mashup + "\r\n" + Replaced("Products"), added);
+    }
+
+    [Theory]
+    [InlineData("")]
+    [InlineData("\r\n")]
+    public void AddOrUpdateQuery_ReplaceLastMember_ShouldSpliceToEndOfDocument(string trailer)
+    {
+        // Arrange
+        var mashup = Crlf(Section, Customers, Destination, Orders, OrdersDestination) + trailer;
+
+        // Act
+        var result = UpdateMashup(mashup, "Orders_DataDestination", NewCode);
+
+        // Assert - same as before, including dropping the trailing line break
+        Assert.Equal(Crlf(Section, Customers, Destination, Orders, Replaced("Orders_DataDestination")), result);
+    }
+
+    [Fact]
+    public void AddOrUpdateQuery_NewQuery_ShouldAppendMember()
+    {
+        // Arrange
+        var mashup = Crlf(Section, Customers, Destination, Orders, OrdersDestination);
+
+        // Act
+        var result = UpdateMashup(mashup, "Products", NewCode);
+
+        // Assert - same as before
+        Assert.Equal(Crlf(Section, Customers, Destination, Orders, OrdersDestination, Replaced("Products")), result);
+    }
+
+    [Fact]
+    public void AddOrUpdateQuery_QuotedQueryName_ShouldAddThenReplaceQuotedMember()
+    {
+        // Arrange
+        var mashup = Crlf(Section, Orders);
+
+        // Act
+        var added = UpdateMashup(mashup, "My Products", "let Source = 0 in Source");
+        var replaced = UpdateMashup(added, "My Products", NewCode);
+
+        // Assert
+        Assert.Equal(Crlf(Section, Orders, """shared #"My Products" = let Source = 0 in Source;"""), added);
+        Assert.Equal(Crlf(Section, Orders, $"""shared #"My Products" = {NewCode};"""), replaced);
+    }
+
+    [Fact]
+    public void AddOrUpdateQuery_SectionOnlyDocument_ShouldAddFirstMember()
+    {
+        // Act
+        var result = UpdateMashup(Section, "Products", NewCode);
+
+        // Assert
+        Assert.Equal(Crlf(Section, Replaced("Products")), result);
+    }
+
+    [Fact]
+    public void AddOrUpdateQuery_RegisteredQuery_ShouldLeaveQueryMetadataUntouched()
+    {
+        // Arrange
+        const string metadata = """{"formatVersion":"202502","documentLocale":"en-US","queriesMetadata":{"Orders":{"queryId":"orders-id","queryName":"Orders","loadEnabled":false}}}""";
+        var definition = CreateDefinition(Crlf(Section, Customers, Orders), metadata);
+
+        // Act
+        _processor.AddOrUpdateQueryInDefinition(definition, "Orders", NewCode);
+
+        // Assert - previously the metadata was parsed and re-serialized on every update
+        Assert.Equal(metadata, ReadPart(definition, "queryMetadata.json"));
+        Assert.Equal(Crlf(Section, Customers, Replaced("Orders")), ReadPart(definition, "mashup.pq"));
+    }
+
+    [Fact]
+    public void AddOrUpdateQuery_NewQuery_ShouldRegisterItAndKeepExistingEntries()
+    {
+        // Arrange
+        const string metadata = """{"formatVersion":"202502","queriesMetadata":{"Orders":{"queryId":"orders-id","queryName":"Orders","loadEnabled":false}}}""";
+        var definition = CreateDefinition(Crlf(Section, Orders), metadata);
+
+        // Act
+        _processor.AddOrUpdateQueryInDefinition(definition, "Products", NewCode);
+
+        // Assert
+        using var updated = JsonDocument.Parse(ReadPart(definition, "queryMetadata.json"));
+        var queries = updated.RootElement.GetProperty("queriesMetadata");
+        Assert.Equal("en-US", updated.RootElement.GetProperty("documentLocale").GetString());
+        Assert.Equal("orders-id", queries.GetProperty("Orders").GetProperty("queryId").GetString());
+        Assert.Equal("Products", queries.GetProperty("Products").GetProperty("queryName").GetString());
+        Assert.False(queries.GetProperty("Products").GetProperty("loadEnabled").GetBoolean());
+    }
+
+    [Fact]
+    public void AddOrUpdateQuery_RegisteredQueryWithDataDestinations_ShouldHideDestinationQuery()
+    {
+        // Arrange - registered, but the attribute names a destination query that still has to be hidden
+        const string metadata = """{"documentLocale":"en-US","queriesMetadata":{"Orders":{"queryId":"orders-id","queryName":"Orders","loadEnabled":false}}}""";
+        var definition = CreateDefinition(Crlf(Section, Orders), metadata);
+
+        // Act
+        _processor.AddOrUpdateQueryInDefinition(definition, "Orders", NewCode, Destination);
+
+        // Assert
+        using var updated = JsonDocument.Parse(ReadPart(definition, "queryMetadata.json"));
+        var destination = updated.RootElement.GetProperty("queriesMetadata").GetProperty("Orders_DataDestination");
+        Assert.True(destination.GetProperty("isHidden").GetBoolean());
+        Assert.Equal(Crlf(Section, Destination, Replaced("Orders")), ReadPart(definition, "mashup.pq"));
+    }
+
+    private string UpdateMashup(string mashup, string queryName, string mCode, string? attribute = null)
+    {
+        var definition = CreateDefinition(mashup, metadataJson: null);
+        _processor.AddOrUpdateQueryInDefinition(definition, queryName, mCode, attribute);
+        return ReadPart(definition, "mashup.pq");
+    }
+
+    private static DataflowDefinition CreateDefinition(string mashup, string? metadataJson)
+    {
+        var definition = new DataflowDefinition();
+        definition.Parts.Add(new DataflowDefinitionPart { Path = "mashup.pq", Payload = Encode(mashup) });
+        if (metadataJson != null)
+        {
+            definition.Parts.Add(new DataflowDefinitionPart { Path = "queryMetadata.json", Payload = Encode(metadataJson) });
+        }
+        return definition;
+    }
+
+    private static string ReadPart(DataflowDefinition definition, string path) =>
+        Encoding.UTF8.GetString(Convert.FromBase64String(definition.Parts.Single(p => p.Path == path).Payload));
+
+    private static string Encode(string text) => Convert.ToBase64String(Encoding.UTF8.GetBytes(text));
+
+    private static string Replaced(string queryName) => $"shared {queryName} = {NewCode};";
+
+    private static string Lf(params string[] blocks) => string.Join("\n", blocks);
+
+    private static string Crlf(params string[] blocks) => string.Join("\n", blocks).ReplaceLineEndings("\r\n");
+}
@@ -0,0 +1,81 @@
+using System.Net;
+using DataFactory.MCP.Models.Dataflow.Query;
+using DataFactory.MCP.Services;
+using DataFactory.MCP.Services.DMTSv2;
+using DataFactory.MCP.Tests.Infrastructure;
+using Microsoft.Extensions.Logging.Abstractions;
+using Xunit;
+
+namespace DataFactory.MCP.Tests.Services;
+
+/// <summary>
+/// Unit tests for the streamed summary mode of ExecuteQueryAsync (maxRows), against a stubbed Fabric API
+/// </summary>
+public class FabricDataflowServiceTests
+{
+    private const string WorkspaceId = "11111111-1111-1111-1111-111111111111";
+    private const string DataflowId = "22222222-2222-2222-2222-222222222222";
+
+    private static readonly ExecuteDataflowQueryRequest Request = new()
+    {
+        QueryName = "Orders",
+        CustomMashupDocument = "section Section1; shared Orders = #table({\"Id\"}, {{1}});"
+    };
+
+    private static FabricDataflowService CreateService(Func<Stream> responseBody)
+    {
+        var factory = new StubHttpClientFactory(_ => new HttpResponseMessage(HttpStatusCode.OK)
+        {
+            Content = new StreamContent(responseBody())
+        });
+        return new FabricDataflowService(
+            factory,
+            NullLogger<FabricDataflowService>.Instance,
+            new ValidationService(),
+            new ArrowDataReaderService(NullLogger<ArrowDataReaderService>.Instance),
+            new GatewayClusterDatasourceService(factory, NullLogger<GatewayClusterDatasourceService>.Instance),
+            new DataflowDefinitionProcessor(
+                NullLogger<DataflowDefinitionProcessor>.Instance,
+                new DataTransformationService(NullLogger<DataTransformationService>.Instance)));
+    }
+
+    [Fact]
+    public async Task ExecuteQuerySummaryAsync_ShouldStreamSampleAndStatisticsWithoutBufferingData()
+    {
+        // Arrange
+        var arrow = ArrowTestData.Stream(
+            ArrowTestData.Batch(("Id", ArrowTestData.Int32Range(0, 500))),
+            ArrowTestData.Batch(("Id", ArrowTestData.Int32Range(500, 500))));
+        var service = CreateService(() => arrow);
+
+        // Act
+        var response = await service.ExecuteQuerySummaryAsync(WorkspaceId, DataflowId, Request, maxSampleRows: 20);
+
+        // Assert
+        Assert.True(response.Success);
+        Assert.Null(response.Data);
+        Assert.Equal(arrow.Length, response.ContentLength);
+        Assert.Equal(1000, response.Summary!.EstimatedRowCount);
+        Assert.Equal(20, response.Summary.SampleRowCount);
+        Assert.True(response.Summary.IsSampled);
+        Assert.Equal("999", response.Summary.ColumnStatistics!["Id"].Max);
+    }
+
+    [Fact]
+    public async Task ExecuteQuerySummaryAsync_WhenConnectionDropsMidStream_ShouldReturnFailure()
+    {
+        // Arrange - the body fails after the schema and part of the first batch
+        var arrow = ArrowTestData.Stream(
+            ArrowTestData.Batch(("Id", ArrowTestData.Int32Range(0, 500))),
+            ArrowTestData.Batch(("Id", ArrowTestData.Int32Range(500, 500))));
+        var service = CreateService(() => new FailingReadStream(arrow, arrow.Length / 3));
+
+        // Act
+        var response = await service.ExecuteQuerySummaryAsync(WorkspaceId, DataflowId, Request, maxSampleRows: 20);
+
+        // Assert - no partial summary is reported as a success
+        Assert.False(response.Success);
+        Assert.Null(response.Summary);
+        Assert.Contains("Query execution error", response.Error);
+    }
+}
@@ -0,0 +1,384 @@
+using System.Net;
+using System.Text;
+using DataFactory.MCP.Abstractions.Interfaces;
+using DataFactory.MCP.Models;
+using DataFactory.MCP.Models.Connection;
+using DataFactory.MCP.Models.Gateway;
+using DataFactory.MCP.Services;
+using DataFactory.MCP.Tests.Infrastructure;
+using Microsoft.Extensions.Logging.Abstractions;
+using Xunit;
+
+namespace DataFactory.MCP.Tests.Services;
+
+/// <summary>
+/// Unit tests for FabricMetadataCache expiry, eviction, single-flight loading, invalidation and tenant scoping
+/// </summary>
+public class FabricMetadataCacheTests
+{
+    private static readonly TimeSpan Ttl = TimeSpan.FromMinutes(5);
+
+    private readonly ManualTimeProvider _clock = new();
+    private readonly StubAuthenticationService _auth = new(Jwt(tenant: "tenant-1", objectId: "user-1"));
+    private readonly FabricMetadataCache _cache;
+    private int _loads;
+
+    public FabricMetadataCacheTests()
+    {
+        _cache = new FabricMetadataCache(_auth, NullLogger<FabricMetadataCache>.Instance, _clock);
+    }
+
+    [Fact]
+    public async Task GetOrLoadAsync_WithinTtl_ShouldServeCachedValue()
+    {
+        // Act
+        var first = await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "", Ttl, Load);
+        _clock.Advance(Ttl - TimeSpan.FromSeconds(1));
+        var second = await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "", Ttl, Load);
+
+        // Assert
+        Assert.Same(first, second);
+        Assert.Equal(1, _loads);
+        Assert.Equal(1, _cache.Hits);
+        Assert.Equal(1, _cache.Misses);
+    }
+
+    [Fact]
+    public async Task GetOrLoadAsync_AfterTtl_ShouldReload()
+    {
+        // Act
+        var first = await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "", Ttl, Load);
+        _clock.Advance(Ttl);
+        var second = await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "", Ttl, Load);
+
+        // Assert
+        Assert.NotSame(first, second);
+        Assert.Equal(2, _loads);
+        Assert.Equal(0, _cache.Hits);
+    }
+
+    [Fact]
+    public async Task GetOrLoadAsync_DifferentArguments_ShouldCacheSeparately()
+    {
+        // Act
+        await _cache.GetOrLoadAsync(FabricMetadataCache.ConnectionTypes, "", Ttl, Load);
+        await _cache.GetOrLoadAsync(FabricMetadataCache.ConnectionTypes, "gateway-1", Ttl, Load);
+        await _cache.GetOrLoadAsync(FabricMetadataCache.ConnectionTypes, "gateway-1", Ttl, Load);
+
+        // Assert
+        Assert.Equal(2, _loads);
+        Assert.Equal(2, _cache.Count);
+    }
+
+    [Fact]
+    public async Task GetOrLoadAsync_OverMaxEntries_ShouldEvictLeastRecentlyUsed()
+    {
+        // Arrange - fill the cache, 100 ms apart, then use the oldest entry again
+        for (var i = 0; i < FabricMetadataCache.MaxEntries; i++)
+        {
+            await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, $"page-{i}", Ttl, Load);
+            _clock.Advance(TimeSpan.FromMilliseconds(100));
+        }
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "page-0", Ttl, Load);
+
+        // Act
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "page-new", Ttl, Load);
+        var loadsBefore = _loads;
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "page-0", Ttl, Load);
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "page-1", Ttl, Load);
+
+        // Assert - page-0 was used recently, page-1 was the least recently used
+        Assert.Equal(loadsBefore + 1, _loads);
+        Assert.Equal(FabricMetadataCache.MaxEntries, _cache.Count);
+        Assert.Equal(2, _cache.Evictions);
+    }
+
+    [Fact]
+    public async Task GetOrLoadAsync_OverMaxEntries_ShouldEvictExpiredEntriesFirst()
+    {
+        // Arrange - one short-lived entry among recently used ones
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Capacities, "", TimeSpan.FromSeconds(1), Load);
+        _clock.Advance(TimeSpan.FromSeconds(2));
+        for (var i = 0; i < FabricMetadataCache.MaxEntries - 1; i++)
+        {
+            await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, $"page-{i}", Ttl, Load);
+        }
+        _clock.Advance(TimeSpan.FromSeconds(1));
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "page-0", Ttl, Load);
+
+        // Act
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "page-new", Ttl, Load);
+        var loadsBefore = _loads;
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "page-1", Ttl, Load);
+
+        // Assert - the expired capacities entry went, not the least recently used workspace page
+        Assert.Equal(loadsBefore, _loads);
+        Assert.Equal(1, _cache.Evictions);
+        Assert.Equal(FabricMetadataCache.MaxEntries, _cache.Count);
+    }
+
+    [Fact]
+    public async Task GetOrLoadAsync_ConcurrentMisses_ShouldShareOneLoad()
+    {
+        // Arrange
+        var release = new TaskCompletionSource<object>(TaskCreationOptions.RunContinuationsAsynchronously);
+        Func<Task<object>> load = () =>
+        {
+            Interlocked.Increment(ref _loads);
+            return release.Task;
+        };
+
+        // Act
+        var callers = Enumerable.Range(0, 10)
+            .Select(_ => _cache.GetOrLoadAsync(FabricMetadataCache.Gateways, "", Ttl, load))
+            .ToList();
+        var value = new object();
+        release.SetResult(value);
+        var results = await Task.WhenAll(callers);
+
+        // Assert
+        Assert.Equal(1, _loads);
+        Assert.Equal(1, _cache.Misses);
+        Assert.Equal(9, _cache.SharedWaits);
+        Assert.All(results, result => Assert.Same(value, result));
+    }
+
+    [Fact]
+    public async Task GetOrLoadAsync_FailedLoad_ShouldNotBeCached()
+    {
+        // Arrange
+        var attempts = 0;
+        Func<Task<object>> load = () => ++attempts == 1
+            ? Task.FromException<object>(new HttpRequestException("Fabric unavailable"))
+            : Task.FromResult(new object());
+
+        // Act
+        await Assert.ThrowsAsync<HttpRequestException>(() => _cache.GetOrLoadAsync(FabricMetadataCache.Gateways, "", Ttl, load));
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Gateways, "", Ttl, load);
+
+        // Assert
+        Assert.Equal(2, attempts);
+        Assert.Equal(1, _cache.Count);
+    }
+
+    [Fact]
+    public async Task Invalidate_ShouldDropOnlyTheGivenKinds()
+    {
+        // Arrange
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Gateways, "", Ttl, Load);
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Gateways, "page-2", Ttl, Load);
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "", Ttl, Load);
+
+        // Act
+        _cache.Invalidate(FabricMetadataCache.Gateways);
+
+        // Assert
+        Assert.Equal(2, _cache.Invalidations);
+        Assert.Equal(1, _cache.Count);
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "", Ttl, Load);
+        Assert.Equal(3, _loads);
+    }
+
+    [Fact]
+    public async Task Invalidate_DuringLoad_ShouldServeButNotKeepTheResult()
+    {
+        // Arrange
+        var release = new TaskCompletionSource<object>(TaskCreationOptions.RunContinuationsAsynchronously);
+        var loading = _cache.GetOrLoadAsync(FabricMetadataCache.Gateways, "", Ttl, () => release.Task);
+
+        // Act - a gateway is created while the listing is in flight
+        _cache.Invalidate(FabricMetadataCache.Gateways);
+        var stale = new object();
+        release.SetResult(stale);
+
+        // Assert
+        Assert.Same(stale, await loading);
+        Assert.Equal(0, _cache.Count);
+    }
+
+    [Fact]
+    public async Task CreateConnectionAsync_ShouldInvalidateConnectionTypesAndGateways()
+    {
+        // Arrange
+        var factory = FabricStub();
+        var connections = new FabricConnectionService(factory, NullLogger<FabricConnectionService>.Instance, new ValidationService(), _cache);
+        var gateways = new FabricGatewayService(factory, NullLogger<FabricGatewayService>.Instance, new ValidationService(), _cache);
+        await connections.ListSupportedConnectionTypesAsync();
+        await gateways.ListGatewaysAsync();
+        await connections.ListSupportedConnectionTypesAsync();
+        await gateways.ListGatewaysAsync();
+
+        // Act
+        await connections.CreateConnectionAsync(new CreateConnectionRequest { DisplayName = "Sales", ConnectivityType = "ShareableCloud" });
+        await connections.ListSupportedConnectionTypesAsync();
+        await gateways.ListGatewaysAsync();
+
+        // Assert
+        Assert.Equal(new[]
+        {
+            "GET /v1/connections/supportedConnectionTypes",
+            "GET /v1/gateways",
+            "POST /v1/connections",
+            "GET /v1/connections/supportedConnectionTypes",
+            "GET /v1/gateways"
+        }, factory.Requests);
+    }
+
+    [Fact]
+    public async Task CreateVirtualnetworkGatewayAsync_ShouldInvalidateGatewaysOnly()
+    {
+        // Arrange
+        var factory = FabricStub();
+        var connections = new FabricConnectionService(factory, NullLogger<FabricConnectionService>.Instance, new ValidationService(), _cache);
+        var gateways = new FabricGatewayService(factory, NullLogger<FabricGatewayService>.Instance, new ValidationService(), _cache);
+        await connections.ListSupportedConnectionTypesAsync();
+        await gateways.ListGatewaysAsync();
+
+        // Act
+        await gateways.CreateVirtualnetworkGatewayAsync(new CreateVirtualnetworkGatewayRequest
+        {
+            DisplayName = "VNet gateway",
+            CapacityId = "33333333-3333-3333-3333-333333333333"
+        });
+        await connections.ListSupportedConnectionTypesAsync();
+        await gateways.ListGatewaysAsync();
+
+        // Assert
+        Assert.Equal(new[]
+        {
+            "GET /v1/connections/supportedConnectionTypes",
+            "GET /v1/gateways",
+            "POST /v1/gateways",
+            "GET /v1/gateways"
+        }, factory.Requests);
+    }
+
+    [Fact]
+    public async Task GetOrLoadAsync_DifferentIdentityOrTenant_ShouldNotShareEntries()
+    {
+        // Act
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "", Ttl, Load);
+        _auth.Token = Jwt(tenant: "tenant-1", objectId: "user-2");
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "", Ttl, Load);
+        _auth.Token = Jwt(tenant: "tenant-2", objectId: "user-1");
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "", Ttl, Load);
+
+        // Assert
+        Assert.Equal(3, _loads);
+        Assert.Equal(3, _cache.Count);
+    }
+
+    [Fact]
+    public async Task GetOrLoadAsync_RenewedTokenForSameIdentity_ShouldHit()
+    {
+        // Act
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "", Ttl, Load);
+        _auth.Token = Jwt(tenant: "tenant-1", objectId: "user-1", expires: 2);
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "", Ttl, Load);
+
+        // Assert
+        Assert.Equal(1, _loads);
+        Assert.Equal(1, _cache.Hits);
+    }
+
+    [Fact]
+    public async Task GetOrLoadAsync_TokenWithoutOid_ShouldScopeBySubject()
+    {
+        // Act
+        _auth.Token = Jwt(tenant: "tenant-1", subject: "subject-1");
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "", Ttl, Load);
+        _auth.Token = Jwt(tenant: "tenant-1", subject: "subject-2");
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "", Ttl, Load);
+        _auth.Token = Jwt(tenant: "tenant-1", subject: "subject-1");
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "", Ttl, Load);
+
+        // Assert
+        Assert.Equal(2, _loads);
+        Assert.Equal(1, _cache.Hits);
+    }
+
+    [Theory]
+    [InlineData(Messages.NoAuthenticationFound)]
+    [InlineData("not-a-jwt")]
+    [InlineData("eyJ.bm90LWpzb24.signature")]
+    public async Task GetOrLoadAsync_WithoutUsableToken_ShouldBypassCache(string token)
+    {
+        // Arrange
+        _auth.Token = token;
+
+        // Act
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "", Ttl, Load);
+        await _cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "", Ttl, Load);
+
+        // Assert
+        Assert.Equal(2, _loads);
+        Assert.Equal(0, _cache.Count);
+    }
+
+    [Fact]
+    public async Task CreateDisabled_ShouldLoadEveryTime()
+    {
+        // Arrange
+        var cache = FabricMetadataCache.CreateDisabled(_auth, NullLogger<FabricMetadataCache>.Instance);
+
+        // Act
+        await cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "", Ttl, Load);
+        await cache.GetOrLoadAsync(FabricMetadataCache.Workspaces, "", Ttl, Load);
+
+        // Assert
+        Assert.Equal(2, _loads);
+        Assert.Equal(2, cache.Misses);
+        Assert.Equal(0, cache.Count);
+    }
+
+    private Task<object> Load()
+    {
+        Interlocked.Increment(ref _loads);
+        return Task.FromResult(new object());
+    }
+
+    /// <summary>
+    /// Fabric stand-in answering the list calls with empty pages and the create calls with no body.
+    /// </summary>
+    private static StubHttpClientFactory FabricStub() => new(request => request.Method == HttpMethod.Get
+        ? new HttpResponseMessage(HttpStatusCode.OK) { Content = new StringContent("""{"value":[]}""", Encoding.UTF8, "application/json") }
+        : new HttpResponseMessage(HttpStatusCode.Created));
+
+    /// <summary>
+    /// Unsigned JWT carrying the claims the cache scopes by.
+    /// </summary>
+    private static string Jwt(string tenant, string? objectId = null, string? subject = null, int expires = 1)
+    {
+        var claims = new Dictionary<string, string> { ["tid"] = tenant, ["exp"] = expires.ToString() };
+        if (objectId != null) claims["oid"] = objectId;
+        if (subject != null) claims["sub"] = subject;
+
+        var payload = "{" + string.Join(",", claims.Select(c => $"\"{c.Key}\":\"{c.Value}\"")) + "}";
+        return $"{Base64Url("""{"alg":"none","typ":"JWT"}""")}.{Base64Url(payload)}.signature";
+    }
+
+    private static string Base64Url(string json) =>
+        Convert.ToBase64String(Encoding.UTF8.GetBytes(json)).TrimEnd('=').Replace('+', '-').Replace('/', '_');
+
+    private sealed class StubAuthenticationService(string token) : IAuthenticationService
+    {
+        public string Token { get; set; } = token;
+
+        public Task<string> GetAccessTokenAsync() => Task.FromResult(Token);
+
+        public Task<string> GetAccessTokenAsync(string[] scopes) => Task.FromResult(Token);
+
+        public Task<string> AuthenticateInteractiveAsync() => throw new NotSupportedException();
+
+        public Task<string> StartDeviceCodeAuthAsync() => throw new NotSupportedException();
+
+        public Task<string> CheckDeviceAuthStatusAsync() => throw new NotSupportedException();
+
+        public Task<string> AuthenticateServicePrincipalAsync(string applicationId, string clientSecret, string? tenantId = null)
+            => throw new NotSupportedException();
+
+        public string GetAuthenticationStatus() => throw new NotSupportedException();
+
+        public Task<string> SignOutAsync() => throw new NotSupportedException();
+    }
+}
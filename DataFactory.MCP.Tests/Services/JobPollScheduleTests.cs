@@ -0,0 +1,94 @@
+using DataFactory.MCP.Services.BackgroundTasks;
+using Xunit;
+
+namespace DataFactory.MCP.Tests.Services;
+
+/// <summary>
+/// Unit tests for the adaptive background job poll schedule
+/// </summary>
+public class JobPollScheduleTests
+{
+    [Theory]
+    [InlineData(0, 1)]
+    [InlineData(5, 1)]
+    [InlineData(30, 3)]
+    [InlineData(25, 2.5)]
+    [InlineData(600, 3)]
+    [InlineData(3600, 3)]
+    public void NextDelay_WithoutHistory_ShouldBeTenthOfAgeWithinBounds(double ageSeconds, double expectedSeconds)
+    {
+        // Act
+        var delay = JobPollSchedule.NextDelay(TimeSpan.FromSeconds(ageSeconds), expectedDuration: null);
+
+        // Assert
+        Assert.Equal(TimeSpan.FromSeconds(expectedSeconds), delay);
+    }
+
+    [Theory]
+    [InlineData(0, 60, 3)]
+    [InlineData(52, 60, 2)]
+    [InlineData(58, 60, 1)]
+    [InlineData(60, 60, 1)]
+    [InlineData(90, 60, 3)]
+    [InlineData(0, 900, 3)]
+    [InlineData(2000, 900, 3)]
+    public void NextDelay_WithHistory_ShouldConvergeOnExpectedFinish(double ageSeconds, double expectedDurationSeconds, double expectedSeconds)
+    {
+        // Act
+        var delay = JobPollSchedule.NextDelay(TimeSpan.FromSeconds(ageSeconds), TimeSpan.FromSeconds(expectedDurationSeconds));
+
+        // Assert
+        Assert.Equal(TimeSpan.FromSeconds(expectedSeconds), delay);
+    }
+
+    [Fact]
+    public void NextDelay_ShouldNeverExceedMaxInterval()
+    {
+        // Arrange
+        var ages = Enumerable.Range(0, 500).Select(i => TimeSpan.FromSeconds(i * 30));
+        TimeSpan?[] expectedDurations = [null, TimeSpan.FromSeconds(20), TimeSpan.FromMinutes(15), TimeSpan.FromHours(3)];
+
+        // Act
+        var delays = ages.SelectMany(age => expectedDurations.Select(expected => JobPollSchedule.NextDelay(age, expected))).ToList();
+
+        // Assert
+        Assert.All(delays, delay => Assert.InRange(delay, JobPollSchedule.MinInterval, JobPollSchedule.MaxInterval));
+        Assert.True(JobPollSchedule.MaxInterval <= TimeSpan.FromSeconds(3));
+    }
+
+    [Fact]
+    public void UpdateExpectedDuration_WithoutHistory_ShouldUseObservedDuration()
+    {
+        // Act
+        var expected = JobPollSchedule.UpdateExpectedDuration(null, TimeSpan.FromSeconds(42));
+
+        // Assert
+        Assert.Equal(TimeSpan.FromSeconds(42), expected);
+    }
+
+    [Fact]
+    public void UpdateExpectedDuration_WithHistory_ShouldWeightPreviousEstimate()
+    {
+        // Act
+        var expected = JobPollSchedule.UpdateExpectedDuration(TimeSpan.FromSeconds(100), TimeSpan.FromSeconds(200));
+
+        // Assert - 0.7 * 100 + 0.3 * 200
+        Assert.Equal(TimeSpan.FromSeconds(130), expected);
+    }
+
+    [Fact]
+    public void UpdateExpectedDuration_RepeatedRuns_ShouldConvergeOnNewDuration()
+    {
+        // Arrange
+        TimeSpan? expected = TimeSpan.FromMinutes(15);
+
+        // Act
+        for (var run = 0; run < 20; run++)
+        {
+            expected = JobPollSchedule.UpdateExpectedDuration(expected, TimeSpan.FromSeconds(30));
+        }
+
+        // Assert
+        Assert.InRange(expected!.Value, TimeSpan.FromSeconds(30), TimeSpan.FromSeconds(31));
+    }
+}
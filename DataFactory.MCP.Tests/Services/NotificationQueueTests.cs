@@ -0,0 +1,249 @@
+using DataFactory.MCP.Abstractions.Interfaces;
+using DataFactory.MCP.Services;
+using DataFactory.MCP.Services.Notifications;
+using Microsoft.Extensions.Logging.Abstractions;
+using ModelContextProtocol;
+using ModelContextProtocol.Server;
+using Xunit;
+
+namespace DataFactory.MCP.Tests.Services;
+
+/// <summary>
+/// Unit tests for NotificationQueue coalescing, batching and per-session delivery
+/// </summary>
+public class NotificationQueueTests : IAsyncDisposable
+{
+    private static readonly TimeSpan WaitLimit = TimeSpan.FromSeconds(10);
+
+    private readonly McpSessionAccessor _sessionAccessor = new();
+    private readonly RecordingNotificationService _notificationService;
+    private readonly McpServer _sessionA = CreateSession();
+    private readonly McpServer _sessionB = CreateSession();
+
+    public NotificationQueueTests()
+    {
+        _notificationService = new RecordingNotificationService(_sessionAccessor);
+    }
+
+    [Fact]
+    public void Coalesce_SingleNotification_ShouldReturnItUnchanged()
+    {
+        // Arrange
+        var notification = Notification("Dataflow Refresh Completed", NotificationLevel.Success);
+
+        // Act
+        var result = NotificationQueue.Coalesce([notification]);
+
+        // Assert
+        Assert.Same(notification, result);
+    }
+
+    [Fact]
+    public void Coalesce_SeveralNotifications_ShouldListMostSevereFirstWithMostSevereLevel()
+    {
+        // Arrange
+        var notifications = new[]
+        {
+            Notification("First Completed", NotificationLevel.Success),
+            Notification("Second Failed", NotificationLevel.Error),
+            Notification("Third Completed", NotificationLevel.Success)
+        };
+
+        // Act
+        var result = NotificationQueue.Coalesce(notifications);
+
+        // Assert
+        Assert.Equal("3 background jobs finished", result.Title);
+        Assert.Equal(NotificationLevel.Error, result.Level);
+        Assert.Equal(
+            new[] { "Second Failed: message", "First Completed: message", "Third Completed: message" },
+            result.Message.Split('\n'));
+        Assert.Equal(notifications[0].QueuedAt, result.QueuedAt);
+    }
+
+    [Fact]
+    public void Coalesce_MoreThanMaxLines_ShouldSummarizeTheRest()
+    {
+        // Arrange
+        var notifications = Enumerable.Range(1, NotificationQueue.MaxCoalescedLines + 5)
+            .Select(i => Notification($"Job {i} Completed", NotificationLevel.Success))
+            .ToList();
+
+        // Act
+        var lines = NotificationQueue.Coalesce(notifications).Message.Split('\n');
+
+        // Assert
+        Assert.Equal(NotificationQueue.MaxCoalescedLines + 1, lines.Length);
+        Assert.Equal("Job 1 Completed: message", lines[0]);
+        Assert.Equal($"Job {NotificationQueue.MaxCoalescedLines} Completed: message", lines[^2]);
+        Assert.Equal("... and 5 more", lines[^1]);
+    }
+
+    [Fact]
+    public void Coalesce_ExactlyMaxLines_ShouldNotSummarize()
+    {
+        // Arrange
+        var notifications = Enumerable.Range(1, NotificationQueue.MaxCoalescedLines)
+            .Select(i => Notification($"Job {i} Completed", NotificationLevel.Success))
+            .ToList();
+
+        // Act
+        var lines = NotificationQueue.Coalesce(notifications).Message.Split('\n');
+
+        // Assert
+        Assert.Equal(NotificationQueue.MaxCoalescedLines, lines.Length);
+        Assert.DoesNotContain(lines, line => line.StartsWith("..."));
+    }
+
+    [Fact]
+    public async Task Enqueue_BurstWhileDelivering_ShouldDeliverOneNotificationForTheBurst()
+    {
+        // Arrange
+        using var queue = CreateQueue();
+        var release = _notificationService.Hold("Blocker");
+        queue.Enqueue(Notification("Blocker", NotificationLevel.Info, _sessionA));
+        await _notificationService.WaitForDeliveriesAsync(1);
+
+        // Act - five completions arrive while the first notification is still being shown
+        for (var i = 1; i <= 5; i++)
+        {
+            queue.Enqueue(Notification($"Job {i} Completed", NotificationLevel.Success, _sessionA));
+        }
+        release.SetResult();
+        await _notificationService.WaitForDeliveriesAsync(2);
+
+        // Assert
+        var burst = _notificationService.Deliveries[1];
+        Assert.Equal("5 background jobs finished", burst.Title);
+        Assert.Equal(5, burst.Message.Split('\n').Length);
+        Assert.Same(_sessionA, burst.Session);
+        Assert.Equal(2, _notificationService.Deliveries.Count);
+    }
+
+    [Fact]
+    public async Task Enqueue_BatchForSeveralSessions_ShouldNotifyEachSessionInItsOwnSession()
+    {
+        // Arrange
+        using var queue = CreateQueue();
+        var release = _notificationService.Hold("Blocker");
+        queue.Enqueue(Notification("Blocker", NotificationLevel.Info));
+        await _notificationService.WaitForDeliveriesAsync(1);
+
+        // Act
+        queue.Enqueue(Notification("A1 Completed", NotificationLevel.Success, _sessionA));
+        queue.Enqueue(Notification("B1 Failed", NotificationLevel.Error, _sessionB));
+        queue.Enqueue(Notification("A2 Completed", NotificationLevel.Success, _sessionA));
+        release.SetResult();
+        await _notificationService.WaitForDeliveriesAsync(3);
+
+        // Assert
+        var deliveries = _notificationService.Deliveries.Skip(1).ToList();
+        var toA = Assert.Single(deliveries, d => ReferenceEquals(d.Session, _sessionA));
+        var toB = Assert.Single(deliveries, d => ReferenceEquals(d.Session, _sessionB));
+        Assert.Equal("2 background jobs finished", toA.Title);
+        Assert.Equal("B1 Failed", toB.Title);
+        Assert.Equal(NotificationLevel.Error, toB.Level);
+        Assert.Null(_notificationService.Deliveries[0].Session);
+    }
+
+    [Fact]
+    public async Task Enqueue_StalledSession_ShouldNotHoldUpOtherSessionsOrLaterBatches()
+    {
+        // Arrange
+        using var queue = CreateQueue(deliveryTimeout: TimeSpan.FromMilliseconds(200));
+        var release = _notificationService.Hold("Blocker");
+        _notificationService.Hold("Stalled");
+        queue.Enqueue(Notification("Blocker", NotificationLevel.Info));
+        await _notificationService.WaitForDeliveriesAsync(1);
+
+        // Act
+        queue.Enqueue(Notification("Stalled", NotificationLevel.Success, _sessionA));
+        queue.Enqueue(Notification("Delivered", NotificationLevel.Success, _sessionB));
+        release.SetResult();
+        await _notificationService.WaitForDeliveriesAsync(3);
+        queue.Enqueue(Notification("Later", NotificationLevel.Success, _sessionB));
+        await _notificationService.WaitForDeliveriesAsync(4);
+
+        // Assert
+        Assert.Equal(
+            new[] { "Blocker", "Delivered", "Later", "Stalled" },
+            _notificationService.Deliveries.Select(d => d.Title).Order(StringComparer.Ordinal));
+        Assert.Equal("Later", _notificationService.Deliveries[^1].Title);
+    }
+
+    public async ValueTask DisposeAsync()
+    {
+        await _sessionA.DisposeAsync();
+        await _sessionB.DisposeAsync();
+        GC.SuppressFinalize(this);
+    }
+
+    private NotificationQueue CreateQueue(TimeSpan? deliveryTimeout = null) => new(
+        _notificationService,
+        _sessionAccessor,
+        NullLogger<NotificationQueue>.Instance,
+        deliveryTimeout ?? WaitLimit);
+
+    private static QueuedNotification Notification(string title, NotificationLevel level, McpSession? session = null) => new()
+    {
+        Title = title,
+        Message = "message",
+        Level = level,
+        Session = session
+    };
+
+    /// <summary>
+    /// A server session over empty streams; only used as a distinct session to route notifications to.
+    /// </summary>
+    private static McpServer CreateSession() =>
+        McpServer.Create(new StreamServerTransport(Stream.Null, Stream.Null), new McpServerOptions());
+
+    private sealed record Delivery(string Title, string Message, NotificationLevel Level, McpSession? Session);
+
+    /// <summary>
+    /// Records each notification with the session it was delivered in; notifications with a held title
+    /// don't complete until released. Uses the default (zero) notification spacing.
+    /// </summary>
+    private sealed class RecordingNotificationService(IMcpSessionAccessor sessionAccessor) : IUserNotificationService
+    {
+        private readonly List<Delivery> _deliveries = new();
+        private readonly Dictionary<string, TaskCompletionSource> _held = new();
+
+        public IReadOnlyList<Delivery> Deliveries
+        {
+            get
+            {
+                lock (_deliveries)
+                {
+                    return _deliveries.ToList();
+                }
+            }
+        }
+
+        public TaskCompletionSource Hold(string title)
+        {
+            var release = new TaskCompletionSource(TaskCreationOptions.RunContinuationsAsynchronously);
+            _held[title] = release;
+            return release;
+        }
+
+        public Task NotifyAsync(string title, string message, NotificationLevel level = NotificationLevel.Info)
+        {
+            lock (_deliveries)
+            {
+                _deliveries.Add(new Delivery(title, message, level, sessionAccessor.CurrentSession));
+            }
+            return _held.TryGetValue(title, out var release) ? release.Task : Task.CompletedTask;
+        }
+
+        public async Task WaitForDeliveriesAsync(int count)
+        {
+            var deadline = DateTime.UtcNow + WaitLimit;
+            while (Deliveries.Count < count)
+            {
+                Assert.True(DateTime.UtcNow < deadline, $"Expected {count} deliveries, got {Deliveries.Count}");
+                await Task.Delay(10);
+            }
+        }
+    }
+}
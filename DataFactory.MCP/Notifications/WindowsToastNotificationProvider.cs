@@ -12,14 +12,14 @@ namespace DataFactory.MCP.Notifications;
 public class WindowsToastNotificationProvider : IPlatformNotificationProvider
 {
     private readonly ILogger<WindowsToastNotificationProvider> _logger;
-    private readonly string _xamlTemplate;
-    private readonly string _psScriptTemplate;
+
+    // Loaded with the first toast; the provider is constructed on every platform
+    private readonly Lazy<string> _xamlTemplate = new(() => LoadEmbeddedResource("ToastNotification.xaml"));
+    private readonly Lazy<string> _psScriptTemplate = new(() => LoadEmbeddedResource("ToastNotification.ps1"));
 
     public WindowsToastNotificationProvider(ILogger<WindowsToastNotificationProvider> logger)
     {
         _logger = logger;
-        _xamlTemplate = LoadEmbeddedResource("ToastNotification.xaml");
-        _psScriptTemplate = LoadEmbeddedResource("ToastNotification.ps1");
     }
 
     public bool IsSupported => RuntimeInformation.IsOSPlatform(OSPlatform.Windows);
@@ -45,12 +45,12 @@ public class WindowsToastNotificationProvider : IPlatformNotificationProvider
         var safeTitle = EscapeXml($"{icon} {title}");
         var safeMessage = EscapeXml(message);
 
-        var xamlContent = _xamlTemplate
+        var xamlContent = _xamlTemplate.Value
             .Replace("{{BorderColor}}", borderColor)
             .Replace("{{Title}}", safeTitle)
             .Replace("{{Message}}", safeMessage);
 
-        var psScript = _psScriptTemplate.Replace("{{XamlContent}}", xamlContent);
+        var psScript = _psScriptTemplate.Value.Replace("{{XamlContent}}", xamlContent);
 
         try
         {
@@ -2,6 +2,7 @@ using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Hosting;
 using Microsoft.Extensions.Logging;
 using DataFactory.MCP.Abstractions.Interfaces;
+using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Extensions;
 using DataFactory.MCP.Notifications;
 using DataFactory.MCP.Services;
@@ -16,9 +17,19 @@ using var loggerFactory = LoggerFactory.Create(b =>
     b.AddConsole(o => o.LogToStandardErrorThreshold = LogLevel.Trace));
 var logger = loggerFactory.CreateLogger("DataFactory.MCP.Startup");
 
+// Startup phase timings for evals/perf/bench_startup.py (no-op unless MCP_STARTUP_TRACE is set)
+StartupTrace.Mark("main", logger);
+
 // Register all DataFactory MCP services (shared with HTTP version)
 builder.Services.AddDataFactoryMcpServices();
 
+// Live eval runs against evals/perf stand-ins, only with DATAFACTORY_MCP_BENCHMARK_MODE set
+BenchmarkMode.LogStatus(logger);
+if (BenchmarkMode.Enabled)
+{
+    builder.Services.AddFabricStandinAuthentication(logger);
+}
+
 // Register platform-specific notification providers (stdio host only - HTTP uses MCP protocol)
 builder.Services.AddSingleton<IPlatformNotificationProvider, WindowsToastNotificationProvider>();
 builder.Services.AddSingleton<IPlatformNotificationProvider, MacOsNotificationProvider>();
@@ -26,6 +37,7 @@ builder.Services.AddSingleton<IPlatformNotificationProvider, LinuxNotificationPr
 
 // Register user notification service - stdio uses OS toast notifications
 builder.Services.AddSingleton<IUserNotificationService, SystemToastNotificationService>();
+StartupTrace.Mark("services", logger);
 
 // Configure MCP server with stdio transport and register tools
 logger.LogInformation("Registering core MCP tools...");
@@ -33,11 +45,23 @@ var mcpBuilder = builder.Services
     .AddMcpServer()
     .WithStdioServerTransport()
     .AddDataFactoryMcpTools();
+StartupTrace.Mark("tools", logger);
 
 // Register optional tools based on feature flags
 mcpBuilder.AddDataFactoryMcpOptionalTools(
     builder.Configuration,
     args.Concat(["--interactive-auth"]).ToArray(),  // Enable interactive auth by default for stdio
     logger);
+StartupTrace.Mark("optional-tools", logger);
+
+// Select the tool response format (--compact-responses trims responses for the model's context)
+builder.Services.AddMcpResponseFormat(builder.Configuration, args, logger);
+
+var host = builder.Build();
+StartupTrace.Mark("host-built", logger);
+
+// The stdio transport is reading requests once the host has started
+host.Services.GetRequiredService<IHostApplicationLifetime>().ApplicationStarted
+    .Register(() => StartupTrace.Mark("host-started", logger));
 
-await builder.Build().RunAsync();
+await host.RunAsync();
@@ -1,4 +1,5 @@
 using DataFactory.MCP.Abstractions.Interfaces;
+using DataFactory.MCP.Configuration;
 using DataFactory.MCP.Extensions;
 using DataFactory.WindowsMCP.Abstractions.Interfaces;
 using DataFactory.WindowsMCP.Extensions;
@@ -16,11 +17,13 @@ public class ExcelTool
 {
     private readonly IExcelService _excelService;
     private readonly IValidationService _validationService;
+    private readonly McpResponseFormat _responseFormat;
 
-    public ExcelTool(IExcelService excelService, IValidationService validationService)
+    public ExcelTool(IExcelService excelService, IValidationService validationService, McpResponseFormat responseFormat)
     {
         _excelService = excelService ?? throw new ArgumentNullException(nameof(excelService));
         _validationService = validationService ?? throw new ArgumentNullException(nameof(validationService));
+        _responseFormat = responseFormat ?? throw new ArgumentNullException(nameof(responseFormat));
     }
 
     [McpServerTool, Description(@"Adds a query table to an Excel workbook based on an M query. Optionally, if data results are provided, they will be included in the table.")]
@@ -48,23 +51,23 @@ public class ExcelTool
                 Details = response?.Success == true ? "Successfully added query table" : "Failed to add query table"
             };
 
-            return result.ToMcpJson();
+            return result.ToMcpJson(_responseFormat);
         }
         catch (ArgumentException ex)
         {
-            return ex.ToValidationError().ToMcpJson();
+            return ex.ToValidationError().ToMcpJson(_responseFormat);
         }
         catch (UnauthorizedAccessException ex)
         {
-            return ex.ToAuthenticationError().ToMcpJson();
+            return ex.ToAuthenticationError().ToMcpJson(_responseFormat);
         }
         catch (HttpRequestException ex)
         {
-            return ex.ToHttpError().ToMcpJson();
+            return ex.ToHttpError().ToMcpJson(_responseFormat);
         }
         catch (Exception ex)
         {
-            return ex.ToOperationError("adding query table").ToMcpJson();
+            return ex.ToOperationError("adding query table").ToMcpJson(_responseFormat);
         }
     }
 }
\ No newline at end of file
@@ -0,0 +1,286 @@
+"""
+Pool of equivalent chat completions deployments shared by the eval runners.
+
+One Azure OpenAI deployment's tokens-per-minute quota caps how fast a run can go. With a
+pool, every request goes to the deployment with the least expected wait: outstanding
+tokens (requests in flight, ~4 chars per token plus max_tokens) divided by the
+deployment's weight (its quota), scaled by its observed latency relative to the pool.
+A 429 puts the deployment in cooldown for its Retry-After (doubling per consecutive 429
+when the header is missing) and the request moves to another deployment.
+
+Deployments file (JSON list; keys come from environment variables, never from the file):
+
+    [
+      {"name": "eastus",  "base_url": "https://a.openai.azure.com", "deployment": "gpt-4o",
+       "api_key_env": "AOAI_EASTUS_KEY", "weight": 450},
+      {"name": "swedenc", "base_url": "https://b.openai.azure.com", "deployment": "gpt-4o-eval",
+       "api_key_env": "AOAI_SWEDEN_KEY", "weight": 150}
+    ]
+
+"deployment" defaults to the run's --model; "weight" (e.g. the quota in thousands of TPM)
+defaults to 1. Entries that are not Azure OpenAI endpoints are called OpenAI-style with
+"deployment" as the model name.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Union
+
+import http_pool
+
+
+API_VERSION = "2024-10-21"
+# Completion tokens assumed for requests without max_tokens
+DEFAULT_COMPLETION_TOKENS = 512
+MAX_COOLDOWN_S = 60.0
+# How long a request keeps waiting for quota while every deployment is throttled
+MAX_THROTTLED_WAIT_S = 300.0
+LATENCY_SMOOTHING = 0.2
+
+
+@dataclass
+class Deployment:
+    name: str
+    base_url: str
+    api_key: str
+    deployment: str
+    weight: float = 1.0
+
+    # Live state, guarded by the pool's lock
+    outstanding_tokens: int = 0
+    in_flight: int = 0
+    cooldown_until: float = 0.0
+    consecutive_throttles: int = 0
+    latency_ewma_ms: Optional[float] = None
+
+    # Stats
+    requests: int = 0
+    errors: int = 0
+    throttled: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    peak_in_flight: int = 0
+    latencies_ms: list[float] = field(default_factory=list)
+
+    @property
+    def is_azure(self) -> bool:
+        return "openai.azure.com" in self.base_url
+
+    def target(self) -> tuple[str, dict[str, str]]:
+        """Chat completions URL and headers for this deployment."""
+        base = self.base_url.rstrip("/")
+        if self.is_azure:
+            url = (f"{base}/chat/completions?api-version={API_VERSION}" if "/openai/deployments/" in base
+                   else f"{base}/openai/deployments/{self.deployment}/chat/completions?api-version={API_VERSION}")
+            return url, {"Content-Type": "application/json", "api-key": self.api_key}
+        return f"{base}/chat/completions", {"Content-Type": "application/json",
+                                             "Authorization": f"Bearer {self.api_key}"}
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))]
+
+
+def _retry_after_s(error: http_pool.HttpError) -> Optional[float]:
+    """Azure sends retry-after-ms and retry-after; OpenAI sends retry-after."""
+    headers = {k.lower(): v for k, v in error.headers.items()}
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except ValueError:
+        pass
+    return None
+
+
+class DeploymentPool:
+    """Thread-safe router over equivalent deployments, with per-deployment stats."""
+
+    def __init__(self, deployments: list[Deployment], max_failures: Optional[int] = None,
+                 max_throttled_wait_s: float = MAX_THROTTLED_WAIT_S,
+                 client: http_pool.KeepAliveClient = http_pool.DEFAULT_CLIENT):
+        if not deployments:
+            raise ValueError("A deployment pool needs at least one deployment")
+        self.deployments = deployments
+        # 5xx and transport failures are retried on the next deployment; 429s only cost time
+        self.max_failures = max_failures or len(deployments) + 1
+        self.max_throttled_wait_s = max_throttled_wait_s
+        self.client = client
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path: Path, model: str) -> "DeploymentPool":
+        entries = json.loads(Path(path).read_text())
+        deployments = []
+        for i, entry in enumerate(entries):
+            key_env = entry.get("api_key_env", "OPENAI_API_KEY")
+            api_key = os.environ.get(key_env, "")
+            if not api_key:
+                raise ValueError(f"Deployment {entry.get('name', i)}: environment variable {key_env} is not set")
+            deployments.append(Deployment(
+                name=entry.get("name") or f"deployment-{i}",
+                base_url=entry["base_url"],
+                api_key=api_key,
+                deployment=entry.get("deployment") or model,
+                weight=float(entry.get("weight", 1.0)),
+            ))
+        return cls(deployments)
+
+    @staticmethod
+    def estimate_tokens(body: dict, size: int) -> int:
+        """Prompt (~4 chars per token of the request) plus the completion budget."""
+        return size // 4 + int(body.get("max_tokens") or DEFAULT_COMPLETION_TOKENS)
+
+    def _score(self, d: Deployment, tokens: int, typical_latency: float) -> float:
+        latency_factor = (d.latency_ewma_ms or typical_latency) / typical_latency if typical_latency else 1.0
+        return (d.outstanding_tokens + tokens) / d.weight * latency_factor
+
+    def _acquire(self, tokens: int, exclude: set[str]) -> tuple[Optional[Deployment], float]:
+        """Reserve the best deployment; returns (None, seconds to wait) when all are cooling down."""
+        with self._lock:
+            now = time.monotonic()
+            observed = [d.latency_ewma_ms for d in self.deployments if d.latency_ewma_ms]
+            typical = _percentile(observed, 50) if observed else 0.0
+            ready = [d for d in self.deployments if d.cooldown_until <= now and d.name not in exclude]
+            if not ready:
+                ready = [d for d in self.deployments if d.cooldown_until <= now]
+            if not ready:
+                return None, min(d.cooldown_until for d in self.deployments) - now
+            best = min(ready, key=lambda d: (self._score(d, tokens, typical), d.requests))
+            best.outstanding_tokens += tokens
+            best.in_flight += 1
+            best.peak_in_flight = max(best.peak_in_flight, best.in_flight)
+            best.requests += 1
+            return best, 0.0
+
+    def _release(self, d: Deployment, tokens: int, latency_ms: Optional[float] = None,
+                 usage: Optional[dict] = None, throttled_for: Optional[float] = None, error: bool = False):
+        with self._lock:
+            d.outstanding_tokens -= tokens
+            d.in_flight -= 1
+            if throttled_for is not None:
+                d.throttled += 1
+                d.consecutive_throttles += 1
+                d.cooldown_until = max(d.cooldown_until, time.monotonic() + throttled_for)
+                return
+            if error:
+                d.errors += 1
+                return
+            d.consecutive_throttles = 0
+            d.latencies_ms.append(latency_ms)
+            d.latency_ewma_ms = latency_ms if d.latency_ewma_ms is None else \
+                (1 - LATENCY_SMOOTHING) * d.latency_ewma_ms + LATENCY_SMOOTHING * latency_ms
+            if usage:
+                d.prompt_tokens += usage.get("prompt_tokens") or 0
+                d.completion_tokens += usage.get("completion_tokens") or 0
+
+    def post_json(self, body: Union[dict, bytes], timeout: float = 60) -> dict:
+        """POST a chat completions body to the best deployment, moving off throttled ones.
+
+        Raises http_pool.HttpError (or a transport error) like KeepAliveClient.post_json when
+        the failure is not retryable, after max_failures 5xx/transport failures, or when the
+        pool stays throttled for longer than max_throttled_wait_s.
+        """
+        payload = body if isinstance(body, dict) else json.loads(body)
+        encoded = body if isinstance(body, bytes) else json.dumps(body).encode()
+        tokens = self.estimate_tokens(payload, len(encoded))
+        deadline = time.monotonic() + self.max_throttled_wait_s
+        tried: set[str] = set()
+        failures = 0
+        last_error: Optional[Exception] = None
+
+        while True:
+            deployment, wait = self._acquire(tokens, tried)
+            if deployment is None:
+                if last_error and time.monotonic() + wait > deadline:
+                    raise last_error
+                # Jitter, so requests waiting on the same cooldown don't all return at once
+                time.sleep(min(wait, MAX_COOLDOWN_S) * random.uniform(1.0, 1.25))
+                tried.clear()
+                continue
+            tried.add(deployment.name)
+
+            url, headers = deployment.target()
+            data = encoded
+            if not deployment.is_azure and payload.get("model") != deployment.deployment:
+                data = json.dumps({**payload, "model": deployment.deployment}).encode()
+
+            started = time.perf_counter()
+            try:
+                response = self.client.post_json(url, data, headers, timeout=timeout)
+            except http_pool.HttpError as e:
+                last_error = e
+                if e.status == 429:
+                    backoff = min(2.0 ** deployment.consecutive_throttles, MAX_COOLDOWN_S)
+                    self._release(deployment, tokens, throttled_for=_retry_after_s(e) or backoff)
+                    continue
+                self._release(deployment, tokens, error=True)
+                failures += 1
+                if e.status < 500 or failures >= self.max_failures:
+                    raise
+                continue
+            except Exception as e:
+                last_error = e
+                self._release(deployment, tokens, error=True)
+                failures += 1
+                if failures >= self.max_failures:
+                    raise
+                continue
+
+            self._release(deployment, tokens, latency_ms=(time.perf_counter() - started) * 1000,
+                          usage=response.get("usage"))
+            return response
+
+    def warm(self, timeout: float = 10):
+        for d in self.deployments:
+            self.client.warm(d.target()[0], timeout=timeout)
+
+    def summary(self) -> list[dict]:
+        with self._lock:
+            # Share of the completed requests; "requests" also counts throttled and failed attempts
+            total = sum(len(d.latencies_ms) for d in self.deployments) or 1
+            return [{
+                "name": d.name,
+                "deployment": d.deployment,
+                "weight": d.weight,
+                "requests": d.requests,
+                "share": round(len(d.latencies_ms) / total, 3),
+                "ok": len(d.latencies_ms),
+                "throttled": d.throttled,
+                "errors": d.errors,
+                "prompt_tokens": d.prompt_tokens,
+                "completion_tokens": d.completion_tokens,
+                "latency_p50_ms": round(_percentile(d.latencies_ms, 50), 1),
+                "latency_p95_ms": round(_percentile(d.latencies_ms, 95), 1),
+                "peak_in_flight": d.peak_in_flight,
+            } for d in self.deployments]
+
+
+# Set by configure(); the runners route chat completions through it when present
+ACTIVE: Optional[DeploymentPool] = None
+
+
+def configure(path: Optional[str], model: str) -> Optional[DeploymentPool]:
+    """Load the deployments file (--deployments / EVAL_DEPLOYMENTS) and make it the active pool."""
+    global ACTIVE
+    ACTIVE = DeploymentPool.from_file(Path(path), model) if path else None
+    return ACTIVE
+
+
+def print_summary(summary: list[dict]):
+    print("\nPer-deployment requests:")
+    print(f"  {'deployment':<24} {'weight':>7} {'requests':>8} {'share':>6} {'429s':>5} {'errors':>6} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'prompt tok':>11} {'compl tok':>10} {'peak':>5}")
+    for row in summary:
+        print(f"  {row['name'][:24]:<24} {row['weight']:>7g} {row['requests']:>8} {row['share']:>6.0%} "
+              f"{row['throttled']:>5} {row['errors']:>6} {row['latency_p50_ms']:>8} {row['latency_p95_ms']:>8} "
+              f"{row['prompt_tokens']:>11,} {row['completion_tokens']:>10,} {row['peak_in_flight']:>5}")
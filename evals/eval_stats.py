@@ -0,0 +1,267 @@
+"""
+Bootstrap and permutation confidence intervals for eval scores, shared by the runners.
+
+A score over 20-100 scenarios moves by several points between identical runs, so the
+summaries print every score with a 95% interval, and the baseline-vs-skills delta with a
+paired permutation p-value as well.
+
+Scenarios are the resampling unit. Each contributes a numerator and a denominator (rules
+passed / rules checked for integration evals, 1, 0.5 or 0 of 1 for tool selection) and a
+score is sum(numerators) / sum(denominators), so a resample only needs column sums. Eval
+outcomes take few distinct values: with NumPy the scenarios are grouped by distinct row
+and each resample is drawn as multinomial counts per group (sign flips as binomial counts
+for the permutation test). That is the exact bootstrap at a cost of resamples × distinct
+rows, whatever the number of scenarios. Without NumPy the same statistics are computed
+with the random module, one scenario at a time; beyond PYTHON_MAX_DRAWS scenario draws
+(where the bootstrap distribution is close to normal anyway) the interval comes from the
+delta-method normal approximation instead.
+"""
+
+import math
+import random
+import statistics
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+DEFAULT_RESAMPLES = 10_000
+# Upper bound on resamples × distinct rows drawn at once
+CHUNK_ELEMENTS = 2_000_000
+# Group scenarios by distinct row when there are at least this many scenarios per row
+COMPRESSION_RATIO = 4
+# Scenario draws (resamples × scenarios) the pure-Python bootstrap does before switching to
+# the normal approximation, about a second
+PYTHON_MAX_DRAWS = 5_000_000
+# Permutation flips of groups this large are drawn with rng.binomial rather than bit counts
+POPCOUNT_MAX_BITS = 1024
+BACKEND = "numpy" if np is not None else "python"
+
+
+@dataclass
+class Interval:
+    estimate: float
+    low: float
+    high: float
+    n: int  # scenarios
+    p_value: Optional[float] = None  # paired permutation test, deltas only
+
+    def format(self, signed: bool = False, unit: str = "%") -> str:
+        sign = "+" if signed else ""
+        return f"{self.estimate:{sign}.1f}{unit} [{self.low:{sign}.1f}, {self.high:{sign}.1f}]"
+
+
+def _use_numpy(vectorized: bool) -> bool:
+    return vectorized and np is not None
+
+
+def _percentiles(stats: list[float], alpha: float) -> tuple[float, float]:
+    ordered = sorted(s for s in stats if not math.isnan(s))
+    if not ordered:
+        return math.nan, math.nan
+    lo = ordered[int(alpha / 2 * len(ordered))]
+    hi = ordered[min(len(ordered) - 1, int((1 - alpha / 2) * len(ordered)))]
+    return lo, hi
+
+
+def _ratio(num: float, den: float) -> float:
+    return num / den if den else math.nan
+
+
+def _delta(sums) -> float:
+    return _ratio(sums[2], sums[3]) - _ratio(sums[0], sums[1])
+
+
+def _ratios(sums, column: int):
+    """Column `column` over column `column + 1` of resampled sums; NaN where the denominator is 0."""
+    num, den = sums[:, column], sums[:, column + 1]
+    return np.divide(num, den, out=np.full(len(num), np.nan), where=den > 0)
+
+
+# ---------------------------------------------------------------------------
+# Resampling
+# ---------------------------------------------------------------------------
+
+def _chunks(resamples: int, width: int):
+    size = max(1, CHUNK_ELEMENTS // max(width, 1))
+    for start in range(0, resamples, size):
+        yield min(size, resamples - start)
+
+
+def _distinct_rows(data):
+    """(distinct rows, counts); unique on a void view is much faster than unique(axis=0)."""
+    data = np.ascontiguousarray(data)
+    keys = data.view(np.dtype((np.void, data.dtype.itemsize * data.shape[1]))).ravel()
+    _, first, counts = np.unique(keys, return_index=True, return_counts=True)
+    return data[first], counts
+
+
+def _bootstrap_sums_numpy(data, resamples: int, seed: int):
+    """(resamples × columns) column sums of bootstrap resamples of the rows of `data`."""
+    rng = np.random.default_rng(seed)
+    n = len(data)
+    distinct, counts = _distinct_rows(data)
+    if len(distinct) * COMPRESSION_RATIO <= n:
+        # Few distinct outcomes: draw how often each one is picked
+        return np.concatenate([rng.multinomial(n, counts / n, size=size) @ distinct
+                               for size in _chunks(resamples, len(distinct))])
+    parts = []
+    for size in _chunks(resamples, n):
+        picks = rng.integers(0, n, size=(size, n), dtype=np.int32)
+        parts.append(np.column_stack([column[picks].sum(axis=1) for column in data.T]))
+    return np.concatenate(parts)
+
+
+def _bootstrap_sums_python(rows: list[tuple], resamples: int, seed: int) -> list[list[float]]:
+    rng = random.Random(seed)
+    return [[sum(column) for column in zip(*rng.choices(rows, k=len(rows)))] for _ in range(resamples)]
+
+
+def _fair_coin_counts(rng, counts, size: int):
+    """(size × groups) Binomial(count, 1/2) draws, as popcounts of random bits.
+
+    rng.binomial is slowest for the small and medium groups evals produce; it is only used
+    for groups of POPCOUNT_MAX_BITS or more, and everywhere on NumPy < 2.0 (no bitwise_count).
+    """
+    if not hasattr(np, "bitwise_count"):
+        return rng.binomial(counts, 0.5, size=(size, len(counts)))
+    # Largest groups first, so the groups that need another 64-bit word are always a prefix
+    order = np.argsort(-np.asarray(counts, dtype=np.int64), kind="stable")
+    counts = np.asarray(counts, dtype=np.int64)[order]
+    heads = np.zeros((size, len(counts)), dtype=np.int64)
+    large = int(np.count_nonzero(counts >= POPCOUNT_MAX_BITS))
+    if large:
+        heads[:, :large] = rng.binomial(counts[:large], 0.5, size=(size, large))
+    for word in range(int(-(-counts[large:].max(initial=0) // 64))):
+        end = large + int(np.count_nonzero(counts[large:] > 64 * word))
+        bits = np.minimum(counts[large:end] - 64 * word, 64).astype(np.uint64)
+        # Low `bits` bits set; shifting a uint64 by 64 is undefined, so full words are masked separately
+        mask = np.where(bits == 64, np.uint64(2**64 - 1), (np.uint64(1) << (bits % np.uint64(64))) - np.uint64(1))
+        draws = rng.integers(0, 2**64 - 1, size=(size, end - large), dtype=np.uint64, endpoint=True)
+        heads[:, large:end] += np.bitwise_count(draws & mask)
+    unsorted = np.empty_like(heads)
+    unsorted[:, order] = heads
+    return unsorted
+
+
+def _flip_sums_numpy(data, resamples: int, seed: int):
+    """Column sums with (a, b) swapped in a random half of the scenarios, per permutation."""
+    rng = np.random.default_rng(seed)
+    distinct, counts = _distinct_rows(data)
+    if len(distinct) * COMPRESSION_RATIO > len(data):
+        distinct, counts = data, None
+    # Swapping a scenario moves its (b - a) into the a columns and its (a - b) into the b columns
+    shift = distinct[:, 2:] - distinct[:, :2]
+    total = data.sum(axis=0)
+    parts = []
+    for size in _chunks(resamples, len(distinct)):
+        flips = (rng.integers(0, 2, size=(size, len(distinct)), dtype=np.int8) if counts is None
+                 else _fair_coin_counts(rng, counts, size))
+        moved = flips @ shift
+        parts.append(np.hstack([total[:2] + moved, total[2:] - moved]))
+    return np.concatenate(parts)
+
+
+def _flip_sums_python(rows: list[tuple], resamples: int, seed: int) -> list[list[float]]:
+    rng = random.Random(seed)
+    sums = []
+    for _ in range(resamples):
+        a_num = a_den = b_num = b_den = 0.0
+        for row in rows:
+            if rng.random() < 0.5:
+                row = (row[2], row[3], row[0], row[1])
+            a_num += row[0]
+            a_den += row[1]
+            b_num += row[2]
+            b_den += row[3]
+        sums.append([a_num, a_den, b_num, b_den])
+    return sums
+
+
+def _normal_interval(influence: list[float], alpha: float) -> tuple[float, float]:
+    """(CI half-width, standard error) of a statistic from its per-scenario influence values."""
+    se = statistics.stdev(influence) / math.sqrt(len(influence))
+    z = statistics.NormalDist().inv_cdf(1 - alpha / 2)
+    return z * se, se
+
+
+def _influence(nums: list[float], dens: list[float]) -> list[float]:
+    """Linearization of sum(nums) / sum(dens) around the observed ratio."""
+    ratio = _ratio(sum(nums), sum(dens))
+    mean_den = sum(dens) / len(dens)
+    return [(x - ratio * d) / mean_den for x, d in zip(nums, dens)]
+
+
+# ---------------------------------------------------------------------------
+# Intervals
+# ---------------------------------------------------------------------------
+
+def ratio_ci(numerators: Sequence[float], denominators: Optional[Sequence[float]] = None,
+             resamples: int = DEFAULT_RESAMPLES, alpha: float = 0.05, scale: float = 1.0,
+             seed: int = 0, vectorized: bool = True) -> Interval:
+    """Percentile bootstrap CI of sum(numerators) / sum(denominators) over scenarios.
+
+    Without denominators this is the CI of the mean.
+    """
+    n = len(numerators)
+    denominators = [1.0] * n if denominators is None else denominators
+    estimate = _ratio(float(sum(numerators)), float(sum(denominators))) * scale
+    if n < 2 or resamples < 1 or math.isnan(estimate):
+        return Interval(estimate, estimate, estimate, n)
+
+    if _use_numpy(vectorized):
+        sums = _bootstrap_sums_numpy(np.column_stack([np.asarray(numerators, dtype=float),
+                                                      np.asarray(denominators, dtype=float)]), resamples, seed)
+        lo, hi = np.nanquantile(_ratios(sums, 0), [alpha / 2, 1 - alpha / 2])
+    elif n * resamples > PYTHON_MAX_DRAWS:
+        half, _ = _normal_interval(_influence([float(x) for x in numerators], [float(d) for d in denominators]), alpha)
+        lo, hi = estimate / scale - half, estimate / scale + half
+    else:
+        rows = [(float(x), float(d)) for x, d in zip(numerators, denominators)]
+        lo, hi = _percentiles([_ratio(s[0], s[1]) for s in _bootstrap_sums_python(rows, resamples, seed)], alpha)
+    return Interval(estimate, float(lo) * scale, float(hi) * scale, n)
+
+
+def mean_ci(values: Sequence[float], resamples: int = DEFAULT_RESAMPLES, alpha: float = 0.05,
+            seed: int = 0, vectorized: bool = True) -> Interval:
+    return ratio_ci(values, None, resamples=resamples, alpha=alpha, seed=seed, vectorized=vectorized)
+
+
+def paired_delta_ci(num_a: Sequence[float], den_a: Sequence[float], num_b: Sequence[float],
+                    den_b: Sequence[float], resamples: int = DEFAULT_RESAMPLES, alpha: float = 0.05,
+                    scale: float = 1.0, seed: int = 0, vectorized: bool = True) -> Interval:
+    """CI of ratio(b) - ratio(a), resampling scenarios with both modes kept together.
+
+    p_value is the two-sided paired permutation test of "a and b score the same": each
+    permutation swaps the a and b results of a random half of the scenarios.
+    """
+    n = len(num_a)
+    columns = (num_a, den_a, num_b, den_b)
+    observed = _delta([float(sum(c)) for c in columns]) if n else math.nan
+    estimate = observed * scale
+    if n < 2 or resamples < 1 or math.isnan(observed):
+        return Interval(estimate, estimate, estimate, n)
+
+    if _use_numpy(vectorized):
+        data = np.column_stack([np.asarray(c, dtype=float) for c in columns])
+        sums = _bootstrap_sums_numpy(data, resamples, seed)
+        lo, hi = np.nanquantile(_ratios(sums, 2) - _ratios(sums, 0), [alpha / 2, 1 - alpha / 2])
+        null = _flip_sums_numpy(data, resamples, seed + 1)
+        null = _ratios(null, 2) - _ratios(null, 0)
+        extreme = int(np.count_nonzero(np.abs(null[~np.isnan(null)]) >= abs(observed) - 1e-12))
+    elif n * resamples > PYTHON_MAX_DRAWS:
+        a = _influence([float(v) for v in num_a], [float(v) for v in den_a])
+        b = _influence([float(v) for v in num_b], [float(v) for v in den_b])
+        half, se = _normal_interval([y - x for x, y in zip(a, b)], alpha)
+        p_value = 2 * (1 - statistics.NormalDist().cdf(abs(observed) / se)) if se else 1.0
+        return Interval(estimate, (observed - half) * scale, (observed + half) * scale, n, p_value=p_value)
+    else:
+        rows = list(zip(*([float(v) for v in c] for c in columns)))
+        lo, hi = _percentiles([_delta(s) for s in _bootstrap_sums_python(rows, resamples, seed)], alpha)
+        null = [_delta(s) for s in _flip_sums_python(rows, resamples, seed + 1)]
+        extreme = sum(1 for d in null if not math.isnan(d) and abs(d) >= abs(observed) - 1e-12)
+    return Interval(estimate, float(lo) * scale, float(hi) * scale, n, p_value=(extreme + 1) / (resamples + 1))
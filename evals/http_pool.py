@@ -0,0 +1,156 @@
+"""
+Keep-alive HTTP client shared by the eval runners.
+
+urllib opens (and TLS-handshakes) a fresh connection for every request. This client keeps
+idle connections per host and reuses them, which matters for long runs and for watch mode,
+where each save should cost one model round-trip and nothing else.
+
+Proxies are honoured the way urllib honours them: HTTP_PROXY / HTTPS_PROXY (or the platform
+settings) unless NO_PROXY matches the host. HTTPS requests tunnel through the proxy with
+CONNECT and the tunnel is pooled like a direct connection; plain HTTP requests are sent to
+the proxy in absolute form.
+"""
+
+import base64
+import http.client
+import json
+import threading
+import urllib.request
+from typing import Optional, Union
+from urllib.parse import SplitResult, unquote, urlsplit
+
+
+class HttpError(Exception):
+    """Non-2xx response. str() matches urllib's "HTTP Error 429: Too Many Requests" format."""
+
+    def __init__(self, status: int, reason: str, body: bytes = b"", headers: Optional[dict] = None):
+        super().__init__(f"HTTP Error {status}: {reason}")
+        self.status = status
+        self.reason = reason
+        self.body = body
+        self.headers = headers or {}
+
+
+# Raised when a pooled connection was closed by the server while idle.
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+def _proxy_for(url: SplitResult) -> Optional[SplitResult]:
+    """The proxy urllib would use for this URL, or None for a direct connection."""
+    proxy = urllib.request.getproxies().get(url.scheme)
+    if not proxy or urllib.request.proxy_bypass(url.netloc):
+        return None
+    return urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+
+
+def _proxy_headers(proxy: SplitResult) -> dict[str, str]:
+    if proxy.username is None:
+        return {}
+    credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}".encode()
+    return {"Proxy-Authorization": "Basic " + base64.b64encode(credentials).decode()}
+
+
+def _pool_key(url: SplitResult, proxy: Optional[SplitResult]) -> tuple[str, str, Optional[str]]:
+    return url.scheme, url.netloc, proxy.netloc if proxy is not None else None
+
+
+class KeepAliveClient:
+    """Thread-safe pool of persistent HTTP(S) connections, keyed by scheme, host and proxy."""
+
+    def __init__(self, max_idle_per_host: int = 16):
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: dict[tuple[str, str, Optional[str]], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _acquire(self, url: SplitResult, proxy: Optional[SplitResult],
+                 timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(_pool_key(url, proxy))
+            if idle:
+                conn = idle.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        cls = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        if proxy is None:
+            return cls(url.netloc, timeout=timeout), False
+        conn = cls(proxy.hostname, proxy.port or 80, timeout=timeout)
+        if url.scheme == "https":
+            conn.set_tunnel(url.hostname, url.port, _proxy_headers(proxy))
+        return conn, False
+
+    def _release(self, url: SplitResult, proxy: Optional[SplitResult], conn: http.client.HTTPConnection):
+        with self._lock:
+            idle = self._idle.setdefault(_pool_key(url, proxy), [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def post_json(
+        self,
+        url: str,
+        body: Union[dict, bytes],
+        headers: dict[str, str],
+        timeout: float = 60,
+    ) -> dict:
+        """POST a JSON body and return the decoded JSON response. Raises HttpError on non-2xx."""
+        parts = urlsplit(url)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        data = body if isinstance(body, bytes) else json.dumps(body).encode()
+        proxy = _proxy_for(parts)
+        if proxy is not None and parts.scheme == "http":
+            path = f"http://{parts.netloc}{path}"
+            headers = {**headers, **_proxy_headers(proxy)}
+
+        for attempt in range(2):
+            conn, reused = self._acquire(parts, proxy, timeout)
+            try:
+                conn.request("POST", path, body=data, headers=headers)
+                resp = conn.getresponse()
+                payload = resp.read()
+            except _STALE_ERRORS:
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+
+            if resp.will_close:
+                conn.close()
+            else:
+                self._release(parts, proxy, conn)
+
+            if resp.status >= 400:
+                raise HttpError(resp.status, resp.reason, payload, dict(resp.getheaders()))
+            return json.loads(payload)
+
+        raise RuntimeError("unreachable")
+
+    def warm(self, url: str, timeout: float = 10):
+        """Open (and TLS-handshake) a connection ahead of the first request."""
+        parts = urlsplit(url)
+        proxy = _proxy_for(parts)
+        conn, reused = self._acquire(parts, proxy, timeout)
+        if not reused:
+            conn.connect()
+        self._release(parts, proxy, conn)
+
+    def close(self):
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+
+
+DEFAULT_CLIENT = KeepAliveClient()
@@ -8,38 +8,55 @@ then reports the delta to measure skill ROI.
 
 Usage:
     python run_integration_evals.py --dry-run           # Parse only
+    python run_integration_evals.py --dry-run --max-prompt-tokens 30000   # Fail on prompts over budget
     python run_integration_evals.py                      # Run all
     python run_integration_evals.py --eval EVAL-INT-M-001
     python run_integration_evals.py --baseline-only      # Skip skills run
     python run_integration_evals.py --skills-only        # Skip baseline run
+    python run_integration_evals.py --ablation loo       # Per-skill contribution (leave-one-out)
+    python run_integration_evals.py --ablation fractional --dry-run   # Show the variant plan
+    python run_integration_evals.py --deployments pool.json --workers 8   # Spread over several deployments
 
 Environment variables:
     OPENAI_API_KEY     - API key (required unless --dry-run)
     EVAL_MODEL         - Model to test (default: gpt-4o)
     EVAL_BASE_URL      - API base URL (default: https://api.openai.com/v1)
                          For Azure OpenAI, use the deployment endpoint URL
+    EVAL_DEPLOYMENTS   - Deployments file for --deployments (see evals/deployment_pool.py)
+    EVAL_HISTORY_DB    - Results history database (default: evals/eval_history.db)
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import deployment_pool  # noqa: E402  (shared with run_evals.py)
+import eval_stats  # noqa: E402  (shared with run_evals.py)
+import http_pool  # noqa: E402  (shared with run_evals.py)
+import pipeline_validator  # noqa: E402
+import results_db  # noqa: E402
+import token_budget  # noqa: E402
+
 
 # ---------------------------------------------------------------------------
 # Skill loader
 # ---------------------------------------------------------------------------
 
-SKILLS_DIR = Path(__file__).parent.parent / "claude-skills"
+SKILLS_DIR = Path(__file__).resolve().parent.parent.parent / "claude-skills"
 
 SKILL_FILES = {
     "datafactory-core": "datafactory-core.md",
-    "datafactory-destinations": "datafactory-destinations.md",
+    "datafactory-destinations": "destinations",  # directory: its .md files in name order
     "datafactory-performance": "datafactory-performance.md",
     "datafactory-advanced": "datafactory-advanced.md",
     "datafactory-pipelines": "datafactory-pipelines.md",
@@ -49,34 +66,65 @@ SKILL_FILES = {
 SKILL_TIPS_FILE = "SKILL.md"
 
 
+@lru_cache(maxsize=None)
 def load_skill(name: str) -> str:
+    """Skill text; empty (with a warning, once per skill) when its file or directory is missing or empty."""
     path = SKILLS_DIR / SKILL_FILES.get(name, "")
-    if path.exists():
-        return path.read_text()
-    return ""
+    if path.is_dir():
+        text = SKILL_SEPARATOR.join(f.read_text() for f in sorted(path.glob("*.md")))
+    elif path.is_file():
+        text = path.read_text()
+    else:
+        text = ""
+    if not text.strip():
+        print(f"Warning: skill '{name}' has no content at {path}; skipping it", file=sys.stderr)
+        return ""
+    return text
 
 
+@lru_cache(maxsize=None)
 def load_tips() -> str:
     path = SKILLS_DIR / SKILL_TIPS_FILE
     return path.read_text() if path.exists() else ""
 
 
-def build_system_prompt(skill_names: list[str]) -> str:
-    base = (
-        "You are an AI assistant that helps users work with Microsoft Fabric Data Factory. "
-        "You write M (Power Query) code, configure data destinations, and build pipeline definitions. "
-        "When asked to write M code, always produce a complete, valid M section document unless told otherwise."
-    )
+BASE_SYSTEM_PROMPT = (
+    "You are an AI assistant that helps users work with Microsoft Fabric Data Factory. "
+    "You write M (Power Query) code, configure data destinations, and build pipeline definitions. "
+    "When asked to write M code, always produce a complete, valid M section document unless told otherwise."
+)
+REFERENCE_HEADER = "\n\n## Reference Knowledge\n\n"
+SKILL_SEPARATOR = "\n\n---\n\n"
+
 
+def build_system_prompt(skill_names: list[str]) -> str:
     if not skill_names:
-        return base
+        return BASE_SYSTEM_PROMPT
 
     tips = load_tips()
-    skills_text = "\n\n---\n\n".join(
+    skills_text = SKILL_SEPARATOR.join(
         load_skill(name) for name in skill_names if load_skill(name)
     )
 
-    return f"{base}\n\n## Reference Knowledge\n\n{tips}\n\n{skills_text}"
+    return f"{BASE_SYSTEM_PROMPT}{REFERENCE_HEADER}{tips}\n\n{skills_text}"
+
+
+def system_prompt_tokens(skill_names: list[str], estimator: token_budget.TokenEstimator) -> int:
+    """Tokens of build_system_prompt(skill_names), from memoized counts of each part and skill file."""
+    tokens = estimator.part("base", BASE_SYSTEM_PROMPT)
+    if not skill_names:
+        return tokens
+    skills = [name for name in skill_names if load_skill(name)]
+    tokens += estimator.part("reference_header", REFERENCE_HEADER) + estimator.part("tips", load_tips() + "\n\n")
+    tokens += sum(estimator.part(f"skill:{name}", load_skill(name)) for name in skills)
+    return tokens + estimator.part("skill_separator", SKILL_SEPARATOR) * max(len(skills) - 1, 0)
+
+
+def prompt_estimate(scenario: "IntegrationScenario", skill_names: list[str], label: str,
+                    estimator: token_budget.TokenEstimator) -> token_budget.PromptEstimate:
+    """Projected prompt tokens and cost of one call_llm request."""
+    tokens = estimator.chat([system_prompt_tokens(skill_names, estimator), estimator.count(scenario.user_prompt)])
+    return token_budget.estimate(estimator, f"{scenario.eval_id} [{label}]", tokens, EXPECTED_COMPLETION_TOKENS)
 
 
 # ---------------------------------------------------------------------------
@@ -86,7 +134,7 @@ def build_system_prompt(skill_names: list[str]) -> str:
 @dataclass
 class ValidationRule:
     description: str
-    check_type: str  # "contains", "not_contains", "regex", "json_valid", "custom"
+    check_type: str  # "contains", "not_contains", "regex", "json_valid", "m_validator", "pipeline"
     pattern: str = ""
 
     def evaluate(self, text: str) -> bool:
@@ -101,6 +149,8 @@ class ValidationRule:
             return _is_valid_json(text)
         elif self.check_type == "m_validator":
             return _m_validator_pass(text)
+        elif self.check_type == "pipeline":
+            return pipeline_validator.check(text, self.pattern)
         return False
 
 
@@ -119,10 +169,12 @@ class IntegrationScenario:
     baseline_output: str = ""
     baseline_passed: list[str] = field(default_factory=list)
     baseline_failed: list[str] = field(default_factory=list)
+    baseline_call: Optional["LLMResult"] = None
     skills_result: Optional[str] = None
     skills_output: str = ""
     skills_passed: list[str] = field(default_factory=list)
     skills_failed: list[str] = field(default_factory=list)
+    skills_call: Optional["LLMResult"] = None
 
 
 # ---------------------------------------------------------------------------
@@ -130,13 +182,9 @@ class IntegrationScenario:
 # ---------------------------------------------------------------------------
 
 def _is_valid_json(text: str) -> bool:
-    # Extract JSON from markdown code blocks if present
-    json_text = _extract_code_block(text, "json") or text
-    try:
-        json.loads(json_text)
-        return True
-    except (json.JSONDecodeError, ValueError):
-        return False
+    # The fenced JSON block holding the pipeline definition parses (the whole text without blocks);
+    # see pipeline_validator.py
+    return pipeline_validator.check(text, "json")
 
 
 def _m_validator_pass(text: str) -> bool:
@@ -263,12 +311,17 @@ RULE_PATTERNS = {
     "NOT contain Action.Sequence": ("not_contains", "Action.Sequence"),
     "NOT use Fast Copy": ("not_contains", "StagingDefinition"),
     "NOT contain hardcoded year": ("not_contains", "2025"),
-    # Pipeline JSON
+    # Pipeline JSON: structural checks on the parsed definition (pipeline_validator.CHECKS)
     "Valid JSON": ("json_valid", ""),
-    "properties.activities": ("contains", '"activities"'),
-    "DataflowActivity": ("contains", "DataflowActivity"),
-    "dependsOn": ("contains", "dependsOn"),
-    "Succeeded": ("contains", "Succeeded"),
+    "Two activities": ("pipeline", "activity_count:2"),
+    "properties.activities": ("pipeline", "activities"),
+    'Both have `type: "DataflowActivity"`': ("pipeline", "all_type:DataflowActivity"),
+    "DataflowActivity": ("pipeline", "has_type:DataflowActivity"),
+    "dataflowId` values": ("pipeline", "schema"),
+    "dependsOn": ("pipeline", "depends_on"),
+    "Succeeded": ("pipeline", "condition:Succeeded"),
+    "`policy` with timeout": ("pipeline", "policy"),
+    "Valid pipeline definition": ("pipeline", "valid"),
     # Validator
     "Passes MDocumentValidator": ("m_validator", ""),
     # Workflow checks
@@ -308,6 +361,12 @@ def _extract_validation_rules(block: str) -> list[ValidationRule]:
 
 def _match_rule(description: str) -> Optional[ValidationRule]:
     """Map a human-readable rule description to a ValidationRule."""
+    # `typeProperties.<key>` = `<value>`: an activity of the parsed pipeline has that value
+    type_property = re.search(r"`typeProperties\.(\w+)`\s*=\s*`([^`]+)`", description)
+    if type_property:
+        return ValidationRule(description=description, check_type="pipeline",
+                              pattern=f"type_property:{type_property.group(1)}={type_property.group(2)}")
+
     # Try exact keyword matches first
     for keyword, (check_type, pattern) in RULE_PATTERNS.items():
         if keyword.lower() in description.lower():
@@ -342,15 +401,25 @@ def _build_azure_url(base_url: str, model: str) -> str:
     return f"{base}/openai/deployments/{model}/chat/completions?api-version=2024-10-21"
 
 
+@dataclass
+class LLMResult:
+    content: str
+    latency_ms: float
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+
+
+# Completion tokens assumed per request in the cost projection (call_llm allows up to 4096)
+EXPECTED_COMPLETION_TOKENS = 1000
+
+
 def call_llm(
     prompt: str,
     system_prompt: str,
     model: str = "gpt-4o",
     base_url: str = "https://api.openai.com/v1",
     api_key: str = "",
-) -> str:
-    import urllib.request
-
+) -> LLMResult:
     body = {
         "model": model,
         "messages": [
@@ -376,18 +445,21 @@ def call_llm(
             "Authorization": f"Bearer {api_key}",
         }
 
-    req = urllib.request.Request(
-        url,
-        data=json.dumps(body).encode(),
-        headers=headers,
-    )
-
+    started = time.perf_counter()
     try:
-        with urllib.request.urlopen(req, timeout=120) as resp:
-            data = json.loads(resp.read())
-            return data["choices"][0]["message"]["content"]
+        if deployment_pool.ACTIVE:
+            data = deployment_pool.ACTIVE.post_json(body, timeout=120)
+        else:
+            data = http_pool.DEFAULT_CLIENT.post_json(url, body, headers, timeout=120)
+        usage = data.get("usage") or {}
+        return LLMResult(
+            content=data["choices"][0]["message"]["content"],
+            latency_ms=(time.perf_counter() - started) * 1000,
+            prompt_tokens=usage.get("prompt_tokens"),
+            completion_tokens=usage.get("completion_tokens"),
+        )
     except Exception as e:
-        return f"[ERROR] {e}"
+        return LLMResult(content=f"[ERROR] {e}", latency_ms=(time.perf_counter() - started) * 1000)
 
 
 # ---------------------------------------------------------------------------
@@ -462,11 +534,37 @@ def _pct(passed: list, failed: list) -> float:
     return (len(passed) / total * 100) if total > 0 else 0
 
 
-def print_summary(scenarios: list[IntegrationScenario]) -> float:
-    """Print summary and return the skills score as a percentage (0-100)."""
+def mode_columns(scenarios: list[IntegrationScenario]) -> tuple[list[int], ...]:
+    """Per-scenario (baseline passed, baseline checked, skills passed, skills checked) rule counts."""
+    return ([len(s.baseline_passed) for s in scenarios],
+            [len(s.baseline_passed) + len(s.baseline_failed) for s in scenarios],
+            [len(s.skills_passed) for s in scenarios],
+            [len(s.skills_passed) + len(s.skills_failed) for s in scenarios])
+
+
+def skill_roi(scenarios: list[IntegrationScenario], resamples: int) -> Optional[eval_stats.Interval]:
+    """Skills minus baseline rule pass rate, over scenarios run in both modes."""
+    paired = [s for s in scenarios if (s.baseline_passed or s.baseline_failed) and (s.skills_passed or s.skills_failed)]
+    if not paired:
+        return None
+    return eval_stats.paired_delta_ci(*mode_columns(paired), resamples=resamples, scale=100)
+
+
+def _ci(interval: eval_stats.Interval, signed: bool = False) -> str:
+    sign = "+" if signed else ""
+    return f"[{interval.low:{sign}.1f}, {interval.high:{sign}.1f}]"
+
+
+def print_summary(scenarios: list[IntegrationScenario], resamples: int = eval_stats.DEFAULT_RESAMPLES) -> float:
+    """Print summary and return the skills score as a percentage (0-100).
+
+    Pass rates carry bootstrap 95% CIs over scenarios; Skill ROI is paired per scenario,
+    with a permutation p-value (eval_stats.py).
+    """
     print("\n" + "=" * 70)
     print("INTEGRATION EVAL SUMMARY")
     print("=" * 70)
+    b_num, b_den, s_num, s_den = mode_columns(scenarios)
 
     b_total_pass = sum(len(s.baseline_passed) for s in scenarios)
     b_total_fail = sum(len(s.baseline_failed) for s in scenarios)
@@ -478,15 +576,19 @@ def print_summary(scenarios: list[IntegrationScenario]) -> float:
 
     skills_pct = 0.0
     if b_total > 0:
-        print(f"\n  Baseline (no skills):   {b_total_pass}/{b_total} rules passed ({b_total_pass/b_total*100:.1f}%)")
+        interval = eval_stats.ratio_ci(b_num, b_den, resamples=resamples, scale=100)
+        print(f"\n  Baseline (no skills):   {b_total_pass}/{b_total} rules passed "
+              f"({b_total_pass/b_total*100:.1f}%, 95% CI {_ci(interval)})")
     if s_total > 0:
         skills_pct = s_total_pass / s_total * 100
-        print(f"  With skills:            {s_total_pass}/{s_total} rules passed ({skills_pct:.1f}%)")
-    if b_total > 0 and s_total > 0:
-        b_pct = b_total_pass / b_total * 100
-        delta = skills_pct - b_pct
-        color = "\033[92m" if delta > 0 else "\033[91m" if delta < 0 else "\033[90m"
-        print(f"  Skill ROI (delta):      {color}{delta:+.1f}%\033[0m")
+        interval = eval_stats.ratio_ci(s_num, s_den, resamples=resamples, scale=100)
+        print(f"  With skills:            {s_total_pass}/{s_total} rules passed ({skills_pct:.1f}%, 95% CI {_ci(interval)})")
+    roi = skill_roi(scenarios, resamples) if b_total > 0 and s_total > 0 else None
+    if roi:
+        # Significant only when the interval excludes zero; otherwise grey, whatever the sign
+        color = "\033[90m" if roi.low <= 0 <= roi.high else "\033[92m" if roi.estimate > 0 else "\033[91m"
+        print(f"  Skill ROI (delta):      {color}{roi.estimate:+.1f}%\033[0m 95% CI {_ci(roi, signed=True)}, "
+              f"permutation p = {roi.p_value:.3f} ({roi.n} paired scenarios)")
 
     # Per-category
     categories = sorted(set(s.category for s in scenarios))
@@ -499,7 +601,16 @@ def print_summary(scenarios: list[IntegrationScenario]) -> float:
         sf = sum(len(s.skills_failed) for s in cat_scenarios)
         b = f"{bp}/{bp+bf}" if bp + bf > 0 else "—"
         s = f"{sp}/{sp+sf}" if sp + sf > 0 else "—"
-        print(f"  {cat:20s}  baseline: {b:8s}  skills: {s}")
+        roi = skill_roi(cat_scenarios, resamples)
+        delta = f"Δ {roi.estimate:+.1f}% {_ci(roi, signed=True)}" if roi else ""
+        print(f"  {cat:20s}  baseline: {b:8s}  skills: {s:8s}  {delta}".rstrip())
+
+    files = sorted(set(s.source_file for s in scenarios))
+    if len(files) > 1:
+        print("\nPer-file:")
+        for f in files:
+            roi = skill_roi([s for s in scenarios if s.source_file == f], resamples)
+            print(f"  {f:40s}  " + (f"Δ {roi.estimate:+.1f}% {_ci(roi, signed=True)}" if roi else "—"))
 
     print("=" * 70)
 
@@ -532,10 +643,311 @@ def save_results(scenarios: list[IntegrationScenario], output_path: Path):
     print(f"\nResults saved to {output_path}")
 
 
+def record_history(scenarios: list[IntegrationScenario], model: str, score: float, db_path: Path):
+    """Append this run (both modes) to the SQLite results history."""
+    records = []
+    for s in scenarios:
+        for mode, result, passed, failed, call in [
+            ("baseline", s.baseline_result, s.baseline_passed, s.baseline_failed, s.baseline_call),
+            ("with_skills", s.skills_result, s.skills_passed, s.skills_failed, s.skills_call),
+        ]:
+            if result is None:
+                continue
+            records.append(results_db.ScenarioRecord(
+                eval_id=s.eval_id,
+                mode=mode,
+                result=result,
+                source_file=s.source_file,
+                category=s.category,
+                difficulty=s.difficulty,
+                latency_ms=call.latency_ms if call else None,
+                prompt_tokens=call.prompt_tokens if call else None,
+                completion_tokens=call.completion_tokens if call else None,
+                rules=[(r, True) for r in passed] + [(r, False) for r in failed],
+            ))
+    run_id = results_db.record_run("integration", model, records, score=score, db_path=db_path)
+    print(f"Recorded run #{run_id} in {db_path}")
+
+
+# ---------------------------------------------------------------------------
+# Skill ablation
+# ---------------------------------------------------------------------------
+
+RESPONSE_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "responses"
+
+
+def _hadamard(n: int) -> list[list[int]]:
+    """Sylvester Hadamard matrix of order n (n must be a power of two)."""
+    h = [[1]]
+    while len(h) < n:
+        h = [row + row for row in h] + [row + [-x for x in row] for row in h]
+    return h
+
+
+def ablation_design(skills: list[str], design: str) -> list[tuple[str, ...]]:
+    """Skill subsets to evaluate, each in canonical SKILL_FILES order.
+
+    - "loo": all skills, no skills, and every leave-one-out subset (k + 2 variants).
+    - "fractional": two-level resolution III design from a Hadamard matrix
+      (smallest power of two > k runs), which estimates every main effect
+      orthogonally instead of running all 2^k subsets.
+    """
+    if design == "loo":
+        rows = [tuple(skills)] + [tuple(s for s in skills if s != drop) for drop in skills] + [()]
+    else:
+        n = 1
+        while n < len(skills) + 1:
+            n *= 2
+        h = _hadamard(n)
+        rows = [tuple(s for j, s in enumerate(skills) if h[i][j + 1] > 0) for i in range(n)]
+    return list(dict.fromkeys(rows))
+
+
+def order_for_prefix_reuse(variants: list[tuple[str, ...]], skills: list[str]) -> list[tuple[str, ...]]:
+    """Sort variants so consecutive system prompts share the longest prefix.
+
+    Prompts are built by appending skills in canonical order, so lexicographic order
+    of skill indices puts every variant right after its longest-prefix neighbour.
+    """
+    index = {name: i for i, name in enumerate(skills)}
+    return sorted(variants, key=lambda v: [index[s] for s in v])
+
+
+def shared_prefix_ratio(prompts: list[str]) -> float:
+    """Fraction of prompt characters shared with the previous prompt in sequence."""
+    total = sum(len(p) for p in prompts)
+    if total == 0:
+        return 0.0
+    shared = sum(len(os.path.commonprefix([prev, cur])) for prev, cur in zip(prompts, prompts[1:]))
+    return shared / total
+
+
+def _response_cache_key(model: str, system_prompt: str, user_prompt: str) -> str:
+    payload = json.dumps([model, system_prompt, user_prompt], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def cached_call_llm(
+    prompt: str,
+    system_prompt: str,
+    model: str,
+    base_url: str,
+    api_key: str,
+    memo: dict[str, LLMResult],
+    cache_dir: Optional[Path] = RESPONSE_CACHE_DIR,
+) -> tuple[LLMResult, bool]:
+    """call_llm() with in-run memoization and an on-disk response cache.
+
+    Returns (result, was_cached). Error responses are never cached.
+    """
+    key = _response_cache_key(model, system_prompt, prompt)
+    if key in memo:
+        return memo[key], True
+
+    path = cache_dir / f"{key}.json" if cache_dir else None
+    if path and path.exists():
+        try:
+            result = LLMResult(**json.loads(path.read_text()))
+            memo[key] = result
+            return result, True
+        except (json.JSONDecodeError, TypeError, OSError):
+            pass
+
+    result = call_llm(prompt, system_prompt, model=model, base_url=base_url, api_key=api_key)
+    if not result.content.startswith("[ERROR]"):
+        memo[key] = result
+        if path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(result.__dict__))
+    return result, False
+
+
+def skill_effects(
+    scores: dict[str, dict[tuple[str, ...], float]],
+    skills: list[str],
+    design: str,
+    variants: list[tuple[str, ...]],
+) -> dict[str, list[float]]:
+    """Per-scenario effect of each skill on a metric.
+
+    loo: metric(all) - metric(all minus skill).
+    fractional: mean(metric | skill in) - mean(metric | skill out) over the design rows.
+    """
+    effects: dict[str, list[float]] = {s: [] for s in skills}
+    full = tuple(skills)
+    for per_variant in scores.values():
+        for skill in skills:
+            if design == "loo":
+                without = tuple(s for s in skills if s != skill)
+                if full in per_variant and without in per_variant:
+                    effects[skill].append(per_variant[full] - per_variant[without])
+            else:
+                with_s = [per_variant[v] for v in variants if skill in v and v in per_variant]
+                without_s = [per_variant[v] for v in variants if skill not in v and v in per_variant]
+                if with_s and without_s:
+                    effects[skill].append(sum(with_s) / len(with_s) - sum(without_s) / len(without_s))
+    return effects
+
+
+def run_ablation(
+    scenarios: list[IntegrationScenario],
+    skills: list[str],
+    design: str,
+    args: argparse.Namespace,
+    api_key: str,
+    estimator: token_budget.TokenEstimator,
+) -> dict:
+    """Run every (variant, scenario) pair, variant-major, and estimate per-skill ROI."""
+    design_order = ablation_design(skills, design)
+    variants = order_for_prefix_reuse(design_order, skills)
+    prompts = {v: build_system_prompt(list(v)) for v in variants}
+
+    # Prefix shared with the previous request, as seen by provider-side prompt caching.
+    ordered_ratio = shared_prefix_ratio([prompts[v] + s.user_prompt for v in variants for s in scenarios])
+    naive_ratio = shared_prefix_ratio([prompts[v] + s.user_prompt for s in scenarios for v in design_order])
+
+    print(f"Ablation design: {design} over {len(skills)} skills → {len(variants)} variants "
+          f"× {len(scenarios)} scenarios (vs {2 ** len(skills)} for full factorial)")
+    print(f"Prompt prefix shared with previous request: {ordered_ratio:.0%} "
+          f"(scenario-major, unordered: {naive_ratio:.0%})")
+    for v in variants:
+        print(f"  [{', '.join(v) or 'no skills'}]  {len(prompts[v]):,} chars, "
+              f"{system_prompt_tokens(list(v), estimator):,} tokens")
+    print()
+
+    labels = {v: "+".join(name.removeprefix("datafactory-") for name in v) or "no skills" for v in variants}
+    over_budget = token_budget.preflight(
+        [prompt_estimate(s, list(v), labels[v], estimator) for v in variants for s in scenarios],
+        estimator, args.max_prompt_tokens)
+    token_budget.exit_if_over(over_budget, args.max_prompt_tokens)
+    if args.dry_run:
+        return {}
+
+    memo: dict[str, LLMResult] = {}
+    cache_dir = None if args.no_cache else RESPONSE_CACHE_DIR
+    quality: dict[str, dict[tuple[str, ...], float]] = {s.eval_id: {} for s in scenarios}
+    tokens: dict[str, dict[tuple[str, ...], float]] = {s.eval_id: {} for s in scenarios}
+    latency: dict[str, dict[tuple[str, ...], float]] = {s.eval_id: {} for s in scenarios}
+    calls = hits = 0
+
+    # Variant-major order: every scenario reuses the same system prompt back to back.
+    for v in variants:
+        for scenario in scenarios:
+            result, was_cached = cached_call_llm(
+                scenario.user_prompt, prompts[v], model=args.model, base_url=args.base_url,
+                api_key=api_key, memo=memo, cache_dir=cache_dir,
+            )
+            hits += was_cached
+            calls += not was_cached
+            if result.content.startswith("[ERROR]"):
+                continue
+            passed, failed = score_output(scenario, result.content)
+            quality[scenario.eval_id][v] = _pct(passed, failed)
+            if result.prompt_tokens is not None:
+                tokens[scenario.eval_id][v] = result.prompt_tokens
+            latency[scenario.eval_id][v] = result.latency_ms
+            if not was_cached and args.delay > 0:
+                time.sleep(args.delay)
+
+    print(f"\n{calls} model calls, {hits} reused from cache")
+
+    report = {"design": design, "skills": skills, "variants": [list(v) for v in variants], "per_skill": {}}
+    effects = {
+        "quality": skill_effects(quality, skills, design, variants),
+        "tokens": skill_effects(tokens, skills, design, variants),
+        "latency": skill_effects(latency, skills, design, variants),
+    }
+
+    print("\n" + "=" * 70)
+    print("SKILL ABLATION (effect of adding each skill)")
+    print("=" * 70)
+    print(f"  {'skill':28s} {'n':>3} {'quality Δ':>10} {'95% CI':>17} {'tokens Δ':>9} {'latency Δ':>10}")
+    for skill in skills:
+        q = effects["quality"][skill]
+        mean_q = sum(q) / len(q) if q else 0.0
+        interval = eval_stats.mean_ci(q, resamples=args.resamples)
+        lo, hi = (interval.low, interval.high) if q else (0.0, 0.0)
+        tok = effects["tokens"][skill]
+        lat = effects["latency"][skill]
+        mean_tok = sum(tok) / len(tok) if tok else None
+        mean_lat = sum(lat) / len(lat) if lat else None
+        trim = q and hi <= 0 and (mean_tok or 0) > 0
+        print(f"  {skill:28s} {len(q):>3} {mean_q:>+9.1f}% [{lo:>+6.1f}, {hi:>+6.1f}] "
+              f"{(f'{mean_tok:+.0f}' if mean_tok is not None else '—'):>9} "
+              f"{(f'{mean_lat:+.0f}ms' if mean_lat is not None else '—'):>10}"
+              + ("  ← trim candidate" if trim else ""))
+        report["per_skill"][skill] = {
+            "n": len(q),
+            "quality_delta": mean_q,
+            "quality_ci95": [lo, hi],
+            "prompt_tokens_delta": mean_tok,
+            "latency_ms_delta": mean_lat,
+            "trim_candidate": bool(trim),
+        }
+    print("=" * 70)
+    return report
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
+def run_scenario(scenario: IntegrationScenario, modes: list[str], args: argparse.Namespace, api_key: str,
+                 delay: float, last: bool = False) -> IntegrationScenario:
+    """Run the scenario in each mode (baseline, with_skills) and score it in place."""
+    # Baseline (no skills)
+    if "baseline" in modes:
+        sys_prompt = build_system_prompt([])
+        scenario.baseline_call = call_llm(scenario.user_prompt, sys_prompt,
+                                          model=args.model, base_url=args.base_url, api_key=api_key)
+        output = scenario.baseline_call.content
+        scenario.baseline_output = output
+        scenario.baseline_passed, scenario.baseline_failed = score_output(scenario, output)
+        scenario.baseline_result = result_label(scenario.baseline_passed, scenario.baseline_failed)
+
+        if delay > 0:
+            time.sleep(delay)
+
+    # With skills
+    if "with_skills" in modes:
+        sys_prompt = build_system_prompt(scenario.skills)
+        scenario.skills_call = call_llm(scenario.user_prompt, sys_prompt,
+                                        model=args.model, base_url=args.base_url, api_key=api_key)
+        output = scenario.skills_call.content
+        scenario.skills_output = output
+        scenario.skills_passed, scenario.skills_failed = score_output(scenario, output)
+        scenario.skills_result = result_label(scenario.skills_passed, scenario.skills_failed)
+
+        if delay > 0 and not last:
+            time.sleep(delay)
+    return scenario
+
+
+def print_deployment_summary(output: Path):
+    deployments = deployment_pool.ACTIVE.summary()
+    deployment_pool.print_summary(deployments)
+    summary_path = output.with_suffix(".deployments.json")
+    summary_path.write_text(json.dumps(deployments, indent=2))
+    print(f"Per-deployment summary saved to {summary_path}")
+
+
+def load_api_key(args: argparse.Namespace) -> str:
+    """OPENAI_API_KEY, or "" when --deployments supplies a key per deployment. Exits if neither is set."""
+    api_key = os.environ.get("OPENAI_API_KEY", "")
+    if args.deployments:
+        try:
+            pool = deployment_pool.configure(args.deployments, args.model)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error: cannot load deployments from {args.deployments}: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Spreading requests over {len(pool.deployments)} deployments: "
+              f"{', '.join(d.name for d in pool.deployments)}")
+    elif not api_key:
+        print("Error: OPENAI_API_KEY not set", file=sys.stderr)
+        sys.exit(1)
+    return api_key
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run integration evals for M code quality")
     parser.add_argument("--eval", help="Run a single eval by ID")
@@ -549,8 +961,32 @@ def main():
     parser.add_argument("--delay", type=float, default=1.0)
     parser.add_argument("--fail-under", type=float, default=0.0,
                         help="Exit non-zero if skills score is below this percentage (default: 0 = always pass)")
+    parser.add_argument("--ablation", choices=["loo", "fractional"],
+                        help="Estimate each skill file's contribution instead of baseline vs skills")
+    parser.add_argument("--ablation-skills", default=",".join(SKILL_FILES),
+                        help="Comma-separated skills to ablate (default: all SKILL_FILES)")
+    parser.add_argument("--ablation-output", default="skill_ablation_results.json")
+    parser.add_argument("--resamples", type=int, default=eval_stats.DEFAULT_RESAMPLES,
+                        help="Bootstrap resamples for confidence intervals")
+    parser.add_argument("--no-cache", action="store_true", help="Do not reuse cached model responses")
+    parser.add_argument("--history-db", default=str(results_db.DEFAULT_DB_PATH),
+                        help="SQLite results history to append this run to")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run in the history database")
+    parser.add_argument("--deployments", default=os.environ.get("EVAL_DEPLOYMENTS"),
+                        help="JSON file of equivalent deployments to spread requests over (see deployment_pool.py)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Scenarios run concurrently; --delay applies only with 1 worker")
+    parser.add_argument("--max-prompt-tokens", type=int, default=0,
+                        help="Fail before any request if an estimated prompt exceeds this (0 = no limit)")
+    parser.add_argument("--price-per-mtok",
+                        help="USD per million input,output tokens for the cost projection (default: list price of --model)")
     args = parser.parse_args()
 
+    try:
+        estimator = token_budget.TokenEstimator(args.model, token_budget.parse_price(args.price_per_mtok))
+    except ValueError as e:
+        parser.error(f"--price-per-mtok: {e}")
+
     evals_dir = Path(__file__).parent
 
     # Parse eval files
@@ -582,6 +1018,24 @@ def main():
     print(f"Skills dir: {SKILLS_DIR}")
     print(f"{'=' * 70}\n")
 
+    if args.ablation:
+        ablation_skills = [name for name in SKILL_FILES
+                           if name in args.ablation_skills.split(",") and load_skill(name)]
+        api_key = "" if args.dry_run else load_api_key(args)
+        report = run_ablation(all_scenarios, ablation_skills, args.ablation, args, api_key, estimator)
+        if report:
+            Path(args.ablation_output).write_text(json.dumps(report, indent=2))
+            print(f"\nAblation results saved to {args.ablation_output}")
+        if deployment_pool.ACTIVE:
+            print_deployment_summary(Path(args.ablation_output))
+        return
+
+    # Pre-flight: projected prompt size and cost of every request, before any is sent
+    mode_skills = {"baseline": lambda s: [], "with_skills": lambda s: s.skills}
+    estimates = {(s.eval_id, mode): prompt_estimate(s, mode_skills[mode](s), mode, estimator)
+                 for s in all_scenarios for mode in modes}
+    over_budget = token_budget.preflight(list(estimates.values()), estimator, args.max_prompt_tokens)
+
     if args.dry_run:
         for s in all_scenarios:
             rules_count = len(s.validation_rules)
@@ -590,47 +1044,40 @@ def main():
             print(f"    Skills: {s.skills or ['none']}")
             print(f"    Validation rules: {rules_count}")
             print(f"    Prompt: {s.user_prompt[:80]}...")
+            print("    Estimated prompt: " + ", ".join(
+                f"{mode} {estimates[s.eval_id, mode].prompt_tokens:,} tokens "
+                f"({token_budget.format_cost(estimates[s.eval_id, mode].cost)})" for mode in modes))
             print()
         print(f"Dry run complete. {len(all_scenarios)} scenarios, "
               f"{sum(len(s.validation_rules) for s in all_scenarios)} total rules.")
+        token_budget.exit_if_over(over_budget, args.max_prompt_tokens)
         return
+    token_budget.exit_if_over(over_budget, args.max_prompt_tokens)
 
-    api_key = os.environ.get("OPENAI_API_KEY", "")
-    if not api_key:
-        print("Error: OPENAI_API_KEY not set", file=sys.stderr)
-        sys.exit(1)
-
-    for i, scenario in enumerate(all_scenarios):
-        print(f"\n--- {scenario.eval_id}: {scenario.title} ---")
-
-        # Baseline (no skills)
-        if "baseline" in modes:
-            sys_prompt = build_system_prompt([])
-            output = call_llm(scenario.user_prompt, sys_prompt,
-                              model=args.model, base_url=args.base_url, api_key=api_key)
-            scenario.baseline_output = output
-            scenario.baseline_passed, scenario.baseline_failed = score_output(scenario, output)
-            scenario.baseline_result = result_label(scenario.baseline_passed, scenario.baseline_failed)
-
-            if args.delay > 0:
-                time.sleep(args.delay)
+    api_key = load_api_key(args)
 
-        # With skills
-        if "with_skills" in modes:
-            sys_prompt = build_system_prompt(scenario.skills)
-            output = call_llm(scenario.user_prompt, sys_prompt,
-                              model=args.model, base_url=args.base_url, api_key=api_key)
-            scenario.skills_output = output
-            scenario.skills_passed, scenario.skills_failed = score_output(scenario, output)
-            scenario.skills_result = result_label(scenario.skills_passed, scenario.skills_failed)
-
-            if args.delay > 0 and i < len(all_scenarios) - 1:
-                time.sleep(args.delay)
-
-        print_scenario_result(scenario)
-
-    score = print_summary(all_scenarios)
+    if args.workers > 1:
+        # Results are printed in scenario order as they complete; --delay does not apply
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            for scenario in executor.map(lambda s: run_scenario(s, modes, args, api_key, delay=0.0),
+                                         all_scenarios):
+                print(f"\n--- {scenario.eval_id}: {scenario.title} ---")
+                print_scenario_result(scenario)
+    else:
+        for i, scenario in enumerate(all_scenarios):
+            print(f"\n--- {scenario.eval_id}: {scenario.title} ---")
+            run_scenario(scenario, modes, args, api_key, delay=args.delay, last=i == len(all_scenarios) - 1)
+            print_scenario_result(scenario)
+
+    score = print_summary(all_scenarios, args.resamples)
+    token_budget.print_accuracy(
+        [(estimates[s.eval_id, mode].prompt_tokens, call.prompt_tokens) for s in all_scenarios
+         for mode, call in (("baseline", s.baseline_call), ("with_skills", s.skills_call)) if call], estimator)
     save_results(all_scenarios, Path(args.output))
+    if deployment_pool.ACTIVE:
+        print_deployment_summary(Path(args.output))
+    if not args.no_history:
+        record_history(all_scenarios, args.model, score, Path(args.history_db))
 
     # Exit non-zero if all outputs are errors
     error_count = sum(1 for s in all_scenarios
@@ -0,0 +1,172 @@
+"""
+Live tool execution for run_evals.py --live.
+
+Starts the Fabric stand-in (perf/fabric_standin.py) and the stdio MCP server once, keeps
+both warm for the whole run, and executes the model's tool calls against them. Every call
+is timed and sized so the eval report can show per-tool server latency and response
+token footprint next to the accuracy score.
+"""
+
+import asyncio
+import json
+import os
+import shlex
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent / "perf"))
+
+from fabric_standin import FabricStandin, StandinConfig  # noqa: E402
+from mcp_client import McpError, McpStdioSession, tool_reported_error  # noqa: E402
+from mcp_load import percentile  # noqa: E402
+
+
+DEFAULT_SERVER_COMMAND = "dotnet run -c Release --project DataFactory.MCP --"
+
+
+@dataclass
+class ToolExecution:
+    tool: str
+    arguments: dict
+    latency_ms: float
+    response_bytes: int
+    # ~4 chars per token, the same rough estimate the perf benchmarks use
+    response_tokens: int
+    error: bool
+    text: str
+
+    def record(self, max_text: int = 500) -> dict:
+        """JSON-friendly form for eval_results.json (response text truncated)."""
+        data = asdict(self)
+        data["latency_ms"] = round(self.latency_ms, 1)
+        data["text"] = self.text[:max_text]
+        return data
+
+
+def to_openai_tools(mcp_tools: list[dict]) -> list[dict]:
+    """MCP tools/list entries in the chat completions "tools" format used by tools_schema.json."""
+    return [{
+        "type": "function",
+        "function": {
+            "name": tool["name"],
+            "description": tool.get("description", ""),
+            "parameters": tool.get("inputSchema") or {"type": "object", "properties": {}},
+        },
+    } for tool in mcp_tools]
+
+
+class LiveToolServer:
+    """Warm stdio MCP server plus Fabric stand-in shared by every scenario of a run.
+
+    run_evals.py is synchronous, so the asyncio session lives on a private event loop that
+    each call drives to completion.
+    """
+
+    def __init__(self, command: str = DEFAULT_SERVER_COMMAND, cwd: Optional[Path] = None,
+                 standin_config: Optional[StandinConfig] = None, startup_timeout: float = 180.0,
+                 call_timeout: float = 60.0, log_path: Optional[Path] = None):
+        self.command = shlex.split(command)
+        self.cwd = cwd
+        self.standin = FabricStandin(standin_config or StandinConfig())
+        self.startup_timeout = startup_timeout
+        self.call_timeout = call_timeout
+        self.log_path = log_path
+        self.executions: list[ToolExecution] = []
+        self.startup_ms: Optional[float] = None
+        self._loop = asyncio.new_event_loop()
+        self._session: Optional[McpStdioSession] = None
+        self._log = None
+        self._standin_started = False
+
+    def start(self) -> list[dict]:
+        """Start the stand-in and the server; returns the live tools in chat completions format."""
+        self.standin.start()
+        self._standin_started = True
+        self._log = open(self.log_path, "w") if self.log_path else None
+        self._session = McpStdioSession(self.command, env={**os.environ, **self.standin.server_env},
+                                        cwd=str(self.cwd) if self.cwd else None,
+                                        client_name="run-evals-live", stderr=self._log)
+        started = time.perf_counter()
+        try:
+            tools = self._loop.run_until_complete(self._start_session())
+        except BaseException:
+            self.close()
+            raise
+        self.startup_ms = (time.perf_counter() - started) * 1000
+        return to_openai_tools(tools)
+
+    async def _start_session(self) -> list[dict]:
+        await self._session.start()
+        # The first request also covers `dotnet run` building the project
+        await asyncio.wait_for(self._session.initialize(), self.startup_timeout)
+        return await self._session.list_tools()
+
+    def call(self, name: str, arguments: dict) -> ToolExecution:
+        """Execute one tool call; transport errors come back as an error result for the model."""
+        started = time.perf_counter()
+        try:
+            result = self._loop.run_until_complete(
+                asyncio.wait_for(self._session.call_tool(name, arguments), self.call_timeout))
+            execution = ToolExecution(name, arguments, result.latency_ms, result.response_bytes,
+                                      len(result.text) // 4, tool_reported_error(result), result.text)
+        except (McpError, ConnectionError, asyncio.TimeoutError) as ex:
+            text = json.dumps({"success": False, "error": str(ex) or type(ex).__name__})
+            execution = ToolExecution(name, arguments, (time.perf_counter() - started) * 1000, 0,
+                                      len(text) // 4, True, text)
+        self.executions.append(execution)
+        return execution
+
+    def summary(self) -> dict[str, dict]:
+        """Per-tool calls, latency percentiles, response tokens and error rate."""
+        by_tool: dict[str, list[ToolExecution]] = {}
+        for execution in self.executions:
+            by_tool.setdefault(execution.tool, []).append(execution)
+
+        summary = {}
+        for tool, runs in sorted(by_tool.items()):
+            latencies = [r.latency_ms for r in runs]
+            tokens = [r.response_tokens for r in runs]
+            summary[tool] = {
+                "calls": len(runs),
+                "latency_p50_ms": round(percentile(latencies, 50), 1),
+                "latency_p95_ms": round(percentile(latencies, 95), 1),
+                "response_tokens_mean": round(sum(tokens) / len(tokens)),
+                "response_tokens_max": max(tokens),
+                "error_rate": round(sum(r.error for r in runs) / len(runs), 3),
+            }
+        return summary
+
+    def close(self):
+        if self._session is not None:
+            try:
+                self._loop.run_until_complete(self._session.close())
+            finally:
+                self._session = None
+        if not self._loop.is_closed():
+            self._loop.close()
+        if self._log:
+            self._log.close()
+            self._log = None
+        if self._standin_started:
+            self.standin.stop()
+            self._standin_started = False
+
+    def __enter__(self) -> "LiveToolServer":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def print_tool_summary(summary: dict[str, dict]):
+    if not summary:
+        print("\nNo tools were executed.")
+        return
+    print("\nPer-tool execution (live server):")
+    print(f"  {'tool':<40} {'calls':>5} {'p50 ms':>8} {'p95 ms':>8} {'~tok mean':>10} {'~tok max':>9} {'errors':>7}")
+    for tool, row in summary.items():
+        print(f"  {tool:<40} {row['calls']:>5} {row['latency_p50_ms']:>8} {row['latency_p95_ms']:>8} "
+              f"{row['response_tokens_mean']:>10} {row['response_tokens_max']:>9} {row['error_rate']:>7.0%}")
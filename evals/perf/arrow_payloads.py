@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Synthetic Apache Arrow IPC stream payloads (stdlib only).
+
+Writes the Arrow IPC *streaming* format — what the Fabric executeQuery endpoint returns —
+without pyarrow: schema message, record batches, end-of-stream marker. Flatbuffer metadata
+is encoded by a small front-to-back builder below. Batches are produced lazily, so the
+Fabric stand-in can stream a multi-million row result without holding it in memory.
+
+Column mix cycles through int64, utf8, double, int32, bool, timestamp[ms, UTC] and date32,
+with a configurable share of nulls (every column except the leading non-null "id").
+
+Usage:
+    python arrow_payloads.py --rows 1000000 --columns 8 --out result.arrow
+    python arrow_payloads.py --rows 10000 --verify   # re-reads with pyarrow when installed
+"""
+
+import argparse
+import itertools
+import struct
+import sys
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Iterator
+
+COLUMN_KINDS = ["int64", "utf8", "double", "int32", "bool", "timestamp", "date32"]
+
+NAMES = ["Contoso", "Fabrikam", "Northwind Traders", "Adventure Works", "Tailspin Toys",
+         "Wide World Importers", "Litware", "Proseware, Inc.", "A. Datum", "Woodgrove Bank"]
+
+_TIMESTAMP_BASE_MS = 1_767_225_600_000  # 2026-01-01T00:00:00Z
+_DATE_BASE_DAYS = 20_454                # 2026-01-01
+
+# Arrow flatbuffer enums (Schema.fbs / Message.fbs)
+_METADATA_V5 = 4
+_HEADER_SCHEMA, _HEADER_RECORD_BATCH = 1, 3
+_TYPE_INT, _TYPE_FLOAT, _TYPE_UTF8, _TYPE_BOOL, _TYPE_DATE, _TYPE_TIMESTAMP = 2, 3, 5, 6, 8, 10
+_CONTINUATION = b"\xff\xff\xff\xff"
+
+
+@dataclass
+class ArrowPayloadSpec:
+    rows: int
+    columns: int = 8
+    batch_rows: int = 65_536
+    null_fraction: float = 0.05
+
+    def column_types(self) -> list[tuple[str, str]]:
+        """(name, kind) per column; column 0 is a non-null int64 "id"."""
+        cols = [("id", "int64")]
+        for k in range(1, self.columns):
+            kind = COLUMN_KINDS[k % len(COLUMN_KINDS)]
+            cols.append((f"{kind}_{k}", kind))
+        return cols
+
+
+# --- flatbuffers ------------------------------------------------------------------------
+
+class _Table:
+    """fields: (slot, struct format or "offset", value); value of an offset is a child object."""
+
+    def __init__(self, *fields):
+        self.fields = sorted(fields, key=lambda f: f[0])
+
+
+class _String:
+    def __init__(self, text: str):
+        self.data = text.encode()
+
+
+class _TableVector:
+    def __init__(self, items: list):
+        self.items = items
+
+
+class _StructVector:
+    """Vector of 8-byte aligned structs given as packed bytes."""
+
+    def __init__(self, data: bytes, count: int):
+        self.data = data
+        self.count = count
+
+
+class _Builder:
+    """Front-to-back flatbuffer writer: parents first, children after (uoffsets point forward)."""
+
+    def __init__(self):
+        self.buf = bytearray(4)  # root uoffset
+
+    def _pad(self, align: int, remainder: int = 0):
+        self.buf += b"\0" * ((remainder - len(self.buf)) % align)
+
+    def _patch(self, at: int, target: int):
+        struct.pack_into("<I", self.buf, at, target - at)
+
+    def finish(self, root: _Table) -> bytes:
+        self._patch(0, self.write(root))
+        self._pad(8)
+        return bytes(self.buf)
+
+    def write(self, obj) -> int:
+        if isinstance(obj, _String):
+            self._pad(4)
+            pos = len(self.buf)
+            self.buf += struct.pack("<I", len(obj.data)) + obj.data + b"\0"
+            return pos
+        if isinstance(obj, _StructVector):
+            self._pad(8, 4)  # elements start 8-aligned after the length prefix
+            pos = len(self.buf)
+            self.buf += struct.pack("<I", obj.count) + obj.data
+            return pos
+        if isinstance(obj, _TableVector):
+            self._pad(4)
+            pos = len(self.buf)
+            self.buf += struct.pack("<I", len(obj.items)) + b"\0" * (4 * len(obj.items))
+            for k, item in enumerate(obj.items):
+                self._patch(pos + 4 + 4 * k, self.write(item))
+            return pos
+        return self._write_table(obj)
+
+    def _write_table(self, table: _Table) -> int:
+        layout, offset = [], 4  # after the soffset to the vtable
+        for slot, fmt, value in table.fields:
+            size = struct.calcsize("<" + ("I" if fmt == "offset" else fmt))
+            offset += -offset % size
+            layout.append((slot, fmt, value, offset))
+            offset += size
+        table_size = offset + (-offset % 4)
+        slots = max((f[0] for f in table.fields), default=-1) + 1
+        vtable = [4 + 2 * slots, table_size] + [0] * slots
+        for slot, _, _, field_offset in layout:
+            vtable[2 + slot] = field_offset
+
+        self._pad(2)
+        vtable_pos = len(self.buf)
+        self.buf += struct.pack(f"<{len(vtable)}H", *vtable)
+        self._pad(8)
+        table_pos = len(self.buf)
+        body = bytearray(table_size)
+        struct.pack_into("<i", body, 0, table_pos - vtable_pos)
+        for _, fmt, value, field_offset in layout:
+            if fmt != "offset":
+                struct.pack_into("<" + fmt, body, field_offset, value)
+        self.buf += body
+        for _, fmt, value, field_offset in layout:
+            if fmt == "offset":
+                self._patch(table_pos + field_offset, self.write(value))
+        return table_pos
+
+
+def _type_table(kind: str) -> tuple[int, _Table]:
+    if kind in ("int32", "int64"):
+        return _TYPE_INT, _Table((0, "i", 32 if kind == "int32" else 64), (1, "B", 1))
+    if kind == "double":
+        return _TYPE_FLOAT, _Table((0, "h", 2))
+    if kind == "utf8":
+        return _TYPE_UTF8, _Table()
+    if kind == "bool":
+        return _TYPE_BOOL, _Table()
+    if kind == "date32":
+        return _TYPE_DATE, _Table((0, "h", 0))  # DAY
+    if kind == "timestamp":
+        return _TYPE_TIMESTAMP, _Table((0, "h", 1), (1, "offset", _String("UTC")))  # MILLISECOND
+    raise ValueError(f"Unsupported column kind: {kind}")
+
+
+def _message(header_type: int, header: _Table, body_length: int) -> bytes:
+    metadata = _Builder().finish(_Table(
+        (0, "h", _METADATA_V5), (1, "B", header_type), (2, "offset", header), (3, "q", body_length)))
+    return _CONTINUATION + struct.pack("<i", len(metadata)) + metadata
+
+
+def schema_message(spec: ArrowPayloadSpec) -> bytes:
+    fields = []
+    for k, (name, kind) in enumerate(spec.column_types()):
+        type_type, type_table = _type_table(kind)
+        fields.append(_Table((0, "offset", _String(name)), (1, "B", int(k > 0)), (2, "B", type_type),
+                             (3, "offset", type_table), (5, "offset", _TableVector([]))))
+    return _message(_HEADER_SCHEMA, _Table((0, "h", 0), (1, "offset", _TableVector(fields))), 0)
+
+
+# --- column data ------------------------------------------------------------------------
+
+def _validity(start: int, n: int, stride: int) -> tuple[int, bytes]:
+    """Validity bitmap with every stride-th row (by absolute index) null."""
+    if not stride:
+        return 0, b""
+    bitmap = bytearray(b"\xff" * ((n + 7) // 8))
+    first = (stride - 1 - start) % stride
+    nulls = 0
+    for i in range(first, n, stride):
+        bitmap[i >> 3] &= ~(1 << (i & 7)) & 0xFF
+        nulls += 1
+    return nulls, bytes(bitmap)
+
+
+def _values(kind: str, start: int, n: int) -> list[bytes]:
+    rows = range(start, start + n)
+    if kind == "int64":
+        return [array("q", rows).tobytes()]
+    if kind == "int32":
+        return [array("i", (r * 7919 % 100_000 for r in rows)).tobytes()]
+    if kind == "double":
+        return [array("d", ((r % 10_000) * 0.25 - 1000.0 for r in rows)).tobytes()]
+    if kind == "bool":
+        bits = bytearray((n + 7) // 8)
+        for i, r in enumerate(rows):
+            if r % 3 == 0:
+                bits[i >> 3] |= 1 << (i & 7)
+        return [bytes(bits)]
+    if kind == "timestamp":
+        return [array("q", (_TIMESTAMP_BASE_MS + r * 60_000 for r in rows)).tobytes()]
+    if kind == "date32":
+        return [array("i", (_DATE_BASE_DAYS + r // 1000 for r in rows)).tobytes()]
+    if kind == "utf8":
+        encoded = [name.encode() for name in NAMES]
+        picked = [encoded[r % len(encoded)] for r in rows]
+        offsets = array("i", itertools.accumulate((len(b) for b in picked), initial=0))
+        return [offsets.tobytes(), b"".join(picked)]
+    raise ValueError(f"Unsupported column kind: {kind}")
+
+
+def record_batch_message(spec: ArrowPayloadSpec, start: int, n: int) -> bytes:
+    stride = round(1 / spec.null_fraction) if spec.null_fraction > 0 else 0
+    nodes, buffers, body = [], [], bytearray()
+
+    def add_buffer(data: bytes):
+        buffers.append(struct.pack("<qq", len(body), len(data)))
+        body.extend(data)
+        body.extend(b"\0" * (-len(body) % 8))
+
+    for k, (_, kind) in enumerate(spec.column_types()):
+        null_count, bitmap = _validity(start, n, stride if k > 0 else 0)
+        nodes.append(struct.pack("<qq", n, null_count))
+        add_buffer(bitmap)
+        for data in _values(kind, start, n):
+            add_buffer(data)
+
+    header = _Table((0, "q", n),
+                    (1, "offset", _StructVector(b"".join(nodes), len(nodes))),
+                    (2, "offset", _StructVector(b"".join(buffers), len(buffers))))
+    return _message(_HEADER_RECORD_BATCH, header, len(body)) + bytes(body)
+
+
+def iter_arrow_stream(spec: ArrowPayloadSpec) -> Iterator[bytes]:
+    """Schema message, one message per record batch, then the end-of-stream marker."""
+    if sys.byteorder != "little":
+        raise RuntimeError("arrow_payloads writes little-endian buffers only")
+    yield schema_message(spec)
+    for start in range(0, spec.rows, spec.batch_rows):
+        yield record_batch_message(spec, start, min(spec.batch_rows, spec.rows - start))
+    yield _CONTINUATION + b"\0\0\0\0"
+
+
+def arrow_stream_bytes(spec: ArrowPayloadSpec) -> bytes:
+    return b"".join(iter_arrow_stream(spec))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic Arrow IPC stream")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--columns", type=int, default=8)
+    parser.add_argument("--batch-rows", type=int, default=65_536)
+    parser.add_argument("--null-fraction", type=float, default=0.05)
+    parser.add_argument("--out", help="Write the stream to this file")
+    parser.add_argument("--verify", action="store_true", help="Read the stream back with pyarrow (if installed)")
+    args = parser.parse_args()
+
+    spec = ArrowPayloadSpec(args.rows, args.columns, args.batch_rows, args.null_fraction)
+    started = time.perf_counter()
+    data = arrow_stream_bytes(spec)
+    elapsed = time.perf_counter() - started
+    print(f"{spec.rows} rows × {spec.columns} columns: {len(data) / 1e6:.2f} MB in {elapsed:.2f}s")
+    if args.out:
+        with open(args.out, "wb") as f:
+            f.write(data)
+    if args.verify:
+        try:
+            import pyarrow.ipc
+        except ImportError:
+            print("pyarrow not installed; skipping read-back")
+            return
+        table = pyarrow.ipc.open_stream(data).read_all()
+        table.validate(full=True)
+        print(f"pyarrow read {table.num_rows} rows, {table.num_columns} columns")
+        print(table.schema)
+
+
+if __name__ == "__main__":
+    main()
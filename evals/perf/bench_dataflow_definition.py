@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Large Dataflow Definition Round-Trip Benchmark
+
+Serves dataflow definitions of 10 to 1000+ queries (section_documents.py) from the Fabric
+stand-in and times the definition tools end to end:
+
+    get      get_dataflow_definition (decode every part)
+    update   AddOrUpdateQueryInDataflowAsync on an existing query in the middle
+    add      AddOrUpdateQueryInDataflowAsync with a new query
+    save     save_dataflow_definition with the whole section document
+
+Per size and operation it reports tool latency, response size, bytes uploaded to
+updateDefinition, server RSS and the managed bytes the server allocated per call (the
+allocatedBytes counter on /health, read before and after each call; calls run one at a
+time). For updates it also checks that everything outside the patched member was uploaded
+byte for byte. Pass --baseline-launch with a build of an earlier commit to compare
+before/after in one run.
+
+Usage:
+    python bench_dataflow_definition.py --launch "dotnet run -c Release --project ../../DataFactory.MCP.Http" \\
+        --url http://127.0.0.1:5000/ --sizes 10,100,500,1000
+    python bench_dataflow_definition.py --launch "dotnet /tmp/after/DataFactory.MCP.Http.dll" \\
+        --baseline-launch "dotnet /tmp/before/DataFactory.MCP.Http.dll" --sizes 100,1000 --json definition.json
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import shlex
+import subprocess
+import urllib.request
+from pathlib import Path
+from statistics import median
+from typing import Optional
+from urllib.parse import urlsplit
+
+from fabric_standin import FabricStandin, add_config_arguments, config_from_args, item_id
+from mcp_client import McpError, McpHttpSession, tool_reported_error
+from mcp_load import percentile, process_rss_mb, wait_for_server
+from section_documents import SectionSpec, generate, m_identifier, query_name
+
+
+OPERATIONS = ("get", "update", "add", "save")
+
+
+def stored_mashup(standin: FabricStandin, dataflow_id: str) -> Optional[str]:
+    definition = standin._definitions.get(dataflow_id) or {}
+    for part in definition.get("parts", []):
+        if part.get("path", "").lower() == "mashup.pq":
+            return base64.b64decode(part["payload"]).decode()
+    return None
+
+
+def rest_unchanged(before: str, after: Optional[str], name: str) -> Optional[bool]:
+    """Whether the uploaded document differs from the original only inside the patched member."""
+    if after is None:
+        return None
+    declaration = before.find(f"shared {m_identifier(name)} =")
+    following = before.find("\nshared ", declaration + 1)
+    # Members end at their ';'; attribute lines between two members belong to the second
+    start = before.rfind(";", 0, declaration) + 1
+    end = before.rfind(";", declaration, len(before) if following < 0 else following) + 1
+    return after.startswith(before[:start]) and after.endswith(before[end:])
+
+
+def allocated_bytes(url: str) -> Optional[int]:
+    """The server's managed allocations so far, or None for builds whose /health doesn't report them."""
+    parts = urlsplit(url)
+    try:
+        health = json.loads(urllib.request.urlopen(f"{parts.scheme}://{parts.netloc}/health", timeout=5).read())
+    except OSError:
+        return None
+    return health.get("allocatedBytes")
+
+
+async def run_operation(url: str, op: str, size: int, repeat: int, args: dict, standin: FabricStandin,
+                        server_pid: Optional[int]) -> list[dict]:
+    session = McpHttpSession(url, client_name="bench-dataflow-definition")
+    calls = []
+    try:
+        await session.initialize()
+        for i in range(repeat):
+            if op == "get":
+                tool, arguments = "get_dataflow_definition", {}
+            elif op == "save":
+                tool, arguments = "save_dataflow_definition", {"mDocument": args["document"]}
+            else:
+                name = args["target"] if op == "update" else f"Added Query {size}_{i}"
+                tool, arguments = "AddOrUpdateQueryInDataflowAsync", {
+                    "queryName": name,
+                    "mCode": f'let\n    Source = Sql.Database("bench.example.com", "db"),\n    Revision = {i}\nin\n    Source'}
+            standin.reset_stats()
+            allocated_before = allocated_bytes(url)
+            try:
+                result = await session.call_tool(tool, {**args["ids"], **arguments})
+                error, latency, size_out, text = tool_reported_error(result), result.latency_ms, \
+                    result.response_bytes, result.text
+            except McpError as ex:
+                error, latency, size_out, text = True, 0.0, 0, str(ex)
+            allocated_after = allocated_bytes(url)
+            upload = standin.stats_snapshot().get("items.updateDefinition", {}).get("bytes_in", 0)
+            calls.append({"latency_ms": round(latency, 1), "response_bytes": size_out, "upload_bytes": upload,
+                          "rss_mb": process_rss_mb(server_pid) if server_pid else None,
+                          "alloc_kb": (allocated_after - allocated_before) // 1024
+                          if allocated_before is not None and allocated_after is not None else None,
+                          "error": error, "error_text": text[:200] if error else None})
+            if error:
+                break
+    finally:
+        await session.close()
+    return calls
+
+
+def summarize(op: str, size: int, calls: list[dict], unchanged: Optional[bool]) -> dict:
+    ok = [c for c in calls if not c["error"]]
+    latencies = [c["latency_ms"] for c in ok]
+    rss = [c["rss_mb"] for c in ok if c["rss_mb"] is not None]
+    alloc = [c["alloc_kb"] for c in ok if c["alloc_kb"] is not None]
+    return {
+        "operation": op, "queries": size, "calls": len(calls), "errors": len(calls) - len(ok),
+        "latency_p50_ms": round(percentile(latencies, 50), 1),
+        "latency_max_ms": max(latencies) if latencies else 0.0,
+        "response_bytes": ok[-1]["response_bytes"] if ok else 0,
+        "upload_bytes": ok[-1]["upload_bytes"] if ok else 0,
+        "server_rss_peak_mb": round(max(rss), 1) if rss else None,
+        "alloc_kb_p50": int(median(alloc)) if alloc else None,
+        "rest_unchanged": unchanged,
+        "first_error": next((c["error_text"] for c in calls if c["error"]), None),
+    }
+
+
+def run_build(label: str, launch: Optional[str], url: str, sizes: list[int], ops: list[str], repeat: int,
+              standin: FabricStandin, server_pid: Optional[int], timeout: float) -> list[dict]:
+    server = None
+    if launch:
+        server = subprocess.Popen(shlex.split(launch), env={**os.environ, **standin.server_env},
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    rows = []
+    try:
+        wait_for_server(url, timeout if server else 5.0, server)
+        pid = server.pid if server else server_pid
+        workspace = item_id("workspace", 0)
+        for d, size in enumerate(sizes):
+            # A different dataflow per size, so definitions stored by earlier updates don't carry over
+            dataflow = item_id(f"dataflow:{workspace}", d % standin.config.dataflows_per_workspace)
+            standin.reset_definitions()
+            standin.config.queries_per_dataflow = size
+            spec = SectionSpec(size, standin.config.query_steps, seed=standin.config.seed)
+            document, _ = generate(spec)
+            args = {"ids": {"workspaceId": workspace, "dataflowId": dataflow}, "document": document,
+                    "target": query_name(spec, max(size // 2, 1))}
+            for op in ops:
+                calls = asyncio.run(run_operation(url, op, size, repeat, args, standin, pid))
+                unchanged = None
+                if op == "update" and not any(c["error"] for c in calls):
+                    unchanged = rest_unchanged(document, stored_mashup(standin, dataflow), args["target"])
+                row = {"build": label, **summarize(op, size, calls, unchanged)}
+                rows.append(row)
+                print_row(row)
+                standin.reset_definitions()
+    finally:
+        if server:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+    return rows
+
+
+def print_header():
+    print(f"\n  {'build':<9} {'op':<7} {'queries':>7} {'p50 ms':>8} {'max ms':>8} {'resp KB':>8} {'upload KB':>9} "
+          f"{'RSS MB':>7} {'alloc KB':>9} {'rest ok':>7}")
+
+
+def print_row(r: dict):
+    fmt = lambda v: "—" if v is None else str(v)  # noqa: E731
+    status = "" if not r["errors"] else f"  ⚠️ {r['first_error']}"
+    print(f"  {r['build']:<9} {r['operation']:<7} {r['queries']:>7} {r['latency_p50_ms']:>8} {r['latency_max_ms']:>8} "
+          f"{r['response_bytes'] / 1024:>8.1f} {r['upload_bytes'] / 1024:>9.1f} {fmt(r['server_rss_peak_mb']):>7} "
+          f"{fmt(r['alloc_kb_p50']):>9} {fmt(r['rest_unchanged']):>7}{status}")
+
+
+def print_comparison(rows: list[dict]):
+    baseline = {(r["operation"], r["queries"]): r for r in rows if r["build"] == "baseline"}
+    if not baseline:
+        return
+    print("\n  current vs baseline:")
+    for r in rows:
+        base = baseline.get((r["operation"], r["queries"]))
+        if r["build"] != "current" or not base or not base["latency_p50_ms"]:
+            continue
+        line = f"    {r['operation']:<7} {r['queries']:>5} queries: p50 {base['latency_p50_ms']} → {r['latency_p50_ms']} ms"
+        if base["upload_bytes"]:
+            line += f", upload {base['upload_bytes'] / 1024:.0f} → {r['upload_bytes'] / 1024:.0f} KB"
+        if base["alloc_kb_p50"] is not None and r["alloc_kb_p50"] is not None:
+            line += f", allocated {base['alloc_kb_p50']} → {r['alloc_kb_p50']} KB"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dataflow definition tools on large section documents")
+    parser.add_argument("--url", default="http://127.0.0.1:5000/", help="MCP endpoint of the HTTP server")
+    parser.add_argument("--sizes", default="10,100,500,1000", help="Comma-separated query counts")
+    parser.add_argument("--operations", default=",".join(OPERATIONS), help=f"Subset of {', '.join(OPERATIONS)}")
+    parser.add_argument("--repeat", type=int, default=5, help="Calls per size and operation")
+    parser.add_argument("--launch", help="Command that starts the MCP HTTP server under test")
+    parser.add_argument("--baseline-launch", help="Command that starts a baseline build (e.g. an earlier commit)")
+    parser.add_argument("--server-pid", type=int, help="PID of an already running server (for RSS)")
+    parser.add_argument("--standin-port", type=int, default=0, help="Port for the stand-in (0 = any)")
+    parser.add_argument("--startup-timeout", type=float, default=120.0)
+    parser.add_argument("--json", help="Write per-build results to this file")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    ops = [o.strip() for o in args.operations.split(",") if o.strip()]
+    if set(ops) - set(OPERATIONS):
+        parser.error(f"--operations accepts {', '.join(OPERATIONS)}")
+    if args.baseline_launch and not args.launch:
+        parser.error("--baseline-launch needs --launch for the build under test")
+
+    rows = []
+    with FabricStandin(config_from_args(args), port=args.standin_port) as standin:
+        print(f"Fabric stand-in: {standin.base_url} ({standin.config.query_steps} steps per query)")
+        if not args.launch:
+            print("Server must be started with:")
+            for key, value in standin.server_env.items():
+                print(f"  {key}={value}")
+        print_header()
+        builds = ([("baseline", args.baseline_launch)] if args.baseline_launch else []) + [("current", args.launch)]
+        for label, launch in builds:
+            rows += run_build(label, launch, args.url, sizes, ops, args.repeat, standin, args.server_pid,
+                              args.startup_timeout)
+
+    print_comparison(rows)
+    if args.json:
+        Path(args.json).write_text(json.dumps({"sizes": sizes, "repeat": args.repeat, "results": rows}, indent=2))
+        print(f"\nResults saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
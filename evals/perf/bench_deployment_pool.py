@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Deployment Pool Throughput Benchmark
+
+Starts one stub_llm.py server per deployment, each with its own tokens-per-minute quota
+and latency, and sends the tool-selection eval requests through deployment_pool.py from
+--workers threads: once to the first deployment alone, once spread over the whole pool.
+Reported per run: completed requests per second, tokens per second, 429s and errors, and
+per deployment the share of requests, 429s and latency.
+
+Each eval request is ~5k tokens (the tool schema dominates). Stub quota accrues from the
+moment the stub starts, so throughput is the steady state a long run would see.
+
+Usage:
+    python bench_deployment_pool.py --tpm 3000000,3000000,3000000 --requests 400 --workers 16
+    python bench_deployment_pool.py --tpm 4000000,1000000 --latency-ms 50,150 --json pool.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import deployment_pool  # noqa: E402
+import run_evals  # noqa: E402
+from deployment_pool import Deployment, DeploymentPool  # noqa: E402
+from stub_llm import StubLLMServer  # noqa: E402
+
+
+EVALS_DIR = Path(__file__).resolve().parent.parent
+
+
+def eval_bodies(model: str) -> list[bytes]:
+    """Pre-encoded chat completions bodies of every tool-selection scenario."""
+    tools = json.loads((EVALS_DIR / "tools_schema.json").read_text())["tools"]
+    scenarios = [s for f in sorted(EVALS_DIR.glob("*.eval.md")) for s in run_evals.parse_eval_file(f)]
+    return [json.dumps({"model": model, "messages": run_evals.build_messages(s.user_prompt, s.context),
+                        "tools": tools, "tool_choice": "auto", "temperature": 0, "max_tokens": 256}).encode()
+            for s in scenarios]
+
+
+def run(label: str, servers: list[StubLLMServer], weights: list[float], bodies: list[bytes], requests: int,
+        workers: int, timeout: float) -> dict:
+    pool = DeploymentPool([Deployment(f"stub-{i}", server.base_url, "stub", "stub-model", weight)
+                           for i, (server, weight) in enumerate(zip(servers, weights))])
+    throttled_before = [server.throttled_count for server in servers]
+
+    def send(i: int) -> tuple[bool, int]:
+        try:
+            response = pool.post_json(bodies[i % len(bodies)], timeout=timeout)
+            return True, (response.get("usage") or {}).get("total_tokens", 0)
+        except Exception:
+            return False, 0
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(send, range(requests)))
+    elapsed = time.perf_counter() - started
+
+    ok = [tokens for success, tokens in results if success]
+    return {
+        "run": label,
+        "deployments": len(servers),
+        "requests": requests,
+        "completed": len(ok),
+        "failed": requests - len(ok),
+        "elapsed_s": round(elapsed, 2),
+        "requests_per_s": round(len(ok) / elapsed, 2),
+        "tokens_per_s": round(sum(ok) / elapsed),
+        "throttled": sum(s.throttled_count - b for s, b in zip(servers, throttled_before)),
+        "per_deployment": pool.summary(),
+    }
+
+
+def print_run(r: dict):
+    print(f"\n{r['run']}: {r['completed']}/{r['requests']} requests in {r['elapsed_s']}s — "
+          f"{r['requests_per_s']} req/s, {r['tokens_per_s']:,} tokens/s, {r['throttled']} 429s, "
+          f"{r['failed']} failed")
+    deployment_pool.print_summary(r["per_deployment"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark throughput of one deployment vs a deployment pool")
+    parser.add_argument("--tpm", default="3000000,3000000,3000000", help="Comma-separated TPM quota per deployment")
+    parser.add_argument("--latency-ms", default="50", help="Comma-separated latency per deployment (last repeats)")
+    parser.add_argument("--weights", help="Comma-separated pool weights (default: the TPM quotas)")
+    parser.add_argument("--requests", type=int, default=400, help="Requests per run")
+    parser.add_argument("--workers", type=int, default=16, help="Concurrent requests")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    tpms = [int(t) for t in args.tpm.split(",") if t.strip()]
+    latencies = [float(v) for v in args.latency_ms.split(",") if v.strip()]
+    latencies += [latencies[-1]] * (len(tpms) - len(latencies))
+    weights = [float(w) for w in args.weights.split(",")] if args.weights else [float(t) for t in tpms]
+    if len(weights) != len(tpms):
+        parser.error("--weights needs one value per --tpm entry")
+
+    bodies = eval_bodies("stub-model")
+    print(f"{len(bodies)} eval request bodies, {args.requests} requests per run, {args.workers} workers")
+
+    rows = []
+    # Fresh stubs per run, so the pool run does not start with quota the single run left unused
+    for label, count in (("single", 1), ("pool", len(tpms))):
+        servers = [StubLLMServer(latency_ms=latencies[i], tpm=tpms[i]).start() for i in range(count)]
+        try:
+            rows.append(run(label, servers, weights[:count], bodies, args.requests, args.workers, args.timeout))
+        finally:
+            for server in servers:
+                server.stop()
+        print_run(rows[-1])
+
+    single, pooled = rows
+    if single["requests_per_s"]:
+        print(f"\npool of {pooled['deployments']} vs single: "
+              f"{pooled['requests_per_s'] / single['requests_per_s']:.2f}× requests/s, "
+              f"429s {single['throttled']} → {pooled['throttled']}")
+    if args.json:
+        Path(args.json).write_text(json.dumps({"tpm": tpms, "latency_ms": latencies, "weights": weights,
+                                               "workers": args.workers, "results": rows}, indent=2))
+        print(f"\nResults saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Eval Statistics Benchmark
+
+Times the bootstrap intervals of eval_stats.py over synthetic result sets of 100 to 100k
+scenarios: the tool-selection score (pass / partial / fail credits) and the paired
+baseline-vs-skills delta with its permutation test (rules passed out of 3-8 per scenario).
+Reported per size and backend: milliseconds per interval and the interval itself, so the
+NumPy and pure-Python results can be compared. The pure-Python backend switches to the
+normal approximation beyond eval_stats.PYTHON_MAX_DRAWS scenario draws.
+
+Usage:
+    python bench_eval_stats.py
+    python bench_eval_stats.py --sizes 100,1000,100000 --resamples 10000 --json stats.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import eval_stats  # noqa: E402
+
+
+def tool_selection_credits(n: int, rng: random.Random) -> list[float]:
+    return rng.choices([1.0, 0.5, 0.0], weights=[5, 3, 2], k=n)
+
+
+def integration_columns(n: int, rng: random.Random) -> tuple[list[int], ...]:
+    rules = [rng.randint(3, 8) for _ in range(n)]
+    baseline = [sum(rng.random() < 0.55 for _ in range(r)) for r in rules]
+    skills = [sum(rng.random() < 0.65 for _ in range(r)) for r in rules]
+    return baseline, rules, skills, rules
+
+
+def timed(fn) -> tuple[float, eval_stats.Interval]:
+    started = time.perf_counter()
+    interval = fn()
+    return (time.perf_counter() - started) * 1000, interval
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bootstrap confidence intervals of eval scores")
+    parser.add_argument("--sizes", default="100,1000,10000,100000", help="Comma-separated scenario counts")
+    parser.add_argument("--resamples", type=int, default=eval_stats.DEFAULT_RESAMPLES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    backends = [("numpy", True)] if eval_stats.np is not None else []
+    backends.append(("python", False))
+    print(f"{args.resamples:,} resamples; backends: {', '.join(name for name, _ in backends)}")
+    print(f"\n  {'scenarios':>9} {'backend':<7} {'score ms':>9} {'score CI':>22} {'delta ms':>9} "
+          f"{'delta CI':>24} {'p':>7}")
+
+    rows = []
+    for n in [int(s) for s in args.sizes.split(",") if s.strip()]:
+        rng = random.Random(args.seed)
+        credits = tool_selection_credits(n, rng)
+        columns = integration_columns(n, rng)
+        for name, vectorized in backends:
+            score_ms, score = timed(lambda: eval_stats.ratio_ci(credits, resamples=args.resamples, scale=100,
+                                                                vectorized=vectorized))
+            delta_ms, delta = timed(lambda: eval_stats.paired_delta_ci(*columns, resamples=args.resamples,
+                                                                       scale=100, vectorized=vectorized))
+            print(f"  {n:>9,} {name:<7} {score_ms:>9.1f} {score.format():>22} {delta_ms:>9.1f} "
+                  f"{delta.format(signed=True):>24} {delta.p_value:>7.4f}")
+            rows.append({"scenarios": n, "backend": name, "score_ms": round(score_ms, 1),
+                         "score": [score.estimate, score.low, score.high], "delta_ms": round(delta_ms, 1),
+                         "delta": [delta.estimate, delta.low, delta.high], "p_value": delta.p_value})
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({"resamples": args.resamples, "results": rows}, indent=2))
+        print(f"\nResults saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
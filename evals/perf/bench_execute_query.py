@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+ExecuteQueryAsync Result Size Benchmark
+
+Calls the ExecuteQueryAsync MCP tool against the Fabric stand-in, which streams a
+synthetic Arrow result of 10k to millions of rows, once as a full result and once with
+maxRows (streamed summary: first N rows plus per-column statistics). Per result size and
+mode it reports tool latency, server peak RSS while the call runs, tool response size
+(bytes and ~tokens) and the Arrow bytes the server read from the stand-in.
+
+Usage:
+    python bench_execute_query.py --launch "dotnet run -c Release --project ../../DataFactory.MCP.Http" \\
+        --url http://127.0.0.1:5000/ --sizes 10000,100000,1000000,2000000 --max-rows 100
+    python bench_execute_query.py --url http://127.0.0.1:5000/ --standin-port 5555 --server-pid 12345
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shlex
+import subprocess
+import time
+from pathlib import Path
+from typing import Optional
+
+from fabric_standin import FabricStandin, add_config_arguments, config_from_args, item_id
+from mcp_client import McpError, McpHttpSession, tool_reported_error
+from mcp_load import percentile, process_rss_mb, wait_for_server
+
+
+QUERY = 'let Source = Sql.Database("server1.example.com", "db") in Source'
+
+
+def table_rows(text: str) -> tuple[Optional[int], Optional[int]]:
+    """(rows returned, total rows reported) from the tool's JSON result."""
+    try:
+        table = json.loads(text).get("table") or {}
+    except (json.JSONDecodeError, AttributeError):
+        return None, None
+    return table.get("rowCount"), table.get("totalRowCount", table.get("rowCount"))
+
+
+async def sample_rss(pid: int, samples: list[float], stop: asyncio.Event, interval: float = 0.02):
+    while not stop.is_set():
+        rss = process_rss_mb(pid)
+        if rss is not None:
+            samples.append(rss)
+        try:
+            await asyncio.wait_for(stop.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def measure(url: str, arguments: dict, repeat: int, server_pid: Optional[int]) -> dict:
+    session = McpHttpSession(url, client_name="bench-execute-query")
+    calls = []
+    try:
+        await session.initialize()
+        for _ in range(repeat):
+            rss: list[float] = []
+            stop = asyncio.Event()
+            sampler = asyncio.create_task(sample_rss(server_pid, rss, stop)) if server_pid else None
+            try:
+                result = await session.call_tool("ExecuteQueryAsync", arguments)
+                error = tool_reported_error(result)
+                latency_ms, size, text = result.latency_ms, result.response_bytes, result.text
+            except McpError as ex:
+                error, latency_ms, size, text = True, 0.0, 0, str(ex)
+            finally:
+                stop.set()
+                if sampler:
+                    await sampler
+            rows, total = table_rows(text)
+            calls.append({"latency_ms": round(latency_ms, 1), "response_bytes": size, "text_chars": len(text),
+                          "rows_returned": rows, "total_rows": total, "error": error,
+                          "rss_start_mb": rss[0] if rss else None, "rss_peak_mb": max(rss) if rss else None,
+                          "error_text": text[:200] if error else None})
+            if error:
+                break
+    finally:
+        await session.close()
+
+    ok = [c for c in calls if not c["error"]]
+    latencies = [c["latency_ms"] for c in ok]
+    peaks = [c["rss_peak_mb"] for c in ok if c["rss_peak_mb"] is not None]
+    return {
+        "calls": len(calls),
+        "errors": len(calls) - len(ok),
+        "latency_p50_ms": round(percentile(latencies, 50), 1),
+        "latency_max_ms": max(latencies) if latencies else 0.0,
+        "response_bytes": ok[-1]["response_bytes"] if ok else 0,
+        # ~4 chars per token, the same rough estimate stub_llm.py uses
+        "approx_tokens": ok[-1]["text_chars"] // 4 if ok else 0,
+        "rows_returned": ok[-1]["rows_returned"] if ok else None,
+        "total_rows": ok[-1]["total_rows"] if ok else None,
+        "server_rss_peak_mb": max(peaks) if peaks else None,
+        "server_rss_start_mb": ok[0]["rss_start_mb"] if ok else None,
+        "first_error": next((c["error_text"] for c in calls if c["error"]), None),
+        "per_call": calls,
+    }
+
+
+def print_row(mode: str, size: int, row: dict, upstream_bytes: int):
+    rss = "—" if row["server_rss_peak_mb"] is None else f"{row['server_rss_start_mb']:.0f}→{row['server_rss_peak_mb']:.0f}"
+    status = "" if not row["errors"] else f"  ⚠️ {row['first_error']}"
+    print(f"  {mode:<8} {size:>9} {str(row['rows_returned']):>8} {str(row['total_rows']):>9} "
+          f"{row['latency_p50_ms']:>9} {row['response_bytes'] / 1e6:>9.2f} {row['approx_tokens']:>10} "
+          f"{upstream_bytes / 1e6:>8.1f} {rss:>12}{status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ExecuteQueryAsync full results vs streamed summaries")
+    parser.add_argument("--url", default="http://127.0.0.1:5000/", help="MCP endpoint of the HTTP server")
+    parser.add_argument("--sizes", default="10000,100000,1000000,2000000", help="Comma-separated result row counts")
+    parser.add_argument("--modes", default="full,summary", help="full (all rows) and/or summary (maxRows)")
+    parser.add_argument("--max-rows", type=int, default=100, help="maxRows for summary mode")
+    parser.add_argument("--full-max-size", type=int, default=1_000_000,
+                        help="Skip full mode above this many rows (the full result is returned as JSON)")
+    parser.add_argument("--repeat", type=int, default=3, help="Calls per size and mode")
+    parser.add_argument("--launch", help="Command that starts the MCP HTTP server (gets stand-in env)")
+    parser.add_argument("--server-pid", type=int, help="PID of an already running server (for RSS)")
+    parser.add_argument("--standin-port", type=int, default=0, help="Port for the stand-in (0 = any)")
+    parser.add_argument("--startup-timeout", type=float, default=120.0)
+    parser.add_argument("--json", help="Write raw results (including per-call rows) to this file")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    if set(modes) - {"full", "summary"}:
+        parser.error("--modes accepts full and summary")
+
+    standin = FabricStandin(config_from_args(args), port=args.standin_port).start()
+    workspace = item_id("workspace", 0)
+    arguments = {"workspaceId": workspace, "dataflowId": item_id(f"dataflow:{workspace}", 0),
+                 "queryName": "Query1", "customMashupDocument": QUERY}
+    print(f"Fabric stand-in: {standin.base_url} ({standin.config.query_columns} columns, "
+          f"{standin.config.query_batch_rows} rows per batch)")
+    server = None
+    results = []
+    try:
+        if args.launch:
+            server = subprocess.Popen(shlex.split(args.launch), env={**os.environ, **standin.server_env},
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        else:
+            print("Server must be started with:")
+            for key, value in standin.server_env.items():
+                print(f"  {key}={value}")
+        wait_for_server(args.url, args.startup_timeout if server else 5.0, server)
+        server_pid = server.pid if server else args.server_pid
+
+        print(f"\n  {'mode':<8} {'size':>9} {'rows':>8} {'total':>9} {'p50 ms':>9} {'resp MB':>9} "
+              f"{'~tokens':>10} {'arrow MB':>8} {'RSS MB':>12}")
+        for size in sizes:
+            # The stand-in generates batches on demand, so resizing between runs is free
+            standin.config.query_rows = size
+            for mode in modes:
+                if mode == "full" and size > args.full_max_size:
+                    continue
+                call_args = arguments if mode == "full" else {**arguments, "maxRows": args.max_rows}
+                standin.reset_stats()
+                started = time.perf_counter()
+                row = asyncio.run(measure(args.url, call_args, args.repeat, server_pid))
+                upstream = standin.stats_snapshot().get("dataflows.executeQuery", {})
+                calls = max(upstream.get("count", 0), 1)
+                upstream_bytes = upstream.get("bytes_out", 0) // calls
+                print_row(mode, size, row, upstream_bytes)
+                results.append({"mode": mode, "size": size, "max_rows": None if mode == "full" else args.max_rows,
+                                "arrow_bytes": upstream_bytes, "wall_s": round(time.perf_counter() - started, 2),
+                                **row})
+    finally:
+        if server:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+        standin.stop()
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({"runs": results}, indent=2))
+        print(f"\nRaw results saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Eval Harness Scaling Benchmark
+
+Generates synthetic scenario corpora of increasing size and measures how the
+tool-selection harness (run_evals.py) scales: parse time, LLM round-trip overhead
+against a local stub endpoint, scoring time, report generation and peak memory.
+Each stage is timed --repeat times per size and the fastest run is kept. The scaling
+exponent between consecutive sizes, and a log-log fit over all sizes, flag superlinear
+stages; pairs of sizes less than 4x apart are reported but never flagged, since timer and
+GC noise dominate small ratios.
+
+Usage:
+    python bench_harness.py                              # 1k, 10k and 50k scenarios
+    python bench_harness.py --sizes 1000,10000,100000 --repeat 7
+    python bench_harness.py --http-sample 500 --stub-latency-ms 5 --json bench.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import run_evals  # noqa: E402
+from generate_scenarios import generate  # noqa: E402
+from stub_llm import StubLLMServer, build_completion  # noqa: E402
+
+
+STAGES = ["parse", "score", "report"]
+
+# Exponent above which a stage is reported as growing faster than linearly.
+SUPERLINEAR_THRESHOLD = 1.2
+
+# Smallest size ratio for which a consecutive-pair exponent is trusted enough to flag.
+MIN_SIZE_RATIO = 4
+
+
+def _parse(files: list[Path]) -> list[run_evals.EvalScenario]:
+    scenarios = []
+    for f in files:
+        scenarios.extend(run_evals.parse_eval_file(f))
+    return scenarios
+
+
+def _score(scenarios: list[run_evals.EvalScenario], responses: list[dict]):
+    for scenario, response in zip(scenarios, responses):
+        calls = run_evals.extract_tool_calls(response)
+        scenario.actual_tools = calls
+        scenario.result, scenario.explanation = run_evals.score_scenario(scenario, calls)
+
+
+def _report(scenarios: list[run_evals.EvalScenario], out_dir: Path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_evals.print_summary(scenarios)
+        run_evals.save_results(scenarios, out_dir / "results.json")
+
+
+def _stub_responses(scenarios: list[run_evals.EvalScenario], tools: list[dict]) -> list[dict]:
+    """Offline equivalent of what the stub endpoint returns for each scenario."""
+    return [build_completion({"messages": [{"role": "user", "content": s.user_prompt}], "tools": tools})
+            for s in scenarios]
+
+
+def _http_round_trips(scenarios: list[run_evals.EvalScenario], tools: list[dict], base_url: str) -> float:
+    """Mean ms per call_llm() round trip through the real client code path."""
+    if not scenarios:
+        return 0.0
+    started = time.perf_counter()
+    for s in scenarios:
+        run_evals.call_llm(s.user_prompt, tools, context=s.context, model="stub",
+                           base_url=base_url, api_key="stub")
+    return (time.perf_counter() - started) * 1000 / len(scenarios)
+
+
+def _best_of(repeat: int, fn) -> float:
+    """Fastest of `repeat` timed calls, in seconds."""
+    best = math.inf
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best
+
+
+def bench_size(size: int, tools: list[dict], stub: StubLLMServer, http_sample: int,
+               measure_memory: bool, seed: int, repeat: int = 1) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        gen_start = time.perf_counter()
+        files = generate(size, tmp_dir / "evals", seed=seed)
+        gen_s = time.perf_counter() - gen_start
+        corpus_mb = sum(f.stat().st_size for f in files) / 1e6
+
+        scenarios = _parse(files)
+        responses = _stub_responses(scenarios, tools)
+        timings = {
+            "parse": _best_of(repeat, lambda: _parse(files)),
+            "score": _best_of(repeat, lambda: _score(scenarios, responses)),
+            "report": _best_of(repeat, lambda: _report(scenarios, tmp_dir)),
+        }
+
+        http_ms = _http_round_trips(scenarios[:http_sample], tools, stub.base_url)
+
+        peak_mb = None
+        if measure_memory:
+            del scenarios
+            tracemalloc.start()
+            scenarios = _parse(files)
+            _score(scenarios, responses)
+            _report(scenarios, tmp_dir)
+            peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+            tracemalloc.stop()
+
+        results = {s.result for s in scenarios}
+        return {
+            "size": size,
+            "parsed": len(scenarios),
+            "corpus_mb": round(corpus_mb, 2),
+            "generate_s": round(gen_s, 3),
+            **{f"{stage}_s": round(timings[stage], 4) for stage in STAGES},
+            "http_ms_per_call": round(http_ms, 3),
+            "peak_mb": round(peak_mb, 1) if peak_mb is not None else None,
+            "results_seen": sorted(r for r in results if r),
+        }
+
+
+def scaling_exponents(rows: list[dict]) -> list[dict]:
+    """log(t2/t1) / log(n2/n1) per stage between consecutive sizes (1.0 = linear)."""
+    out = []
+    for a, b in zip(rows, rows[1:]):
+        ratio = math.log(b["size"] / a["size"])
+        entry = {"from": a["size"], "to": b["size"]}
+        for stage in STAGES:
+            t1, t2 = a[f"{stage}_s"], b[f"{stage}_s"]
+            entry[stage] = round(math.log(t2 / t1) / ratio, 2) if t1 > 0 and t2 > 0 else None
+        entry["trusted"] = b["size"] / a["size"] >= MIN_SIZE_RATIO
+        out.append(entry)
+    return out
+
+
+def fitted_exponents(rows: list[dict]) -> Optional[dict]:
+    """Least-squares slope of log(time) over log(size) per stage, across all sizes."""
+    if len(rows) < 2:
+        return None
+    fit = {}
+    for stage in STAGES:
+        points = [(math.log(r["size"]), math.log(r[f"{stage}_s"])) for r in rows if r[f"{stage}_s"] > 0]
+        if len(points) < 2:
+            fit[stage] = None
+            continue
+        mean_x = sum(x for x, _ in points) / len(points)
+        mean_y = sum(y for _, y in points) / len(points)
+        var_x = sum((x - mean_x) ** 2 for x, _ in points)
+        fit[stage] = round(sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x, 2) if var_x else None
+    return fit
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark eval harness scaling on synthetic corpora")
+    parser.add_argument("--sizes", default="1000,10000,50000", help="Comma-separated scenario counts")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per stage and size (fastest is kept)")
+    parser.add_argument("--http-sample", type=int, default=200,
+                        help="Scenarios sent through call_llm() to the stub per size (0 = skip)")
+    parser.add_argument("--stub-latency-ms", type=float, default=0.0, help="Artificial stub latency")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Write raw results to this file")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    tools = json.loads(run_evals.Path(run_evals.__file__).with_name("tools_schema.json").read_text())["tools"]
+
+    rows = []
+    with StubLLMServer(latency_ms=args.stub_latency_ms) as stub:
+        print(f"Stub endpoint: {stub.base_url}")
+        print(f"\n  {'size':>8} {'MB':>7} {'parse s':>9} {'score s':>9} {'report s':>9} "
+              f"{'http ms':>8} {'peak MB':>8}  µs/scenario (parse+score+report)")
+        for size in sizes:
+            row = bench_size(size, tools, stub, args.http_sample, not args.no_memory, args.seed,
+                             max(args.repeat, 1))
+            rows.append(row)
+            per = sum(row[f"{s}_s"] for s in STAGES) / max(row["parsed"], 1) * 1e6
+            peak = f"{row['peak_mb']:8.1f}" if row["peak_mb"] is not None else f"{'—':>8}"
+            print(f"  {size:>8} {row['corpus_mb']:>7.1f} {row['parse_s']:>9.3f} {row['score_s']:>9.3f} "
+                  f"{row['report_s']:>9.3f} {row['http_ms_per_call']:>8.2f} {peak}  {per:.1f}")
+
+    exponents = scaling_exponents(rows)
+    fit = fitted_exponents(rows)
+    if exponents:
+        print(f"\nScaling exponent per stage (1.0 = linear, best of {args.repeat}):")
+        for e in exponents:
+            flags = [s for s in STAGES if e["trusted"] and e[s] is not None and e[s] > SUPERLINEAR_THRESHOLD]
+            stages = "  ".join(f"{s}={e[s]}" for s in STAGES)
+            note = f"  ⚠️ superlinear: {flags}" if flags else ("" if e["trusted"] else "  (sizes too close to judge)")
+            print(f"  {e['from']:>7} → {e['to']:<7} {stages}{note}")
+        flags = [s for s in STAGES if fit[s] is not None and fit[s] > SUPERLINEAR_THRESHOLD]
+        stages = "  ".join(f"{s}={fit[s]}" for s in STAGES)
+        print(f"  {'fit':>7}   {'':<7} {stages}" + (f"  ⚠️ superlinear: {flags}" if flags else ""))
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({"repeat": args.repeat, "runs": rows, "exponents": exponents,
+                                               "fit": fit}, indent=2))
+        print(f"\nRaw results saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Fabric Metadata Cache Benchmark
+
+Replays the multi-step workflows from the `.eval.md` files (each scenario's expected tool
+call sequence, auth tools left out) against the Fabric stand-in over concurrent
+MCP sessions, each running every workflow --rounds times, in order. The HTTP server is
+restarted per mode:
+
+    nocache   FABRIC_METADATA_CACHE=off — every workspace, capacity, gateway and
+              connection type lookup goes to Fabric (baseline)
+    cache     FabricMetadataCache on: lookups are served per tenant for their TTL, and
+              connection / gateway creation invalidates what it changes
+
+Per mode it reports upstream Fabric requests by route, per-tool p50 latency, workflow
+p50 duration, and the cache's hit/miss counters from the server's /health endpoint; the
+comparison shows the upstream requests and latency the cache saves. The stand-in adds
+--latency-ms (50 ms by default) to every request, roughly a Fabric round-trip.
+
+Usage:
+    python bench_metadata_cache.py --launch "dotnet run -c Release --project ../../DataFactory.MCP.Http" \\
+        --url http://127.0.0.1:5000/ --sessions 5 --rounds 3
+    python bench_metadata_cache.py --launch "..." --eval ../multi-step.eval.md --latency-ms 150
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shlex
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import defaultdict
+from pathlib import Path
+from statistics import median
+from urllib.parse import urlsplit
+
+from fabric_standin import FabricStandin, add_config_arguments, config_from_args
+from mcp_client import McpError, McpHttpSession, tool_reported_error
+from mcp_load import (DEFAULT_EXCLUDE, EVALS_DIR, MixEntry, fill_arguments, normalize_tool_name, percentile,
+                      run_evals, wait_for_server)
+
+
+MODES = ("nocache", "cache")
+
+# Tools answered from FabricMetadataCache (GetGatewayAsync lists gateways to find one)
+CACHED_TOOLS = {"listworkspaces", "listcapacities", "listgateways", "getgateway", "listsupportedconnectiontypes"}
+
+
+def load_workflows(files: list[Path]) -> list[tuple[str, list[run_evals.ExpectedToolCall]]]:
+    """Expected tool call sequences without the auth tools, as (eval id, steps)."""
+    workflows = []
+    for f in files:
+        for scenario in run_evals.parse_eval_file(f):
+            steps = [t for t in scenario.expected_sequence if normalize_tool_name(t.tool_name) not in DEFAULT_EXCLUDE]
+            if steps:
+                workflows.append((scenario.eval_id, steps))
+    return workflows
+
+
+async def replay(url: str, session_no: int, workflows, tools: dict[str, dict], inventory: dict,
+                 rounds: int, seed: int, calls: list[dict], runs: list[dict]):
+    """One agent session: every workflow, in order, `rounds` times."""
+    rng = random.Random(seed + session_no)
+    session = McpHttpSession(url, client_name=f"bench-metadata-cache-{session_no}")
+    await session.initialize()
+    try:
+        for _ in range(rounds):
+            for eval_id, steps in workflows:
+                started = time.perf_counter()
+                for step in steps:
+                    tool = tools.get(normalize_tool_name(step.tool_name))
+                    if tool is None:
+                        continue
+                    entry = MixEntry(tool["name"], tool.get("inputSchema", {}))
+                    arguments = fill_arguments(entry, step.parameters, inventory, rng)
+                    try:
+                        result = await session.call_tool(tool["name"], arguments)
+                        calls.append({"tool": tool["name"], "ms": result.latency_ms,
+                                      "tool_error": tool_reported_error(result), "server_error": False})
+                    except McpError:
+                        calls.append({"tool": tool["name"], "ms": 0.0, "tool_error": False, "server_error": True})
+                runs.append({"workflow": eval_id, "ms": (time.perf_counter() - started) * 1000})
+    finally:
+        await session.close()
+
+
+async def run_sessions(url: str, workflows, inventory: dict, args) -> tuple[list[dict], list[dict], float]:
+    probe = McpHttpSession(url, client_name="bench-metadata-cache-probe")
+    await probe.initialize()
+    try:
+        tools = {normalize_tool_name(t["name"]): t for t in await probe.list_tools()}
+    finally:
+        await probe.close()
+
+    calls: list[dict] = []
+    runs: list[dict] = []
+    started = time.perf_counter()
+    await asyncio.gather(*(replay(url, i, workflows, tools, inventory, args.rounds, args.seed, calls, runs)
+                           for i in range(args.sessions)))
+    return calls, runs, time.perf_counter() - started
+
+
+def server_health(url: str) -> dict:
+    parts = urlsplit(url)
+    return json.loads(urllib.request.urlopen(f"{parts.scheme}://{parts.netloc}/health", timeout=5).read())
+
+
+def run_mode(mode: str, args, workflows, standin: FabricStandin) -> dict:
+    env = {**os.environ, **standin.server_env}
+    if mode == "nocache":
+        env["FABRIC_METADATA_CACHE"] = "off"
+    server = subprocess.Popen(shlex.split(args.launch), env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_server(args.url, args.startup_timeout, server)
+        standin.reset_stats()
+        calls, runs, elapsed = asyncio.run(run_sessions(args.url, workflows, standin.inventory.sample(), args))
+        cache = server_health(args.url).get("metadataCache")
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+    by_tool = defaultdict(list)
+    for c in calls:
+        if not c["server_error"]:
+            by_tool[c["tool"]].append(c["ms"])
+    by_workflow = defaultdict(list)
+    for r in runs:
+        by_workflow[r["workflow"]].append(r["ms"])
+    upstream = standin.stats_snapshot()
+
+    return {
+        "mode": mode,
+        "elapsed_s": round(elapsed, 2),
+        "calls": len(calls),
+        "tool_errors": sum(c["tool_error"] for c in calls),
+        "server_errors": sum(c["server_error"] for c in calls),
+        "tool_ms_total": round(sum(c["ms"] for c in calls), 1),
+        "upstream_requests": sum(s["count"] for s in upstream.values()),
+        "upstream": {route: s["count"] for route, s in upstream.items()},
+        "metadata_cache": cache,
+        "tools": {tool: {"calls": len(ms), "p50_ms": round(percentile(ms, 50), 1),
+                         "p99_ms": round(percentile(ms, 99), 1)} for tool, ms in sorted(by_tool.items())},
+        "workflows": {w: round(median(ms), 1) for w, ms in by_workflow.items()},
+    }
+
+
+def print_mode(row: dict):
+    print(f"\n  {row['mode']}: {row['calls']} tool calls in {row['elapsed_s']}s, "
+          f"{row['upstream_requests']} upstream requests, tool errors {row['tool_errors']}, "
+          f"server errors {row['server_errors']}")
+    cache = row["metadata_cache"]
+    if cache:
+        lookups = cache["hits"] + cache["misses"] + cache["sharedWaits"]
+        print(f"    cache: {cache['hits']} hits, {cache['misses']} misses, {cache['sharedWaits']} shared waits "
+              f"({cache['hits'] / max(lookups, 1):.1%} hit rate), {cache['invalidations']} invalidated, "
+              f"{cache['evictions']} evicted, {cache['entries']} entries")
+    else:
+        print("    cache: (no metadataCache in /health: build predates FabricMetadataCache)")
+
+
+def print_comparison(base: dict, current: dict):
+    print(f"\n  {'upstream route':<28} {base['mode']:>8} {current['mode']:>8} {'saved':>8}")
+    for route in sorted(set(base["upstream"]) | set(current["upstream"])):
+        before, after = base["upstream"].get(route, 0), current["upstream"].get(route, 0)
+        if before or after:
+            print(f"  {route:<28} {before:>8} {after:>8} {before - after:>8}")
+    saved = base["upstream_requests"] - current["upstream_requests"]
+    print(f"  {'total':<28} {base['upstream_requests']:>8} {current['upstream_requests']:>8} {saved:>8} "
+          f"({saved / max(base['upstream_requests'], 1):.1%})")
+
+    print(f"\n  {'tool (p50 ms)':<40} {base['mode']:>8} {current['mode']:>8} {'saved':>8}")
+    for tool in base["tools"]:
+        if tool in current["tools"]:
+            before, after = base["tools"][tool]["p50_ms"], current["tools"][tool]["p50_ms"]
+            marker = "*" if normalize_tool_name(tool) in CACHED_TOOLS else " "
+            print(f"  {marker}{tool:<39} {before:>8} {after:>8} {before - after:>8.1f}")
+
+    print(f"\n  {'workflow (p50 ms)':<40} {base['mode']:>8} {current['mode']:>8} {'saved':>8}")
+    for workflow, before in base["workflows"].items():
+        after = current["workflows"].get(workflow)
+        if after is not None:
+            print(f"  {workflow:<40} {before:>8} {after:>8} {before - after:>8.1f}")
+    saved_ms = base["tool_ms_total"] - current["tool_ms_total"]
+    print(f"\n  Time spent in tool calls: {base['tool_ms_total'] / 1000:.1f}s → {current['tool_ms_total'] / 1000:.1f}s "
+          f"({saved_ms / max(base['tool_ms_total'], 1):.1%} saved); * served from the metadata cache")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Fabric metadata cache on the multi-step eval workflows")
+    parser.add_argument("--url", default="http://127.0.0.1:5000/", help="MCP endpoint of the HTTP server")
+    parser.add_argument("--launch", required=True,
+                        help="Command that starts the MCP HTTP server; restarted per mode with its cache setting")
+    parser.add_argument("--modes", default=",".join(MODES), help=f"Comma-separated subset of {', '.join(MODES)}")
+    parser.add_argument("--sessions", type=int, default=5, help="Concurrent MCP sessions (agents)")
+    parser.add_argument("--rounds", type=int, default=3, help="Times each session replays every workflow")
+    parser.add_argument("--eval", action="append", help="Specific .eval.md file(s) to take workflows from")
+    parser.add_argument("--startup-timeout", type=float, default=120.0)
+    parser.add_argument("--json", help="Write per-mode results to this file")
+    add_config_arguments(parser)
+    parser.set_defaults(latency_ms=50.0)
+    args = parser.parse_args()
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    if set(modes) - set(MODES):
+        parser.error(f"--modes accepts {', '.join(MODES)}")
+
+    files = [Path(f) for f in args.eval] if args.eval else sorted(EVALS_DIR.glob("*.eval.md"))
+    workflows = load_workflows(files)
+    if not workflows:
+        sys.exit("No multi-step workflows in the selected eval files")
+
+    rows = []
+    with FabricStandin(config_from_args(args)) as standin:
+        print(f"Fabric stand-in: {standin.base_url} ({args.latency_ms:.0f} ms per request)")
+        print(f"{len(workflows)} workflows ({sum(len(s) for _, s in workflows)} steps) × {args.rounds} rounds "
+              f"× {args.sessions} sessions per mode")
+        for mode in modes:
+            print(f"  running {mode}...", flush=True)
+            rows.append(run_mode(mode, args, workflows, standin))
+
+    for row in rows:
+        print_mode(row)
+    if len(rows) == 2:
+        print_comparison(*rows)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({"sessions": args.sessions, "rounds": args.rounds,
+                                               "latency_ms": args.latency_ms, "results": rows}, indent=2))
+        print(f"\nResults saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
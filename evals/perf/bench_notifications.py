@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Notification Fan-out Benchmark
+
+Completes many background jobs at once across many MCP sessions and measures how the
+server's notifications get back to them. Each of N sessions opens its GET event stream,
+starts M dataflow refreshes with RefreshDataflowBackground (display names
+bench-s<session>-j<job>), and the Fabric stand-in holds every job InProgress until all
+are started, then completes them in the same instant (--hold-jobs / release_jobs()).
+
+While the burst drains, /health is sampled for the notification queue depth
+(pendingNotifications). Each job's latency is measured from the first status poll that
+saw it completed (recorded by the stand-in) to the notification naming it; notifications
+that coalesce several jobs ("3 background jobs finished") count for every job they list,
+and "... and N more" lines count as delivered without a latency.
+
+Reported: delivered, dropped (never notified by --settle), misrouted (notified on another
+session) and late (over --late-ms) jobs, latency p50/p95/max, notification messages per
+job, peak queue depth and the time from release until every notification arrived.
+
+Usage:
+    python bench_notifications.py --launch "dotnet run -c Release --project ../../DataFactory.MCP.Http" \\
+        --url http://127.0.0.1:5000/ --sessions 50 --jobs-per-session 10
+    python bench_notifications.py --url http://127.0.0.1:5000/ --standin-url http://127.0.0.1:5555
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import shlex
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from fabric_standin import FabricStandin, add_config_arguments, config_from_args, item_id  # noqa: E402
+from mcp_client import McpHttpSession, tool_reported_error  # noqa: E402
+from mcp_load import percentile, wait_for_server  # noqa: E402
+
+JOB_NAME = re.compile(r"'(bench-s\d+-j\d+)'")
+COALESCED_TITLE = re.compile(r"^(\d+) background jobs finished")
+MORE_LINE = re.compile(r"\.\.\. and (\d+) more")
+
+
+def job_name(session: int, job: int) -> str:
+    return f"bench-s{session:03d}-j{job:03d}"
+
+
+def session_of(name: str) -> int:
+    return int(name.split("-")[1][1:])
+
+
+def user_notification(message: dict) -> Optional[dict]:
+    """The {title, message, level} data of a UserNotification log message, else None."""
+    params = message.get("params") or {}
+    if message.get("method") != "notifications/message" or params.get("logger") != "UserNotification":
+        return None
+    data = params.get("data")
+    return data if isinstance(data, dict) else None
+
+
+class Fanout:
+    """Sessions, their jobs and everything their event streams received."""
+
+    def __init__(self, url: str, sessions: int, jobs_per_session: int, workspaces: list[str]):
+        self.url = url
+        self.sessions = [McpHttpSession(url, client_name=f"bench-notify-{i}") for i in range(sessions)]
+        self.jobs_per_session = jobs_per_session
+        self.workspaces = workspaces
+        self.items: dict[str, str] = {}  # dataflow id -> job name
+        self.start_failures: list[str] = []
+        self.received: list[tuple[int, float, dict]] = []  # (session, time, notification data)
+        self._listeners: list[asyncio.Task] = []
+
+    async def open(self):
+        await asyncio.gather(*(session.initialize() for session in self.sessions))
+        self._listeners = [asyncio.create_task(self._listen(i, session)) for i, session in enumerate(self.sessions)]
+        await asyncio.sleep(0.5)  # let every GET stream attach before anything can be sent on it
+
+    async def _listen(self, index: int, session: McpHttpSession):
+        async for message in session.listen():
+            data = user_notification(message)
+            if data is not None:
+                self.received.append((index, time.time(), data))
+
+    async def start_jobs(self):
+        async def start(index: int, session: McpHttpSession):
+            workspace = self.workspaces[index % len(self.workspaces)]
+            for k in range(self.jobs_per_session):
+                name = job_name(index, k)
+                dataflow = item_id("bench-dataflow", name)
+                self.items[dataflow] = name
+                result = await session.call_tool("RefreshDataflowBackground", {
+                    "workspaceId": workspace, "dataflowId": dataflow, "displayName": name})
+                if tool_reported_error(result):
+                    self.start_failures.append(f"{name}: {result.text[:200]}")
+
+        await asyncio.gather(*(start(i, session) for i, session in enumerate(self.sessions)))
+
+    def accounted(self) -> int:
+        """Jobs named or summarized in the notifications received so far."""
+        total = 0
+        for _, _, data in self.received:
+            title = COALESCED_TITLE.match(str(data.get("title", "")))
+            total += int(title.group(1)) if title else 1
+        return total
+
+    async def close(self):
+        for task in self._listeners:
+            task.cancel()
+        await asyncio.gather(*self._listeners, return_exceptions=True)
+        await asyncio.gather(*(session.close() for session in self.sessions), return_exceptions=True)
+
+
+def queue_depth(health_url: str) -> Optional[int]:
+    try:
+        return json.loads(urllib.request.urlopen(health_url, timeout=2).read()).get("pendingNotifications")
+    except (OSError, ValueError):
+        return None
+
+
+async def run(args, standin: Optional[FabricStandin], standin_url: str) -> dict:
+    inventory = json.loads(urllib.request.urlopen(f"{standin_url}/_standin/inventory").read())
+    parts = urlsplit(args.url)
+    health_url = f"{parts.scheme}://{parts.netloc}/health"
+    fanout = Fanout(args.url, args.sessions, args.jobs_per_session, inventory["workspaceId"])
+    expected = args.sessions * args.jobs_per_session
+    try:
+        await fanout.open()
+        started = time.perf_counter()
+        await fanout.start_jobs()
+        start_s = time.perf_counter() - started
+        print(f"Started {expected - len(fanout.start_failures)}/{expected} jobs in {start_s:.1f}s "
+              f"across {args.sessions} sessions")
+        for failure in fanout.start_failures[:5]:
+            print(f"  start failed: {failure}")
+
+        await asyncio.sleep(args.release_after)
+        if standin:
+            standin.release_jobs()
+        else:
+            urllib.request.urlopen(f"{standin_url}/_standin/release").read()
+        released = time.time()
+
+        depths: list[int] = []
+        target = expected - len(fanout.start_failures)
+        while time.time() - released < args.settle and fanout.accounted() < target:
+            depth = await asyncio.to_thread(queue_depth, health_url)
+            if depth is not None:
+                depths.append(depth)
+            await asyncio.sleep(args.sample_ms / 1000)
+        drained_s = time.time() - released if fanout.accounted() >= target else None
+    finally:
+        await fanout.close()
+
+    if standin:
+        observations = standin.job_observations()
+    else:
+        observations = json.loads(urllib.request.urlopen(f"{standin_url}/_standin/jobs").read())["value"]
+    observed = {fanout.items[o["item"]]: o["observed"] for o in observations if o["item"] in fanout.items}
+    return summarize(fanout, observed, released, depths, drained_s, args.late_ms, start_s)
+
+
+def summarize(fanout: Fanout, observed: dict[str, Optional[float]], released: float, depths: list[int],
+              drained_s: Optional[float], late_ms: float, start_s: float) -> dict:
+    notified: dict[str, float] = {}
+    summarized = [0] * len(fanout.sessions)
+    misrouted = 0
+    for session, at, data in fanout.received:
+        message = str(data.get("message", ""))
+        for name in JOB_NAME.findall(message):
+            if session_of(name) != session:
+                misrouted += 1
+                continue
+            notified.setdefault(name, at)
+        more = MORE_LINE.search(message)
+        if more:
+            summarized[session] += int(more.group(1))
+
+    started = [name for name in fanout.items.values()
+               if not any(f.startswith(f"{name}:") for f in fanout.start_failures)]
+    latencies, since_release = [], []
+    dropped = 0
+    by_session: dict[int, list[str]] = {}
+    for name in started:
+        by_session.setdefault(session_of(name), []).append(name)
+    for session, names in by_session.items():
+        unnamed = [n for n in names if n not in notified]
+        # "... and N more" covers jobs the coalesced message didn't list by name
+        dropped += max(0, len(unnamed) - summarized[session])
+        for name in names:
+            if name in notified:
+                since_release.append((notified[name] - released) * 1000)
+                if observed.get(name):
+                    latencies.append((notified[name] - observed[name]) * 1000)
+
+    return {
+        "sessions": len(fanout.sessions),
+        "jobs": len(started),
+        "start_failures": len(fanout.start_failures),
+        "start_s": round(start_s, 2),
+        "messages": len(fanout.received),
+        "messages_per_job": round(len(fanout.received) / max(len(started), 1), 3),
+        "delivered": len(started) - dropped,
+        "named": len(notified),
+        "dropped": dropped,
+        "misrouted": misrouted,
+        "late": sum(ms > late_ms for ms in latencies),
+        "late_ms": late_ms,
+        "latency_ms": {"p50": round(percentile(latencies, 50)), "p95": round(percentile(latencies, 95)),
+                       "max": round(max(latencies, default=0.0))},
+        "since_release_ms": {"p50": round(percentile(since_release, 50)),
+                             "p95": round(percentile(since_release, 95)),
+                             "max": round(max(since_release, default=0.0))},
+        "queue_depth": {"peak": max(depths, default=None), "samples": len(depths)},
+        "drained_s": round(drained_s, 2) if drained_s is not None else None,
+    }
+
+
+def print_summary(summary: dict):
+    print(f"\n  Jobs completed together:  {summary['jobs']} over {summary['sessions']} sessions")
+    print(f"  Notification messages:    {summary['messages']} ({summary['messages_per_job']} per job)")
+    print(f"  Delivered:                {summary['delivered']} ({summary['named']} by name)")
+    print(f"  Dropped:                  {summary['dropped']}")
+    print(f"  Misrouted:                {summary['misrouted']}")
+    late = f"Late (> {summary['late_ms']:.0f} ms):"
+    print(f"  {late:<26}{summary['late']}")
+    lat, rel = summary["latency_ms"], summary["since_release_ms"]
+    print(f"  Poll → notified ms:       p50 {lat['p50']}  p95 {lat['p95']}  max {lat['max']}")
+    print(f"  Release → notified ms:    p50 {rel['p50']}  p95 {rel['p95']}  max {rel['max']}")
+    peak = summary["queue_depth"]["peak"]
+    print(f"  Peak queue depth:         {peak if peak is not None else 'n/a (no pendingNotifications in /health)'}")
+    drained = summary["drained_s"]
+    print(f"  Release → all notified:   {f'{drained}s' if drained is not None else 'not within --settle'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark notification delivery for bursts of job completions")
+    parser.add_argument("--url", default="http://127.0.0.1:5000/", help="MCP endpoint of the HTTP server")
+    parser.add_argument("--sessions", type=int, default=20, help="Concurrent MCP sessions")
+    parser.add_argument("--jobs-per-session", type=int, default=5, help="Dataflow refreshes started per session")
+    parser.add_argument("--release-after", type=float, default=1.0,
+                        help="Seconds between the last job start and completing them all")
+    parser.add_argument("--settle", type=float, default=120.0,
+                        help="Seconds to wait for notifications after the release")
+    parser.add_argument("--late-ms", type=float, default=2000.0,
+                        help="A notification arriving later than this after its completion was seen is late")
+    parser.add_argument("--sample-ms", type=float, default=100.0, help="Queue depth sampling interval")
+    parser.add_argument("--standin-url", help="Use an already running stand-in (started with --hold-jobs)")
+    parser.add_argument("--launch", help="Command that starts the MCP HTTP server (gets stand-in env)")
+    parser.add_argument("--startup-timeout", type=float, default=120.0)
+    parser.add_argument("--json", help="Write the summary to this file")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    standin = None
+    if args.standin_url:
+        standin_url = args.standin_url.rstrip("/")
+    else:
+        config = config_from_args(args)
+        config.hold_jobs = True
+        standin = FabricStandin(config).start()
+        standin_url = standin.base_url
+        print(f"Fabric stand-in: {standin_url}")
+
+    server = None
+    try:
+        if args.launch:
+            env = {**os.environ, **(standin.server_env if standin else {})}
+            server = subprocess.Popen(shlex.split(args.launch), env=env,
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        elif standin:
+            print("Start the server with:")
+            for key, value in standin.server_env.items():
+                print(f"  {key}={value}")
+        wait_for_server(args.url, args.startup_timeout if server else 5.0, server)
+
+        summary = asyncio.run(run(args, standin, standin_url))
+        print_summary(summary)
+    finally:
+        if server:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+        if standin:
+            standin.stop()
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(summary, indent=2))
+        print(f"\nSummary saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Pagination Stress Benchmark
+
+Pages through 10k–100k workspaces, connections and gateways served by the Fabric
+stand-in, one MCP tool call per page, the way an agent does: call the list tool, read
+continuationToken from the result, call again. Per tool and tenant size it reports
+end-to-end latency, tool round-trips, per-page latency, serialized tool response size
+(bytes and ~tokens) and server RSS while paging.
+
+Usage:
+    python bench_pagination.py --launch "dotnet run -c Release --project ../../DataFactory.MCP.Http" \\
+        --url http://127.0.0.1:5000/ --sizes 10000,50000,100000
+    python bench_pagination.py --url http://127.0.0.1:5000/ --standin-port 5555 --server-pid 12345
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shlex
+import subprocess
+import time
+from pathlib import Path
+from typing import Optional
+
+from fabric_standin import FabricStandin, add_config_arguments, config_from_args
+from mcp_client import McpHttpSession, tool_reported_error
+from mcp_load import normalize_tool_name, percentile, process_rss_mb, wait_for_server
+
+
+DEFAULT_TOOLS = ["ListWorkspacesAsync", "ListConnectionsAsync", "ListGatewaysAsync"]
+
+# List tool → stand-in inventory size it pages through
+TOOL_INVENTORY = {"listworkspaces": "workspaces", "listconnections": "connections", "listgateways": "gateways"}
+
+
+def continuation_token(text: str) -> Optional[str]:
+    """continuationToken from a list tool's JSON result (None on the last page or non-JSON text)."""
+    try:
+        body = json.loads(text)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(body, dict):
+        return None
+    return body.get("continuationToken") or body.get("ContinuationToken")
+
+
+def page_item_count(text: str) -> int:
+    try:
+        body = json.loads(text)
+    except json.JSONDecodeError:
+        return 0
+    if not isinstance(body, dict):
+        return 0
+    return body.get("totalCount") or body.get("TotalCount") or 0
+
+
+async def page_through(url: str, tool: str, max_pages: int, server_pid: Optional[int]) -> dict:
+    session = McpHttpSession(url, client_name="bench-pagination")
+    pages: list[dict] = []
+    rss_samples = []
+    started = time.perf_counter()
+    try:
+        await session.initialize()
+        token = None
+        while len(pages) < max_pages:
+            result = await session.call_tool(tool, {"continuationToken": token} if token else {})
+            if server_pid:
+                rss_samples.append(process_rss_mb(server_pid))
+            pages.append({
+                "latency_ms": round(result.latency_ms, 2),
+                "response_bytes": result.response_bytes,
+                "text_chars": len(result.text),
+                "items": page_item_count(result.text),
+                "error": tool_reported_error(result),
+            })
+            if pages[-1]["error"]:
+                break
+            token = continuation_token(result.text)
+            if not token:
+                break
+    finally:
+        await session.close()
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    latencies = [p["latency_ms"] for p in pages]
+    sizes = [p["response_bytes"] for p in pages]
+    items = sum(p["items"] for p in pages)
+    text_chars = sum(p["text_chars"] for p in pages)
+    rss = [r for r in rss_samples if r is not None]
+    return {
+        "round_trips": len(pages),
+        "items": items,
+        "completed": bool(pages) and not pages[-1]["error"] and len(pages) < max_pages,
+        "end_to_end_ms": round(elapsed_ms, 1),
+        "page_p50_ms": round(percentile(latencies, 50), 2),
+        "page_p99_ms": round(percentile(latencies, 99), 2),
+        "page_max_ms": round(max(latencies), 2) if latencies else 0.0,
+        "first_vs_last_page_ms": [latencies[0], latencies[-1]] if latencies else [],
+        "response_bytes_total": sum(sizes),
+        "response_bytes_mean": round(sum(sizes) / len(sizes)) if sizes else 0,
+        "response_bytes_max": max(sizes) if sizes else 0,
+        "bytes_per_item": round(sum(sizes) / items, 1) if items else None,
+        # ~4 chars per token, the same rough estimate stub_llm.py uses
+        "approx_tokens_total": text_chars // 4,
+        "server_rss_mb": {"start": rss[0], "peak": max(rss), "end": rss[-1]} if rss else None,
+        "pages": pages,
+    }
+
+
+def print_row(tool: str, size: int, row: dict, upstream: int):
+    rss = row["server_rss_mb"]
+    rss_text = f"{rss['start']:.0f}→{rss['peak']:.0f}" if rss else "—"
+    print(f"  {tool:<24} {size:>7} {row['items']:>7} {row['round_trips']:>6} {row['end_to_end_ms'] / 1000:>8.2f} "
+          f"{row['page_p50_ms']:>8} {row['page_p99_ms']:>8} {row['response_bytes_mean'] / 1024:>8.1f} "
+          f"{row['response_bytes_total'] / 1e6:>8.2f} {row['approx_tokens_total']:>10} {upstream:>6} {rss_text:>10}"
+          + ("" if row["completed"] else "  ⚠️ incomplete"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark continuation-token paging through MCP list tools")
+    parser.add_argument("--url", default="http://127.0.0.1:5000/", help="MCP endpoint of the HTTP server")
+    parser.add_argument("--sizes", default="10000,50000,100000", help="Comma-separated inventory sizes")
+    parser.add_argument("--tools", default=",".join(DEFAULT_TOOLS), help="Comma-separated list tools")
+    parser.add_argument("--max-pages", type=int, default=5000, help="Safety stop per run")
+    parser.add_argument("--launch", help="Command that starts the MCP HTTP server (gets stand-in env)")
+    parser.add_argument("--server-pid", type=int, help="PID of an already running server (for RSS)")
+    parser.add_argument("--standin-port", type=int, default=0, help="Port for the stand-in (0 = any)")
+    parser.add_argument("--startup-timeout", type=float, default=120.0)
+    parser.add_argument("--json", help="Write raw results (including per-page rows) to this file")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    tools = [t.strip() for t in args.tools.split(",") if t.strip()]
+    unknown = [t for t in tools if normalize_tool_name(t) not in TOOL_INVENTORY]
+    if unknown:
+        parser.error(f"No stand-in inventory for {unknown}; choose from {DEFAULT_TOOLS}")
+
+    standin = FabricStandin(config_from_args(args), port=args.standin_port).start()
+    print(f"Fabric stand-in: {standin.base_url} (page size {standin.config.page_size})")
+    server = None
+    results = []
+    try:
+        if args.launch:
+            server = subprocess.Popen(shlex.split(args.launch), env={**os.environ, **standin.server_env},
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        else:
+            print("Server must be started with:")
+            for key, value in standin.server_env.items():
+                print(f"  {key}={value}")
+        wait_for_server(args.url, args.startup_timeout if server else 5.0, server)
+        server_pid = server.pid if server else args.server_pid
+
+        print(f"\n  {'tool':<24} {'size':>7} {'items':>7} {'calls':>6} {'total s':>8} {'p50 ms':>8} "
+              f"{'p99 ms':>8} {'KB/page':>8} {'MB total':>8} {'~tokens':>10} {'fabric':>6} {'RSS MB':>10}")
+        for tool in tools:
+            attr = TOOL_INVENTORY[normalize_tool_name(tool)]
+            for size in sizes:
+                # Inventory is generated on demand, so resizing between runs is free
+                setattr(standin.config, attr, size)
+                standin.reset_stats()
+                row = asyncio.run(page_through(args.url, tool, args.max_pages, server_pid))
+                upstream = sum(s["count"] for s in standin.stats_snapshot().values())
+                print_row(tool, size, row, upstream)
+                results.append({"tool": tool, "size": size, "page_size": standin.config.page_size,
+                                "upstream_requests": upstream, **row})
+    finally:
+        if server:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+        standin.stop()
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({"runs": results}, indent=2))
+        print(f"\nRaw results saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Pipeline Validator Benchmark
+
+Generates pipeline definitions of 100 to 10k activities and times
+pipeline_validator.analyze() on them, as a fenced JSON answer the way the integration
+evals see it. Shapes: a chain, a fan-out/fan-in (one root, N parallel activities, one
+join), and a layered DAG where each activity depends on up to three activities of the
+previous layer. With --defects, each pipeline also gets a dependency cycle, a dangling
+reference and an activity that waits on the cycle, and the report must find all three.
+
+Reported per shape and size: milliseconds for JSON parsing alone and for the full
+analysis, dependencies, and the issues found.
+
+Usage:
+    python bench_pipeline_validator.py
+    python bench_pipeline_validator.py --sizes 100,1000,10000 --defects --json validator.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import pipeline_validator  # noqa: E402
+
+
+def activity(i: int, depends_on: list[int]) -> dict:
+    return {
+        "name": f"Refresh {i}",
+        "type": "DataflowActivity",
+        "dependsOn": [{"activity": f"Refresh {d}", "dependencyConditions": ["Succeeded"]} for d in depends_on],
+        "policy": {"timeout": "0.01:00:00", "retry": 1, "retryIntervalInSeconds": 60},
+        "typeProperties": {"dataflowId": f"df-{i}", "workspaceId": "ws-1"},
+    }
+
+
+def generate(shape: str, n: int, rng: random.Random) -> list[dict]:
+    if shape == "chain":
+        return [activity(i, [i - 1] if i else []) for i in range(n)]
+    if shape == "fan":
+        return ([activity(0, [])] + [activity(i, [0]) for i in range(1, n - 1)]
+                + [activity(n - 1, list(range(1, n - 1)))])
+    width = max(1, int(n ** 0.5))
+    return [activity(i, sorted(rng.sample(range((i // width - 1) * width, (i // width) * width), min(3, width)))
+                     if i >= width else []) for i in range(n)]
+
+
+def add_defects(activities: list[dict]):
+    """A cycle of the last two activities, a dangling reference, and an activity behind the cycle."""
+    n = len(activities)
+    activities[-2]["dependsOn"].append({"activity": activities[-1]["name"], "dependencyConditions": ["Succeeded"]})
+    activities[-1]["dependsOn"].append({"activity": activities[-2]["name"], "dependencyConditions": ["Succeeded"]})
+    activities.append(activity(n, [n - 1]))
+    activities.append(activity(n + 1, []))
+    activities[-1]["dependsOn"].append({"activity": "Missing", "dependencyConditions": ["Succeeded"]})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark structural validation of large pipeline definitions")
+    parser.add_argument("--sizes", default="100,1000,10000", help="Comma-separated activity counts")
+    parser.add_argument("--shapes", default="chain,fan,layered")
+    parser.add_argument("--defects", action="store_true", help="Add a cycle, a dangling reference and a blocked activity")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per pipeline (best is reported)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"  {'shape':<8} {'activities':>10} {'KB':>8} {'parse ms':>9} {'analyze ms':>11} {'deps':>7}  issues")
+    rows = []
+    for shape in [s.strip() for s in args.shapes.split(",") if s.strip()]:
+        for n in [int(s) for s in args.sizes.split(",") if s.strip()]:
+            activities = generate(shape, n, rng)
+            if args.defects:
+                add_defects(activities)
+            answer = f"```json\n{json.dumps({'properties': {'activities': activities}}, indent=2)}\n```\n"
+
+            parse_ms = analyze_ms = float("inf")
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                json.loads(answer[8:-4])
+                parse_ms = min(parse_ms, (time.perf_counter() - started) * 1000)
+                started = time.perf_counter()
+                report = pipeline_validator.analyze(answer)
+                analyze_ms = min(analyze_ms, (time.perf_counter() - started) * 1000)
+
+            found = {"cycles": len(report.cycles), "dangling": len(report.dangling),
+                     "unreachable": len(report.unreachable)}
+            print(f"  {shape:<8} {len(activities):>10,} {len(answer) / 1024:>8.0f} {parse_ms:>9.1f} "
+                  f"{analyze_ms:>11.1f} {report.dependencies:>7,}  "
+                  + (", ".join(f"{k} {v}" for k, v in found.items() if v) or "none"))
+            rows.append({"shape": shape, "activities": len(activities), "bytes": len(answer),
+                         "parse_ms": round(parse_ms, 2), "analyze_ms": round(analyze_ms, 2),
+                         "dependencies": report.dependencies, **found})
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({"defects": args.defects, "results": rows}, indent=2))
+        print(f"\nResults saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Server Cold-Start Benchmark
+
+Launches the stdio DataFactory.MCP server N times, the way every agent session does, and
+times each cold start from spawn: the `initialize` response, the first `tools/list`, and
+the first tool call (GetAuthenticationStatus by default, which builds the authentication
+services). The server runs with MCP_STARTUP_TRACE set, so it logs when each startup
+phase finished (ms since process start); the report breaks startup down by phase:
+
+    main            runtime started, entered Program
+    services        AddDataFactoryMcpServices and host-specific registrations
+    tools           core tool registration
+    optional-tools  feature-flag tool registration
+    host-built      service provider built
+    host-started    stdio transport reading requests
+
+Reported per build: median and p95 per milestone, phase medians with the time each phase
+took, tool count and server RSS after the first call. Pass --baseline-launch with a build
+of an earlier commit to compare before/after in one run.
+
+Usage:
+    dotnet build -c Release DataFactory.MCP
+    python bench_startup.py --runs 20
+    python bench_startup.py --launch "dotnet /tmp/after/DataFactory.MCP.dll" \\
+        --baseline-launch "dotnet /tmp/before/DataFactory.MCP.dll" --runs 20 --json startup.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import shlex
+import sys
+import tempfile
+import time
+from pathlib import Path
+from statistics import median
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from fabric_standin import FabricStandin  # noqa: E402
+from mcp_client import McpStdioSession  # noqa: E402
+from mcp_load import normalize_tool_name, percentile, process_rss_mb  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_LAUNCH = f"dotnet {ROOT / 'DataFactory.MCP' / 'bin' / 'Release' / 'net10.0' / 'DataFactory.MCP.dll'}"
+PHASE_LINE = re.compile(r"Startup phase (\S+) at ([\d.]+) ms")
+MILESTONES = ["initialize_ms", "tools_list_ms", "first_call_ms"]
+
+
+async def cold_start(command: list[str], env: dict[str, str], first_call: Optional[str], timeout: float) -> dict:
+    """One launch: milliseconds from spawn to each milestone, plus the server's own phase marks."""
+    with tempfile.TemporaryFile("w+") as log:
+        session = McpStdioSession(command, env=env, client_name="bench-startup", stderr=log)
+        spawned = time.perf_counter()
+        await session.start()
+        try:
+            await asyncio.wait_for(session.initialize(), timeout)
+            initialize_ms = (time.perf_counter() - spawned) * 1000
+            tools = await asyncio.wait_for(session.list_tools(), timeout)
+            tools_list_ms = (time.perf_counter() - spawned) * 1000
+
+            first_call_ms = None
+            if first_call:
+                name = next((t["name"] for t in tools if normalize_tool_name(t["name"]) == first_call), None)
+                if name is None:
+                    raise SystemExit(f"Server has no tool matching --first-call {first_call}")
+                await asyncio.wait_for(session.call_tool(name, {}), timeout)
+                first_call_ms = (time.perf_counter() - spawned) * 1000
+            rss_mb = process_rss_mb(session.pid) if session.pid else None
+        finally:
+            await session.close()
+        log.seek(0)
+        phases = {m.group(1): float(m.group(2)) for m in PHASE_LINE.finditer(log.read())}
+
+    return {"initialize_ms": initialize_ms, "tools_list_ms": tools_list_ms, "first_call_ms": first_call_ms,
+            "tools": len(tools), "rss_mb": rss_mb, "phases": phases}
+
+
+def run_build(label: str, launch: str, args, env: dict[str, str]) -> dict:
+    command = shlex.split(launch)
+    first_call = normalize_tool_name(args.first_call) if args.first_call.lower() != "none" else None
+    runs = []
+    for i in range(args.warmup + args.runs):
+        result = asyncio.run(cold_start(command, env, first_call, args.timeout))
+        if i >= args.warmup:
+            runs.append(result)
+
+    summary = {"build": label, "launch": launch, "runs": len(runs), "tools": runs[-1]["tools"]}
+    for key in MILESTONES + ["rss_mb"]:
+        values = [r[key] for r in runs if r[key] is not None]
+        summary[key] = {"median": round(median(values), 1), "p95": round(percentile(values, 95), 1),
+                        "min": round(min(values), 1)} if values else None
+    names = sorted({p for r in runs for p in r["phases"]}, key=lambda p: median(
+        r["phases"][p] for r in runs if p in r["phases"]))
+    summary["phases"] = {p: round(median(r["phases"][p] for r in runs if p in r["phases"]), 1) for p in names}
+    return summary
+
+
+def print_build(summary: dict):
+    print(f"\n  {summary['build']}: {summary['launch']}")
+    print(f"  {summary['runs']} cold starts, {summary['tools']} tools")
+    if summary["phases"]:
+        print(f"\n    {'phase':<16} {'at ms':>8} {'took ms':>8}")
+        previous = 0.0
+        for phase, at in summary["phases"].items():
+            print(f"    {phase:<16} {at:>8.1f} {at - previous:>8.1f}")
+            previous = at
+    else:
+        print("    (no phase marks: build predates MCP_STARTUP_TRACE)")
+    print(f"\n    {'from spawn':<16} {'median':>8} {'p95':>8} {'min':>8}")
+    for key in MILESTONES:
+        stats = summary[key]
+        if stats:
+            print(f"    {key[:-3]:<16} {stats['median']:>8.1f} {stats['p95']:>8.1f} {stats['min']:>8.1f}")
+    if summary["rss_mb"]:
+        print(f"    {'rss MB':<16} {summary['rss_mb']['median']:>8.1f}")
+
+
+def print_comparison(baseline: dict, current: dict):
+    print("\n  current vs baseline (median):")
+    for key in MILESTONES + ["rss_mb"]:
+        if baseline.get(key) and current.get(key):
+            before, after = baseline[key]["median"], current[key]["median"]
+            print(f"    {key[:-3] if key.endswith('_ms') else key:<16} {before:>8.1f} → {after:>8.1f} "
+                  f"({after - before:+.1f}, {(after - before) / before:+.1%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold start of the stdio MCP server")
+    parser.add_argument("--launch", default=DEFAULT_LAUNCH, help="Command that starts the stdio server under test")
+    parser.add_argument("--baseline-launch", help="Command that starts a baseline build (e.g. an earlier commit)")
+    parser.add_argument("--runs", type=int, default=10, help="Recorded cold starts per build")
+    parser.add_argument("--warmup", type=int, default=1, help="Unrecorded launches first (disk cache)")
+    parser.add_argument("--first-call", default="GetAuthenticationStatus",
+                        help="Tool called after tools/list, with no arguments ('none' to skip)")
+    parser.add_argument("--standin", action="store_true",
+                        help="Point the server at an in-process Fabric stand-in (fixed token, no sign-in)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds to wait for each response")
+    parser.add_argument("--json", help="Write per-build results to this file")
+    args = parser.parse_args()
+
+    standin = FabricStandin().start() if args.standin else None
+    env = {**os.environ, **(standin.server_env if standin else {}), "MCP_STARTUP_TRACE": "1"}
+    try:
+        builds = ([("baseline", args.baseline_launch)] if args.baseline_launch else []) + [("current", args.launch)]
+        results = [run_build(label, launch, args, env) for label, launch in builds]
+    finally:
+        if standin:
+            standin.stop()
+
+    for summary in results:
+        print_build(summary)
+    if len(results) == 2:
+        print_comparison(*results)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({"results": results}, indent=2))
+        print(f"\nResults saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
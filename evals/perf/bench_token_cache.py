@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Token Acquisition Benchmark
+
+Runs the eval-derived tool mix (mcp_load.py) over concurrent MCP sessions against the
+Fabric stand-in three times, restarting the HTTP server with different auth settings:
+
+    fixed     FABRIC_STANDIN_TOKEN — no token acquisition at all (baseline)
+    nocache   tokens from the token endpoint stand-in (identity_standin.py) with the
+              server's access token cache off: one token round-trip per Fabric request
+    cache     same endpoint, AccessTokenCache on: single-flight acquisition, reuse until
+              5 min before expiry, then one background refresh
+
+Per mode it reports token requests, Fabric requests, token round-trips per Fabric call,
+peak concurrent token requests, and tool p50/p99 minus the fixed baseline (the latency
+auth adds to each tool call). Use a short --expires-in to see background refreshes
+within a run.
+
+Usage:
+    python bench_token_cache.py --launch "dotnet run -c Release --project ../../DataFactory.MCP.Http" \\
+        --url http://127.0.0.1:5000/ --sessions 20 --duration 30 --token-latency-ms 150
+    python bench_token_cache.py --launch "..." --modes nocache,cache --expires-in 120 --duration 120
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shlex
+import subprocess
+import sys
+from pathlib import Path
+
+from fabric_standin import FabricStandin, add_config_arguments, config_from_args
+from identity_standin import IdentityStandin, add_identity_arguments, identity_config_from_args
+from mcp_load import (DEFAULT_EXCLUDE, EVALS_DIR, build_mix, fetch_live_tools, normalize_tool_name, run_evals,
+                      run_load, wait_for_server)
+
+
+MODES = ("fixed", "nocache", "cache")
+
+
+def mode_env(mode: str, standin: FabricStandin, identity: IdentityStandin) -> dict[str, str]:
+    env = dict(standin.server_env)
+    if mode != "fixed":
+        env.update(identity.server_env)
+    if mode == "nocache":
+        env["FABRIC_STANDIN_TOKEN_CACHE"] = "off"
+    return env
+
+
+def run_mode(mode: str, args, scenarios, include, exclude, standin: FabricStandin, identity: IdentityStandin) -> dict:
+    inventory = standin.inventory.sample()
+    server = subprocess.Popen(shlex.split(args.launch), env={**os.environ, **mode_env(mode, standin, identity)},
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_server(args.url, args.startup_timeout, server)
+        mix = build_mix(scenarios, asyncio.run(fetch_live_tools(args.url)), include, exclude)
+        if not mix:
+            sys.exit("No eval-expected tools are exposed by the server")
+        # Counted from a cold cache, so the first burst of concurrent sessions is included
+        standin.reset_stats()
+        identity.reset_stats()
+        summary = asyncio.run(run_load(args.url, mix, inventory, args.sessions, args.duration,
+                                       args.calls_per_session, args.warmup_calls, 0.0, args.ramp, args.seed))
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+    fabric = sum(s["count"] for s in standin.stats_snapshot().values())
+    tokens = identity.stats_snapshot()
+    return {
+        "mode": mode,
+        "calls": summary["calls"],
+        "throughput_rps": summary["throughput_rps"],
+        "p50_ms": summary["p50_ms"],
+        "p99_ms": summary["p99_ms"],
+        "server_error_rate": summary["server_error_rate"],
+        "tool_error_rate": summary["tool_error_rate"],
+        "fabric_requests": fabric,
+        "token_requests": tokens["token_requests"],
+        "token_errors": tokens["errors"],
+        "tokens_per_fabric_request": round(tokens["token_requests"] / fabric, 3) if fabric else 0.0,
+        "peak_concurrent_token_requests": tokens["peak_in_flight"],
+        "tools": {row["tool"]: {"p50_ms": row["p50_ms"], "p99_ms": row["p99_ms"], "calls": row["calls"]}
+                  for row in summary["tools"]},
+    }
+
+
+def add_auth_overhead(rows: list[dict]):
+    """Tool p50/p99 minus the fixed-token baseline, overall and per tool."""
+    base = next((r for r in rows if r["mode"] == "fixed"), None)
+    if not base:
+        return
+    for row in rows:
+        row["auth_added_p50_ms"] = round(row["p50_ms"] - base["p50_ms"], 1)
+        row["auth_added_p99_ms"] = round(row["p99_ms"] - base["p99_ms"], 1)
+        for tool, stats in row["tools"].items():
+            if tool in base["tools"]:
+                stats["auth_added_p50_ms"] = round(stats["p50_ms"] - base["tools"][tool]["p50_ms"], 1)
+
+
+def print_comparison(rows: list[dict]):
+    print(f"\n  {'mode':<8} {'calls':>6} {'rps':>7} {'p50':>7} {'p99':>7} {'+p50':>7} {'+p99':>7} "
+          f"{'fabric':>7} {'tokens':>7} {'tok/req':>8} {'peak':>5} {'srv err':>8}")
+    for r in rows:
+        print(f"  {r['mode']:<8} {r['calls']:>6} {r['throughput_rps']:>7} {r['p50_ms']:>7} {r['p99_ms']:>7} "
+              f"{r.get('auth_added_p50_ms', '—'):>7} {r.get('auth_added_p99_ms', '—'):>7} "
+              f"{r['fabric_requests']:>7} {r['token_requests']:>7} {r['tokens_per_fabric_request']:>8} "
+              f"{r['peak_concurrent_token_requests']:>5} {r['server_error_rate']:>8.1%}")
+    print("\n  +p50/+p99: tool latency added by auth vs the fixed-token baseline; "
+          "peak: most token requests in flight at once")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark token acquisition with and without the access token cache")
+    parser.add_argument("--url", default="http://127.0.0.1:5000/", help="MCP endpoint of the HTTP server")
+    parser.add_argument("--launch", required=True,
+                        help="Command that starts the MCP HTTP server; restarted per mode with its auth settings")
+    parser.add_argument("--modes", default=",".join(MODES), help=f"Comma-separated subset of {', '.join(MODES)}")
+    parser.add_argument("--sessions", type=int, default=20, help="Concurrent MCP sessions")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds per mode")
+    parser.add_argument("--calls-per-session", type=int, help="Stop each session after this many calls")
+    parser.add_argument("--warmup-calls", type=int, default=0, help="Unrecorded calls per session")
+    parser.add_argument("--ramp", type=float, default=0.0, help="Seconds over which sessions start")
+    parser.add_argument("--eval", action="append", help="Specific .eval.md file(s) to take the mix from")
+    parser.add_argument("--include", help="Comma-separated tools to keep (any naming style)")
+    parser.add_argument("--startup-timeout", type=float, default=120.0)
+    parser.add_argument("--json", help="Write per-mode results to this file")
+    add_config_arguments(parser)
+    add_identity_arguments(parser)
+    args = parser.parse_args()
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    if set(modes) - set(MODES):
+        parser.error(f"--modes accepts {', '.join(MODES)}")
+    if args.expires_in < 120:
+        parser.error("--expires-in must be at least 120 s (tokens within 30 s of expiry are never served)")
+
+    files = [Path(f) for f in args.eval] if args.eval else sorted(EVALS_DIR.glob("*.eval.md"))
+    scenarios = [s for f in files for s in run_evals.parse_eval_file(f)]
+    include = {normalize_tool_name(t) for t in args.include.split(",")} if args.include else None
+
+    rows = []
+    with FabricStandin(config_from_args(args)) as standin, IdentityStandin(identity_config_from_args(args)) as identity:
+        print(f"Fabric stand-in: {standin.base_url}   token endpoint: {identity.token_url} "
+              f"({args.token_latency_ms:.0f} ms, expires_in {args.expires_in}s)")
+        print(f"{args.sessions} sessions × {args.duration:.0f}s per mode")
+        for mode in modes:
+            print(f"  running {mode}...", flush=True)
+            rows.append(run_mode(mode, args, scenarios, include, DEFAULT_EXCLUDE, standin, identity))
+
+    add_auth_overhead(rows)
+    print_comparison(rows)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({"sessions": args.sessions, "duration_s": args.duration,
+                                               "token_latency_ms": args.token_latency_ms,
+                                               "expires_in": args.expires_in, "results": rows}, indent=2))
+        print(f"\nResults saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,696 @@
+#!/usr/bin/env python3
+"""
+Local Fabric REST stand-in for MCP server load tests.
+
+Serves the subset of the Fabric v1 and Power BI v2.0 REST APIs that the DataFactory MCP
+services call (workspaces, capacities, connections, gateways, dataflows, pipelines), with
+configurable latency, error / throttle rates, page sizes and payload padding. Inventory is
+derived deterministically from item indexes, so a 100k-item tenant costs no memory until
+it is paged through. Dataflow executeQuery streams a synthetic Arrow IPC result
+(arrow_payloads.py) in chunked batches of the configured size. Dataflow definitions are
+synthetic section documents (section_documents.py); updateDefinition stores what it is
+sent, so later getDefinition calls return it. Jobs (pipeline runs, dataflow refreshes) run
+for --job-seconds, or with --hold-jobs stay InProgress until release_jobs() (or
+/_standin/release) completes them all at once; the first poll that sees each job completed
+is recorded for notification benchmarks.
+
+Point the HTTP server at it with:
+    DATAFACTORY_MCP_BENCHMARK_MODE=1
+    FABRIC_API_BASE_URL=http://127.0.0.1:5555/v1
+    POWERBI_API_BASE_URL=http://127.0.0.1:5555/v2.0
+    FABRIC_STANDIN_TOKEN=<STANDIN_TOKEN below>
+
+Usage:
+    python fabric_standin.py --port 5555 --latency-ms 40 --error-rate 0.01
+    python fabric_standin.py --workspaces 50000 --connections 20000 --page-size 100
+"""
+
+import argparse
+import base64
+import functools
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterator, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from arrow_payloads import ArrowPayloadSpec, iter_arrow_stream
+from section_documents import SectionSpec, generate as generate_section
+
+
+# Unsigned JWT-shaped token; the server only checks the "eyJ" prefix before sending it.
+STANDIN_TOKEN = (
+    base64.urlsafe_b64encode(b'{"alg":"none","typ":"JWT"}').decode().rstrip("=") + "."
+    + base64.urlsafe_b64encode(b'{"sub":"fabric-standin"}').decode().rstrip("=") + "."
+)
+
+_NAMESPACE = uuid.UUID("6f1c2a52-3d4e-4b8f-9a51-0d2c7e4f8a10")
+
+CONNECTION_TYPES = ["SQL", "AzureBlobs", "Web", "SharePoint", "AzureDataLakeStorage", "PostgreSql"]
+CONNECTIVITY_TYPES = ["ShareableCloud", "ShareableCloud", "PersonalCloud",
+                      "OnPremisesGateway", "VirtualNetworkGateway"]
+GATEWAY_TYPES = ["OnPremises", "OnPremises", "VirtualNetwork", "OnPremisesPersonal"]
+SKUS = ["F2", "F8", "F64", "P1"]
+REGIONS = ["West US", "East US", "North Europe", "West Europe"]
+
+
+def item_id(kind: str, key) -> str:
+    """Deterministic GUID for the key-th item of a kind (stable across runs)."""
+    return str(uuid.uuid5(_NAMESPACE, f"{kind}:{key}"))
+
+
+def encode_token(offset: int) -> str:
+    return base64.urlsafe_b64encode(f"offset:{offset}".encode()).decode()
+
+
+def decode_token(token: Optional[str]) -> int:
+    if not token:
+        return 0
+    try:
+        return int(base64.urlsafe_b64decode(token.encode()).decode().split(":", 1)[1])
+    except (ValueError, IndexError):
+        return 0
+
+
+@dataclass
+class StandinConfig:
+    workspaces: int = 200
+    capacities: int = 8
+    connections: int = 500
+    gateways: int = 20
+    dataflows_per_workspace: int = 10
+    pipelines_per_workspace: int = 10
+    queries_per_dataflow: int = 5
+    query_steps: int = 4
+    page_size: int = 100
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    description_bytes: int = 0
+    query_rows: int = 10_000
+    query_columns: int = 8
+    query_batch_rows: int = 65_536
+    job_seconds: float = 0.0
+    hold_jobs: bool = False
+    seed: int = 0
+
+
+class Inventory:
+    """Builds Fabric-shaped JSON items on demand from their index."""
+
+    def __init__(self, config: StandinConfig):
+        self.config = config
+        self.created: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def _description(self, text: str) -> str:
+        pad = self.config.description_bytes - len(text)
+        return text + (" " + "x" * (pad - 1) if pad > 1 else "")
+
+    def workspace(self, i: int) -> dict:
+        return {
+            "id": item_id("workspace", i),
+            "displayName": f"Workspace {i:06d}",
+            "description": self._description(f"Synthetic workspace {i}"),
+            "type": "Workspace",
+            "capacityId": item_id("capacity", i % max(self.config.capacities, 1)),
+        }
+
+    def capacity(self, i: int) -> dict:
+        return {
+            "id": item_id("capacity", i),
+            "displayName": f"Capacity {i:03d}",
+            "sku": SKUS[i % len(SKUS)],
+            "region": REGIONS[i % len(REGIONS)],
+            "state": "Active",
+        }
+
+    def gateway(self, i: int) -> dict:
+        kind = GATEWAY_TYPES[i % len(GATEWAY_TYPES)]
+        gateway = {"id": item_id("gateway", i), "type": kind, "displayName": f"Gateway {i:04d}",
+                   "numberOfMemberGateways": 1 + i % 3}
+        if kind == "VirtualNetwork":
+            gateway.update({
+                "capacityId": item_id("capacity", i % max(self.config.capacities, 1)),
+                "virtualNetworkAzureResource": {
+                    "subscriptionId": item_id("subscription", 0), "resourceGroupName": "rg-standin",
+                    "virtualNetworkName": f"vnet-{i}", "subnetName": "default"},
+                "inactivityMinutesBeforeSleep": 30,
+            })
+        else:
+            gateway.update({
+                "publicKey": {"exponent": "AQAB", "modulus": "standin"},
+                "version": "3000.250.5",
+                "loadBalancingSetting": "Failover",
+                "allowCloudConnectionRefresh": True,
+                "allowCustomConnectors": False,
+            })
+        return gateway
+
+    def connection(self, i: int) -> dict:
+        connectivity = CONNECTIVITY_TYPES[i % len(CONNECTIVITY_TYPES)]
+        kind = CONNECTION_TYPES[i % len(CONNECTION_TYPES)]
+        connection = {
+            "id": item_id("connection", i),
+            "displayName": f"{kind} connection {i:06d}",
+            "connectivityType": connectivity,
+            "connectionDetails": {"type": kind, "path": self._description(f"server{i}.example.com;db{i}")},
+            "privacyLevel": "Organizational",
+            "credentialDetails": {"credentialType": "Basic", "singleSignOnType": "None",
+                                  "connectionEncryption": "NotEncrypted", "skipTestConnection": False},
+        }
+        if "Gateway" in connectivity:
+            connection["gatewayId"] = item_id("gateway", i % max(self.config.gateways, 1))
+        else:
+            connection["allowConnectionUsageInGateway"] = False
+        return connection
+
+    def dataflow(self, workspace_id: str, j: int) -> dict:
+        return {
+            "id": item_id(f"dataflow:{workspace_id}", j),
+            "displayName": f"Dataflow {j:04d}",
+            "description": self._description(f"Synthetic dataflow {j}"),
+            "type": "Dataflow",
+            "workspaceId": workspace_id,
+            "properties": {"isParametric": False},
+        }
+
+    def pipeline(self, workspace_id: str, j: int) -> dict:
+        return {
+            "id": item_id(f"pipeline:{workspace_id}", j),
+            "displayName": f"Pipeline {j:04d}",
+            "description": self._description(f"Synthetic pipeline {j}"),
+            "type": "DataPipeline",
+            "workspaceId": workspace_id,
+        }
+
+    def dataflow_definition(self, dataflow_id: str) -> dict:
+        c = self.config
+        metadata, mashup = _section_parts(c.queries_per_dataflow, c.query_steps, c.seed)
+        platform = {"metadata": {"type": "Dataflow", "displayName": dataflow_id},
+                    "config": {"version": "2.0", "logicalId": dataflow_id}}
+        return {"definition": {"parts": [metadata, mashup, _part(".platform", json.dumps(platform))]}}
+
+    def pipeline_definition(self, pipeline_id: str) -> dict:
+        content = {"properties": {"activities": [
+            {"name": "Wait1", "type": "Wait", "dependsOn": [], "typeProperties": {"waitTimeInSeconds": 1}}]}}
+        return {"definition": {"parts": [_part("pipeline-content.json", json.dumps(content))]}}
+
+    def is_pipeline(self, workspace_id: str, item: str) -> bool:
+        created = self.created.get(item)
+        if created is not None:
+            return created.get("type") == "DataPipeline"
+        return any(item == item_id(f"pipeline:{workspace_id}", j)
+                   for j in range(self.config.pipelines_per_workspace))
+
+    def remember(self, item: dict) -> dict:
+        with self._lock:
+            self.created[item["id"]] = item
+        return item
+
+    def sample(self, limit: int = 20) -> dict:
+        """IDs the load generator can use to build valid tool arguments."""
+        c = self.config
+        workspaces = [self.workspace(i)["id"] for i in range(min(limit, c.workspaces))]
+        ws = workspaces[0] if workspaces else item_id("workspace", 0)
+        return {
+            "workspaceId": workspaces,
+            "capacityId": [self.capacity(i)["id"] for i in range(min(limit, c.capacities))],
+            "connectionId": [self.connection(i)["id"] for i in range(min(limit, c.connections))],
+            "gatewayId": [self.gateway(i)["id"] for i in range(min(limit, c.gateways))],
+            "dataflowId": [self.dataflow(ws, j)["id"] for j in range(min(limit, c.dataflows_per_workspace))],
+            "pipelineId": [self.pipeline(ws, j)["id"] for j in range(min(limit, c.pipelines_per_workspace))],
+        }
+
+
+def _utc(timestamp: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(timestamp))
+
+
+def _part(path: str, text: str) -> dict:
+    return {"path": path, "payload": base64.b64encode(text.encode()).decode()}
+
+
+@functools.lru_cache(maxsize=16)
+def _section_parts(queries: int, steps: int, seed: int) -> tuple[dict, dict]:
+    """Encoded queryMetadata.json and mashup.pq parts, generated once per size."""
+    mashup, metadata = generate_section(SectionSpec(queries, steps, seed=seed))
+    return _part("queryMetadata.json", json.dumps(metadata, indent=2)), _part("mashup.pq", mashup)
+
+
+class StreamedBody:
+    """Route result body sent with chunked transfer encoding instead of as JSON."""
+
+    def __init__(self, chunks: Iterator[bytes], content_type: str):
+        self.chunks = chunks
+        self.content_type = content_type
+
+
+class RouteStats:
+    __slots__ = ("count", "errors", "bytes_in", "bytes_out", "total_ms")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.total_ms = 0.0
+
+
+class FabricStandin:
+    """Threaded Fabric REST stand-in; use as a context manager in benchmarks."""
+
+    def __init__(self, config: Optional[StandinConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or StandinConfig()
+        self.inventory = Inventory(self.config)
+        self.stats: dict[str, RouteStats] = {}
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._routes = self._build_routes()
+        self._jobs: dict[str, tuple[float, float]] = {}  # job id -> (started, duration)
+        self._job_items: dict[str, str] = {}  # job id -> item id
+        self._job_observed: dict[str, float] = {}  # job id -> first poll that reported it completed
+        self._definitions: dict[str, dict] = {}  # item id -> definition stored by updateDefinition
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def server_env(self) -> dict[str, str]:
+        """Environment variables that point DataFactory.MCP(.Http) at this stand-in."""
+        return {
+            "DATAFACTORY_MCP_BENCHMARK_MODE": "1",
+            "FABRIC_API_BASE_URL": f"{self.base_url}/v1",
+            "POWERBI_API_BASE_URL": f"{self.base_url}/v2.0",
+            "FABRIC_STANDIN_TOKEN": STANDIN_TOKEN,
+        }
+
+    # --- routing -------------------------------------------------------------------------
+
+    def _build_routes(self) -> list[tuple[str, re.Pattern, str, Callable]]:
+        guid = r"([0-9a-fA-F-]{36})"
+        table = [
+            ("GET", r"/v1/workspaces", "workspaces", self._list_workspaces),
+            ("GET", r"/v1/capacities", "capacities", self._list_capacities),
+            ("GET", r"/v1/connections", "connections", self._list_connections),
+            ("POST", r"/v1/connections", "connections.create", self._create_connection),
+            ("GET", r"/v1/connections/supportedConnectionTypes", "connections.types", self._connection_types),
+            ("GET", r"/v1/gateways", "gateways", self._list_gateways),
+            ("POST", r"/v1/gateways", "gateways.create", self._create_gateway),
+            ("GET", rf"/v1/workspaces/{guid}/dataflows", "dataflows", self._list_dataflows),
+            ("POST", rf"/v1/workspaces/{guid}/dataflows", "dataflows.create", self._create_dataflow),
+            ("POST", rf"/v1/workspaces/{guid}/dataflows/{guid}/executeQuery", "dataflows.executeQuery",
+             self._execute_query),
+            ("POST", rf"/v1/workspaces/{guid}/dataflows/{guid}/jobs/(\w+)/instances", "dataflows.jobs.run",
+             self._run_job),
+            ("GET", rf"/v1/workspaces/{guid}/dataPipelines", "pipelines", self._list_pipelines),
+            ("POST", rf"/v1/workspaces/{guid}/dataPipelines", "pipelines.create", self._create_pipeline),
+            ("GET", rf"/v1/workspaces/{guid}/dataPipelines/{guid}", "pipelines.get", self._get_pipeline),
+            ("PATCH", rf"/v1/workspaces/{guid}/dataPipelines/{guid}", "pipelines.update", self._update_pipeline),
+            ("POST", rf"/v1/workspaces/{guid}/items/{guid}/getDefinition", "items.getDefinition", self._get_definition),
+            ("POST", rf"/v1/workspaces/{guid}/items/{guid}/updateDefinition", "items.updateDefinition",
+             self._update_definition),
+            ("POST", rf"/v1/workspaces/{guid}/items/{guid}/jobs/(\w+)/instances", "jobs.run", self._run_job),
+            ("GET", rf"/v1/workspaces/{guid}/items/{guid}/jobs/instances/{guid}", "jobs.get", self._get_job),
+            ("GET", rf"/v1/workspaces/{guid}/items/{guid}/jobs/(\w+)/schedules", "schedules", self._list_schedules),
+            ("POST", rf"/v1/workspaces/{guid}/items/{guid}/jobs/(\w+)/schedules", "schedules.create",
+             self._create_schedule),
+            ("GET", rf"/v1/workspaces/{guid}/items/{guid}/jobs/(\w+)/schedules/{guid}", "schedules.get",
+             self._get_schedule),
+            ("PATCH", rf"/v1/workspaces/{guid}/items/{guid}/jobs/(\w+)/schedules/{guid}", "schedules.update",
+             self._get_schedule),
+            ("GET", r"/v2.0/myorg/me/gatewayClusterDatasources", "powerbi.datasources", self._cluster_datasources),
+        ]
+        return [(method, re.compile(pattern + "$"), name, fn) for method, pattern, name, fn in table]
+
+    def _page(self, count: int, build: Callable[[int], dict], query: dict, path: str) -> dict:
+        offset = decode_token(query.get("continuationToken", [None])[0])
+        end = min(count, offset + self.config.page_size)
+        page = {"value": [build(i) for i in range(offset, end)]}
+        if end < count:
+            token = encode_token(end)
+            page["continuationToken"] = token
+            page["continuationUri"] = f"{self.base_url}{path}?continuationToken={token}"
+        return page
+
+    def _list_workspaces(self, query, path, body, *_):
+        return 200, self._page(self.config.workspaces, self.inventory.workspace, query, path)
+
+    def _list_capacities(self, query, path, body, *_):
+        return 200, self._page(self.config.capacities, self.inventory.capacity, query, path)
+
+    def _list_connections(self, query, path, body, *_):
+        return 200, self._page(self.config.connections, self.inventory.connection, query, path)
+
+    def _list_gateways(self, query, path, body, *_):
+        return 200, self._page(self.config.gateways, self.inventory.gateway, query, path)
+
+    def _list_dataflows(self, query, path, body, ws):
+        return 200, self._page(self.config.dataflows_per_workspace,
+                               lambda j: self.inventory.dataflow(ws, j), query, path)
+
+    def _list_pipelines(self, query, path, body, ws):
+        return 200, self._page(self.config.pipelines_per_workspace,
+                               lambda j: self.inventory.pipeline(ws, j), query, path)
+
+    def _connection_types(self, query, path, body, *_):
+        return 200, {"value": [{
+            "type": kind,
+            "creationMethods": [{"name": kind, "parameters": [
+                {"name": "server", "dataType": "Text", "required": True},
+                {"name": "database", "dataType": "Text", "required": False},
+                # Enumerated parameters (regions, API versions) carry long allowedValues lists in Fabric
+                {"name": "region", "dataType": "Text", "required": False,
+                 "allowedValues": [f"{area}{n}" for area in ("westus", "eastus", "northeurope", "westeurope")
+                                   for n in ("", "2", "3")]}]}],
+            "supportedCredentialTypes": ["Basic", "OAuth2", "ServicePrincipal"],
+            "supportedConnectionEncryptionTypes": ["Encrypted", "NotEncrypted"],
+            "supportsSkipTestConnection": True,
+        } for kind in CONNECTION_TYPES]}
+
+    def _create_connection(self, query, path, body, *_):
+        return 201, self.inventory.remember({
+            "id": str(uuid.uuid4()),
+            "displayName": body.get("displayName", "connection"),
+            "connectivityType": "ShareableCloud",
+            "connectionDetails": {"type": (body.get("connectionDetails") or {}).get("type", "SQL"), "path": ""},
+            "privacyLevel": body.get("privacyLevel", "Organizational"),
+            "allowConnectionUsageInGateway": False,
+        })
+
+    def _create_gateway(self, query, path, body, *_):
+        return 201, self.inventory.remember({
+            "id": str(uuid.uuid4()),
+            "type": "VirtualNetwork",
+            "displayName": body.get("displayName", "gateway"),
+            "capacityId": body.get("capacityId"),
+            "virtualNetworkAzureResource": body.get("virtualNetworkAzureResource"),
+            "inactivityMinutesBeforeSleep": body.get("inactivityMinutesBeforeSleep", 30),
+            "numberOfMemberGateways": body.get("numberOfMemberGateways", 1),
+        })
+
+    def _create_dataflow(self, query, path, body, ws):
+        return 201, self.inventory.remember({
+            "id": str(uuid.uuid4()), "displayName": body.get("displayName", "dataflow"),
+            "description": body.get("description"), "type": "Dataflow", "workspaceId": ws})
+
+    def _execute_query(self, query, path, body, ws, dataflow_id):
+        c = self.config
+        spec = ArrowPayloadSpec(c.query_rows, c.query_columns, c.query_batch_rows)
+        return 200, StreamedBody(iter_arrow_stream(spec), "application/vnd.apache.arrow.stream")
+
+    def _create_pipeline(self, query, path, body, ws):
+        return 201, self.inventory.remember({
+            "id": str(uuid.uuid4()), "displayName": body.get("displayName", "pipeline"),
+            "description": body.get("description"), "type": "DataPipeline", "workspaceId": ws})
+
+    def _get_pipeline(self, query, path, body, ws, pipeline_id):
+        return 200, self.inventory.created.get(pipeline_id) or {
+            "id": pipeline_id, "displayName": "Pipeline", "type": "DataPipeline", "workspaceId": ws}
+
+    def _update_pipeline(self, query, path, body, ws, pipeline_id):
+        _, pipeline = self._get_pipeline(query, path, body, ws, pipeline_id)
+        return 200, {**pipeline, **{k: v for k, v in body.items() if k in ("displayName", "description")}}
+
+    def _get_definition(self, query, path, body, ws, item):
+        stored = self._definitions.get(item)
+        if stored is not None:
+            return 200, {"definition": stored}
+        if self.inventory.is_pipeline(ws, item):
+            return 200, self.inventory.pipeline_definition(item)
+        return 200, self.inventory.dataflow_definition(item)
+
+    def _update_definition(self, query, path, body, ws, item):
+        if isinstance(body.get("definition"), dict):
+            with self._lock:
+                self._definitions[item] = body["definition"]
+        return 200, None
+
+    def reset_definitions(self):
+        """Forget definitions stored by updateDefinition (back to generated ones)."""
+        with self._lock:
+            self._definitions.clear()
+
+    def _run_job(self, query, path, body, ws, item, job_type):
+        job = str(uuid.uuid4())
+        with self._lock:
+            duration = math.inf if self.config.hold_jobs else self.config.job_seconds * self._rng.uniform(0.5, 1.5)
+            self._jobs[job] = (time.time(), duration)
+            self._job_items[job] = item
+        return 202, None, {"Location": f"{self.base_url}/v1/workspaces/{ws}/items/{item}/jobs/instances/{job}"}
+
+    def _get_job(self, query, path, body, ws, item, job):
+        now = time.time()
+        with self._lock:
+            started, duration = self._jobs.get(job, (now - 5, 5.0))
+            done = now >= started + duration
+            if done and job in self._jobs:
+                self._job_observed.setdefault(job, now)
+        return 200, {"id": job, "itemId": item, "jobType": "Pipeline", "invokeType": "Manual",
+                     "status": "Completed" if done else "InProgress", "rootActivityId": job,
+                     "startTimeUtc": _utc(started), "endTimeUtc": _utc(started + duration) if done else None}
+
+    def release_jobs(self) -> int:
+        """Complete every held job now; returns how many were released."""
+        now = time.time()
+        with self._lock:
+            held = [job for job, (_, duration) in self._jobs.items() if duration == math.inf]
+            for job in held:
+                self._jobs[job] = (self._jobs[job][0], now - self._jobs[job][0])
+        return len(held)
+
+    def job_observations(self) -> list[dict]:
+        """Every job started so far: item, start time, and when a poll first saw it completed (or None)."""
+        with self._lock:
+            return [{"job": job, "item": self._job_items.get(job), "started": started,
+                     "observed": self._job_observed.get(job)} for job, (started, _) in self._jobs.items()]
+
+    def _schedule(self, schedule_id: str) -> dict:
+        return {"id": schedule_id, "enabled": True, "createdDateTime": "2026-01-01T00:00:00Z",
+                "configuration": {"type": "Cron", "interval": 60, "startDateTime": "2026-01-01T00:00:00",
+                                  "endDateTime": "2027-01-01T00:00:00", "localTimeZoneId": "UTC"},
+                "owner": {"id": item_id("user", 0), "type": "User"}}
+
+    def _list_schedules(self, query, path, body, ws, item, job_type):
+        return 200, {"value": [self._schedule(item_id(f"schedule:{item}", k)) for k in range(2)]}
+
+    def _create_schedule(self, query, path, body, ws, item, job_type):
+        return 201, {**self._schedule(str(uuid.uuid4())), **body}
+
+    def _get_schedule(self, query, path, body, ws, item, job_type, schedule_id):
+        return 200, {**self._schedule(schedule_id), **(body or {})}
+
+    def _cluster_datasources(self, query, path, body, *_):
+        count = min(self.config.connections, 1000)
+        return 200, {"value": [{"id": item_id("connection", i), "clusterId": item_id("cluster", i % 10)}
+                               for i in range(count)]}
+
+    # --- faults, stats, HTTP -------------------------------------------------------------
+
+    def _inject(self) -> Optional[tuple[int, dict, dict]]:
+        c = self.config
+        with self._lock:
+            delay = c.latency_ms + (self._rng.uniform(0, c.jitter_ms) if c.jitter_ms else 0)
+            roll = self._rng.random()
+        if delay > 0:
+            time.sleep(delay / 1000)
+        if roll < c.throttle_rate:
+            return 429, {"errorCode": "TooManyRequests", "message": "stand-in throttle"}, {"Retry-After": "1"}
+        if roll < c.throttle_rate + c.error_rate:
+            return 500, {"errorCode": "InternalServerError", "message": "stand-in error",
+                         "requestId": str(uuid.uuid4())}, {}
+        return None
+
+    def _record(self, route: str, status: int, size: int, elapsed_ms: float, size_in: int = 0):
+        with self._lock:
+            stats = self.stats.setdefault(route, RouteStats())
+            stats.count += 1
+            stats.errors += status >= 400
+            stats.bytes_in += size_in
+            stats.bytes_out += size
+            stats.total_ms += elapsed_ms
+
+    def stats_snapshot(self) -> dict:
+        with self._lock:
+            return {route: {"count": s.count, "errors": s.errors, "bytes_in": s.bytes_in, "bytes_out": s.bytes_out,
+                            "mean_ms": round(s.total_ms / s.count, 2) if s.count else 0.0}
+                    for route, s in sorted(self.stats.items())}
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats.clear()
+
+    def handle(self, method: str, raw_path: str, body: dict) -> tuple[str, int, object, dict]:
+        """Dispatch one request. Returns (route name, status, JSON payload or StreamedBody, extra headers)."""
+        parts = urlsplit(raw_path)
+        query = parse_qs(parts.query)
+        if parts.path == "/_standin/stats":
+            return "_standin", 200, self.stats_snapshot(), {}
+        if parts.path == "/_standin/inventory":
+            return "_standin", 200, self.inventory.sample(), {}
+        if parts.path == "/_standin/reset":
+            self.reset_stats()
+            return "_standin", 200, {}, {}
+        if parts.path == "/_standin/release":
+            return "_standin", 200, {"released": self.release_jobs()}, {}
+        if parts.path == "/_standin/jobs":
+            return "_standin", 200, {"value": self.job_observations()}, {}
+
+        for route_method, pattern, name, fn in self._routes:
+            if route_method != method:
+                continue
+            match = pattern.match(parts.path)
+            if not match:
+                continue
+            fault = self._inject()
+            if fault:
+                return name, fault[0], fault[1], fault[2]
+            result = fn(query, parts.path, body, *match.groups())
+            status, payload = result[0], result[1]
+            return name, status, payload, result[2] if len(result) > 2 else {}
+        return "unmatched", 404, {"errorCode": "EntityNotFound", "message": f"No stand-in route for {method} {parts.path}"}, {}
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Body follows the headers at once instead of after the client's delayed ACK (~40 ms per response)
+            disable_nagle_algorithm = True
+
+            def _dispatch(self):
+                started = time.perf_counter()
+                length = int(self.headers.get("Content-Length", 0))
+                raw = self.rfile.read(length) if length else b""
+                try:
+                    body = json.loads(raw) if raw else {}
+                except json.JSONDecodeError:
+                    body = {}
+                route, status, payload, headers = server.handle(self.command, self.path, body)
+                if isinstance(payload, StreamedBody):
+                    size = self._send_chunked(status, payload, headers)
+                    server._record(route, status, size, (time.perf_counter() - started) * 1000, length)
+                    return
+                data = json.dumps(payload).encode() if payload is not None else b""
+                self.send_response(status)
+                if data:
+                    self.send_header("Content-Type", "application/json")
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+                if route != "_standin":
+                    server._record(route, status, len(data), (time.perf_counter() - started) * 1000, length)
+
+            def _send_chunked(self, status: int, payload: StreamedBody, headers: dict) -> int:
+                self.send_response(status)
+                self.send_header("Content-Type", payload.content_type)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                size = 0
+                try:
+                    for chunk in payload.chunks:
+                        self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+                        size += len(chunk)
+                    self.wfile.write(b"0\r\n\r\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    self.close_connection = True
+                return size
+
+            do_GET = do_POST = do_PATCH = do_DELETE = _dispatch
+
+            def log_message(self, format, *args):  # noqa: A002 - signature from base class
+                pass
+
+        return Handler
+
+    def start(self) -> "FabricStandin":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FabricStandin":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def add_config_arguments(parser: argparse.ArgumentParser):
+    """Stand-in knobs shared by every script that starts one in-process."""
+    defaults = StandinConfig()
+    group = parser.add_argument_group("Fabric stand-in")
+    group.add_argument("--workspaces", type=int, default=defaults.workspaces)
+    group.add_argument("--capacities", type=int, default=defaults.capacities)
+    group.add_argument("--connections", type=int, default=defaults.connections)
+    group.add_argument("--gateways", type=int, default=defaults.gateways)
+    group.add_argument("--dataflows-per-workspace", type=int, default=defaults.dataflows_per_workspace)
+    group.add_argument("--pipelines-per-workspace", type=int, default=defaults.pipelines_per_workspace)
+    group.add_argument("--queries-per-dataflow", type=int, default=defaults.queries_per_dataflow,
+                       help="Shared members in each dataflow definition's section document")
+    group.add_argument("--query-steps", type=int, default=defaults.query_steps,
+                       help="Transformation steps per generated query")
+    group.add_argument("--page-size", type=int, default=defaults.page_size, help="Items per continuation page")
+    group.add_argument("--latency-ms", type=float, default=defaults.latency_ms, help="Added latency per request")
+    group.add_argument("--jitter-ms", type=float, default=defaults.jitter_ms, help="Uniform random extra latency")
+    group.add_argument("--error-rate", type=float, default=defaults.error_rate, help="Fraction of 500 responses")
+    group.add_argument("--throttle-rate", type=float, default=defaults.throttle_rate,
+                       help="Fraction of 429 responses")
+    group.add_argument("--description-bytes", type=int, default=defaults.description_bytes,
+                       help="Pad item descriptions to this size to grow payloads")
+    group.add_argument("--query-rows", type=int, default=defaults.query_rows,
+                       help="Rows in each executeQuery Arrow result")
+    group.add_argument("--query-columns", type=int, default=defaults.query_columns)
+    group.add_argument("--query-batch-rows", type=int, default=defaults.query_batch_rows,
+                       help="Rows per Arrow record batch (one chunk each)")
+    group.add_argument("--job-seconds", type=float, default=defaults.job_seconds,
+                       help="Mean job run time (0.5-1.5x); jobs report InProgress until it elapses")
+    group.add_argument("--hold-jobs", action="store_true",
+                       help="Keep jobs InProgress until /_standin/release completes them all at once")
+    group.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def config_from_args(args: argparse.Namespace) -> StandinConfig:
+    return StandinConfig(**{name: getattr(args, name) for name in StandinConfig.__dataclass_fields__})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Fabric REST stand-in for MCP server load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5555)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    server = FabricStandin(config_from_args(args), args.host, args.port)
+    print(f"Fabric stand-in listening on {server.base_url}")
+    for key, value in server.server_env.items():
+        print(f"  {key}={value}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
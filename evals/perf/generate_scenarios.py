@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Synthetic Eval Scenario Generator
+
+Expands parameterized templates into large `.eval.md` files in the same format as the
+hand-written evals, using the tool and parameter definitions in tools_schema.json.
+Meant for scaling benchmarks of the parser, scorer and reporter — not for model quality.
+
+Usage:
+    python generate_scenarios.py --count 10000 --output-dir /tmp/synthetic-evals
+    python generate_scenarios.py --count 100000 --files 7 --seed 1
+"""
+
+import argparse
+import json
+import random
+import re
+from pathlib import Path
+from typing import Optional
+
+
+SCHEMA_PATH = Path(__file__).parent.parent / "tools_schema.json"
+
+ID_PREFIXES = {
+    "workspaceId": "ws",
+    "dataflowId": "df",
+    "pipelineId": "pl",
+    "connectionId": "conn",
+    "gatewayId": "gw",
+    "capacityId": "cap",
+    "jobInstanceId": "job",
+    "scheduleId": "sched",
+    "folderId": "folder",
+    "subscriptionId": "sub",
+    "applicationId": "app",
+    "tenantId": "tenant",
+}
+
+NAME_NOUNS = ["Sales", "Inventory", "Customers", "Orders", "Finance", "Marketing", "HR", "Telemetry"]
+NAME_SUFFIXES = ["ETL", "Load", "Sync", "Daily", "Staging", "Report", "Ingest"]
+
+# Parameters whose real values are documents/blobs: expected as descriptive text
+# (the scorer skips "any ..." expectations) and never quoted in the prompt.
+DOCUMENT_PARAMS = {"mCode", "mDocument", "customMashupDocument", "definitionJson",
+                   "connectionParameters", "credentials"}
+
+PROMPT_TEMPLATES = [
+    "{action} — {details}",
+    "Can you {action_lower}? Use {details}.",
+    "I need to {action_lower} ({details})",
+    "Please {action_lower} with {details}",
+]
+
+EDGE_PROMPTS = [
+    "Do the thing with my {noun} stuff from earlier",
+    "Why is {noun} {suffix} broken?",
+    "Delete everything in the {noun} workspace",
+    "Make the {noun} {suffix} faster",
+]
+
+
+def load_tools(schema_path: Path = SCHEMA_PATH) -> list[dict]:
+    return [t["function"] for t in json.loads(schema_path.read_text())["tools"]]
+
+
+def _humanize(param: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", " ", param).lower()
+
+
+def _param_value(name: str, spec: dict, rng: random.Random, n: int) -> str:
+    if name in ID_PREFIXES:
+        return f"{ID_PREFIXES[name]}-{rng.randrange(100000):05d}"
+    if spec.get("type") == "boolean":
+        return rng.choice(["true", "false"])
+    if spec.get("type") == "integer":
+        return str(rng.randrange(1, 60))
+    if spec.get("enum"):
+        return rng.choice(spec["enum"])
+    if "name" in name.lower():
+        return f"{rng.choice(NAME_NOUNS)} {rng.choice(NAME_SUFFIXES)} {n}"
+    return f"{name}-{n}"
+
+
+def _tool_call(tool: dict, rng: random.Random, n: int, optional: bool,
+               shared: Optional[dict[str, str]] = None) -> tuple[dict[str, str], list[str]]:
+    """Pick parameter values for a tool. Returns (expected params, prompt fragments)."""
+    props = tool.get("parameters", {}).get("properties", {})
+    required = set(tool.get("parameters", {}).get("required", []))
+    expected: dict[str, str] = {}
+    fragments: list[str] = []
+    for name, spec in props.items():
+        if name not in required and not (optional and rng.random() < 0.5):
+            continue
+        if name in DOCUMENT_PARAMS:
+            expected[name] = f"any valid {_humanize(name)}"
+            continue
+        value = (shared or {}).get(name) or _param_value(name, spec, rng, n)
+        expected[name] = value
+        fragments.append(f"{_humanize(name)} `{value}`")
+    return expected, fragments
+
+
+def _action_text(tool: dict) -> str:
+    desc = tool.get("description", "").split(". ")[0].split(" - ")[0].strip().rstrip(".")
+    return desc or tool["name"]
+
+
+def render_scenario(eval_id: str, title: str, category: str, difficulty: str, prompt: str,
+                    expected: list[tuple[str, dict[str, str]]], assertions: list[str],
+                    context: Optional[str] = None) -> str:
+    lines = [
+        f"### {eval_id}: {title}",
+        "",
+        f"**Category:** {category}",
+        f"**Difficulty:** {difficulty}",
+        "",
+        "**User prompt:**",
+        f"> {prompt}",
+        "",
+    ]
+    if context:
+        lines += ["**Context:**"] + [f"> {line}" for line in context.split("\n")] + [""]
+    if expected:
+        lines.append("**Expected tool call(s):**")
+        numbered = len(expected) > 1
+        for i, (tool_name, params) in enumerate(expected, 1):
+            lines.append(f"{i}. Tool: `{tool_name}`" if numbered else f"- Tool: `{tool_name}`")
+            for k, v in params.items():
+                lines.append(f"  - `{k}`: `{v}`" if not v.startswith("any ") else f"  - `{k}`: {v}")
+        lines.append("")
+    lines.append("**Assertions:**")
+    lines += [f"- {a}" for a in assertions]
+    lines += ["", "---", "", ""]
+    return "\n".join(lines)
+
+
+def generate_scenario(n: int, tools: list[dict], rng: random.Random) -> str:
+    """Generate the markdown for scenario number n."""
+    eval_id = f"EVAL-SYN-{n:06d}"
+    roll = rng.random()
+
+    if roll < 0.15:
+        # Edge case: behavioral only, no expected tool call
+        noun, suffix = rng.choice(NAME_NOUNS), rng.choice(NAME_SUFFIXES)
+        prompt = rng.choice(EDGE_PROMPTS).format(noun=noun, suffix=suffix)
+        return render_scenario(
+            eval_id, f"Ambiguous request {n}", "Edge Case", "Hard", prompt, [],
+            ["Must ask a clarifying question before calling a tool",
+             "Must not invent resource IDs"],
+        )
+
+    if roll < 0.25:
+        # Multi-step: two tools sharing the workspace
+        first, second = rng.sample([t for t in tools if "workspaceId" in
+                                    t.get("parameters", {}).get("properties", {})], 2)
+        shared = {"workspaceId": _param_value("workspaceId", {}, rng, n)}
+        p1, f1 = _tool_call(first, rng, n, optional=False, shared=shared)
+        p2, f2 = _tool_call(second, rng, n, optional=False, shared=shared)
+        prompt = f"First {_action_text(first).lower()} ({', '.join(f1)}), " \
+                 f"then {_action_text(second).lower()} ({', '.join(f2)})"
+        return render_scenario(
+            eval_id, f"{first['name']} then {second['name']}", "Tool Selection", "Hard", prompt,
+            [(first["name"], p1), (second["name"], p2)],
+            ["Must call both tools in order", "Must reuse the same workspace ID"],
+            context=f"User is working in workspace {shared['workspaceId']}",
+        )
+
+    tool = rng.choice(tools)
+    extraction = roll > 0.6
+    params, fragments = _tool_call(tool, rng, n, optional=extraction)
+    action = _action_text(tool)
+    template = rng.choice(PROMPT_TEMPLATES)
+    prompt = template.format(action=action, action_lower=action[:1].lower() + action[1:],
+                             details=", ".join(fragments) or "the defaults")
+    return render_scenario(
+        eval_id,
+        f"{tool['name']} #{n}",
+        "Parameter Extraction" if extraction else "Tool Selection",
+        rng.choice(["Easy", "Medium", "Hard"]),
+        prompt,
+        [(tool["name"], params)],
+        [f"Must select {tool['name']}", "Must extract every quoted value verbatim"],
+    )
+
+
+def generate(count: int, output_dir: Path, files: int = 7, seed: int = 0,
+             schema_path: Path = SCHEMA_PATH) -> list[Path]:
+    """Write `count` scenarios split across `files` synthetic .eval.md files."""
+    rng = random.Random(seed)
+    tools = load_tools(schema_path)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    per_file = -(-count // files)
+    paths = []
+    for i in range(files):
+        start = i * per_file
+        end = min(count, start + per_file)
+        if start >= end:
+            break
+        path = output_dir / f"synthetic-{i + 1:02d}.eval.md"
+        with path.open("w") as fh:
+            fh.write(f"# Synthetic Evals {i + 1}\n\nGenerated by generate_scenarios.py (seed {seed}).\n\n---\n\n")
+            for n in range(start, end):
+                fh.write(generate_scenario(n, tools, rng))
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic eval scenarios")
+    parser.add_argument("--count", type=int, default=10000, help="Number of scenarios")
+    parser.add_argument("--files", type=int, default=7, help="Number of .eval.md files to split into")
+    parser.add_argument("--output-dir", default="synthetic-evals")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    paths = generate(args.count, Path(args.output_dir), args.files, args.seed)
+    total = sum(p.stat().st_size for p in paths)
+    print(f"Wrote {args.count} scenarios to {len(paths)} files in {args.output_dir} ({total / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Local OAuth2 token endpoint stand-in for token acquisition benchmarks.
+
+Answers the client credentials grant at POST /{tenant}/oauth2/v2.0/token with a fresh,
+unique JWT-shaped token per request, after configurable latency, with a configurable
+token lifetime and error rate. Counts every token request, so benchmarks can report
+token round-trips per Fabric API call.
+
+DataFactory.MCP.Http uses it when started with (alongside the fabric_standin.py URLs):
+    FABRIC_STANDIN_TOKEN_URL=http://127.0.0.1:5556/standin-tenant/oauth2/v2.0/token
+
+Usage:
+    python identity_standin.py --port 5556 --token-latency-ms 150 --expires-in 3600
+"""
+
+import argparse
+import base64
+import json
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+
+TENANT = "standin-tenant"
+CLIENT_ID = "standin-client"
+CLIENT_SECRET = "standin-secret"
+
+
+def _b64(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def issue_token(subject: str, expires_in: int) -> str:
+    """Unsigned JWT-shaped token; the server only checks the "eyJ" prefix before sending it."""
+    now = int(time.time())
+    return _b64({"alg": "none", "typ": "JWT"}) + "." + _b64(
+        {"sub": subject, "jti": uuid.uuid4().hex, "iat": now, "exp": now + expires_in}) + "."
+
+
+@dataclass
+class IdentityConfig:
+    expires_in: int = 3600
+    token_latency_ms: float = 150.0
+    token_jitter_ms: float = 0.0
+    token_error_rate: float = 0.0
+    seed: int = 0
+
+
+class IdentityStandin:
+    """Threaded token endpoint stand-in; use as a context manager in benchmarks."""
+
+    def __init__(self, config: Optional[IdentityConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or IdentityConfig()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._errors = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._request_times: list[float] = []
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def token_url(self) -> str:
+        return f"{self.base_url}/{TENANT}/oauth2/v2.0/token"
+
+    @property
+    def server_env(self) -> dict[str, str]:
+        """Environment variables that make DataFactory.MCP.Http acquire tokens from this stand-in."""
+        return {
+            "FABRIC_STANDIN_TOKEN_URL": self.token_url,
+            "FABRIC_STANDIN_CLIENT_ID": CLIENT_ID,
+            "FABRIC_STANDIN_CLIENT_SECRET": CLIENT_SECRET,
+        }
+
+    def stats_snapshot(self) -> dict:
+        with self._lock:
+            times = self._request_times
+            return {"token_requests": self._requests, "errors": self._errors,
+                    "peak_in_flight": self._peak_in_flight,
+                    "first_at": times[0] if times else None, "last_at": times[-1] if times else None}
+
+    def reset_stats(self):
+        with self._lock:
+            self._requests = self._errors = self._peak_in_flight = 0
+            self._request_times = []
+
+    def issue(self, form: dict[str, list[str]]) -> tuple[int, dict]:
+        """Handle one token request. Returns (status, JSON payload)."""
+        c = self.config
+        with self._lock:
+            self._requests += 1
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            self._request_times.append(time.time())
+            delay = c.token_latency_ms + (self._rng.uniform(0, c.token_jitter_ms) if c.token_jitter_ms else 0)
+            roll = self._rng.random()
+        try:
+            if delay > 0:
+                time.sleep(delay / 1000)
+            field = lambda name: (form.get(name) or [""])[0]  # noqa: E731
+            if field("grant_type") != "client_credentials":
+                return 400, {"error": "unsupported_grant_type"}
+            if field("client_id") != CLIENT_ID or field("client_secret") != CLIENT_SECRET:
+                return 401, {"error": "invalid_client", "error_description": "stand-in: unknown client"}
+            if roll < c.token_error_rate:
+                return 503, {"error": "temporarily_unavailable", "error_description": "stand-in error"}
+            return 200, {"token_type": "Bearer", "expires_in": c.expires_in, "ext_expires_in": c.expires_in,
+                         "access_token": issue_token(field("client_id"), c.expires_in)}
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # TCP_NODELAY, as in fabric_standin.py
+            disable_nagle_algorithm = True
+
+            def _reply(self, status: int, payload: dict):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                raw = self.rfile.read(length).decode() if length else ""
+                if urlsplit(self.path).path.endswith("/oauth2/v2.0/token"):
+                    status, payload = server.issue(parse_qs(raw))
+                    if status >= 400:
+                        with server._lock:
+                            server._errors += 1
+                    self._reply(status, payload)
+                else:
+                    self._reply(404, {"error": "not_found"})
+
+            def do_GET(self):
+                path = urlsplit(self.path).path
+                if path == "/_standin/stats":
+                    self._reply(200, server.stats_snapshot())
+                elif path == "/_standin/reset":
+                    server.reset_stats()
+                    self._reply(200, {})
+                else:
+                    self._reply(404, {"error": "not_found"})
+
+            def log_message(self, format, *args):  # noqa: A002 - signature from base class
+                pass
+
+        return Handler
+
+    def start(self) -> "IdentityStandin":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "IdentityStandin":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def add_identity_arguments(parser: argparse.ArgumentParser):
+    defaults = IdentityConfig()
+    group = parser.add_argument_group("Token endpoint stand-in")
+    group.add_argument("--expires-in", type=int, default=defaults.expires_in,
+                       help="Token lifetime in seconds (the server refreshes 5 min, or half the lifetime, early)")
+    group.add_argument("--token-latency-ms", type=float, default=defaults.token_latency_ms,
+                       help="Added latency per token request")
+    group.add_argument("--token-jitter-ms", type=float, default=defaults.token_jitter_ms)
+    group.add_argument("--token-error-rate", type=float, default=defaults.token_error_rate,
+                       help="Fraction of 503 token responses")
+
+
+def identity_config_from_args(args: argparse.Namespace) -> IdentityConfig:
+    return IdentityConfig(args.expires_in, args.token_latency_ms, args.token_jitter_ms, args.token_error_rate,
+                          getattr(args, "seed", 0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OAuth2 token endpoint stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5556)
+    parser.add_argument("--seed", type=int, default=0)
+    add_identity_arguments(parser)
+    args = parser.parse_args()
+
+    server = IdentityStandin(identity_config_from_args(args), args.host, args.port)
+    print(f"Token endpoint stand-in listening on {server.token_url}")
+    for key, value in server.server_env.items():
+        print(f"  {key}={value}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+MCP stdio Traffic Capture
+
+Sits between an MCP client and the stdio server (DataFactory.MCP): everything is relayed
+unchanged, and every client-to-server JSON-RPC message is written to a JSON lines capture
+with its arrival offset, params (credential-like values redacted), latency to the matching
+response and response size. The format matches the HTTP capture the server writes when
+MCP_CAPTURE_PATH is set (McpTrafficCapture.cs), so mcp_replay.py reads either.
+
+Point the client's server command at this script, e.g. in an MCP client config:
+
+    "command": "python",
+    "args": ["evals/perf/mcp_capture.py", "--output", "/tmp/session.jsonl", "--",
+             "dotnet", "run", "--project", "DataFactory.MCP"]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import TextIO
+
+
+# Keep in sync with McpTrafficCapture.cs
+SECRET_KEY_PARTS = ("secret", "password", "credential", "token", "key")
+KEPT_KEYS = {"continuationtoken", "credentialtype"}
+REDACTED = "***"
+
+LINE_LIMIT = 256 * 1024 * 1024
+
+
+def redact(value):
+    """Copy of a JSON value with credential-like scalar properties masked, at any depth."""
+    if isinstance(value, dict):
+        return {k: REDACTED if not isinstance(v, (dict, list)) and is_secret(k) else redact(v)
+                for k, v in value.items()}
+    if isinstance(value, list):
+        return [redact(v) for v in value]
+    return value
+
+
+def is_secret(name: str) -> bool:
+    lowered = name.lower()
+    return lowered not in KEPT_KEYS and any(part in lowered for part in SECRET_KEY_PARTS)
+
+
+class StdioCapture:
+    def __init__(self, command: list[str], output: TextIO, session: str):
+        self.command = command
+        self.output = output
+        self.session = session
+        self._clock = time.perf_counter()
+        # request id -> (record, perf_counter at send)
+        self._pending: dict[object, tuple[dict, float]] = {}
+        self.records = 0
+
+    def _write(self, record: dict):
+        self.output.write(json.dumps(record) + "\n")
+        self.output.flush()
+        self.records += 1
+
+    def _client_message(self, line: bytes, now: float):
+        try:
+            messages = json.loads(line)
+        except json.JSONDecodeError:
+            return
+        for message in messages if isinstance(messages, list) else [messages]:
+            if not isinstance(message, dict) or "method" not in message:
+                continue  # replies to server requests (ping, roots/list)
+            record = {"t": round(now - self._clock, 4), "transport": "stdio", "session": self.session,
+                      "method": message["method"], "id": message.get("id"),
+                      "params": redact(message.get("params")), "latency_ms": None, "status": None,
+                      "request_bytes": len(line), "response_bytes": 0}
+            if "id" in message:
+                self._pending[message["id"]] = (record, now)
+            else:
+                self._write(record)
+
+    def _server_message(self, line: bytes, now: float):
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            return
+        if not isinstance(message, dict) or "method" in message or "id" not in message:
+            return
+        pending = self._pending.pop(message["id"], None)
+        if pending is None:
+            return
+        record, sent = pending
+        record["latency_ms"] = round((now - sent) * 1000, 2)
+        record["status"] = "error" if "error" in message else "ok"
+        record["response_bytes"] = len(line)
+        self._write(record)
+
+    async def run(self) -> int:
+        loop = asyncio.get_running_loop()
+        process = await asyncio.create_subprocess_exec(
+            *self.command, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, stderr=None,
+            limit=LINE_LIMIT)
+
+        client_in = asyncio.StreamReader(limit=LINE_LIMIT)
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(client_in), sys.stdin)
+        client_out = sys.stdout.buffer
+
+        async def client_to_server():
+            while line := await client_in.readline():
+                self._client_message(line, time.perf_counter())
+                process.stdin.write(line)
+                await process.stdin.drain()
+            process.stdin.close()
+
+        async def server_to_client():
+            while line := await process.stdout.readline():
+                self._server_message(line, time.perf_counter())
+                client_out.write(line)
+                client_out.flush()
+
+        upstream = asyncio.create_task(client_to_server())
+        await server_to_client()
+        upstream.cancel()
+        for record, _ in self._pending.values():
+            record["status"] = "unanswered"
+            self._write(record)
+        return await process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Relay an MCP stdio server and capture its JSON-RPC traffic",
+                                     usage="%(prog)s --output FILE -- <server command>")
+    parser.add_argument("--output", default=os.environ.get("MCP_CAPTURE_PATH"),
+                        help="Capture file (JSON lines; default $MCP_CAPTURE_PATH)")
+    parser.add_argument("--session", help="Session label written to every record (default: stdio-<pid>)")
+    parser.add_argument("command", nargs=argparse.REMAINDER, help="Server command after --")
+    args = parser.parse_args()
+
+    command = args.command[1:] if args.command[:1] == ["--"] else args.command
+    if not command:
+        parser.error("Missing server command after --")
+    if not args.output:
+        parser.error("--output (or MCP_CAPTURE_PATH) is required")
+
+    with open(args.output, "w") as output:
+        capture = StdioCapture(command, output, args.session or f"stdio-{os.getpid()}")
+        try:
+            code = asyncio.run(capture.run())
+        except KeyboardInterrupt:
+            code = 130
+    print(f"mcp_capture: {capture.records} messages written to {args.output}", file=sys.stderr)
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,403 @@
+"""
+Minimal asyncio MCP client for load tests and live eval runs (stdlib only).
+
+Speaks the streamable HTTP transport used by DataFactory.MCP.Http: JSON-RPC requests are
+POSTed to the MCP endpoint, responses come back as JSON or as a short SSE stream, and the
+session is identified by the Mcp-Session-Id header. Each session keeps one persistent
+HTTP/1.1 connection, so latency numbers reflect the server, not connection setup.
+McpHttpSession.listen() opens the session's GET event stream on a second connection and
+yields the messages the server sends on its own (notifications).
+
+McpStdioSession speaks the stdio transport of DataFactory.MCP instead: it starts the
+server as a subprocess and exchanges newline-delimited JSON-RPC messages with it.
+"""
+
+import asyncio
+import json
+import re
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional, TextIO
+from urllib.parse import urlsplit
+
+
+PROTOCOL_VERSION = "2025-06-18"
+
+
+class McpError(Exception):
+    """Transport failure or JSON-RPC error response."""
+
+    def __init__(self, message: str, status: Optional[int] = None, code: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+
+
+@dataclass
+class ToolCallResult:
+    tool: str
+    latency_ms: float
+    is_error: bool
+    text: str
+    response_bytes: int
+
+
+def tool_reported_error(result: ToolCallResult) -> bool:
+    """True for isError results and for the server's {"success": false, "error": ...} envelope."""
+    if result.is_error:
+        return True
+    text = result.text.lstrip()
+    if not text.startswith("{"):
+        return False
+    try:
+        body = json.loads(text)
+    except json.JSONDecodeError:
+        return False
+    return isinstance(body, dict) and body.get("success") is False
+
+
+class AsyncHttpConnection:
+    """One keep-alive HTTP/1.1 connection (Content-Length, chunked and read-to-close bodies)."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def _connect(self):
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method: str, path: str, headers: dict[str, str],
+                      body: bytes = b"") -> tuple[int, dict[str, str], bytes]:
+        for attempt in range(2):
+            if self._writer is None:
+                await self._connect()
+            try:
+                return await self._exchange(method, path, headers, body)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                await self.close()
+                if attempt:
+                    raise
+        raise RuntimeError("unreachable")
+
+    async def _exchange(self, method, path, headers, body):
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}",
+                 f"Content-Length: {len(body)}"]
+        lines += [f"{k}: {v}" for k, v in headers.items()]
+        self._writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + body)
+        await self._writer.drain()
+
+        status, resp_headers = await read_response_head(self._reader)
+
+        if resp_headers.get("transfer-encoding", "").lower() == "chunked":
+            payload = b"".join([chunk async for chunk in read_chunks(self._reader)])
+        elif "content-length" in resp_headers:
+            payload = await self._reader.readexactly(int(resp_headers["content-length"]))
+        else:
+            payload = await self._reader.read()
+            await self.close()
+
+        if resp_headers.get("connection", "").lower() == "close":
+            await self.close()
+        return status, resp_headers, payload
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+        self._reader = self._writer = None
+
+
+async def read_response_head(reader: asyncio.StreamReader) -> tuple[int, dict[str, str]]:
+    """Status code and lower-cased headers of an HTTP/1.1 response."""
+    status_line = await reader.readuntil(b"\r\n")
+    if not status_line:
+        raise ConnectionError("connection closed")
+    headers: dict[str, str] = {}
+    while True:
+        line = await reader.readuntil(b"\r\n")
+        if line == b"\r\n":
+            break
+        key, _, value = line.decode("latin-1").partition(":")
+        headers[key.strip().lower()] = value.strip()
+    return int(status_line.split()[1]), headers
+
+
+async def read_chunks(reader: asyncio.StreamReader) -> AsyncIterator[bytes]:
+    """Chunks of a chunked response body as they arrive."""
+    while True:
+        size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+        if size == 0:
+            await reader.readuntil(b"\r\n")
+            return
+        yield await reader.readexactly(size)
+        await reader.readexactly(2)
+
+
+async def read_until_closed(reader: asyncio.StreamReader) -> AsyncIterator[bytes]:
+    """A read-to-close response body as it arrives."""
+    while data := await reader.read(65536):
+        yield data
+
+
+def sse_data(event: str) -> str:
+    """The data of one server-sent event (its data: lines joined)."""
+    return "\n".join(line[5:].lstrip() for line in event.splitlines() if line.startswith("data:"))
+
+
+def parse_jsonrpc_payload(content_type: str, payload: bytes, request_id: int) -> Optional[dict]:
+    """Find the JSON-RPC response for request_id in a JSON or SSE body."""
+    if "text/event-stream" in content_type:
+        for event in payload.decode().split("\n\n"):
+            data = sse_data(event)
+            if not data:
+                continue
+            message = json.loads(data)
+            if message.get("id") == request_id:
+                return message
+        return None
+    if not payload:
+        return None
+    message = json.loads(payload)
+    if isinstance(message, list):
+        return next((m for m in message if m.get("id") == request_id), None)
+    return message
+
+
+class McpSession:
+    """Client side of the MCP methods the load tools use; subclasses provide the transport."""
+
+    client_name = "mcp-load"
+    server_info: dict = {}
+
+    async def request(self, method: str, params: Optional[dict] = None) -> tuple[dict, int]:
+        """Send a JSON-RPC request; returns (result, response size in bytes)."""
+        raise NotImplementedError
+
+    async def notify(self, method: str, params: Optional[dict] = None):
+        raise NotImplementedError
+
+    async def initialize(self) -> dict:
+        self.server_info, _ = await self.request("initialize", {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": self.client_name, "version": "1.0"},
+        })
+        await self.notify("notifications/initialized")
+        return self.server_info
+
+    async def list_tools(self) -> list[dict]:
+        tools, cursor = [], None
+        while True:
+            result, _ = await self.request("tools/list", {"cursor": cursor} if cursor else {})
+            tools.extend(result.get("tools", []))
+            cursor = result.get("nextCursor")
+            if not cursor:
+                return tools
+
+    async def call_tool(self, name: str, arguments: dict) -> ToolCallResult:
+        started = time.perf_counter()
+        result, size = await self.request("tools/call", {"name": name, "arguments": arguments})
+        latency_ms = (time.perf_counter() - started) * 1000
+        text = "\n".join(c.get("text", "") for c in result.get("content", []) if c.get("type") == "text")
+        return ToolCallResult(name, latency_ms, bool(result.get("isError")), text, size)
+
+    async def close(self):
+        raise NotImplementedError
+
+
+class McpHttpSession(McpSession):
+    """One MCP session over streamable HTTP."""
+
+    def __init__(self, url: str, client_name: str = "mcp-load"):
+        parts = urlsplit(url)
+        self.path = parts.path or "/"
+        self.client_name = client_name
+        self.session_id: Optional[str] = None
+        self.server_info: dict = {}
+        self._conn = AsyncHttpConnection(parts.hostname or "127.0.0.1", parts.port or 80)
+        self._next_id = 0
+
+    async def _post(self, message: dict) -> tuple[Optional[dict], int]:
+        headers = {"Content-Type": "application/json", "Accept": "application/json, text/event-stream",
+                   "MCP-Protocol-Version": PROTOCOL_VERSION}
+        if self.session_id:
+            headers["Mcp-Session-Id"] = self.session_id
+        status, resp_headers, payload = await self._conn.request(
+            "POST", self.path, headers, json.dumps(message).encode())
+        if status >= 400:
+            raise McpError(f"HTTP {status}: {payload[:200].decode(errors='replace')}", status=status)
+        self.session_id = resp_headers.get("mcp-session-id", self.session_id)
+        if "id" not in message:
+            return None, len(payload)
+        response = parse_jsonrpc_payload(resp_headers.get("content-type", ""), payload, message["id"])
+        if response is None:
+            raise McpError(f"No JSON-RPC response for request {message['id']}", status=status)
+        if "error" in response:
+            raise McpError(response["error"].get("message", "JSON-RPC error"), code=response["error"].get("code"))
+        return response.get("result", {}), len(payload)
+
+    async def request(self, method: str, params: Optional[dict] = None) -> tuple[dict, int]:
+        self._next_id += 1
+        result, size = await self._post({"jsonrpc": "2.0", "id": self._next_id, "method": method,
+                                         "params": params or {}})
+        return result or {}, size
+
+    async def notify(self, method: str, params: Optional[dict] = None):
+        await self._post({"jsonrpc": "2.0", "method": method, **({"params": params} if params else {})})
+
+    async def listen(self) -> AsyncIterator[dict]:
+        """Messages the server sends on its own (notifications), from the session's GET event stream.
+
+        Opens a second connection; call after initialize(). Ends when the server closes the stream.
+        """
+        if not self.session_id:
+            raise McpError("listen() needs an initialized session")
+        host, port = self._conn.host, self._conn.port
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            lines = [f"GET {self.path} HTTP/1.1", f"Host: {host}:{port}", "Accept: text/event-stream",
+                     f"MCP-Protocol-Version: {PROTOCOL_VERSION}", f"Mcp-Session-Id: {self.session_id}"]
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode())
+            await writer.drain()
+            status, headers = await read_response_head(reader)
+            if status >= 400:
+                raise McpError(f"HTTP {status} opening the event stream", status=status)
+            chunked = headers.get("transfer-encoding", "").lower() == "chunked"
+            buffer = b""
+            async for data in read_chunks(reader) if chunked else read_until_closed(reader):
+                buffer += data
+                *events, buffer = re.split(rb"\r?\n\r?\n", buffer)
+                for event in events:
+                    text = sse_data(event.decode())
+                    if text:
+                        message = json.loads(text)
+                        if isinstance(message, dict):
+                            yield message
+        except (ConnectionError, asyncio.IncompleteReadError):
+            return
+        finally:
+            writer.close()
+
+    async def close(self):
+        await self._conn.close()
+
+
+class McpStdioSession(McpSession):
+    """One MCP session with a server subprocess over stdio (newline-delimited JSON-RPC).
+
+    Server-to-client requests (ping, roots/list) are answered so the server never blocks on
+    the client; notifications are counted and dropped. Lines that are not JSON (e.g. build
+    output from `dotnet run`) are skipped.
+    """
+
+    # Tool results arrive as one line each; large definitions and query results exceed asyncio's 64 KiB default
+    LINE_LIMIT = 256 * 1024 * 1024
+
+    def __init__(self, command: list[str], env: Optional[dict[str, str]] = None, cwd: Optional[str] = None,
+                 client_name: str = "mcp-stdio", stderr: Optional[TextIO] = None):
+        self.command = command
+        self.env = env
+        self.cwd = cwd
+        self.client_name = client_name
+        self.stderr = stderr
+        self.server_info: dict = {}
+        self.notifications = 0
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._next_id = 0
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process else None
+
+    async def start(self) -> "McpStdioSession":
+        self._process = await asyncio.create_subprocess_exec(
+            *self.command, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE,
+            stderr=self.stderr if self.stderr is not None else asyncio.subprocess.DEVNULL,
+            env=self.env, cwd=self.cwd, limit=self.LINE_LIMIT)
+        self._reader_task = asyncio.create_task(self._read_loop())
+        return self
+
+    async def _write(self, message: dict):
+        if self._process is None or self._process.stdin is None:
+            raise McpError("Server process is not running")
+        self._process.stdin.write(json.dumps(message).encode() + b"\n")
+        await self._process.stdin.drain()
+
+    async def _read_loop(self):
+        assert self._process and self._process.stdout
+        try:
+            while True:
+                line = await self._process.stdout.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(message, dict):
+                    continue
+                if "method" in message:
+                    if "id" in message:
+                        await self._answer_server_request(message)
+                    else:
+                        self.notifications += 1
+                    continue
+                future = self._pending.pop(message.get("id"), None)
+                if future and not future.done():
+                    future.set_result((message, len(line)))
+        finally:
+            code = self._process.returncode
+            reason = "Server closed stdout before responding" + (f" (exit code {code})" if code is not None else "")
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(McpError(reason))
+            self._pending.clear()
+
+    async def _answer_server_request(self, message: dict):
+        if message["method"] == "ping":
+            reply = {"jsonrpc": "2.0", "id": message["id"], "result": {}}
+        elif message["method"] == "roots/list":
+            reply = {"jsonrpc": "2.0", "id": message["id"], "result": {"roots": []}}
+        else:
+            reply = {"jsonrpc": "2.0", "id": message["id"],
+                     "error": {"code": -32601, "message": f"Client does not support {message['method']}"}}
+        await self._write(reply)
+
+    async def request(self, method: str, params: Optional[dict] = None,
+                      timeout: Optional[float] = None) -> tuple[dict, int]:
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        await self._write({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}})
+        try:
+            response, size = await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(request_id, None)
+        if "error" in response:
+            raise McpError(response["error"].get("message", "JSON-RPC error"), code=response["error"].get("code"))
+        return response.get("result") or {}, size
+
+    async def notify(self, method: str, params: Optional[dict] = None):
+        await self._write({"jsonrpc": "2.0", "method": method, **({"params": params} if params else {})})
+
+    async def close(self):
+        if self._process is None:
+            return
+        if self._process.stdin and not self._process.stdin.is_closing():
+            self._process.stdin.close()
+        try:
+            await asyncio.wait_for(self._process.wait(), 10)
+        except asyncio.TimeoutError:
+            self._process.kill()
+            await self._process.wait()
+        if self._reader_task:
+            await self._reader_task
+        self._process = None
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+MCP Server Load Generator
+
+Opens N concurrent MCP sessions against DataFactory.MCP.Http and replays a weighted
+tools/call mix taken from the expected tool calls in the `.eval.md` files. Tool weights
+are how often each tool is expected across the evals. ID arguments are swapped for IDs
+the Fabric stand-in (fabric_standin.py) actually serves, so calls reach the C# services
+instead of failing GUID validation.
+
+Reports throughput, per-tool p50/p99 latency, tool-level and server error rates, and how
+many upstream Fabric requests each tool call caused.
+
+Usage:
+    # Stand-in in-process, server launched with the matching environment:
+    python mcp_load.py --launch "dotnet run -c Release --project ../../DataFactory.MCP.Http" \\
+        --url http://127.0.0.1:5000/ --sessions 50 --duration 60
+
+    # Server already running against a separately started stand-in:
+    python mcp_load.py --url http://127.0.0.1:5000/ --standin-url http://127.0.0.1:5555
+
+    python mcp_load.py --dry-run                  # show the mix derived from the evals
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shlex
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import run_evals  # noqa: E402
+from fabric_standin import FabricStandin, add_config_arguments, config_from_args  # noqa: E402
+from mcp_client import McpError, McpHttpSession, tool_reported_error  # noqa: E402
+
+
+EVALS_DIR = Path(__file__).resolve().parent.parent
+SCHEMA_PATH = EVALS_DIR / "tools_schema.json"
+
+# Auth tools change shared server state (sign-out, device code) and are not load-relevant.
+DEFAULT_EXCLUDE = {"authenticateinteractive", "startdevicecodeauth", "checkdeviceauthstatus",
+                   "signout", "authenticateserviceprincipal"}
+
+# Arguments whose eval values are placeholders; replaced with IDs served by the stand-in.
+ID_PARAMS = {"workspaceId", "capacityId", "connectionId", "gatewayId", "dataflowId", "pipelineId"}
+WORKSPACE_SCOPED = {"dataflowId", "pipelineId"}
+
+
+def normalize_tool_name(name: str) -> str:
+    """ListWorkspacesAsync, list_workspaces and list_workspaces_async all map to "listworkspaces"."""
+    key = name.replace("_", "").lower()
+    return key[:-5] if key.endswith("async") else key
+
+
+@dataclass
+class MixEntry:
+    tool: str
+    input_schema: dict
+    weight: int = 0
+    templates: list[dict[str, str]] = field(default_factory=list)
+
+
+def build_mix(scenarios: list[run_evals.EvalScenario], tools: list[dict],
+              include: Optional[set[str]] = None, exclude: Optional[set[str]] = None) -> list[MixEntry]:
+    """Weight each live tool by how often the evals expect it, keeping the expected arguments."""
+    by_key = {normalize_tool_name(t["name"]): t for t in tools}
+    mix: dict[str, MixEntry] = {}
+    for scenario in scenarios:
+        for expected in scenario.expected_tools:
+            key = normalize_tool_name(expected.tool_name)
+            if key not in by_key or (include and key not in include) or (exclude and key in exclude):
+                continue
+            tool = by_key[key]
+            entry = mix.setdefault(key, MixEntry(tool["name"], tool.get("inputSchema", {})))
+            entry.weight += 1
+            entry.templates.append(expected.parameters)
+    return sorted(mix.values(), key=lambda e: -e.weight)
+
+
+def fill_arguments(entry: MixEntry, template: dict[str, str], inventory: dict[str, list[str]],
+                   rng: random.Random) -> dict:
+    """Turn eval expectations into concrete arguments the stand-in can serve."""
+    props = entry.input_schema.get("properties", {})
+    required = entry.input_schema.get("required", [])
+    args: dict = {}
+    for name in list(template) + [r for r in required if r not in template]:
+        if name not in props:
+            continue
+        value = template.get(name, "")
+        if name in ID_PARAMS and inventory.get(name):
+            args[name] = rng.choice(inventory[name])
+        elif not value or value.lower().startswith("any "):
+            if name in required:
+                args[name] = f"load-{name}"
+            continue
+        else:
+            kind = props[name].get("type")
+            if kind == "boolean":
+                args[name] = value.lower() == "true"
+            elif kind == "integer":
+                args[name] = int(value) if value.isdigit() else 1
+            else:
+                args[name] = value
+    # Dataflows and pipelines in the inventory belong to the first workspace
+    if WORKSPACE_SCOPED & args.keys() and inventory.get("workspaceId"):
+        args["workspaceId"] = inventory["workspaceId"][0]
+    return args
+
+
+def schema_tools(path: Path = SCHEMA_PATH) -> list[dict]:
+    """tools_schema.json in tools/list shape (used for --dry-run)."""
+    return [{"name": t["function"]["name"], "inputSchema": t["function"].get("parameters", {})}
+            for t in json.loads(path.read_text())["tools"]]
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))]
+
+
+def process_rss_mb(pid: int) -> Optional[float]:
+    """Resident set size of a process from /proc (None where unavailable)."""
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.tool_errors: dict[str, int] = defaultdict(int)
+        self.server_errors: dict[str, int] = defaultdict(int)
+        self.bytes: dict[str, int] = defaultdict(int)
+        self.session_init_ms: list[float] = []
+        self.error_samples: dict[str, str] = {}
+
+    def ok(self, tool: str, latency_ms: float, size: int, tool_error: bool, text: str):
+        self.latencies[tool].append(latency_ms)
+        self.bytes[tool] += size
+        if tool_error:
+            self.tool_errors[tool] += 1
+            self.error_samples.setdefault(tool, text[:200])
+
+    def failed(self, tool: str, error: Exception):
+        self.server_errors[tool] += 1
+        self.error_samples.setdefault(tool, str(error)[:200])
+
+    def summary(self, elapsed_s: float) -> dict:
+        tools = sorted(set(self.latencies) | set(self.server_errors),
+                       key=lambda t: -(len(self.latencies[t]) + self.server_errors[t]))
+        rows = []
+        for tool in tools:
+            lat = self.latencies[tool]
+            total = len(lat) + self.server_errors[tool]
+            rows.append({
+                "tool": tool,
+                "calls": total,
+                "rps": round(total / elapsed_s, 2) if elapsed_s else 0.0,
+                "p50_ms": round(percentile(lat, 50), 1),
+                "p99_ms": round(percentile(lat, 99), 1),
+                "max_ms": round(max(lat), 1) if lat else 0.0,
+                "tool_error_rate": round(self.tool_errors[tool] / total, 4) if total else 0.0,
+                "server_error_rate": round(self.server_errors[tool] / total, 4) if total else 0.0,
+                "mean_response_kb": round(self.bytes[tool] / len(lat) / 1024, 2) if lat else 0.0,
+            })
+        all_lat = [v for lat in self.latencies.values() for v in lat]
+        total_calls = len(all_lat) + sum(self.server_errors.values())
+        return {
+            "elapsed_s": round(elapsed_s, 2),
+            "calls": total_calls,
+            "throughput_rps": round(total_calls / elapsed_s, 2) if elapsed_s else 0.0,
+            "p50_ms": round(percentile(all_lat, 50), 1),
+            "p99_ms": round(percentile(all_lat, 99), 1),
+            "tool_error_rate": round(sum(self.tool_errors.values()) / total_calls, 4) if total_calls else 0.0,
+            "server_error_rate": round(sum(self.server_errors.values()) / total_calls, 4) if total_calls else 0.0,
+            "session_init_p50_ms": round(percentile(self.session_init_ms, 50), 1),
+            "tools": rows,
+            "error_samples": self.error_samples,
+        }
+
+
+async def run_session(url: str, mix: list[MixEntry], inventory: dict[str, list[str]], recorder: Recorder,
+                      deadline: float, max_calls: Optional[int], warmup_calls: int, think_ms: float,
+                      rng: random.Random):
+    session = McpHttpSession(url)
+    try:
+        started = time.perf_counter()
+        try:
+            await session.initialize()
+        except (McpError, OSError) as e:
+            recorder.failed("initialize", e)
+            return
+        recorder.session_init_ms.append((time.perf_counter() - started) * 1000)
+
+        weights = [e.weight for e in mix]
+        calls = 0
+        while time.perf_counter() < deadline and (max_calls is None or calls < max_calls + warmup_calls):
+            entry = rng.choices(mix, weights)[0]
+            args = fill_arguments(entry, rng.choice(entry.templates), inventory, rng)
+            try:
+                result = await session.call_tool(entry.tool, args)
+                if calls >= warmup_calls:
+                    recorder.ok(entry.tool, result.latency_ms, result.response_bytes,
+                                tool_reported_error(result), result.text)
+            except (McpError, OSError, asyncio.IncompleteReadError) as e:
+                if calls >= warmup_calls:
+                    recorder.failed(entry.tool, e)
+            calls += 1
+            if think_ms:
+                await asyncio.sleep(rng.uniform(0, 2 * think_ms) / 1000)
+    finally:
+        await session.close()
+
+
+async def run_load(url: str, mix: list[MixEntry], inventory: dict[str, list[str]], sessions: int,
+                   duration_s: float, max_calls: Optional[int], warmup_calls: int, think_ms: float,
+                   ramp_s: float, seed: int) -> dict:
+    recorder = Recorder()
+    started = time.perf_counter()
+    deadline = started + duration_s
+
+    async def delayed(i: int):
+        if ramp_s and sessions > 1:
+            await asyncio.sleep(ramp_s * i / sessions)
+        await run_session(url, mix, inventory, recorder, deadline, max_calls, warmup_calls, think_ms,
+                          random.Random(seed + i))
+
+    await asyncio.gather(*(delayed(i) for i in range(sessions)))
+    return recorder.summary(time.perf_counter() - started)
+
+
+async def fetch_live_tools(url: str) -> list[dict]:
+    session = McpHttpSession(url, client_name="mcp-load-probe")
+    try:
+        await session.initialize()
+        return await session.list_tools()
+    finally:
+        await session.close()
+
+
+def wait_for_server(url: str, timeout_s: float, process: Optional[subprocess.Popen] = None):
+    """Poll the server's /health endpoint until it answers."""
+    parts = urlsplit(url)
+    health = f"{parts.scheme}://{parts.netloc}/health"
+    deadline = time.time() + timeout_s
+    while time.time() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode} before becoming ready")
+        try:
+            urllib.request.urlopen(health, timeout=2).read()
+            return
+        except OSError:
+            time.sleep(0.5)
+    raise TimeoutError(f"Server at {url} not ready after {timeout_s}s")
+
+
+def print_summary(summary: dict, standin_stats: Optional[dict]):
+    print(f"\n{'=' * 96}")
+    print(f"  {summary['calls']} calls in {summary['elapsed_s']}s — {summary['throughput_rps']} calls/s  "
+          f"p50 {summary['p50_ms']} ms  p99 {summary['p99_ms']} ms  "
+          f"session init p50 {summary['session_init_p50_ms']} ms")
+    print(f"  tool errors {summary['tool_error_rate']:.2%}   server errors {summary['server_error_rate']:.2%}")
+    print(f"{'=' * 96}")
+    print(f"  {'tool':<40} {'calls':>6} {'rps':>7} {'p50':>8} {'p99':>8} {'max':>8} "
+          f"{'tool err':>8} {'srv err':>8} {'KB':>6}")
+    for row in summary["tools"]:
+        print(f"  {row['tool']:<40} {row['calls']:>6} {row['rps']:>7} {row['p50_ms']:>8} {row['p99_ms']:>8} "
+              f"{row['max_ms']:>8} {row['tool_error_rate']:>8.1%} {row['server_error_rate']:>8.1%} "
+              f"{row['mean_response_kb']:>6}")
+    if summary["error_samples"]:
+        print("\n  First error per tool:")
+        for tool, sample in summary["error_samples"].items():
+            print(f"    {tool}: {sample}")
+    if standin_stats:
+        upstream = sum(s["count"] for s in standin_stats.values())
+        print(f"\n  Upstream Fabric requests: {upstream} "
+              f"({upstream / max(summary['calls'], 1):.2f} per tool call)")
+        for route, s in standin_stats.items():
+            print(f"    {route:<28} {s['count']:>7}  errors {s['errors']:>5}  mean {s['mean_ms']} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test DataFactory.MCP.Http with eval-derived tool mixes")
+    parser.add_argument("--url", default="http://127.0.0.1:5000/", help="MCP endpoint of the HTTP server")
+    parser.add_argument("--sessions", type=int, default=10, help="Concurrent MCP sessions")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run")
+    parser.add_argument("--calls-per-session", type=int, help="Stop each session after this many calls")
+    parser.add_argument("--warmup-calls", type=int, default=2, help="Unrecorded calls per session")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="Mean pause between a session's calls")
+    parser.add_argument("--ramp", type=float, default=0.0, help="Seconds over which sessions start")
+    parser.add_argument("--eval", action="append", help="Specific .eval.md file(s) to take the mix from")
+    parser.add_argument("--include", help="Comma-separated tools to keep (any naming style)")
+    parser.add_argument("--exclude", help="Comma-separated tools to drop (default: auth tools)")
+    parser.add_argument("--standin-url", help="Use an already running stand-in instead of starting one")
+    parser.add_argument("--launch", help="Command that starts the MCP HTTP server (gets stand-in env)")
+    parser.add_argument("--startup-timeout", type=float, default=120.0)
+    parser.add_argument("--dry-run", action="store_true", help="Print the tool mix and exit")
+    parser.add_argument("--json", help="Write the summary to this file")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    files = [Path(f) for f in args.eval] if args.eval else sorted(EVALS_DIR.glob("*.eval.md"))
+    scenarios = [s for f in files for s in run_evals.parse_eval_file(f)]
+    include = {normalize_tool_name(t) for t in args.include.split(",")} if args.include else None
+    exclude = {normalize_tool_name(t) for t in args.exclude.split(",")} if args.exclude else DEFAULT_EXCLUDE
+
+    if args.dry_run:
+        mix = build_mix(scenarios, schema_tools(), include, exclude)
+        total = sum(e.weight for e in mix)
+        print(f"Tool mix from {len(scenarios)} scenarios in {len(files)} file(s):")
+        for e in mix:
+            print(f"  {e.tool:<40} {e.weight:>4}  ({e.weight / total:.1%})")
+        return
+
+    standin = None
+    if args.standin_url:
+        standin_url = args.standin_url.rstrip("/")
+    else:
+        standin = FabricStandin(config_from_args(args)).start()
+        standin_url = standin.base_url
+        print(f"Fabric stand-in: {standin_url}")
+    inventory = json.loads(urllib.request.urlopen(f"{standin_url}/_standin/inventory").read())
+
+    server = None
+    try:
+        if args.launch:
+            env = {**os.environ, **(standin.server_env if standin else {})}
+            server = subprocess.Popen(shlex.split(args.launch), env=env,
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        elif standin:
+            print("Start the server with:")
+            for key, value in standin.server_env.items():
+                print(f"  {key}={value}")
+        wait_for_server(args.url, args.startup_timeout if server else 5.0, server)
+
+        tools = asyncio.run(fetch_live_tools(args.url))
+        mix = build_mix(scenarios, tools, include, exclude)
+        if not mix:
+            sys.exit("No eval-expected tools are exposed by the server")
+        print(f"Replaying {len(mix)} tools ({sum(e.weight for e in mix)} weighted calls) "
+              f"over {args.sessions} sessions for {args.duration}s")
+        urllib.request.urlopen(f"{standin_url}/_standin/reset").read()
+
+        rss_before = process_rss_mb(server.pid) if server else None
+        summary = asyncio.run(run_load(args.url, mix, inventory, args.sessions, args.duration,
+                                       args.calls_per_session, args.warmup_calls, args.think_ms,
+                                       args.ramp, args.seed))
+        if server:
+            summary["server_rss_mb"] = {"before": rss_before, "after": process_rss_mb(server.pid)}
+        standin_stats = json.loads(urllib.request.urlopen(f"{standin_url}/_standin/stats").read())
+        summary["upstream"] = standin_stats
+        print_summary(summary, standin_stats)
+        if summary.get("server_rss_mb"):
+            print(f"\n  Server RSS: {summary['server_rss_mb']['before']} → {summary['server_rss_mb']['after']} MB")
+    finally:
+        if server:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+        if standin:
+            standin.stop()
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(summary, indent=2))
+        print(f"\nSummary saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
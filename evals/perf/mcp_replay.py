@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+MCP Traffic Replay
+
+Replays captured JSON-RPC traffic against a local server backed by the Fabric stand-in and
+compares latency between two builds. Captures come from the HTTP server (MCP_CAPTURE_PATH,
+McpTrafficCapture.cs) or from mcp_capture.py in front of the stdio server; both write one
+JSON line per client message:
+
+    {"t": 1.25, "transport": "http", "session": "...", "method": "tools/call", "id": 3,
+     "params": {...}, "latency_ms": 84.1, "status": 200, "request_bytes": 120, "response_bytes": 2048}
+
+Every captured session gets its own MCP session, opened and initialized before the clock
+starts. Requests keep their captured offsets divided by --speed, and each session sends its
+requests in captured order, so overlap between sessions is preserved while a session never
+has more than one request in flight (as in the capture). When the server falls behind, a
+request goes out as soon as the previous one in its session returns; the delay is reported
+as schedule slip. Several capture files are overlaid, each starting at t=0.
+
+ID arguments (workspaceId, dataflowId, ...) are mapped to IDs the stand-in serves, the same
+captured ID always to the same stand-in ID. initialize and notifications are not replayed.
+
+Usage:
+    python mcp_replay.py capture.jsonl --launch "dotnet run -c Release --project ../../DataFactory.MCP.Http" \\
+        --url http://127.0.0.1:5000/ --speed 1,10,100
+    python mcp_replay.py capture.jsonl --transport stdio --launch "dotnet /tmp/after/DataFactory.MCP.dll" \\
+        --baseline-launch "dotnet /tmp/before/DataFactory.MCP.dll" --speed 10 --fail-on-regression
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shlex
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from fabric_standin import FabricStandin, add_config_arguments, config_from_args
+from mcp_client import McpError, McpHttpSession, McpSession, McpStdioSession, ToolCallResult, tool_reported_error
+from mcp_load import ID_PARAMS, WORKSPACE_SCOPED, percentile, wait_for_server
+
+
+SKIPPED_METHODS = {"initialize", "ping"}
+
+
+@dataclass
+class CapturedRequest:
+    t: float
+    method: str
+    params: dict
+    captured_latency_ms: Optional[float]
+
+    @property
+    def key(self) -> str:
+        """Tool name for tools/call, the method otherwise."""
+        if self.method == "tools/call":
+            return self.params.get("name", "tools/call")
+        return self.method
+
+
+@dataclass
+class CapturedSession:
+    name: str
+    requests: list[CapturedRequest] = field(default_factory=list)
+
+
+def load_captures(paths: list[Path]) -> list[CapturedSession]:
+    """Replayable requests grouped by session; each file's offsets start at 0."""
+    sessions: dict[str, CapturedSession] = {}
+    for index, path in enumerate(paths):
+        records = []
+        for number, line in enumerate(path.read_text().splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError as ex:
+                raise ValueError(f"{path}:{number}: {ex}") from ex
+        requests = [r for r in records if r.get("id") is not None and r.get("method") not in SKIPPED_METHODS]
+        start = min((r["t"] for r in records), default=0.0)
+        for r in requests:
+            name = f"{index}:{r.get('session') or 'default'}"
+            session = sessions.setdefault(name, CapturedSession(name))
+            session.requests.append(CapturedRequest(r["t"] - start, r["method"], r.get("params") or {},
+                                                    r.get("latency_ms")))
+    for session in sessions.values():
+        session.requests.sort(key=lambda r: r.t)
+    return [s for s in sessions.values() if s.requests]
+
+
+class IdMapper:
+    """Maps captured IDs to stand-in IDs, first come first served and stable for the whole run."""
+
+    def __init__(self, inventory: dict[str, list[str]]):
+        self.inventory = inventory
+        self._mapped: dict[tuple[str, str], str] = {}
+
+    def _map(self, name: str, value: str) -> str:
+        choices = self.inventory.get(name)
+        if not choices:
+            return value
+        key = (name, value)
+        if key not in self._mapped:
+            used = sum(1 for n, _ in self._mapped if n == name)
+            self._mapped[key] = choices[used % len(choices)]
+        return self._mapped[key]
+
+    def params(self, method: str, params: dict) -> dict:
+        if method != "tools/call" or not isinstance(params.get("arguments"), dict):
+            return params
+        arguments = {name: self._map(name, value) if name in ID_PARAMS and isinstance(value, str) else value
+                     for name, value in params["arguments"].items()}
+        # The stand-in serves its sample dataflows and pipelines from the first workspace
+        if WORKSPACE_SCOPED & arguments.keys() and self.inventory.get("workspaceId"):
+            arguments["workspaceId"] = self.inventory["workspaceId"][0]
+        return {**params, "arguments": arguments}
+
+
+@dataclass
+class ReplayedCall:
+    key: str
+    latency_ms: float
+    captured_latency_ms: Optional[float]
+    slip_ms: float
+    response_bytes: int
+    error: bool
+
+
+def is_error_result(method: str, result: dict, size: int) -> bool:
+    if method != "tools/call":
+        return False
+    text = "\n".join(c.get("text", "") for c in result.get("content", []) if c.get("type") == "text")
+    return tool_reported_error(ToolCallResult(method, 0.0, bool(result.get("isError")), text, size))
+
+
+async def replay_session(session: McpSession, captured: CapturedSession, ids: IdMapper, speed: float,
+                         start: float, timeout: float) -> list[ReplayedCall]:
+    calls = []
+    for request in captured.requests:
+        due = start + request.t / speed
+        delay = due - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        sent = time.perf_counter()
+        params = ids.params(request.method, request.params)
+        try:
+            result, size = await asyncio.wait_for(session.request(request.method, params), timeout)
+            error = is_error_result(request.method, result, size)
+        except (McpError, ConnectionError, asyncio.TimeoutError):
+            size, error = 0, True
+        calls.append(ReplayedCall(request.key, (time.perf_counter() - sent) * 1000, request.captured_latency_ms,
+                                  max(0.0, (sent - due) * 1000), size, error))
+    return calls
+
+
+async def replay(sessions: list[CapturedSession], open_session, ids: IdMapper, speed: float,
+                 timeout: float) -> tuple[list[ReplayedCall], float]:
+    """Open every session, then replay them concurrently on one clock; returns calls and wall time."""
+    clients: list[McpSession] = []
+    try:
+        for _ in sessions:
+            clients.append(await open_session())
+        start = time.perf_counter()
+        per_session = await asyncio.gather(*(replay_session(client, captured, ids, speed, start, timeout)
+                                             for client, captured in zip(clients, sessions)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await asyncio.gather(*(client.close() for client in clients), return_exceptions=True)
+    return [call for calls in per_session for call in calls], elapsed
+
+
+def summarize(build: str, speed: float, calls: list[ReplayedCall], elapsed: float) -> list[dict]:
+    groups: dict[str, list[ReplayedCall]] = {"(all)": calls}
+    for call in calls:
+        groups.setdefault(call.key, []).append(call)
+
+    rows = []
+    for key, group in sorted(groups.items()):
+        latencies = [c.latency_ms for c in group]
+        captured = [c.captured_latency_ms for c in group if c.captured_latency_ms is not None]
+        slips = [c.slip_ms for c in group]
+        rows.append({
+            "build": build, "speed": speed, "key": key, "calls": len(group),
+            "errors": sum(c.error for c in group),
+            "p50_ms": round(percentile(latencies, 50), 1),
+            "p90_ms": round(percentile(latencies, 90), 1),
+            "p99_ms": round(percentile(latencies, 99), 1),
+            "max_ms": round(max(latencies), 1) if latencies else 0.0,
+            "captured_p50_ms": round(percentile(captured, 50), 1) if captured else None,
+            "captured_p99_ms": round(percentile(captured, 99), 1) if captured else None,
+            "slip_p99_ms": round(percentile(slips, 99), 1),
+            "response_kb": round(sum(c.response_bytes for c in group) / 1024, 1),
+            "elapsed_s": round(elapsed, 2),
+        })
+    return rows
+
+
+def session_factory(transport: str, launch: Optional[str], url: str, env: dict[str, str]):
+    if transport == "http":
+        async def open_http() -> McpSession:
+            session = McpHttpSession(url, client_name="mcp-replay")
+            await session.initialize()
+            return session
+        return open_http
+
+    async def open_stdio() -> McpSession:
+        # stdio servers serve a single client, so every captured session gets its own process
+        session = McpStdioSession(shlex.split(launch), env=env, client_name="mcp-replay")
+        await session.start()
+        try:
+            await session.initialize()
+        except BaseException:
+            await session.close()
+            raise
+        return session
+    return open_stdio
+
+
+def run_build(label: str, launch: Optional[str], args: argparse.Namespace, sessions: list[CapturedSession],
+              speeds: list[float], standin: FabricStandin) -> list[dict]:
+    env = {**os.environ, **standin.server_env}
+    server = None
+    if args.transport == "http" and launch:
+        server = subprocess.Popen(shlex.split(launch), env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    rows = []
+    try:
+        if args.transport == "http":
+            wait_for_server(args.url, args.startup_timeout if server else 5.0, server)
+        ids = IdMapper(standin.inventory.sample())
+        open_session = session_factory(args.transport, launch, args.url, env)
+        for speed in speeds:
+            calls, elapsed = asyncio.run(replay(sessions, open_session, ids, speed, args.timeout))
+            summary = summarize(label, speed, calls, elapsed)
+            rows += summary
+            print_rows(summary)
+    finally:
+        if server:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+    return rows
+
+
+def print_header():
+    print(f"\n  {'build':<9} {'speed':>5} {'tool / method':<40} {'calls':>6} {'err':>4} {'p50':>8} {'p90':>8} "
+          f"{'p99':>8} {'max':>8} {'capt p50':>9} {'slip p99':>9}")
+
+
+def print_rows(rows: list[dict]):
+    fmt = lambda v: "—" if v is None else str(v)  # noqa: E731
+    for r in rows:
+        print(f"  {r['build']:<9} {r['speed']:>4g}× {r['key'][:40]:<40} {r['calls']:>6} {r['errors']:>4} "
+              f"{r['p50_ms']:>8} {r['p90_ms']:>8} {r['p99_ms']:>8} {r['max_ms']:>8} "
+              f"{fmt(r['captured_p50_ms']):>9} {r['slip_p99_ms']:>9}")
+
+
+def compare(rows: list[dict], threshold: float, min_delta_ms: float) -> list[str]:
+    """Print current vs baseline per speed and key; returns the regressions above the threshold."""
+    baseline = {(r["speed"], r["key"]): r for r in rows if r["build"] == "baseline"}
+    if not baseline:
+        return []
+    delta = lambda old, new: (new - old) / old if old else 0.0  # noqa: E731
+    regressions = []
+    print(f"\n  current vs baseline (regression = p50 or p90 more than {threshold:.0%} and {min_delta_ms:g} ms slower):")
+    print(f"    {'speed':>5} {'tool / method':<40} {'p50 Δ':>8} {'p90 Δ':>8} {'p99 Δ':>8} {'errors':>9}")
+    for r in rows:
+        base = baseline.get((r["speed"], r["key"]))
+        if r["build"] != "current" or not base:
+            continue
+        d50, d90, d99 = (delta(base[k], r[k]) for k in ("p50_ms", "p90_ms", "p99_ms"))
+        # Sub-millisecond methods swing by large percentages on noise alone
+        regressed = any(delta(base[k], r[k]) > threshold and r[k] - base[k] > min_delta_ms
+                        for k in ("p50_ms", "p90_ms"))
+        marker = "  ⚠️" if regressed else ""
+        print(f"    {r['speed']:>4g}× {r['key'][:40]:<40} {d50:>+8.0%} {d90:>+8.0%} {d99:>+8.0%} "
+              f"{base['errors']:>4} → {r['errors']:<3}{marker}")
+        if regressed:
+            regressions.append(f"{r['key']} at {r['speed']:g}×: p50 {base['p50_ms']} → {r['p50_ms']} ms, "
+                               f"p90 {base['p90_ms']} → {r['p90_ms']} ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay captured MCP traffic and compare latency between builds")
+    parser.add_argument("captures", nargs="+", type=Path, help="Capture files (JSON lines)")
+    parser.add_argument("--transport", choices=("http", "stdio"), default="http")
+    parser.add_argument("--url", default="http://127.0.0.1:5000/", help="MCP endpoint of the HTTP server")
+    parser.add_argument("--launch", help="Command that starts the server under test (required for stdio)")
+    parser.add_argument("--baseline-launch", help="Command that starts a baseline build (e.g. an earlier commit)")
+    parser.add_argument("--speed", default="1", help="Comma-separated speed-ups, e.g. 1,10,100")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-request timeout in seconds")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Relative p50/p90 slowdown counted as a regression")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0,
+                        help="Slowdowns smaller than this are never counted as regressions")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit 1 when a regression is found")
+    parser.add_argument("--standin-port", type=int, default=0, help="Port for the stand-in (0 = any)")
+    parser.add_argument("--startup-timeout", type=float, default=120.0)
+    parser.add_argument("--json", help="Write per-build results to this file")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    speeds = [float(s) for s in args.speed.split(",") if s.strip()]
+    if not speeds or any(s <= 0 for s in speeds):
+        parser.error("--speed takes positive numbers")
+    if args.baseline_launch and not args.launch:
+        parser.error("--baseline-launch needs --launch for the build under test")
+    if args.transport == "stdio" and not args.launch:
+        parser.error("--transport stdio needs --launch to start the server")
+
+    sessions = load_captures(args.captures)
+    if not sessions:
+        parser.error("No replayable requests in the capture files")
+    requests = sum(len(s.requests) for s in sessions)
+    span = max(r.t for s in sessions for r in s.requests)
+    print(f"{requests} requests in {len(sessions)} sessions over {span:.1f}s "
+          f"({len({r.key for s in sessions for r in s.requests})} tools / methods)")
+
+    rows = []
+    with FabricStandin(config_from_args(args), port=args.standin_port) as standin:
+        print(f"Fabric stand-in: {standin.base_url}")
+        if not args.launch:
+            print("Server must be started with:")
+            for key, value in standin.server_env.items():
+                print(f"  {key}={value}")
+        print_header()
+        builds = ([("baseline", args.baseline_launch)] if args.baseline_launch else []) + [("current", args.launch)]
+        for label, launch in builds:
+            rows += run_build(label, launch, args, sessions, speeds, standin)
+
+    regressions = compare(rows, args.threshold, args.min_delta_ms)
+    if args.json:
+        Path(args.json).write_text(json.dumps({"captures": [str(p) for p in args.captures], "speeds": speeds,
+                                               "sessions": len(sessions), "requests": requests,
+                                               "results": rows, "regressions": regressions}, indent=2))
+        print(f"\nResults saved to {args.json}")
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        if args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Background Refresh Polling Simulator
+
+Discrete-event model of BackgroundJobMonitor watching many concurrent dataflow refreshes
+(RefreshDataflowBackground), comparing the old fixed 3 s poll of every job through
+Task.WhenAll with the adaptive schedule in JobPollSchedule.cs (per-job delay from age and
+learned duration, at most 8 status requests in flight). Time is virtual, so hours of
+refreshes simulate in well under a second.
+
+Each dataflow is refreshed --runs times back to back; its refreshes are either short or
+long (--long-fraction) with per-run jitter. Reported per policy: status requests (total,
+per job, peak per second and per minute) and completion-notification lag (time from the
+refresh finishing in Fabric to the monitor enqueuing its notification), overall and for
+short and long refreshes.
+
+Usage:
+    python refresh_simulator.py --dataflows 60 --runs 3 --long-fraction 0.3
+    python refresh_simulator.py --dataflows 200 --status-latency-ms 400 --json refresh-sim.json
+"""
+
+import argparse
+import bisect
+import json
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from mcp_load import percentile
+
+
+@dataclass
+class Workload:
+    dataflows: int = 60
+    runs: int = 3
+    short_seconds: float = 20.0
+    long_seconds: float = 900.0
+    long_fraction: float = 0.3
+    jitter: float = 0.2
+    arrival_window: float = 30.0
+    gap_seconds: float = 5.0
+    seed: int = 0
+
+
+# --- policies --------------------------------------------------------------------------
+
+class FixedPolicy:
+    """Previous monitor: every active job checked each 3 s tick, all at once."""
+
+    name = "fixed-3s"
+    tick = 3.0
+    max_concurrency: Optional[int] = None
+
+    def first_check(self, registered: float, expected: Optional[float]) -> float:
+        return registered
+
+    def next_check(self, checked: float, age: float, expected: Optional[float]) -> float:
+        return checked
+
+    def is_due(self, next_check: float, now: float) -> bool:
+        return next_check <= now
+
+
+class AdaptivePolicy:
+    """Mirror of JobPollSchedule.cs / BackgroundJobMonitor; keep the constants in sync."""
+
+    name = "adaptive"
+    tick = 1.0
+    min_interval = 1.0
+    max_interval = 3.0
+    due_slack = 0.1
+    max_concurrency: Optional[int] = 8
+
+    def next_delay(self, age: float, expected: Optional[float]) -> float:
+        if expected is None:
+            delay = age / 10
+        elif age < expected:
+            delay = (expected - age) / 4
+        else:
+            delay = (age - expected) / 10
+        return min(max(delay, self.min_interval), self.max_interval)
+
+    def first_check(self, registered: float, expected: Optional[float]) -> float:
+        return registered + self.next_delay(0.0, expected)
+
+    def next_check(self, checked: float, age: float, expected: Optional[float]) -> float:
+        return checked + self.next_delay(age, expected)
+
+    def is_due(self, next_check: float, now: float) -> bool:
+        return next_check <= now + self.due_slack
+
+    @staticmethod
+    def update_expected(current: Optional[float], observed: float) -> float:
+        return observed if current is None else current * 0.7 + observed * 0.3
+
+
+POLICIES = {"fixed": FixedPolicy, "adaptive": AdaptivePolicy}
+
+
+# --- simulation ------------------------------------------------------------------------
+
+@dataclass
+class Job:
+    dataflow: int
+    run: int
+    registered: float
+    ends: float
+    long: bool
+    expected: Optional[float]
+    next_check: float
+    checks: int = 0
+
+
+@dataclass
+class SimResult:
+    policy: str
+    jobs: int = 0
+    requests: list[float] = field(default_factory=list)
+    lags: list[tuple[bool, float]] = field(default_factory=list)
+    skipped_ticks: int = 0
+    span_s: float = 0.0
+
+    def summary(self) -> dict:
+        per_second = Counter(int(t) for t in self.requests)
+        per_minute = Counter(int(t // 60) for t in self.requests)
+        all_lags = [lag for _, lag in self.lags]
+        short = [lag for is_long, lag in self.lags if not is_long]
+        long = [lag for is_long, lag in self.lags if is_long]
+
+        def lag_stats(values):
+            return {"p50": round(percentile(values, 50), 2), "p95": round(percentile(values, 95), 2),
+                    "max": round(max(values), 2) if values else 0.0,
+                    "mean": round(sum(values) / len(values), 2) if values else 0.0}
+
+        return {
+            "policy": self.policy,
+            "jobs": self.jobs,
+            "status_requests": len(self.requests),
+            "requests_per_job": round(len(self.requests) / self.jobs, 1) if self.jobs else 0.0,
+            "peak_requests_per_s": max(per_second.values(), default=0),
+            "peak_requests_per_min": max(per_minute.values(), default=0),
+            "skipped_ticks": self.skipped_ticks,
+            "span_min": round(self.span_s / 60, 1),
+            "lag_s": lag_stats(all_lags),
+            "lag_short_s": lag_stats(short),
+            "lag_long_s": lag_stats(long),
+        }
+
+
+def dataflow_profiles(workload: Workload) -> list[tuple[float, bool, float]]:
+    """(base duration, is long, first arrival) per dataflow; identical for every policy."""
+    rng = random.Random(workload.seed)
+    profiles = []
+    for _ in range(workload.dataflows):
+        is_long = rng.random() < workload.long_fraction
+        base = (workload.long_seconds if is_long else workload.short_seconds) * rng.uniform(0.5, 1.5)
+        profiles.append((base, is_long, rng.uniform(0, workload.arrival_window)))
+    return profiles
+
+
+def simulate(policy, workload: Workload, status_latency_s: float) -> SimResult:
+    profiles = dataflow_profiles(workload)
+    rng = random.Random(workload.seed + 1)
+    durations = {(d, r): base * rng.uniform(1 - workload.jitter, 1 + workload.jitter)
+                 for d, (base, _, _) in enumerate(profiles) for r in range(workload.runs)}
+
+    starts = sorted((arrival, d, 0) for d, (_, _, arrival) in enumerate(profiles))
+    expected: dict[int, float] = {}
+    active: list[Job] = []
+    result = SimResult(policy.name)
+    next_tick = float("inf")
+    busy_until = 0.0
+    last_event = 0.0
+
+    while starts or active:
+        if starts and starts[0][0] <= next_tick:
+            registered, d, run = starts.pop(0)
+            job = Job(d, run, registered, registered + durations[(d, run)], profiles[d][1],
+                      expected.get(d), 0.0)
+            job.next_check = policy.first_check(registered, job.expected)
+            active.append(job)
+            result.jobs += 1
+            if next_tick == float("inf"):
+                next_tick = registered + policy.tick  # timer restarts with the first job
+            continue
+
+        now = next_tick
+        if now < busy_until:
+            # The previous poll is still running; the monitor's poll lock skips this tick
+            result.skipped_ticks += 1
+            next_tick += policy.tick
+            continue
+
+        due = sorted((j for j in active if policy.is_due(j.next_check, now)), key=lambda j: j.next_check)
+        cap = policy.max_concurrency or max(len(due), 1)
+        for i, job in enumerate(due):
+            sent = now + (i // cap) * status_latency_s
+            answered = sent + status_latency_s
+            result.requests.append(sent)
+            job.checks += 1
+            if sent + status_latency_s / 2 >= job.ends:  # Fabric answers mid-request
+                active.remove(job)
+                result.lags.append((job.long, answered - job.ends))
+                last_event = max(last_event, answered)
+                if isinstance(policy, AdaptivePolicy):
+                    expected[job.dataflow] = policy.update_expected(expected.get(job.dataflow), job.ends - job.registered)
+                if job.run + 1 < workload.runs:
+                    bisect.insort(starts, (answered + workload.gap_seconds, job.dataflow, job.run + 1))
+            else:
+                job.next_check = policy.next_check(now, now - job.registered, job.expected)
+
+        waves = -(-len(due) // cap) if due else 0
+        busy_until = now + waves * status_latency_s
+        next_tick = now + policy.tick if active else float("inf")
+
+    result.span_s = last_event
+    return result
+
+
+def print_comparison(rows: list[dict]):
+    print(f"\n  {'policy':<10} {'jobs':>5} {'requests':>9} {'req/job':>8} {'peak/s':>7} {'peak/min':>9} "
+          f"{'lag p50':>8} {'lag p95':>8} {'lag max':>8} {'short p95':>10} {'long p95':>9}")
+    for r in rows:
+        print(f"  {r['policy']:<10} {r['jobs']:>5} {r['status_requests']:>9} {r['requests_per_job']:>8} "
+              f"{r['peak_requests_per_s']:>7} {r['peak_requests_per_min']:>9} {r['lag_s']['p50']:>8} "
+              f"{r['lag_s']['p95']:>8} {r['lag_s']['max']:>8} {r['lag_short_s']['p95']:>10} "
+              f"{r['lag_long_s']['p95']:>9}")
+    if len(rows) == 2 and rows[0]["status_requests"]:
+        base, new = rows
+        saved = 1 - new["status_requests"] / base["status_requests"]
+        print(f"\n  {new['policy']} vs {base['policy']}: {abs(saved):.0%} {'fewer' if saved >= 0 else 'more'} status requests, "
+              f"lag p95 {base['lag_s']['p95']}s → {new['lag_s']['p95']}s, "
+              f"short-refresh lag p95 {base['lag_short_s']['p95']}s → {new['lag_short_s']['p95']}s")
+
+
+def main():
+    defaults = Workload()
+    parser = argparse.ArgumentParser(description="Simulate BackgroundJobMonitor polling of concurrent refreshes")
+    parser.add_argument("--dataflows", type=int, default=defaults.dataflows)
+    parser.add_argument("--runs", type=int, default=defaults.runs, help="Back-to-back refreshes per dataflow")
+    parser.add_argument("--short-seconds", type=float, default=defaults.short_seconds)
+    parser.add_argument("--long-seconds", type=float, default=defaults.long_seconds)
+    parser.add_argument("--long-fraction", type=float, default=defaults.long_fraction)
+    parser.add_argument("--jitter", type=float, default=defaults.jitter, help="Per-run duration jitter (fraction)")
+    parser.add_argument("--arrival-window", type=float, default=defaults.arrival_window,
+                        help="First refreshes start within this many seconds")
+    parser.add_argument("--gap-seconds", type=float, default=defaults.gap_seconds,
+                        help="Delay between a notification and the next run")
+    parser.add_argument("--status-latency-ms", type=float, default=150.0, help="Fabric job-status response time")
+    parser.add_argument("--policies", default="fixed,adaptive")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--json", help="Write summaries to this file")
+    args = parser.parse_args()
+
+    workload = Workload(args.dataflows, args.runs, args.short_seconds, args.long_seconds, args.long_fraction,
+                        args.jitter, args.arrival_window, args.gap_seconds, args.seed)
+    names = [p.strip() for p in args.policies.split(",") if p.strip()]
+    unknown = set(names) - set(POLICIES)
+    if unknown:
+        parser.error(f"Unknown policies {sorted(unknown)}; choose from {sorted(POLICIES)}")
+
+    rows = [simulate(POLICIES[name](), workload, args.status_latency_ms / 1000).summary() for name in names]
+    print(f"{workload.dataflows} dataflows × {workload.runs} runs, {workload.long_fraction:.0%} long "
+          f"(~{workload.short_seconds:.0f}s / ~{workload.long_seconds:.0f}s), "
+          f"status latency {args.status_latency_ms:.0f} ms")
+    print_comparison(rows)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({"workload": workload.__dict__,
+                                               "status_latency_ms": args.status_latency_ms,
+                                               "results": rows}, indent=2))
+        print(f"\nSummaries saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Synthetic M section documents for dataflow definition benchmarks.
+
+Generates mashup.pq / queryMetadata.json pairs shaped like production Gen2 dataflows:
+hundreds of shared members with multi-step let expressions, quoted names, and queries
+writing to a destination through a [DataDestinations] attribute plus a hidden
+*_DataDestination helper query. Output is deterministic for a given spec.
+
+Usage:
+    python section_documents.py --queries 500 --steps 12 > big.pq
+    python section_documents.py --queries 500 --metadata > queryMetadata.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import uuid
+from dataclasses import dataclass
+
+_NAMESPACE = uuid.UUID("0b8f6c3e-2a41-4d6b-8e0f-5c7a9d1e2f34")
+
+
+@dataclass
+class SectionSpec:
+    queries: int = 100
+    steps: int = 8
+    destination_fraction: float = 0.3
+    quoted_fraction: float = 0.2
+    staging: bool = False
+    line_ending: str = "\r\n"
+    seed: int = 0
+
+
+def query_name(spec: SectionSpec, k: int) -> str:
+    """Name of the k-th generated query (1-based), as it appears in queryMetadata.json."""
+    rng = random.Random(spec.seed * 1_000_003 + k)
+    return f"Sales Query {k}" if rng.random() < spec.quoted_fraction else f"Query{k}"
+
+
+def m_identifier(name: str) -> str:
+    return f'#"{name}"' if " " in name or "(" in name or ")" in name else name
+
+
+def _query_body(rng: random.Random, k: int, steps: int, nl: str) -> str:
+    lines = [f'Source = Sql.Database("server{k % 17}.example.com", "sales_{k % 5}")',
+             f'Navigation = Source{{[Schema = "dbo", Item = "Orders{k}"]}}[Data]']
+    previous = "Navigation"
+    for s in range(steps):
+        step = f"#\"Step {s + 1}\""
+        kind = rng.randrange(4)
+        if kind == 0:
+            expr = f"Table.SelectRows({previous}, each [Amount{s}] > {rng.randrange(1000)})"
+        elif kind == 1:
+            expr = (f"Table.AddColumn({previous}, \"Derived{s}\", each [Price] * [Quantity] + {s}, "
+                    f"type number)")
+        elif kind == 2:
+            expr = f"Table.RenameColumns({previous}, {{{{\"Col{s}\", \"Column {s}\"}}}})"
+        else:
+            expr = (f"Table.TransformColumnTypes({previous}, {{{{\"OrderDate\", type date}}, "
+                    f"{{\"Amount{s}\", type number}}}})")
+        lines.append(f"{step} = {expr}")
+        previous = step
+    return "let" + nl + ("," + nl).join("    " + line for line in lines) + nl + "in" + nl + "    " + previous
+
+
+def generate(spec: SectionSpec) -> tuple[str, dict]:
+    """(mashup.pq text, queryMetadata.json object) for the spec."""
+    nl = spec.line_ending
+    parts = []
+    if spec.staging:
+        parts.append('[StagingDefinition = [Kind = "FastCopy"]]')
+    parts.append("section Section1;")
+    entries: dict[str, dict] = {}
+
+    for k in range(1, spec.queries + 1):
+        rng = random.Random(spec.seed * 7_919 + k)
+        name = query_name(spec, k)
+        body = _query_body(rng, k, spec.steps, nl)
+        entries[name] = {"queryId": str(uuid.uuid5(_NAMESPACE, f"{spec.seed}:{name}")), "queryName": name,
+                         "loadEnabled": False}
+        if rng.random() < spec.destination_fraction:
+            destination = f"Query{k}_DataDestination"
+            parts.append(
+                f'[DataDestinations = {{[Definition = [Kind = "Reference", QueryName = "{destination}", '
+                f'IsNewTarget = true], Settings = [Kind = "Automatic", TypeSettings = [Kind = "Table"]]]}}]')
+            parts.append(f"shared {m_identifier(name)} = {body};")
+            parts.append(
+                f"shared {destination} = let{nl}"
+                f'    Pattern = Lakehouse.Contents([CreateNavigationProperties = false, EnableFolding = false]),{nl}'
+                f'    Navigation_1 = Pattern{{[workspaceId = "{uuid.uuid5(_NAMESPACE, "ws")}"]}}[Data],{nl}'
+                f'    TableNavigation = Navigation_1{{[Id = "Orders{k}", ItemKind = "Table"]}}?[Data]?{nl}'
+                f"in{nl}    TableNavigation;")
+            entries[destination] = {"queryId": str(uuid.uuid5(_NAMESPACE, f"{spec.seed}:{destination}")),
+                                    "queryName": destination, "isHidden": True, "loadEnabled": False}
+        else:
+            parts.append(f"shared {m_identifier(name)} = {body};")
+
+    metadata = {
+        "formatVersion": "202502",
+        "computeEngineSettings": {},
+        "name": f"Synthetic dataflow ({spec.queries} queries)",
+        "queryGroups": [],
+        "documentLocale": "en-US",
+        "queriesMetadata": entries,
+        "connections": [{"path": f"server{i}.example.com;sales_{i % 5}", "kind": "SQL",
+                         "connectionId": str(uuid.uuid5(_NAMESPACE, f"connection:{i}"))}
+                        for i in range(min(spec.queries, 17))],
+        "fastCombine": True,
+        "allowNativeQueries": False,
+    }
+    return nl.join(parts) + nl, metadata
+
+
+def main():
+    defaults = SectionSpec()
+    parser = argparse.ArgumentParser(description="Generate a synthetic M section document")
+    parser.add_argument("--queries", type=int, default=defaults.queries)
+    parser.add_argument("--steps", type=int, default=defaults.steps, help="Transformation steps per query")
+    parser.add_argument("--destination-fraction", type=float, default=defaults.destination_fraction)
+    parser.add_argument("--quoted-fraction", type=float, default=defaults.quoted_fraction)
+    parser.add_argument("--staging", action="store_true", help="Add a [StagingDefinition] section attribute")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--metadata", action="store_true", help="Print queryMetadata.json instead")
+    args = parser.parse_args()
+
+    mashup, metadata = generate(SectionSpec(args.queries, args.steps, args.destination_fraction,
+                                            args.quoted_fraction, args.staging, seed=args.seed))
+    sys.stdout.write(json.dumps(metadata, indent=2) + "\n" if args.metadata else mashup)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Local OpenAI-compatible chat completions stub for harness benchmarks.
+
+Answers /chat/completions (OpenAI) and /openai/deployments/{d}/chat/completions (Azure)
+without a real model. When tools are offered it picks the tool whose name best matches
+the last user message and fills string arguments from backticked values in the prompt,
+so the scorer sees a realistic mix of pass / partial / fail.
+
+With --tpm it enforces a tokens-per-minute quota like an Azure OpenAI deployment, which
+checks it over short windows: quota accrues continuously from startup, at most 10 seconds'
+worth is kept for a burst, and requests over it get 429 with retry-after-ms until enough
+tokens have accrued.
+
+Usage:
+    python stub_llm.py --port 8765 --latency-ms 20
+    python stub_llm.py --port 8766 --tpm 300000
+    python run_evals.py --base-url http://127.0.0.1:8765 --delay 0
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+_WORD = re.compile(r"[A-Za-z][a-z]+|[A-Z]+(?![a-z])")
+
+
+def _name_tokens(tool_name: str) -> set[str]:
+    """Split CamelCase / snake_case tool names into lowercase words (minus noise)."""
+    words = {w.lower() for w in _WORD.findall(tool_name.replace("_", " "))}
+    return words - {"async", "get", "the"}
+
+
+def stub_tool_calls(prompt: str, tools: list[dict]) -> list[dict]:
+    """Deterministically choose one tool call for a prompt.
+
+    Returns OpenAI-format tool_calls (arguments JSON-encoded), or [] when nothing matches.
+    """
+    prompt_words = {w.lower().rstrip("s") for w in re.findall(r"[A-Za-z]+", prompt)}
+    best, best_score = None, 0
+    for tool in tools:
+        fn = tool.get("function", {})
+        tokens = {t.rstrip("s") for t in _name_tokens(fn.get("name", ""))}
+        score = len(tokens & prompt_words)
+        if score > best_score:
+            best, best_score = fn, score
+    if best is None:
+        return []
+
+    values = re.findall(r"`([^`]+)`", prompt)
+    params = list(best.get("parameters", {}).get("properties", {}).items())
+    args = {}
+    for (name, spec), value in zip(params, values):
+        if spec.get("type") == "boolean":
+            args[name] = value.lower() == "true"
+        elif spec.get("type") == "integer" and value.isdigit():
+            args[name] = int(value)
+        else:
+            args[name] = value
+
+    call_id = "call_" + hashlib.sha1(prompt.encode()).hexdigest()[:12]
+    return [{
+        "id": call_id,
+        "type": "function",
+        "function": {"name": best["name"], "arguments": json.dumps(args)},
+    }]
+
+
+def build_completion(body: dict, content: Optional[str] = None) -> dict:
+    """Build a chat completions response for a request body."""
+    messages = body.get("messages", [])
+    prompt = next((m.get("content") or "" for m in reversed(messages) if m.get("role") == "user"), "")
+    tools = body.get("tools") or []
+    # After a tool result (run_evals.py --live) answer in text, like a model summarizing it
+    answered = bool(messages) and messages[-1].get("role") == "tool"
+
+    tool_calls = stub_tool_calls(prompt, tools) if tools and not answered else []
+    if content is None:
+        content = None if tool_calls else f"[stub] {prompt[:200]}"
+
+    prompt_chars = sum(len(m.get("content") or "") for m in messages) + (len(json.dumps(tools)) if tools else 0)
+    completion_chars = len(content or "") + len(json.dumps(tool_calls))
+    message: dict = {"role": "assistant", "content": content}
+    if tool_calls:
+        message["tool_calls"] = tool_calls
+    return {
+        "id": "chatcmpl-stub",
+        "object": "chat.completion",
+        "model": body.get("model", "stub"),
+        "choices": [{"index": 0, "message": message,
+                     "finish_reason": "tool_calls" if tool_calls else "stop"}],
+        # ~4 chars per token is close enough for harness benchmarks
+        "usage": {
+            "prompt_tokens": prompt_chars // 4,
+            "completion_tokens": completion_chars // 4,
+            "total_tokens": (prompt_chars + completion_chars) // 4,
+        },
+    }
+
+
+class StubLLMServer:
+    """Threaded stub server; use as a context manager in benchmarks."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0.0,
+                 status_code: int = 200, tpm: Optional[int] = None):
+        self.latency_ms = latency_ms
+        self.status_code = status_code
+        self.tpm = tpm
+        self.request_count = 0
+        self.throttled_count = 0
+        self._burst = (tpm or 0) / 6
+        self._tokens = 0.0
+        self._refilled = time.monotonic()
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _take_quota(self, tokens: int) -> Optional[float]:
+        """Spend quota for a request; returns seconds until it fits when the quota is exhausted."""
+        with self._lock:
+            now = time.monotonic()
+            rate = self.tpm / 60
+            self._tokens = min(self._burst, self._tokens + (now - self._refilled) * rate)
+            self._refilled = now
+            if self._tokens < tokens:
+                self.throttled_count += 1
+                return (min(tokens, self._burst) - self._tokens) / rate
+            self._tokens -= tokens
+            return None
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; with Nagle on, the body waits for the
+            # client's delayed ACK (~40 ms) on every keep-alive request
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                with server._lock:
+                    server.request_count += 1
+                if server.latency_ms > 0:
+                    time.sleep(server.latency_ms / 1000)
+
+                if not self.path.split("?")[0].endswith("/chat/completions"):
+                    self._send(404, {"error": {"message": f"Unknown path {self.path}"}})
+                elif server.status_code != 200:
+                    self._send(server.status_code, {"error": {"message": "stub error"}})
+                else:
+                    completion = build_completion(body)
+                    wait = server._take_quota(completion["usage"]["total_tokens"]) if server.tpm else None
+                    if wait is None:
+                        self._send(200, completion)
+                    else:
+                        self._send(429, {"error": {"code": "429", "message": "Rate limit exceeded"}},
+                                   {"retry-after-ms": str(int(wait * 1000) + 1)})
+
+            def _send(self, status: int, payload: dict, headers: Optional[dict] = None):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):  # noqa: A002 - signature from base class
+                pass
+
+        return Handler
+
+    def start(self) -> "StubLLMServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StubLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible stub for eval benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Artificial latency per request")
+    parser.add_argument("--tpm", type=int, help="Tokens-per-minute quota; requests over it get 429")
+    args = parser.parse_args()
+
+    server = StubLLMServer(args.host, args.port, args.latency_ms, tpm=args.tpm)
+    print(f"Stub LLM listening on {server.base_url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
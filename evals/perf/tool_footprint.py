@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Tool Response Footprint Analyzer
+
+Tool responses go straight back into the model's context, so their size is paid again on
+every later turn. This script starts the stdio MCP server against the Fabric stand-in,
+calls every tool from its tools/list once with arguments taken from the evals (IDs
+swapped for stand-in IDs, as in mcp_load.py), and reports per tool the response size in
+bytes and ~tokens plus the biggest JSON fields (aggregated over list items), the
+indentation overhead and the bytes spent on null fields.
+
+With --modes default,compact the server is started once per mode, compact adding
+--compact-responses, and the per-tool token savings are reported. --check-evals also runs
+run_evals.py --live in each mode and fails if the compact score is lower.
+
+Usage:
+    python tool_footprint.py --description-bytes 300
+    python tool_footprint.py --modes default,compact --top-fields 5 --json footprint.json
+    OPENAI_API_KEY=sk-... python tool_footprint.py --check-evals --eval-args "--file workspace"
+"""
+
+import argparse
+import json
+import random
+import shlex
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Optional
+
+from fabric_standin import add_config_arguments, config_from_args
+from mcp_load import DEFAULT_EXCLUDE, EVALS_DIR, MixEntry, build_mix, fill_arguments, normalize_tool_name
+
+# evals/ is on sys.path through mcp_load
+import live_tools  # noqa: E402
+import run_evals  # noqa: E402
+
+
+COMPACT_FLAG = "--compact-responses"
+
+
+def field_sizes(value: Any, path: str = "$", sizes: Optional[dict[str, int]] = None) -> dict[str, int]:
+    """Minified bytes per JSON path ("[]" aggregates list items), including the key itself."""
+    sizes = defaultdict(int) if sizes is None else sizes
+    if isinstance(value, dict):
+        for key, child in value.items():
+            child_path = f"{path}.{key}"
+            sizes[child_path] += len(json.dumps(key)) + 1 + len(minified(child))
+            field_sizes(child, child_path, sizes)
+    elif isinstance(value, list):
+        for item in value:
+            field_sizes(item, f"{path}[]", sizes)
+    return sizes
+
+
+def null_bytes(value: Any) -> int:
+    """Bytes spent on `"key":null` members."""
+    if isinstance(value, dict):
+        return sum(len(json.dumps(k)) + 6 if v is None else null_bytes(v) for k, v in value.items())
+    if isinstance(value, list):
+        return sum(null_bytes(item) for item in value)
+    return 0
+
+
+def minified(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def analyze_response(text: str, top: int) -> dict:
+    """Size breakdown of one tool response."""
+    size = len(text.encode())
+    try:
+        body = json.loads(text)
+    except json.JSONDecodeError:
+        return {"json": False, "formatting_bytes": 0, "null_bytes": 0, "top_fields": []}
+    compact = len(minified(body).encode())
+    sizes = field_sizes(body)
+    # Leaf fields only; containers just repeat the sum of what they hold
+    parents = {path.rsplit(".", 1)[0].removesuffix("[]") for path in sizes}
+    fields = sorted(((p, n) for p, n in sizes.items() if p not in parents), key=lambda kv: -kv[1])[:top]
+    return {
+        "json": True,
+        "formatting_bytes": max(size - compact, 0),
+        "null_bytes": null_bytes(body),
+        "top_fields": [{"path": path, "bytes": n, "share": round(n / max(compact, 1), 3)} for path, n in fields],
+    }
+
+
+def call_plan(tools: list[dict], include: Optional[set[str]], exclude: set[str],
+              inventory: dict[str, list[str]], seed: int) -> list[tuple[str, dict]]:
+    """One call per tool: the first eval expectation for it (or just its required arguments)."""
+    mcp_tools = [{"name": t["function"]["name"], "inputSchema": t["function"].get("parameters", {})} for t in tools]
+    scenarios = [s for f in sorted(EVALS_DIR.glob("*.eval.md")) for s in run_evals.parse_eval_file(f)]
+    mix = {normalize_tool_name(e.tool): e for e in build_mix(scenarios, mcp_tools, include, exclude)}
+
+    plan = []
+    for tool in mcp_tools:
+        key = normalize_tool_name(tool["name"])
+        if (include and key not in include) or key in exclude:
+            continue
+        entry = mix.get(key) or MixEntry(tool["name"], tool["inputSchema"], templates=[{}])
+        # Seeded per tool, so every mode calls each tool with the same arguments
+        rng = random.Random(f"{seed}:{key}")
+        plan.append((tool["name"], fill_arguments(entry, entry.templates[0], inventory, rng)))
+    return plan
+
+
+def run_mode(mode: str, args: argparse.Namespace, include: Optional[set[str]], exclude: set[str]) -> dict:
+    command = args.server_command + (f" {COMPACT_FLAG}" if mode == "compact" else "")
+    server = live_tools.LiveToolServer(command, cwd=EVALS_DIR.parent, standin_config=config_from_args(args),
+                                       startup_timeout=args.startup_timeout,
+                                       log_path=Path(f"{args.server_log}.{mode}") if args.server_log else None)
+    print(f"\n[{mode}] {' '.join(server.command)}")
+    tools = server.start()
+    rows = {}
+    try:
+        plan = call_plan(tools, include, exclude, server.standin.inventory.sample(), args.seed)
+        for name, arguments in plan:
+            execution = server.call(name, arguments)
+            rows[name] = {
+                "arguments": arguments,
+                "bytes": len(execution.text.encode()),
+                "tokens": execution.response_tokens,
+                "latency_ms": round(execution.latency_ms, 1),
+                "error": execution.error,
+                **analyze_response(execution.text, args.top_fields),
+            }
+    finally:
+        server.close()
+    return {"mode": mode, "tool_count": len(tools), "tools": rows}
+
+
+def print_mode(result: dict, top: int):
+    rows = result["tools"]
+    print(f"\n  {'tool':<36} {'bytes':>8} {'~tok':>7} {'fmt %':>6} {'null %':>6}  biggest fields")
+    for name, row in sorted(rows.items(), key=lambda kv: -kv[1]["bytes"]):
+        fields = ", ".join(f"{f['path'][2:]} {f['share']:.0%}" for f in row["top_fields"][:top]) or "(text)"
+        size = max(row["bytes"], 1)
+        flag = " ✗" if row["error"] else ""
+        print(f"  {name:<36} {row['bytes']:>8} {row['tokens']:>7} {row['formatting_bytes'] / size:>6.0%} "
+              f"{row['null_bytes'] / size:>6.0%}  {fields}{flag}")
+    total = sum(r["tokens"] for r in rows.values())
+    print(f"  {'total':<36} {sum(r['bytes'] for r in rows.values()):>8} {total:>7}")
+
+
+def compare_modes(base: dict, new: dict) -> list[dict]:
+    rows = []
+    for name, before in base["tools"].items():
+        after = new["tools"].get(name)
+        if after is None:
+            continue
+        rows.append({"tool": name, "tokens_before": before["tokens"], "tokens_after": after["tokens"],
+                     "saved": round(1 - after["tokens"] / before["tokens"], 3) if before["tokens"] else 0.0,
+                     "error_before": before["error"], "error_after": after["error"]})
+    return sorted(rows, key=lambda r: -(r["tokens_before"] - r["tokens_after"]))
+
+
+def print_comparison(rows: list[dict], base: str, new: str):
+    print(f"\n  {'tool':<36} {base + ' ~tok':>14} {new + ' ~tok':>14} {'saved':>7}")
+    for r in rows:
+        note = "  ⚠️ error status changed" if r["error_before"] != r["error_after"] else ""
+        print(f"  {r['tool']:<36} {r['tokens_before']:>14} {r['tokens_after']:>14} {r['saved']:>7.0%}{note}")
+    before = sum(r["tokens_before"] for r in rows)
+    after = sum(r["tokens_after"] for r in rows)
+    if before:
+        print(f"  {'total':<36} {before:>14} {after:>14} {1 - after / before:>7.0%}")
+
+
+def eval_score(results: list[dict]) -> Optional[float]:
+    """Score as run_evals.print_summary computes it (None when nothing was scored)."""
+    counts = defaultdict(int)
+    for r in results:
+        counts[r["result"]] += 1
+    scored = counts["pass"] + counts["partial"] + counts["fail"]
+    return (counts["pass"] + 0.5 * counts["partial"]) / scored * 100 if scored else None
+
+
+def check_evals(mode: str, args: argparse.Namespace) -> dict:
+    """run_evals.py --live against this mode's server; returns the score and per-tool response tokens."""
+    command = args.server_command + (f" {COMPACT_FLAG}" if mode == "compact" else "")
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / f"evals-{mode}.json"
+        cmd = [sys.executable, str(EVALS_DIR / "run_evals.py"), "--live", "--server-command", command,
+               "--output", str(output), "--no-history", *shlex.split(args.eval_args)]
+        print(f"\n[{mode}] run_evals.py --live {args.eval_args}".rstrip())
+        completed = subprocess.run(cmd, stdout=subprocess.DEVNULL)
+        if not output.exists():
+            return {"mode": mode, "score": None, "exit_code": completed.returncode}
+        results = json.loads(output.read_text())
+        summary_path = output.with_suffix(".tools.json")
+        tools = json.loads(summary_path.read_text())["tools"] if summary_path.exists() else {}
+    return {
+        "mode": mode,
+        "score": eval_score(results),
+        "results": {r["eval_id"]: r["result"] for r in results},
+        "response_tokens": sum(t["response_tokens_mean"] * t["calls"] for t in tools.values()),
+        "exit_code": completed.returncode,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure MCP tool response sizes and compact-mode savings")
+    parser.add_argument("--server-command", default=live_tools.DEFAULT_SERVER_COMMAND,
+                        help="Command that starts the stdio MCP server, run from the repo root")
+    parser.add_argument("--modes", default="default,compact", help="default and/or compact (--compact-responses)")
+    parser.add_argument("--tools", help="Comma-separated tools to call (default: every listed tool)")
+    parser.add_argument("--exclude", default=",".join(sorted(DEFAULT_EXCLUDE)),
+                        help="Comma-separated tools to skip (default: auth tools that change session state)")
+    parser.add_argument("--top-fields", type=int, default=3, help="Biggest fields to show per tool")
+    parser.add_argument("--startup-timeout", type=float, default=180.0)
+    parser.add_argument("--server-log", help="Write each mode's server stderr to <path>.<mode>")
+    parser.add_argument("--check-evals", action="store_true",
+                        help="Also run run_evals.py --live per mode and compare scores (needs OPENAI_API_KEY)")
+    parser.add_argument("--eval-args", default="", help="Extra arguments for run_evals.py (e.g. \"--file workspace\")")
+    parser.add_argument("--json", help="Write raw results to this file")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    if set(modes) - {"default", "compact"}:
+        parser.error("--modes accepts default and compact")
+    include = {normalize_tool_name(t) for t in args.tools.split(",")} if args.tools else None
+    exclude = {normalize_tool_name(t) for t in args.exclude.split(",") if t.strip()}
+
+    results = [run_mode(mode, args, include, exclude) for mode in modes]
+    for result in results:
+        print(f"\n{result['mode']}: {len(result['tools'])} of {result['tool_count']} tools called "
+              f"(fmt = indentation bytes, null = null-field bytes)")
+        print_mode(result, args.top_fields)
+
+    report: dict = {"modes": results}
+    if len(results) == 2:
+        report["comparison"] = compare_modes(*results)
+        print_comparison(report["comparison"], results[0]["mode"], results[1]["mode"])
+
+    exit_code = 0
+    if args.check_evals:
+        checks = [check_evals(mode, args) for mode in modes]
+        report["evals"] = checks
+        print()
+        for check in checks:
+            score = "n/a" if check["score"] is None else f"{check['score']:.1f}%"
+            print(f"  {check['mode']:<8} score {score:>7}  tool response ~tokens {check.get('response_tokens', 0):.0f}")
+        if len(checks) == 2 and None not in (checks[0]["score"], checks[1]["score"]):
+            changed = [eval_id for eval_id, result in checks[0]["results"].items()
+                       if checks[1]["results"].get(eval_id) != result]
+            if changed:
+                print(f"  Results changed: {', '.join(changed)}")
+            if checks[1]["score"] < checks[0]["score"]:
+                print(f"\nFAILED: {checks[1]['mode']} score is below {checks[0]['mode']}", file=sys.stderr)
+                exit_code = 1
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+        print(f"\nRaw results saved to {args.json}")
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Tool Description Compression Study
+
+Every tool-selection request carries all of tools_schema.json, the same [Description]
+text the C# tools advertise to real clients, so every client pays for it on every turn.
+This script writes compressed variants of the schema, each building on the previous one:
+
+    original     tools_schema.json as is
+    redundancy   drops "(required)" / "(optional)" markers the schema already states, and
+                 "defaults to X" text that repeats the parameter's default
+    enums        also turns prose value lists ("Privacy level: None, Organizational, ...")
+                 into JSON Schema enums
+    short        also keeps only the first sentence of every description, without
+                 leading articles
+    minimal      also drops parameter descriptions that only restate the parameter name
+
+Tool names, parameter names, types and required lists never change. Per variant it
+reports bytes and prompt tokens (token_budget.py), and unless --dry-run runs the
+tool-selection evals against it (run_evals.py --tools-schema) and reports accuracy,
+reported prompt tokens, latency and the scenarios that got worse than with the original.
+The recommendation is the smallest variant whose score is within --tolerance points.
+
+Usage:
+    python tool_schema_study.py --dry-run --per-tool
+    OPENAI_API_KEY=sk-... python tool_schema_study.py --workers 8 --json study.json
+    OPENAI_API_KEY=sk-... python tool_schema_study.py --variants original,enums --eval-args "--file dataflows"
+"""
+
+import argparse
+import copy
+import json
+import os
+import re
+import shlex
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import token_budget  # noqa: E402
+from tool_footprint import eval_score  # noqa: E402
+
+
+EVALS_DIR = Path(__file__).resolve().parent.parent
+VARIANTS = ["original", "redundancy", "enums", "short", "minimal"]
+RESULT_RANK = {"pass": 2, "partial": 1, "fail": 0, "error": 0}
+
+PRESENCE_MARKER = re.compile(r"\s*\((?:required|optional)\)", re.IGNORECASE)
+OPTIONAL_PREFIX = re.compile(r"^Optional\.\s*|(?<=\()optional,\s*", re.IGNORECASE)
+BOOLEAN_HINT = re.compile(r"\s*\(true/false(?:,\s*optional)?\)", re.IGNORECASE)
+DEFAULT_TEXT = re.compile(r"\s*\(defaults? to ([^)]+)\)|\s*Defaults? to ([^.(]+)\.?", re.IGNORECASE)
+# "Label: A, B, or C" closing a description; values are single identifiers or numbers
+VALUE_LIST = re.compile(r"(?P<label>[A-Z][\w ]*?):\s*(?P<values>[\w.]+(?:,\s*[\w.]+)+,?\s*(?:or\s+[\w.]+)?)\.?$")
+GENERIC_LABELS = {"valid values", "values", "allowed values", "options"}
+SENTENCE_END = re.compile(r"(?<=[a-z0-9)'\"][.!?])\s+(?=[A-Z])")
+LEADING_ARTICLE = re.compile(r"^(?:The|A|An)\s+(?=\w)")
+FILLER_WORDS = {"the", "a", "an", "of", "for", "to", "in", "on", "by", "with", "from", "is", "be", "this"}
+
+
+# ---------------------------------------------------------------------------
+# Transforms
+# ---------------------------------------------------------------------------
+
+def _tidy(text: str) -> str:
+    text = re.sub(r"\s+", " ", text).strip()
+    text = re.sub(r"\s+([.,;:)])", r"\1", text)
+    text = re.sub(r"\(\s*\)", "", text)
+    return text.strip(" ,;")
+
+
+def _same_value(text: str, default) -> bool:
+    expected = json.dumps(default).strip('"').lower()
+    return text.strip().strip("'\"").lower().startswith(expected)
+
+
+def drop_redundancy(description: str, spec: Optional[dict] = None) -> str:
+    """Remove what the schema already says: presence markers, boolean hints, repeated defaults."""
+    text = PRESENCE_MARKER.sub("", description)
+    text = OPTIONAL_PREFIX.sub("", text)
+    if spec is not None:
+        if spec.get("type") == "boolean":
+            text = BOOLEAN_HINT.sub("", text)
+        if "default" in spec:
+            text = DEFAULT_TEXT.sub(lambda m: "" if _same_value(m.group(1) or m.group(2), spec["default"])
+                                    else m.group(0), text)
+    return _tidy(text) or description
+
+
+def extract_enum(description: str, spec: dict) -> tuple[str, Optional[list]]:
+    """Split a closing "Label: A, B, or C" value list into (description, enum values)."""
+    if spec.get("type") not in ("string", "integer") or "enum" in spec:
+        return description, None
+    match = VALUE_LIST.search(description)
+    if not match:
+        return description, None
+    values = [v.strip() for v in re.split(r",\s*(?:or\s+)?|\s+or\s+", match.group("values")) if v.strip()]
+    if len(values) < 3:
+        return description, None
+    if spec["type"] == "integer":
+        if not all(v.isdigit() for v in values):
+            return description, None
+        values = [int(v) for v in values]
+    if "default" in spec and spec["default"] not in values:
+        return description, None
+    label = match.group("label").strip()
+    head = description[:match.start()].strip()
+    text = head if label.lower() in GENERIC_LABELS else f"{head} {label}".strip()
+    return _tidy(text) or label, values
+
+
+def shorten(description: str) -> str:
+    """First sentence, without a leading article."""
+    first = SENTENCE_END.split(description.strip(), maxsplit=1)[0]
+    first = LEADING_ARTICLE.sub("", first)
+    return _tidy(first[:1].upper() + first[1:]) or description
+
+
+def name_words(name: str) -> set[str]:
+    return {w.lower() for w in re.findall(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+", name)}
+
+
+def restates_name(description: str, name: str) -> bool:
+    words = {w.lower() for w in re.findall(r"[A-Za-z]+", description)} - FILLER_WORDS
+    return bool(words) and words <= name_words(name)
+
+
+def compress_tool(tool: dict, variant: str) -> dict:
+    level = VARIANTS.index(variant)
+    tool = copy.deepcopy(tool)
+    function = tool["function"]
+    properties = function.get("parameters", {}).get("properties", {})
+
+    if level >= VARIANTS.index("redundancy"):
+        function["description"] = drop_redundancy(function.get("description", ""))
+        for spec in properties.values():
+            if "description" in spec:
+                spec["description"] = drop_redundancy(spec["description"], spec)
+    if level >= VARIANTS.index("enums"):
+        for spec in properties.values():
+            if "description" in spec:
+                spec["description"], values = extract_enum(spec["description"], spec)
+                if values:
+                    spec["enum"] = values
+    if level >= VARIANTS.index("short"):
+        function["description"] = shorten(function.get("description", ""))
+        for spec in properties.values():
+            if "description" in spec:
+                spec["description"] = shorten(spec["description"])
+    if level >= VARIANTS.index("minimal"):
+        for name, spec in properties.items():
+            if restates_name(spec.get("description", ""), name):
+                del spec["description"]
+    return tool
+
+
+def check_contract(original: dict, compressed: dict):
+    """Raise ValueError if a variant changed anything a client binds to."""
+    def contract(tool: dict):
+        function = tool["function"]
+        parameters = function.get("parameters", {})
+        return (function["name"], sorted(parameters.get("required", [])),
+                {name: (spec.get("type"), spec.get("nullable"), json.dumps(spec.get("default")))
+                 for name, spec in parameters.get("properties", {}).items()})
+    if contract(original) != contract(compressed):
+        raise ValueError(f"{original['function']['name']}: variant changed the tool contract")
+
+
+def build_variant(tools: list[dict], variant: str) -> list[dict]:
+    compressed = [compress_tool(t, variant) for t in tools]
+    for before, after in zip(tools, compressed):
+        check_contract(before, after)
+    return compressed
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def measure(tools: list[dict], estimator: token_budget.TokenEstimator) -> dict:
+    per_tool = {t["function"]["name"]: estimator.count(json.dumps(t, separators=(",", ":"))) for t in tools}
+    return {
+        "bytes": len(json.dumps(tools, separators=(",", ":")).encode()),
+        "tokens": sum(per_tool.values()),
+        "per_tool": per_tool,
+    }
+
+
+def run_variant_evals(variant: str, schema_path: Path, args: argparse.Namespace) -> dict:
+    """run_evals.py --tools-schema <variant>; returns the score and per-scenario outcomes."""
+    output = schema_path.with_suffix(".results.json")
+    cmd = [sys.executable, str(EVALS_DIR / "run_evals.py"), "--tools-schema", str(schema_path),
+           "--output", str(output), "--no-history", "--delay", "0", "--workers", str(args.workers),
+           "--model", args.model, "--base-url", args.base_url, *shlex.split(args.eval_args)]
+    if args.deployments:
+        cmd += ["--deployments", args.deployments]
+    print(f"\n[{variant}] run_evals.py --tools-schema {schema_path.name} {args.eval_args}".rstrip())
+    completed = subprocess.run(cmd, stdout=subprocess.DEVNULL)
+    if not output.exists():
+        return {"score": None, "exit_code": completed.returncode, "results": {}}
+    results = json.loads(output.read_text())
+    latencies = sorted(r["latency_ms"] for r in results if r.get("latency_ms") is not None)
+    prompt_tokens = [r["prompt_tokens"] for r in results if r.get("prompt_tokens")]
+    return {
+        "score": eval_score(results),
+        "exit_code": completed.returncode,
+        "results": {r["eval_id"]: r["result"] for r in results},
+        "errors": sum(r["result"] == "error" for r in results),
+        "prompt_tokens_mean": round(sum(prompt_tokens) / len(prompt_tokens)) if prompt_tokens else None,
+        "latency_p50_ms": round(latencies[len(latencies) // 2], 1) if latencies else None,
+        "latency_p95_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 1)
+        if latencies else None,
+    }
+
+
+def regressions(base: dict, evals: dict) -> list[str]:
+    """Scenarios scored lower than with the original schema (skips are not compared)."""
+    worse = []
+    for eval_id, result in evals["results"].items():
+        before = base["results"].get(eval_id)
+        if before in RESULT_RANK and result in RESULT_RANK and RESULT_RANK[result] < RESULT_RANK[before]:
+            worse.append(f"{eval_id} ({before} → {result})")
+    return worse
+
+
+def print_report(rows: list[dict], tokenizer: str):
+    base = rows[0]
+    print(f"\n{'variant':<12} {'bytes':>8} {'tokens':>8} {'saved':>7} {'score':>7} {'prompt tok':>11} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'worse':>6}   ({tokenizer})")
+    for row in rows:
+        evals = row.get("evals") or {}
+        score = f"{evals['score']:.1f}%" if evals.get("score") is not None else "-"
+        prompt_tokens = f"{evals['prompt_tokens_mean']:,}" if evals.get("prompt_tokens_mean") else "-"
+        worse = len(row["worse"]) if "worse" in row else "-"
+        print(f"{row['variant']:<12} {row['bytes']:>8,} {row['tokens']:>8,} "
+              f"{1 - row['tokens'] / base['tokens']:>7.0%} {score:>7} {prompt_tokens:>11} "
+              f"{evals.get('latency_p50_ms') or '-':>8} {evals.get('latency_p95_ms') or '-':>8} {worse:>6}")
+    for row in rows[1:]:
+        if row.get("worse"):
+            print(f"\n{row['variant']}: worse than original on {', '.join(row['worse'])}")
+
+
+def print_per_tool(rows: list[dict]):
+    names = sorted(rows[0]["per_tool"], key=lambda n: rows[0]["per_tool"][n], reverse=True)
+    print(f"\n{'tool':<36}" + "".join(f" {row['variant']:>11}" for row in rows))
+    for name in names:
+        print(f"{name[:36]:<36}" + "".join(f" {row['per_tool'][name]:>11,}" for row in rows))
+
+
+def recommend(rows: list[dict], tolerance: float) -> Optional[dict]:
+    """Smallest variant scoring within `tolerance` points of the original."""
+    base_score = (rows[0].get("evals") or {}).get("score")
+    if base_score is None:
+        return None
+    ok = [row for row in rows if (row.get("evals") or {}).get("score") is not None
+          and row["evals"]["score"] >= base_score - tolerance]
+    return min(ok, key=lambda row: row["tokens"]) if ok else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compress tool descriptions and measure tokens vs eval accuracy")
+    parser.add_argument("--schema", default=str(EVALS_DIR / "tools_schema.json"), help="Tool definitions to compress")
+    parser.add_argument("--variants", default=",".join(VARIANTS), help=f"Comma-separated subset of {VARIANTS}")
+    parser.add_argument("--output-dir", default="tool_schema_variants",
+                        help="Where tools_schema.<variant>.json (and its eval results) are written")
+    parser.add_argument("--dry-run", action="store_true", help="Write the variants and report tokens only")
+    parser.add_argument("--model", default=os.environ.get("EVAL_MODEL", "gpt-4o"))
+    parser.add_argument("--base-url", default=os.environ.get("EVAL_BASE_URL", "https://api.openai.com/v1"))
+    parser.add_argument("--deployments", default=os.environ.get("EVAL_DEPLOYMENTS"),
+                        help="Deployments file passed to run_evals.py (see deployment_pool.py)")
+    parser.add_argument("--workers", type=int, default=4, help="run_evals.py --workers per variant")
+    parser.add_argument("--eval-args", default="", help="Extra arguments for run_evals.py (e.g. \"--file dataflows\")")
+    parser.add_argument("--tolerance", type=float, default=0.0,
+                        help="Score points a variant may lose and still be recommended")
+    parser.add_argument("--per-tool", action="store_true", help="Show tokens per tool and variant")
+    parser.add_argument("--json", help="Write the report to this file")
+    args = parser.parse_args()
+
+    variants = [v.strip() for v in args.variants.split(",") if v.strip()]
+    if set(variants) - set(VARIANTS):
+        parser.error(f"--variants accepts {', '.join(VARIANTS)}")
+    # Always measured against the original, which comes first
+    variants = ["original"] + [v for v in VARIANTS if v in variants and v != "original"]
+    if not args.dry_run and not (os.environ.get("OPENAI_API_KEY") or args.deployments):
+        parser.error("OPENAI_API_KEY (or --deployments) is required unless --dry-run")
+
+    tools = json.loads(Path(args.schema).read_text())["tools"]
+    estimator = token_budget.TokenEstimator(args.model)
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    rows = []
+    for variant in variants:
+        compressed = build_variant(tools, variant)
+        schema_path = output_dir / f"tools_schema.{variant}.json"
+        schema_path.write_text(json.dumps({"tools": compressed}, indent=2, ensure_ascii=False) + "\n")
+        rows.append({"variant": variant, "schema": str(schema_path), **measure(compressed, estimator)})
+    print(f"{len(tools)} tools, {len(rows)} variants written to {output_dir}/")
+
+    if not args.dry_run:
+        for row in rows:
+            row["evals"] = run_variant_evals(row["variant"], Path(row["schema"]), args)
+        for row in rows[1:]:
+            row["worse"] = regressions(rows[0]["evals"], row["evals"])
+
+    print_report(rows, estimator.tokenizer)
+    if args.per_tool:
+        print_per_tool(rows)
+
+    best = recommend(rows, args.tolerance)
+    if best:
+        print(f"\nRecommended: {best['variant']} ({1 - best['tokens'] / rows[0]['tokens']:.0%} fewer tool tokens, "
+              f"score {best['evals']['score']:.1f}% vs {rows[0]['evals']['score']:.1f}%) — {best['schema']}")
+    if args.json:
+        Path(args.json).write_text(json.dumps({"schema": args.schema, "model": args.model,
+                                               "tokenizer": estimator.tokenizer, "variants": rows,
+                                               "recommended": best["variant"] if best else None}, indent=2))
+        print(f"\nResults saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
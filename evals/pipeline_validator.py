@@ -0,0 +1,369 @@
+"""
+Structural validation of pipeline definition JSON for the integration evals.
+
+The pipeline rules of run_integration_evals.py used to be substring tests ("activities",
+"dependsOn", "DataflowActivity" somewhere in the answer). This module parses the pipeline
+JSON from the answer and checks it the way the service would see it:
+
+- every activity has a name, a known type and the typeProperties that type requires
+  (ACTIVITY_TYPES), names are unique within their scope, dependency conditions are valid;
+- the dependsOn graph of each scope (top level, and the inner activities of ForEach, Until,
+  IfCondition and Switch) has no dangling references, no cycles, and no activities that
+  can never run because they wait on a cycle or a missing activity.
+
+The graph checks are Kahn's algorithm plus an iterative Tarjan pass over whatever Kahn
+could not order, linear in activities + dependencies. An answer is analyzed once and the
+report is shared by all of a scenario's pipeline rules (validate() is memoized on the
+text); each rule is a named check on the report, e.g. "activity_count:2" (CHECKS).
+
+Usage:
+    python pipeline_validator.py answer.md          # print the report of a saved answer
+"""
+
+import json
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Optional
+
+
+# Activity type -> typeProperties it cannot run without. Types the skills and the Fabric
+# pipeline editor produce; anything else is reported as an unknown type.
+ACTIVITY_TYPES: dict[str, tuple[str, ...]] = {
+    "DataflowActivity": ("dataflowId", "workspaceId"),
+    "RefreshDataflow": ("dataflowId", "workspaceId"),
+    "Copy": ("source", "sink"),
+    "ExecutePipeline": ("pipeline",),
+    "InvokePipeline": ("pipelineId",),
+    "TridentNotebook": ("notebookId", "workspaceId"),
+    "SparkJobDefinition": ("sparkJobDefinitionId", "workspaceId"),
+    "Lookup": ("source",),
+    "GetMetadata": ("fieldList",),
+    "Script": ("scripts",),
+    "SqlServerStoredProcedure": ("storedProcedureName",),
+    "WebActivity": ("method",),
+    "WebHook": ("method",),
+    "Wait": ("waitTimeInSeconds",),
+    "SetVariable": ("variableName",),
+    "AppendVariable": ("variableName", "value"),
+    "Filter": ("items", "condition"),
+    "Fail": ("message", "errorCode"),
+    "ForEach": ("items", "activities"),
+    "Until": ("expression", "activities"),
+    "IfCondition": ("expression",),
+    "Switch": ("on",),
+    "Office365Outlook": (),
+    "Teams": (),
+}
+
+DEPENDENCY_CONDITIONS = frozenset({"Succeeded", "Failed", "Skipped", "Completed"})
+POLICY_FIELDS = ("timeout", "retry")
+
+_JSON_LANGS = {"", "json", "jsonc", "json5"}
+
+
+@dataclass
+class PipelineReport:
+    parsed: bool = False  # a JSON block of the answer parsed
+    document: Optional[dict] = None  # the pipeline definition (object with properties.activities)
+    activities: list[dict] = field(default_factory=list)  # top-level activities
+    # (scope, activity) for every activity, nested ones included; scope is "" at the top level
+    all_activities: list[tuple[str, dict]] = field(default_factory=list)
+    dependencies: int = 0  # resolved dependsOn edges
+    conditions: set[str] = field(default_factory=set)
+    # Schema issues
+    invalid_activities: list[str] = field(default_factory=list)
+    unknown_types: list[str] = field(default_factory=list)
+    missing_properties: list[str] = field(default_factory=list)
+    duplicate_names: list[str] = field(default_factory=list)
+    invalid_conditions: list[str] = field(default_factory=list)
+    # Graph issues
+    dangling: list[str] = field(default_factory=list)
+    cycles: list[list[str]] = field(default_factory=list)
+    unreachable: list[str] = field(default_factory=list)
+
+    @property
+    def schema_ok(self) -> bool:
+        return self.document is not None and not (self.invalid_activities or self.unknown_types or
+                                                  self.missing_properties or self.duplicate_names or
+                                                  self.invalid_conditions)
+
+    @property
+    def graph_ok(self) -> bool:
+        return self.document is not None and not (self.dangling or self.cycles or self.unreachable)
+
+    def issues(self) -> list[str]:
+        if not self.parsed:
+            return ["no JSON block parses"]
+        if self.document is None:
+            return ["no pipeline definition (properties.activities) in the JSON"]
+        return ([f"invalid activity: {a}" for a in self.invalid_activities]
+                + [f"unknown activity type: {t}" for t in self.unknown_types]
+                + [f"missing typeProperties: {p}" for p in self.missing_properties]
+                + [f"duplicate activity name: {n}" for n in self.duplicate_names]
+                + [f"invalid dependency condition: {c}" for c in self.invalid_conditions]
+                + [f"dependsOn a missing activity: {d}" for d in self.dangling]
+                + [f"dependency cycle: {' -> '.join(c + c[:1])}" for c in self.cycles]
+                + [f"never runs (waits on a cycle or missing activity): {u}" for u in self.unreachable])
+
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+def _fenced_blocks(text: str):
+    """(language, body) of markdown fenced code blocks; str.find, as a lazy regex is slow on MBs of JSON."""
+    pos = 0
+    while True:
+        start = text.find("```", pos)
+        newline = text.find("\n", start) if start >= 0 else -1
+        end = text.find("```", newline) if newline >= 0 else -1
+        if end < 0:
+            return
+        yield text[start + 3:newline].strip(), text[newline + 1:end]
+        pos = end + 3
+
+
+def _json_candidates(text: str):
+    """Parsed JSON values of the answer's fenced JSON blocks, or of the whole text without any."""
+    blocks = [body for lang, body in _fenced_blocks(text) if lang.lower() in _JSON_LANGS]
+    for body in blocks or [text]:
+        try:
+            yield json.loads(body)
+        except ValueError:
+            continue
+
+
+def _pipeline_document(value) -> Optional[dict]:
+    """The definition object: {"properties": {"activities": [...]}}, or a bare pipeline properties object."""
+    if not isinstance(value, dict):
+        return None
+    properties = value.get("properties")
+    if isinstance(properties, dict) and isinstance(properties.get("activities"), list):
+        return value
+    if isinstance(value.get("activities"), list) and "type" not in value:
+        return {"properties": value}
+    return None
+
+
+def _inner_scopes(activity: dict) -> list[tuple[str, list]]:
+    """(suffix, activities) of the inner activity lists of a container activity."""
+    props = activity.get("typeProperties")
+    if not isinstance(props, dict):
+        return []
+    scopes = [(key, props[key]) for key in ("activities", "ifTrueActivities", "ifFalseActivities",
+                                            "defaultActivities") if isinstance(props.get(key), list)]
+    cases = props.get("cases")
+    for i, case in enumerate(cases if isinstance(cases, list) else []):
+        if isinstance(case, dict) and isinstance(case.get("activities"), list):
+            scopes.append((f"cases[{case.get('value', i)}]", case["activities"]))
+    return scopes
+
+
+# ---------------------------------------------------------------------------
+# Checks
+# ---------------------------------------------------------------------------
+
+def _check_activity(activity: dict, label: str, report: PipelineReport):
+    activity_type = activity.get("type")
+    if not isinstance(activity_type, str) or activity_type not in ACTIVITY_TYPES:
+        report.unknown_types.append(f"{label} ({activity_type!r})")
+        return
+    props = activity.get("typeProperties")
+    props = props if isinstance(props, dict) else {}
+    missing = [p for p in ACTIVITY_TYPES[activity_type] if p not in props]
+    if missing:
+        report.missing_properties.append(f"{label}: {', '.join(missing)}")
+
+
+def _tarjan_cycles(nodes: list[int], children: list[list[int]]) -> list[list[int]]:
+    """Strongly connected components of more than one node, or with a self-loop; iterative."""
+    index: dict[int, int] = {}
+    low: dict[int, int] = {}
+    on_stack: set[int] = set()
+    stack: list[int] = []
+    members = set(nodes)
+    cycles = []
+    counter = 0
+    for root in nodes:
+        if root in index:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, child_pos = work.pop()
+            if child_pos == 0:
+                index[node] = low[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack.add(node)
+            recurse = False
+            edges = children[node]
+            while child_pos < len(edges):
+                child = edges[child_pos]
+                child_pos += 1
+                if child not in members:
+                    continue
+                if child not in index:
+                    work.append((node, child_pos))
+                    work.append((child, 0))
+                    recurse = True
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            if recurse:
+                continue
+            if low[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                if len(component) > 1 or node in children[node]:
+                    cycles.append(component[::-1])
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+    return cycles
+
+
+def _check_scope(activities: list, scope: str, report: PipelineReport):
+    """Schema and dependsOn graph checks of one list of sibling activities, then of nested ones."""
+    prefix = f"{scope}/" if scope else ""
+    valid: list[dict] = []
+    for i, activity in enumerate(activities):
+        if not isinstance(activity, dict) or not isinstance(activity.get("name"), str):
+            report.invalid_activities.append(f"{prefix}activities[{i}] (no name)")
+            continue
+        valid.append(activity)
+
+    position: dict[str, int] = {}
+    for i, activity in enumerate(valid):
+        name = activity["name"]
+        if name in position:
+            report.duplicate_names.append(prefix + name)
+            continue
+        position[name] = i
+        report.all_activities.append((scope, activity))
+        _check_activity(activity, prefix + name, report)
+
+    # Edges run from a dependency to its dependent; a missing dependency is never satisfied
+    children: list[list[int]] = [[] for _ in valid]
+    waiting = [0] * len(valid)
+    for i, activity in enumerate(valid):
+        depends_on = activity.get("dependsOn") or []
+        if not isinstance(depends_on, list):
+            report.invalid_activities.append(f"{prefix}{activity['name']} (dependsOn is not a list)")
+            continue
+        for dependency in depends_on:
+            upstream = dependency.get("activity") if isinstance(dependency, dict) else None
+            conditions = dependency.get("dependencyConditions") if isinstance(dependency, dict) else None
+            if not isinstance(conditions, list) or not conditions or not DEPENDENCY_CONDITIONS.issuperset(conditions):
+                report.invalid_conditions.append(f"{prefix}{activity['name']} -> {upstream}: {conditions!r}")
+            else:
+                report.conditions.update(conditions)
+            waiting[i] += 1
+            if upstream in position:
+                children[position[upstream]].append(i)
+                report.dependencies += 1
+            else:
+                report.dangling.append(f"{prefix}{activity['name']} -> {upstream}")
+
+    # Kahn: whatever never becomes ready is in a cycle or waits on one (or on a missing activity)
+    ready = [i for i, count in enumerate(waiting) if count == 0]
+    ordered = 0
+    while ready:
+        node = ready.pop()
+        ordered += 1
+        for child in children[node]:
+            waiting[child] -= 1
+            if waiting[child] == 0:
+                ready.append(child)
+    if ordered < len(valid):
+        blocked = [i for i, count in enumerate(waiting) if count > 0]
+        cycles = _tarjan_cycles(blocked, children)
+        in_cycle = {node for cycle in cycles for node in cycle}
+        report.cycles.extend([prefix + valid[node]["name"] for node in cycle] for cycle in cycles)
+        report.unreachable.extend(prefix + valid[node]["name"] for node in blocked if node not in in_cycle)
+
+    for activity in valid:
+        for suffix, inner in _inner_scopes(activity):
+            _check_scope(inner, f"{prefix}{activity['name']}.{suffix}", report)
+
+
+def analyze(text: str) -> PipelineReport:
+    """Parse the pipeline JSON of an answer and check its activities and dependency graph."""
+    report = PipelineReport()
+    for value in _json_candidates(text):
+        report.parsed = True
+        document = _pipeline_document(value)
+        if document is not None:
+            report.document = document
+            break
+    if report.document is None:
+        return report
+    activities = report.document["properties"]["activities"]
+    report.activities = [a for a in activities if isinstance(a, dict)]
+    _check_scope(activities, "", report)
+    return report
+
+
+# Each answer is checked by several rules
+validate = lru_cache(maxsize=256)(analyze)
+
+
+# ---------------------------------------------------------------------------
+# Rules
+# ---------------------------------------------------------------------------
+
+def _type_property(report: PipelineReport, arg: str) -> bool:
+    key, _, expected = arg.partition("=")
+    return any(str((activity.get("typeProperties") or {}).get(key)) == expected
+               for _, activity in report.all_activities if isinstance(activity.get("typeProperties"), dict))
+
+
+def _has_policy(report: PipelineReport, _: str) -> bool:
+    return bool(report.all_activities) and all(
+        isinstance(activity.get("policy"), dict) and all(f in activity["policy"] for f in POLICY_FIELDS)
+        for _, activity in report.all_activities)
+
+
+# Rule name -> check(report, argument); a ValidationRule pattern is "name" or "name:argument"
+CHECKS: dict[str, Callable[[PipelineReport, str], bool]] = {
+    # The block holding the pipeline parses; another block that parses doesn't count
+    "json": lambda r, _: r.document is not None,
+    "activities": lambda r, _: bool(r.activities),
+    "activity_count": lambda r, n: len(r.activities) == int(n),
+    "has_type": lambda r, t: any(a.get("type") == t for a in r.activities),
+    "all_type": lambda r, t: bool(r.activities) and all(a.get("type") == t for a in r.activities),
+    "type_property": _type_property,
+    "policy": _has_policy,
+    "condition": lambda r, c: c in r.conditions and not r.invalid_conditions,
+    # At least one dependency, and every activity can run
+    "depends_on": lambda r, _: r.dependencies > 0 and r.graph_ok,
+    "schema": lambda r, _: bool(r.activities) and r.schema_ok,
+    "valid": lambda r, _: bool(r.activities) and r.schema_ok and r.graph_ok,
+}
+
+
+def check(text: str, rule: str) -> bool:
+    name, _, arg = rule.partition(":")
+    return CHECKS[name](validate(text), arg)
+
+
+def main():
+    if len(sys.argv) != 2:
+        print(__doc__.strip().split("Usage:")[1], file=sys.stderr)
+        sys.exit(2)
+    report = analyze(Path(sys.argv[1]).read_text())
+    print(f"{len(report.all_activities)} activities ({len(report.activities)} top-level), "
+          f"{report.dependencies} dependencies")
+    for issue in report.issues():
+        print(f"  {issue}")
+    sys.exit(0 if report.schema_ok and report.graph_ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Eval Results History (SQLite)
+
+Both eval runners append every run to an embedded SQLite database so results can be
+compared across commits and models long after CI artifacts expire.
+
+Usage:
+    python results_db.py runs                                # Recent runs
+    python results_db.py regressions                         # Latest run vs last main run
+    python results_db.py regressions --run 42 --branch main
+    python results_db.py latency-trend --model gpt-4o        # Avg latency / tokens per run
+    python results_db.py flaky-rules --last 50               # Rules whose outcome flips most
+    python results_db.py merge other.db                      # Import runs recorded elsewhere (CI)
+
+Environment variables:
+    EVAL_HISTORY_DB    - Database path (default: evals/eval_history.db)
+"""
+
+import argparse
+import os
+import sqlite3
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+
+DEFAULT_DB_PATH = Path(os.environ.get("EVAL_HISTORY_DB", Path(__file__).parent / "eval_history.db"))
+
+# Ordering used to decide whether a scenario got worse between runs.
+# "skip" is not ranked: skipped scenarios never count as regressions.
+RESULT_RANK = {"pass": 3, "partial": 2, "fail": 1, "error": 0}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      INTEGER PRIMARY KEY,
+    runner      TEXT NOT NULL,          -- "tool_selection" | "integration"
+    started_at  TEXT NOT NULL,          -- ISO-8601 UTC
+    model       TEXT NOT NULL,
+    commit_sha  TEXT,
+    branch      TEXT,
+    score       REAL
+);
+
+CREATE TABLE IF NOT EXISTS scenarios (
+    run_id            INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    eval_id           TEXT NOT NULL,
+    mode              TEXT NOT NULL,    -- "default" | "live" | "baseline" | "with_skills"
+    source_file       TEXT,
+    category          TEXT,
+    difficulty        TEXT,
+    result            TEXT,
+    explanation       TEXT,
+    latency_ms        REAL,
+    prompt_tokens     INTEGER,
+    completion_tokens INTEGER,
+    PRIMARY KEY (run_id, eval_id, mode)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS rule_results (
+    run_id   INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    eval_id  TEXT NOT NULL,
+    mode     TEXT NOT NULL,
+    rule     TEXT NOT NULL,
+    passed   INTEGER NOT NULL,
+    PRIMARY KEY (run_id, eval_id, mode, rule)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS ix_runs_runner_branch ON runs(runner, branch, run_id);
+CREATE INDEX IF NOT EXISTS ix_runs_model ON runs(model, run_id);
+CREATE INDEX IF NOT EXISTS ix_runs_commit ON runs(commit_sha);
+CREATE INDEX IF NOT EXISTS ix_scenarios_eval ON scenarios(eval_id, mode, run_id);
+CREATE INDEX IF NOT EXISTS ix_rule_results_rule ON rule_results(eval_id, mode, rule, run_id);
+"""
+
+
+# ---------------------------------------------------------------------------
+# Records
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ScenarioRecord:
+    eval_id: str
+    mode: str
+    result: Optional[str]
+    source_file: str = ""
+    category: str = ""
+    difficulty: str = ""
+    explanation: str = ""
+    latency_ms: Optional[float] = None
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    rules: list[tuple[str, bool]] = field(default_factory=list)  # (rule description, passed)
+
+
+# ---------------------------------------------------------------------------
+# Connection / writes
+# ---------------------------------------------------------------------------
+
+def connect(db_path: Path = DEFAULT_DB_PATH) -> sqlite3.Connection:
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        out = subprocess.run(["git", *args], capture_output=True, text=True, timeout=5,
+                             cwd=Path(__file__).parent)
+        if out.returncode != 0:
+            return None
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def current_commit() -> Optional[str]:
+    return os.environ.get("GITHUB_SHA") or _git("rev-parse", "HEAD")
+
+
+def current_branch() -> Optional[str]:
+    # On pull_request events GITHUB_REF_NAME is "<pr>/merge"; the head ref is more useful.
+    return (os.environ.get("GITHUB_HEAD_REF") or os.environ.get("GITHUB_REF_NAME")
+            or _git("rev-parse", "--abbrev-ref", "HEAD"))
+
+
+def record_run(
+    runner: str,
+    model: str,
+    records: list[ScenarioRecord],
+    score: Optional[float] = None,
+    db_path: Path = DEFAULT_DB_PATH,
+) -> int:
+    """Append one run with all its scenario and rule outcomes. Returns the run_id."""
+    conn = connect(db_path)
+    try:
+        with conn:
+            cur = conn.execute(
+                "INSERT INTO runs (runner, started_at, model, commit_sha, branch, score) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (runner, datetime.now(timezone.utc).isoformat(timespec="seconds"), model,
+                 current_commit(), current_branch(), score),
+            )
+            run_id = cur.lastrowid
+            conn.executemany(
+                "INSERT OR REPLACE INTO scenarios (run_id, eval_id, mode, source_file, category, difficulty, "
+                "result, explanation, latency_ms, prompt_tokens, completion_tokens) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, r.eval_id, r.mode, r.source_file, r.category, r.difficulty, r.result,
+                  r.explanation, r.latency_ms, r.prompt_tokens, r.completion_tokens) for r in records],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO rule_results (run_id, eval_id, mode, rule, passed) VALUES (?, ?, ?, ?, ?)",
+                [(run_id, r.eval_id, r.mode, rule, int(passed)) for r in records for rule, passed in r.rules],
+            )
+        return run_id
+    finally:
+        conn.close()
+
+
+def merge_runs(conn: sqlite3.Connection, source_path: Path) -> int:
+    """Copy the runs in source_path that conn does not have yet. Returns the number of runs added.
+
+    Runs are matched on (runner, started_at, model, commit_sha) and renumbered, so databases
+    restored from the same history and extended independently merge without collisions.
+    """
+    source = connect(source_path)
+    try:
+        added = 0
+        with conn:
+            for run in source.execute("SELECT * FROM runs ORDER BY run_id"):
+                exists = conn.execute(
+                    "SELECT 1 FROM runs WHERE runner = ? AND started_at = ? AND model = ? AND commit_sha IS ?",
+                    (run["runner"], run["started_at"], run["model"], run["commit_sha"]),
+                ).fetchone()
+                if exists:
+                    continue
+                run_id = conn.execute(
+                    "INSERT INTO runs (runner, started_at, model, commit_sha, branch, score) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (run["runner"], run["started_at"], run["model"], run["commit_sha"], run["branch"], run["score"]),
+                ).lastrowid
+                conn.executemany(
+                    "INSERT INTO scenarios (run_id, eval_id, mode, source_file, category, difficulty, "
+                    "result, explanation, latency_ms, prompt_tokens, completion_tokens) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(run_id, *row) for row in source.execute(
+                        "SELECT eval_id, mode, source_file, category, difficulty, result, explanation, "
+                        "latency_ms, prompt_tokens, completion_tokens FROM scenarios WHERE run_id = ?",
+                        (run["run_id"],))],
+                )
+                conn.executemany(
+                    "INSERT INTO rule_results (run_id, eval_id, mode, rule, passed) VALUES (?, ?, ?, ?, ?)",
+                    [(run_id, *row) for row in source.execute(
+                        "SELECT eval_id, mode, rule, passed FROM rule_results WHERE run_id = ?",
+                        (run["run_id"],))],
+                )
+                added += 1
+        return added
+    finally:
+        source.close()
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+def list_runs(conn: sqlite3.Connection, runner: Optional[str] = None, limit: int = 20) -> list[sqlite3.Row]:
+    sql = "SELECT * FROM runs"
+    params: list = []
+    if runner:
+        sql += " WHERE runner = ?"
+        params.append(runner)
+    sql += " ORDER BY run_id DESC LIMIT ?"
+    params.append(limit)
+    return conn.execute(sql, params).fetchall()
+
+
+def find_baseline_run(conn: sqlite3.Connection, run_id: int, branch: str = "main") -> Optional[int]:
+    """Latest run on `branch` with the same runner that precedes run_id."""
+    row = conn.execute(
+        "SELECT b.run_id FROM runs r JOIN runs b ON b.runner = r.runner "
+        "WHERE r.run_id = ? AND b.branch = ? AND b.run_id < r.run_id "
+        "ORDER BY b.run_id DESC LIMIT 1",
+        (run_id, branch),
+    ).fetchone()
+    return row["run_id"] if row else None
+
+
+def regressions(conn: sqlite3.Connection, run_id: int, baseline_run_id: int) -> list[sqlite3.Row]:
+    """Scenarios whose result ranks lower in run_id than in baseline_run_id."""
+    rank_case = "CASE {col} " + " ".join(f"WHEN '{k}' THEN {v}" for k, v in RESULT_RANK.items()) + " END"
+    sql = (
+        "SELECT c.eval_id, c.mode, b.result AS before, c.result AS after, c.explanation "
+        "FROM scenarios c JOIN scenarios b "
+        "  ON b.run_id = ? AND b.eval_id = c.eval_id AND b.mode = c.mode "
+        f"WHERE c.run_id = ? AND {rank_case.format(col='c.result')} < {rank_case.format(col='b.result')} "
+        "ORDER BY c.eval_id, c.mode"
+    )
+    return conn.execute(sql, (baseline_run_id, run_id)).fetchall()
+
+
+def latency_trend(
+    conn: sqlite3.Connection,
+    model: Optional[str] = None,
+    runner: Optional[str] = None,
+    limit: int = 20,
+) -> list[sqlite3.Row]:
+    """Average/max latency and token usage per run, newest first."""
+    where = []
+    params: list = []
+    if model:
+        where.append("r.model = ?")
+        params.append(model)
+    if runner:
+        where.append("r.runner = ?")
+        params.append(runner)
+    sql = (
+        "SELECT r.run_id, r.started_at, r.model, r.runner, r.commit_sha, "
+        "  COUNT(s.latency_ms) AS calls, AVG(s.latency_ms) AS avg_ms, MAX(s.latency_ms) AS max_ms, "
+        "  AVG(s.prompt_tokens) AS avg_prompt_tokens, AVG(s.completion_tokens) AS avg_completion_tokens "
+        "FROM (SELECT * FROM runs r" + (" WHERE " + " AND ".join(where) if where else "") +
+        "      ORDER BY r.run_id DESC LIMIT ?) r "
+        "JOIN scenarios s ON s.run_id = r.run_id "
+        "GROUP BY r.run_id ORDER BY r.run_id DESC"
+    )
+    return conn.execute(sql, [*params, limit]).fetchall()
+
+
+def flaky_rules(
+    conn: sqlite3.Connection,
+    last: int = 50,
+    min_runs: int = 3,
+    runner: Optional[str] = None,
+    limit: int = 20,
+) -> list[sqlite3.Row]:
+    """Rules with the most mixed pass/fail outcomes over the last N runs.
+
+    flakiness = min(passes, failures) / runs — 0.5 means a coin flip, 0 means stable.
+    """
+    run_filter = "SELECT run_id FROM runs" + (" WHERE runner = ?" if runner else "") + \
+        " ORDER BY run_id DESC LIMIT ?"
+    params: list = [runner, last] if runner else [last]
+    sql = (
+        "SELECT eval_id, mode, rule, COUNT(*) AS runs, SUM(passed) AS passes, "
+        "  CAST(MIN(SUM(passed), COUNT(*) - SUM(passed)) AS REAL) / COUNT(*) AS flakiness "
+        f"FROM rule_results WHERE run_id IN ({run_filter}) "
+        "GROUP BY eval_id, mode, rule HAVING COUNT(*) >= ? AND flakiness > 0 "
+        "ORDER BY flakiness DESC, runs DESC LIMIT ?"
+    )
+    return conn.execute(sql, [*params, min_runs, limit]).fetchall()
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _fmt(value, spec: str = "") -> str:
+    return "—" if value is None else format(value, spec)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query eval results history")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="History database path")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_runs = sub.add_parser("runs", help="List recent runs")
+    p_runs.add_argument("--runner", choices=["tool_selection", "integration"])
+    p_runs.add_argument("--limit", type=int, default=20)
+
+    p_reg = sub.add_parser("regressions", help="Scenarios that regressed vs the last run on a branch")
+    p_reg.add_argument("--run", type=int, help="Run to check (default: latest run)")
+    p_reg.add_argument("--runner", choices=["tool_selection", "integration"])
+    p_reg.add_argument("--branch", default="main", help="Baseline branch (default: main)")
+
+    p_lat = sub.add_parser("latency-trend", help="Latency and token usage per run")
+    p_lat.add_argument("--model")
+    p_lat.add_argument("--runner", choices=["tool_selection", "integration"])
+    p_lat.add_argument("--limit", type=int, default=20)
+
+    p_flaky = sub.add_parser("flaky-rules", help="Rules whose outcome flips most often")
+    p_flaky.add_argument("--last", type=int, default=50, help="Consider the last N runs")
+    p_flaky.add_argument("--min-runs", type=int, default=3)
+    p_flaky.add_argument("--runner", choices=["tool_selection", "integration"])
+    p_flaky.add_argument("--limit", type=int, default=20)
+
+    p_merge = sub.add_parser("merge", help="Import runs from other history databases (skips runs already present)")
+    p_merge.add_argument("sources", nargs="+", help="History database(s) to import from")
+
+    args = parser.parse_args()
+
+    if args.command == "merge":
+        conn = connect(Path(args.db))
+        for source in args.sources:
+            if not Path(source).exists():
+                print(f"Skipping {source}: not found", file=sys.stderr)
+                continue
+            print(f"  {source}: {merge_runs(conn, Path(source))} new run(s)")
+        conn.close()
+        return
+
+    if not Path(args.db).exists():
+        print(f"No history database at {args.db}", file=sys.stderr)
+        sys.exit(1)
+    conn = connect(Path(args.db))
+
+    if args.command == "runs":
+        for r in list_runs(conn, args.runner, args.limit):
+            print(f"  #{r['run_id']:<5} {r['started_at']}  {r['runner']:15s} {r['model']:20s} "
+                  f"{(r['branch'] or '—'):20s} {(r['commit_sha'] or '—')[:8]}  score={_fmt(r['score'], '.1f')}")
+
+    elif args.command == "regressions":
+        run_id = args.run
+        if run_id is None:
+            latest = list_runs(conn, args.runner, 1)
+            if not latest:
+                print("No runs recorded", file=sys.stderr)
+                sys.exit(1)
+            run_id = latest[0]["run_id"]
+        baseline = find_baseline_run(conn, run_id, args.branch)
+        if baseline is None:
+            print(f"No earlier run on '{args.branch}' to compare run #{run_id} against", file=sys.stderr)
+            sys.exit(1)
+        rows = regressions(conn, run_id, baseline)
+        print(f"Run #{run_id} vs #{baseline} ({args.branch}): {len(rows)} regression(s)")
+        for r in rows:
+            print(f"  {r['eval_id']} [{r['mode']}]: {r['before']} → {r['after']}  {r['explanation'] or ''}")
+        if rows:
+            sys.exit(2)
+
+    elif args.command == "latency-trend":
+        print(f"  {'run':>6}  {'started_at':25s} {'model':20s} {'calls':>5} {'avg ms':>8} {'max ms':>8} "
+              f"{'prompt tok':>10} {'compl tok':>10}")
+        for r in latency_trend(conn, args.model, args.runner, args.limit):
+            print(f"  #{r['run_id']:<5} {r['started_at']:25s} {r['model']:20s} {r['calls']:>5} "
+                  f"{_fmt(r['avg_ms'], '8.0f')} {_fmt(r['max_ms'], '8.0f')} "
+                  f"{_fmt(r['avg_prompt_tokens'], '10.0f')} {_fmt(r['avg_completion_tokens'], '10.0f')}")
+
+    elif args.command == "flaky-rules":
+        for r in flaky_rules(conn, args.last, args.min_runs, args.runner, args.limit):
+            print(f"  {r['flakiness']:.2f}  {r['passes']}/{r['runs']} passed  "
+                  f"{r['eval_id']} [{r['mode']}]: {r['rule']}")
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,22 +11,38 @@ Usage:
     python run_evals.py --eval EVAL-AUTH-001     # Run one scenario
     python run_evals.py --category "Tool Selection"  # Filter by category
     python run_evals.py --dry-run                # Parse only, no LLM calls
+    python run_evals.py --dry-run --max-prompt-tokens 8000   # Fail on prompts over budget
+    python run_evals.py --judge                  # Also grade **Assertions:** with an LLM judge
+    python run_evals.py --live                   # Execute tool calls against a warm stdio server
+    python run_evals.py --tools-schema variant.json   # Send other tool definitions (see perf/tool_schema_study.py)
+    python run_evals.py --deployments pool.json --workers 16   # Spread requests over several deployments
 
 Environment variables:
     OPENAI_API_KEY     - API key (required unless --dry-run)
     EVAL_MODEL         - Model to test (default: gpt-4o)
     EVAL_BASE_URL      - API base URL (default: https://api.openai.com/v1)
+    EVAL_DEPLOYMENTS   - Deployments file for --deployments (see deployment_pool.py)
+    EVAL_JUDGE_MODEL   - Judge model for --judge (default: same as --model)
+    EVAL_HISTORY_DB    - Results history database (default: evals/eval_history.db)
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
+
+import deployment_pool
+import eval_stats
+import http_pool
+import results_db
+import token_budget
 
 
 # ---------------------------------------------------------------------------
@@ -51,10 +67,30 @@ class EvalScenario:
     assertions: list[str]
     notes: Optional[str]
     source_file: str
+    # Ordered calls of a multi-step scenario (**Expected tool call sequence:**); not scored
+    expected_sequence: list[ExpectedToolCall] = field(default_factory=list)
     # Set after evaluation
     result: Optional[str] = None  # "pass", "partial", "fail", "skip", "error"
     actual_tools: list[dict] = field(default_factory=list)
+    response_text: str = ""
     explanation: str = ""
+    latency_ms: Optional[float] = None
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    # Offline estimate of the first request's prompt tokens (token_budget.py)
+    estimated_prompt_tokens: Optional[int] = None
+    # Set in --live mode: executed tool calls (see live_tools.ToolExecution.record)
+    tool_executions: list[dict] = field(default_factory=list)
+    # Set by the judge stage (--judge)
+    verdicts: list["AssertionVerdict"] = field(default_factory=list)
+
+
+@dataclass
+class AssertionVerdict:
+    assertion: str
+    passed: Optional[bool]  # None = not judged (judge error or missing verdict)
+    reason: str = ""
+    cached: bool = False
 
 
 # ---------------------------------------------------------------------------
@@ -84,6 +120,7 @@ def parse_eval_file(filepath: Path) -> list[EvalScenario]:
         assertions = _extract_list(block, "Assertions")
         notes = _extract_blockquote(block, "Notes")
         expected_tools = _extract_expected_tools(block)
+        expected_sequence = _extract_expected_tools(block, "Expected tool call sequence")
 
         scenarios.append(EvalScenario(
             eval_id=eval_id,
@@ -96,6 +133,7 @@ def parse_eval_file(filepath: Path) -> list[EvalScenario]:
             assertions=assertions,
             notes=notes,
             source_file=filepath.name,
+            expected_sequence=expected_sequence,
         ))
 
     return scenarios
@@ -127,9 +165,9 @@ def _extract_list(block: str, section_name: str) -> list[str]:
     return [re.sub(r"^\s*-\s+", "", line).strip() for line in lines if line.strip()]
 
 
-def _extract_expected_tools(block: str) -> list[ExpectedToolCall]:
-    """Extract expected tool calls from the **Expected tool call(s):** section."""
-    pattern = r"\*\*Expected tool call\(s\):\*\*\s*\n((?:[\s\S]*?)(?=\n\*\*|$))"
+def _extract_expected_tools(block: str, heading: str = "Expected tool call(s)") -> list[ExpectedToolCall]:
+    """Extract expected tool calls from the **Expected tool call(s):** (or another heading's) section."""
+    pattern = rf"\*\*{re.escape(heading)}:\*\*\s*\n((?:[\s\S]*?)(?=\n\*\*|$))"
     m = re.search(pattern, block)
     if not m:
         return []
@@ -175,6 +213,36 @@ def _build_azure_url(base_url: str, model: str) -> str:
     return f"{base}/openai/deployments/{model}/chat/completions?api-version=2024-10-21"
 
 
+SYSTEM_PROMPT = (
+    "You are an AI assistant that helps users work with Microsoft Fabric Data Factory. "
+    "You have access to MCP tools for authentication, workspaces, capacities, connections, "
+    "gateways, dataflows, and pipelines. Use the appropriate tools to fulfill user requests. "
+    "If you need more information, ask the user."
+)
+
+
+def build_messages(prompt: str, context: Optional[str] = None) -> list[dict]:
+    """Chat messages for a tool-selection scenario."""
+    messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+    if context:
+        messages.append({"role": "assistant", "content": f"[Prior context]\n{context}"})
+    messages.append({"role": "user", "content": prompt})
+    return messages
+
+
+# Completion tokens assumed per request in the cost projection (a tool call or a short answer)
+EXPECTED_COMPLETION_TOKENS = 200
+
+
+def estimate_prompt_tokens(scenario: EvalScenario, tools: list[dict], estimator: token_budget.TokenEstimator) -> int:
+    """Offline prompt tokens of the scenario's (first) request, as build_messages composes it."""
+    messages = [estimator.part("system", SYSTEM_PROMPT)]
+    if scenario.context:
+        messages.append(estimator.count(f"[Prior context]\n{scenario.context}"))
+    messages.append(estimator.count(scenario.user_prompt))
+    return estimator.chat(messages) + estimator.tools(tools)
+
+
 def call_llm(
     prompt: str,
     tools: list[dict],
@@ -184,24 +252,7 @@ def call_llm(
     api_key: str = "",
 ) -> dict:
     """Call the LLM with tool definitions and return the response."""
-    import urllib.request
-
-    messages = []
-
-    messages.append({
-        "role": "system",
-        "content": (
-            "You are an AI assistant that helps users work with Microsoft Fabric Data Factory. "
-            "You have access to MCP tools for authentication, workspaces, capacities, connections, "
-            "gateways, dataflows, and pipelines. Use the appropriate tools to fulfill user requests. "
-            "If you need more information, ask the user."
-        ),
-    })
-
-    if context:
-        messages.append({"role": "assistant", "content": f"[Prior context]\n{context}"})
-
-    messages.append({"role": "user", "content": prompt})
+    messages = build_messages(prompt, context)
 
     body = {
         "model": model,
@@ -211,6 +262,27 @@ def call_llm(
         "temperature": 0,
     }
 
+    return _post_chat_completion(body, model=model, base_url=base_url, api_key=api_key)
+
+
+def _post_chat_completion(
+    body: Union[dict, bytes],
+    model: str,
+    base_url: str,
+    api_key: str,
+    timeout: int = 60,
+) -> dict:
+    """POST a chat completions request and return the parsed JSON (or {"error": ...}).
+
+    `body` may be pre-encoded JSON bytes. Connections are kept alive between calls. With a
+    deployment pool configured, the request goes to the pool instead of `base_url`.
+    """
+    if deployment_pool.ACTIVE:
+        try:
+            return deployment_pool.ACTIVE.post_json(body, timeout=timeout)
+        except Exception as e:
+            return {"error": str(e)}
+
     is_azure = _is_azure_openai(base_url)
 
     if is_azure:
@@ -226,15 +298,8 @@ def call_llm(
             "Authorization": f"Bearer {api_key}",
         }
 
-    req = urllib.request.Request(
-        url,
-        data=json.dumps(body).encode(),
-        headers=headers,
-    )
-
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            return json.loads(resp.read())
+        return http_pool.DEFAULT_CLIENT.post_json(url, body, headers, timeout=timeout)
     except Exception as e:
         return {"error": str(e)}
 
@@ -264,10 +329,106 @@ def extract_tool_calls(response: dict) -> list[dict]:
     return results
 
 
+def extract_response_text(response: dict) -> str:
+    """Extract the assistant's text reply (if any) from an LLM response."""
+    choices = response.get("choices", [])
+    if not choices:
+        return ""
+    return choices[0].get("message", {}).get("content") or ""
+
+
+def run_live_scenario(
+    scenario: EvalScenario,
+    tools: list[dict],
+    server,
+    model: str,
+    base_url: str,
+    api_key: str,
+    max_turns: int = 4,
+) -> list[dict]:
+    """Agent loop for --live: execute each tool call on `server` (a live_tools.LiveToolServer)
+    and feed the real response back until the model answers without tools or max_turns is hit.
+
+    Fills the scenario's usage, response text and tool executions; returns every tool call
+    the model made, in order, for scoring.
+    """
+    messages = build_messages(scenario.user_prompt, scenario.context)
+    calls: list[dict] = []
+    scenario.prompt_tokens = scenario.completion_tokens = 0
+    for _ in range(max_turns):
+        response = _post_chat_completion({
+            "model": model,
+            "messages": messages,
+            "tools": tools,
+            "tool_choice": "auto",
+            "temperature": 0,
+        }, model=model, base_url=base_url, api_key=api_key)
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        usage = response.get("usage") or {}
+        scenario.prompt_tokens += usage.get("prompt_tokens") or 0
+        scenario.completion_tokens += usage.get("completion_tokens") or 0
+        scenario.response_text = extract_response_text(response)
+
+        message = response["choices"][0]["message"]
+        turn_calls = message.get("tool_calls") or []
+        if not turn_calls:
+            break
+        messages.append(message)
+        for call, parsed in zip(turn_calls, extract_tool_calls(response)):
+            calls.append(parsed)
+            execution = server.call(parsed["name"], parsed["arguments"])
+            scenario.tool_executions.append(execution.record())
+            messages.append({"role": "tool", "tool_call_id": call.get("id", ""), "content": execution.text})
+    return calls
+
+
 # ---------------------------------------------------------------------------
 # Scoring
 # ---------------------------------------------------------------------------
 
+def run_scenario(scenario: EvalScenario, tools: list[dict], args: argparse.Namespace, api_key: str,
+                 live_server=None) -> EvalScenario:
+    """Run one scenario against the model (and the live server, if any) and score it in place."""
+    try:
+        started = time.perf_counter()
+        if live_server:
+            # Latency covers every model turn plus the tool executions between them
+            actual_calls = run_live_scenario(scenario, tools, live_server, model=args.model,
+                                             base_url=args.base_url, api_key=api_key,
+                                             max_turns=args.max_turns)
+            scenario.latency_ms = (time.perf_counter() - started) * 1000
+            scenario.actual_tools = actual_calls
+            scenario.result, scenario.explanation = score_scenario(scenario, actual_calls)
+        else:
+            response = call_llm(
+                prompt=scenario.user_prompt,
+                tools=tools,
+                context=scenario.context,
+                model=args.model,
+                base_url=args.base_url,
+                api_key=api_key,
+            )
+            scenario.latency_ms = (time.perf_counter() - started) * 1000
+            usage = response.get("usage") or {}
+            scenario.prompt_tokens = usage.get("prompt_tokens")
+            scenario.completion_tokens = usage.get("completion_tokens")
+
+            if "error" in response:
+                scenario.result = "error"
+                scenario.explanation = response["error"]
+            else:
+                actual_calls = extract_tool_calls(response)
+                scenario.actual_tools = actual_calls
+                scenario.response_text = extract_response_text(response)
+                scenario.result, scenario.explanation = score_scenario(scenario, actual_calls)
+
+    except Exception as e:
+        scenario.result = "error"
+        scenario.explanation = str(e)
+    return scenario
+
+
 def score_scenario(scenario: EvalScenario, actual_calls: list[dict]) -> tuple[str, str]:
     """Score: pass / partial / fail with explanation."""
     if not scenario.expected_tools:
@@ -320,6 +481,238 @@ def score_scenario(scenario: EvalScenario, actual_calls: list[dict]) -> tuple[st
     return "pass", "All tools and parameters match"
 
 
+# ---------------------------------------------------------------------------
+# LLM judge (natural-language assertions)
+# ---------------------------------------------------------------------------
+
+# Bump when the judge prompt or schema changes so cached verdicts are not reused.
+JUDGE_PROMPT_VERSION = "1"
+
+JUDGE_SYSTEM_PROMPT = (
+    "You grade an AI assistant that uses Microsoft Fabric Data Factory MCP tools. "
+    "You receive a JSON list of scenarios. Each has the user prompt, optional prior context, "
+    "the tool calls the assistant made, the text it replied with, and a list of assertions. "
+    "Decide independently for every assertion whether the assistant's behavior satisfies it. "
+    "Judge only what is observable in the transcript. If an assertion cannot be verified from it, "
+    "mark it as not passed and say why. Return exactly one verdict per assertion key."
+)
+
+JUDGE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "assertion_verdicts",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "verdicts": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "key": {"type": "string"},
+                            "passed": {"type": "boolean"},
+                            "reason": {"type": "string"},
+                        },
+                        "required": ["key", "passed", "reason"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["verdicts"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+DEFAULT_JUDGE_CACHE = Path(__file__).parent / ".cache" / "judge_cache.json"
+
+
+def assertion_cache_key(scenario: EvalScenario, assertion: str, judge_model: str) -> str:
+    """Content hash of everything the verdict depends on."""
+    payload = json.dumps(
+        [
+            JUDGE_PROMPT_VERSION,
+            judge_model,
+            scenario.user_prompt,
+            scenario.context,
+            scenario.actual_tools,
+            scenario.response_text,
+            assertion,
+        ],
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:24]
+
+
+def load_judge_cache(path: Path) -> dict[str, dict]:
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+
+def save_judge_cache(cache: dict[str, dict], path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(cache, indent=1, sort_keys=True))
+
+
+def _pack_judge_batches(
+    pending: list[tuple[EvalScenario, list[tuple[str, str]]]],
+    batch_size: int,
+) -> list[list[tuple[EvalScenario, list[tuple[str, str]]]]]:
+    """Group scenarios into batches of roughly batch_size assertions.
+
+    A scenario's assertions always travel together so its transcript is sent once.
+    """
+    batches = []
+    current: list[tuple[EvalScenario, list[tuple[str, str]]]] = []
+    count = 0
+    for scenario, items in pending:
+        if current and count + len(items) > batch_size:
+            batches.append(current)
+            current, count = [], 0
+        current.append((scenario, items))
+        count += len(items)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def call_judge(
+    batch: list[tuple[EvalScenario, list[tuple[str, str]]]],
+    model: str,
+    base_url: str,
+    api_key: str,
+) -> dict[str, dict]:
+    """Send one batched judge request. Returns {key: {"passed", "reason"}}."""
+    payload = [
+        {
+            "scenario": scenario.eval_id,
+            "user_prompt": scenario.user_prompt,
+            "context": scenario.context,
+            "tool_calls": scenario.actual_tools,
+            "response_text": scenario.response_text,
+            "assertions": [{"key": key, "text": text} for key, text in items],
+        }
+        for scenario, items in batch
+    ]
+    body = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": JUDGE_SYSTEM_PROMPT},
+            {"role": "user", "content": json.dumps(payload, indent=1)},
+        ],
+        "response_format": JUDGE_RESPONSE_FORMAT,
+        "temperature": 0,
+    }
+
+    response = _post_chat_completion(body, model=model, base_url=base_url, api_key=api_key, timeout=180)
+    if "error" in response:
+        raise RuntimeError(response["error"])
+
+    content = extract_response_text(response)
+    verdicts = json.loads(content).get("verdicts", [])
+    return {
+        v["key"]: {"passed": bool(v["passed"]), "reason": v.get("reason", "")}
+        for v in verdicts
+        if isinstance(v, dict) and "key" in v and "passed" in v
+    }
+
+
+def judge_scenarios(
+    scenarios: list[EvalScenario],
+    model: str,
+    base_url: str,
+    api_key: str,
+    batch_size: int = 40,
+    cache_path: Path = DEFAULT_JUDGE_CACHE,
+    delay: float = 0.0,
+) -> dict[str, int]:
+    """Grade every scenario's assertions, reusing cached verdicts where possible.
+
+    Uncached assertions are packed into a few structured-output requests rather than
+    one request per assertion. Sets scenario.verdicts and returns request stats.
+    """
+    cache = load_judge_cache(cache_path)
+    stats = {"assertions": 0, "cached": 0, "requests": 0, "unjudged": 0}
+
+    keyed: list[tuple[EvalScenario, list[tuple[str, str]]]] = []
+    pending: list[tuple[EvalScenario, list[tuple[str, str]]]] = []
+    for scenario in scenarios:
+        if scenario.result == "error" or not scenario.assertions:
+            continue
+        items = [(assertion_cache_key(scenario, a, model), a) for a in scenario.assertions]
+        keyed.append((scenario, items))
+        stats["assertions"] += len(items)
+        uncached = [(k, a) for k, a in items if k not in cache]
+        stats["cached"] += len(items) - len(uncached)
+        if uncached:
+            pending.append((scenario, uncached))
+
+    fresh: set[str] = set()
+    batches = _pack_judge_batches(pending, batch_size)
+    for i, batch in enumerate(batches):
+        stats["requests"] += 1
+        try:
+            results = call_judge(batch, model=model, base_url=base_url, api_key=api_key)
+        except (RuntimeError, json.JSONDecodeError, TypeError, KeyError) as e:
+            print(f"  Judge batch {i + 1}/{len(batches)} failed: {e}", file=sys.stderr)
+            results = {}
+        expected = {k for _, items in batch for k, _ in items}
+        for key in expected & results.keys():
+            cache[key] = results[key]
+            fresh.add(key)
+        if i < len(batches) - 1 and delay > 0:
+            time.sleep(delay)
+
+    for scenario, items in keyed:
+        scenario.verdicts = []
+        for key, assertion in items:
+            verdict = cache.get(key)
+            if verdict is None:
+                stats["unjudged"] += 1
+                scenario.verdicts.append(AssertionVerdict(assertion, None, "No verdict returned by judge"))
+            else:
+                scenario.verdicts.append(AssertionVerdict(
+                    assertion, verdict["passed"], verdict.get("reason", ""), cached=key not in fresh,
+                ))
+
+    if fresh:
+        save_judge_cache(cache, cache_path)
+    return stats
+
+
+def apply_judge_verdicts(scenario: EvalScenario):
+    """Merge assertion verdicts into the tool-selection result.
+
+    - Behavioral scenarios (previously "skip") are scored on assertions alone.
+    - A tool-level "pass" is downgraded to "partial" when an assertion fails.
+    """
+    judged = [v for v in scenario.verdicts if v.passed is not None]
+    if not judged:
+        return
+
+    failed = [v for v in judged if not v.passed]
+    failed_desc = "; ".join(f"{v.assertion} ({v.reason})" for v in failed[:3])
+
+    if scenario.result == "skip":
+        if not failed:
+            scenario.result = "pass"
+        elif len(failed) < len(judged):
+            scenario.result = "partial"
+        else:
+            scenario.result = "fail"
+        scenario.explanation = f"Judge: {len(judged) - len(failed)}/{len(judged)} assertions passed"
+        if failed:
+            scenario.explanation += f" — failed: {failed_desc}"
+    elif scenario.result == "pass" and failed:
+        scenario.result = "partial"
+        scenario.explanation = f"Tools match but judge failed {len(failed)}/{len(judged)} assertions: {failed_desc}"
+
+
 # ---------------------------------------------------------------------------
 # Reporter
 # ---------------------------------------------------------------------------
@@ -341,9 +734,32 @@ def print_result(scenario: EvalScenario):
     if scenario.actual_tools:
         names = [t["name"] for t in scenario.actual_tools]
         print(f"         Tools called: {names}")
+    if scenario.tool_executions:
+        timings = [f"{e['tool']} {e['latency_ms']:.0f} ms/~{e['response_tokens']} tok"
+                   + (" ✗" if e["error"] else "") for e in scenario.tool_executions]
+        print(f"         Executed: {', '.join(timings)}")
+
+
+RESULT_CREDIT = {"pass": 1.0, "partial": 0.5, "fail": 0.0}
+
+
+def score_interval(scenarios: list[EvalScenario], resamples: int = eval_stats.DEFAULT_RESAMPLES) -> eval_stats.Interval:
+    """Score with its bootstrap 95% CI over the scored scenarios (skips and errors are not scored)."""
+    credits = [RESULT_CREDIT[s.result] for s in scenarios if s.result in RESULT_CREDIT]
+    return eval_stats.ratio_ci(credits, resamples=resamples, scale=100)
+
+
+def print_breakdown(title: str, scenarios: list[EvalScenario], key, resamples: int):
+    print(f"\n{title}:")
+    for group in sorted(set(key(s) for s in scenarios)):
+        grouped = [s for s in scenarios if key(s) == group]
+        p = sum(1 for s in grouped if s.result == "pass")
+        interval = score_interval(grouped, resamples)
+        score = interval.format() if interval.n else "n/a"
+        print(f"  {group}: {p}/{len(grouped)} pass, score {score}")
 
 
-def print_summary(scenarios: list[EvalScenario]) -> float:
+def print_summary(scenarios: list[EvalScenario], resamples: int = eval_stats.DEFAULT_RESAMPLES) -> float:
     """Print summary and return the score as a percentage (0-100)."""
     total = len(scenarios)
     counts = {"pass": 0, "partial": 0, "fail": 0, "skip": 0, "error": 0}
@@ -364,19 +780,15 @@ def print_summary(scenarios: list[EvalScenario]) -> float:
     score = 0.0
     if scored > 0:
         score = (counts["pass"] + 0.5 * counts["partial"]) / scored * 100
-        print(f"\n  Score: {score:.1f}% ({scored} scored)")
+        interval = score_interval(scenarios, resamples)
+        print(f"\n  Score: {score:.1f}% ({scored} scored), 95% CI [{interval.low:.1f}, {interval.high:.1f}]")
     elif counts["error"] > 0:
         print(f"\n  Score: N/A (all {counts['error']} scenarios errored)")
     print("=" * 60)
 
-    # Per-file breakdown
-    files = sorted(set(s.source_file for s in scenarios))
-    print("\nPer-file breakdown:")
-    for f in files:
-        file_scenarios = [s for s in scenarios if s.source_file == f]
-        p = sum(1 for s in file_scenarios if s.result == "pass")
-        t = len(file_scenarios)
-        print(f"  {f}: {p}/{t} pass")
+    # Score CIs are bootstrap percentiles over scenarios (eval_stats.py)
+    print_breakdown("Per-file breakdown", scenarios, lambda s: s.source_file, resamples)
+    print_breakdown("Per-category breakdown", scenarios, lambda s: s.category, resamples)
 
     return score
 
@@ -391,16 +803,48 @@ def save_results(scenarios: list[EvalScenario], output_path: Path):
             "category": s.category,
             "difficulty": s.difficulty,
             "source_file": s.source_file,
+            "estimated_prompt_tokens": s.estimated_prompt_tokens,
+            "prompt_tokens": s.prompt_tokens,
+            "completion_tokens": s.completion_tokens,
+            "latency_ms": s.latency_ms,
             "result": s.result,
             "explanation": s.explanation,
             "expected_tools": [{"name": t.tool_name, "params": t.parameters} for t in s.expected_tools],
             "actual_tools": s.actual_tools,
+            "tool_executions": s.tool_executions,
+            "assertion_verdicts": [
+                {"assertion": v.assertion, "passed": v.passed, "reason": v.reason}
+                for v in s.verdicts
+            ],
         })
 
     output_path.write_text(json.dumps(results, indent=2))
     print(f"\nDetailed results saved to {output_path}")
 
 
+def record_history(scenarios: list[EvalScenario], model: str, score: float, db_path: Path,
+                   mode: str = "default"):
+    """Append this run to the SQLite results history."""
+    records = [
+        results_db.ScenarioRecord(
+            eval_id=s.eval_id,
+            mode=mode,
+            result=s.result,
+            source_file=s.source_file,
+            category=s.category,
+            difficulty=s.difficulty,
+            explanation=s.explanation,
+            latency_ms=s.latency_ms,
+            prompt_tokens=s.prompt_tokens,
+            completion_tokens=s.completion_tokens,
+            rules=[(v.assertion, v.passed) for v in s.verdicts if v.passed is not None],
+        )
+        for s in scenarios
+    ]
+    run_id = results_db.record_run("tool_selection", model, records, score=score, db_path=db_path)
+    print(f"Recorded run #{run_id} in {db_path}")
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -412,20 +856,61 @@ def main():
     parser.add_argument("--category", help="Filter by category (e.g., 'Tool Selection')")
     parser.add_argument("--difficulty", help="Filter by difficulty (e.g., 'Easy', 'Medium', 'Hard')")
     parser.add_argument("--dry-run", action="store_true", help="Parse only, no LLM calls")
+    parser.add_argument("--tools-schema", help="Tool definitions to send (default: evals/tools_schema.json)")
     parser.add_argument("--model", default=os.environ.get("EVAL_MODEL", "gpt-4o"), help="Model to evaluate")
     parser.add_argument("--base-url", default=os.environ.get("EVAL_BASE_URL", "https://api.openai.com/v1"))
     parser.add_argument("--output", default="eval_results.json", help="Output file for results")
     parser.add_argument("--delay", type=float, default=1.0, help="Delay between API calls (seconds)")
+    parser.add_argument("--resamples", type=int, default=eval_stats.DEFAULT_RESAMPLES,
+                        help="Bootstrap resamples for score confidence intervals")
     parser.add_argument("--fail-under", type=float, default=0.0,
                         help="Exit non-zero if score is below this percentage (default: 0 = always pass)")
+    parser.add_argument("--history-db", default=str(results_db.DEFAULT_DB_PATH),
+                        help="SQLite results history to append this run to")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run in the history database")
+    parser.add_argument("--judge", action="store_true",
+                        help="Grade **Assertions:** with a batched LLM judge and merge verdicts into the score")
+    parser.add_argument("--judge-model", default=os.environ.get("EVAL_JUDGE_MODEL"),
+                        help="Model used as judge (default: --model)")
+    parser.add_argument("--judge-batch-size", type=int, default=40,
+                        help="Max assertions packed into one judge request (default: 40)")
+    parser.add_argument("--judge-cache", default=str(DEFAULT_JUDGE_CACHE),
+                        help="Verdict cache file, keyed by content hash")
+    parser.add_argument("--live", action="store_true",
+                        help="Execute tool calls against a warm stdio MCP server backed by the Fabric stand-in, "
+                             "using its live tools/list instead of tools_schema.json")
+    parser.add_argument("--server-command", default=None,
+                        help="Command that starts the stdio MCP server for --live, run from the repo root "
+                             "(default: dotnet run -c Release --project DataFactory.MCP --)")
+    parser.add_argument("--max-turns", type=int, default=4,
+                        help="Model turns per scenario in --live mode (tool results are fed back between turns)")
+    parser.add_argument("--startup-timeout", type=float, default=180.0,
+                        help="Seconds to wait for the --live server to answer initialize (includes the build)")
+    parser.add_argument("--server-log", help="Write the --live server's stderr to this file")
+    parser.add_argument("--deployments", default=os.environ.get("EVAL_DEPLOYMENTS"),
+                        help="JSON file of equivalent deployments to spread requests over (see deployment_pool.py)")
+    parser.add_argument("--max-prompt-tokens", type=int, default=0,
+                        help="Fail before any request if a scenario's estimated prompt exceeds this (0 = no limit)")
+    parser.add_argument("--price-per-mtok",
+                        help="USD per million input,output tokens for the cost projection (default: list price of --model)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Scenarios run concurrently (not with --live); --delay applies only with 1 worker")
     args = parser.parse_args()
+    if args.workers > 1 and args.live:
+        parser.error("--workers > 1 is not supported with --live (the stdio server runs one call at a time)")
+
+    try:
+        price = token_budget.parse_price(args.price_per_mtok)
+    except ValueError as e:
+        parser.error(f"--price-per-mtok: {e}")
 
     evals_dir = Path(__file__).parent
-    schema_path = evals_dir / "tools_schema.json"
+    schema_path = Path(args.tools_schema) if args.tools_schema else evals_dir / "tools_schema.json"
 
-    # Load tool schemas
+    # Load tool schemas (--live replaces them with the server's tools/list once it is up)
     tools = json.loads(schema_path.read_text())["tools"]
-    print(f"Loaded {len(tools)} tool definitions from {schema_path.name}")
+    if not args.live:
+        print(f"Loaded {len(tools)} tool definitions from {schema_path.name}")
 
     # Parse eval files
     if args.file:
@@ -455,61 +940,135 @@ def main():
     print(f"Running {len(all_scenarios)} evals with model: {args.model}")
     print(f"{'=' * 60}\n")
 
+    # Pre-flight: projected prompt size and cost, before any request (--live estimates with the schema's tools)
+    estimator = token_budget.TokenEstimator(args.model, price)
+    estimates = []
+    for s in all_scenarios:
+        s.estimated_prompt_tokens = estimate_prompt_tokens(s, tools, estimator)
+        estimates.append(token_budget.estimate(estimator, s.eval_id, s.estimated_prompt_tokens,
+                                               EXPECTED_COMPLETION_TOKENS))
+    over_budget = token_budget.preflight(estimates, estimator, args.max_prompt_tokens)
+
     if args.dry_run:
-        for s in all_scenarios:
+        for s, e in zip(all_scenarios, estimates):
             exp = [f"{t.tool_name}({', '.join(f'{k}={v}' for k, v in t.parameters.items())})" for t in s.expected_tools]
             print(f"  {s.eval_id}: {s.title}")
             print(f"    Category: {s.category} | Difficulty: {s.difficulty}")
             print(f"    Prompt: {s.user_prompt[:80]}...")
             print(f"    Expected: {exp or '(behavioral)'}")
+            print(f"    Estimated prompt: {e.prompt_tokens:,} tokens ({token_budget.format_cost(e.cost)})")
             print()
         print(f"Dry run complete. {len(all_scenarios)} scenarios parsed.")
+        token_budget.exit_if_over(over_budget, args.max_prompt_tokens)
         return
+    token_budget.exit_if_over(over_budget, args.max_prompt_tokens)
 
-    # Validate API key
+    # Validate API key (a deployment pool reads each deployment's key from its own variable)
     api_key = os.environ.get("OPENAI_API_KEY", "")
-    if not api_key:
+    if args.deployments:
+        try:
+            pool = deployment_pool.configure(args.deployments, args.model)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error: cannot load deployments from {args.deployments}: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Spreading requests over {len(pool.deployments)} deployments: "
+              f"{', '.join(d.name for d in pool.deployments)}")
+    elif not api_key:
         print("Error: OPENAI_API_KEY environment variable not set", file=sys.stderr)
         print("Set it or use --dry-run to parse without LLM calls", file=sys.stderr)
         sys.exit(1)
 
-    # Run evals
-    current_file = None
-    for i, scenario in enumerate(all_scenarios):
-        if scenario.source_file != current_file:
-            current_file = scenario.source_file
-            print(f"\n--- {current_file} ---")
-
+    live_server = None
+    if args.live:
+        import live_tools
+
+        live_server = live_tools.LiveToolServer(
+            args.server_command or live_tools.DEFAULT_SERVER_COMMAND,
+            cwd=evals_dir.parent,
+            startup_timeout=args.startup_timeout,
+            log_path=Path(args.server_log) if args.server_log else None,
+        )
+        print(f"Starting MCP server over stdio: {' '.join(live_server.command)}")
         try:
-            response = call_llm(
-                prompt=scenario.user_prompt,
-                tools=tools,
-                context=scenario.context,
-                model=args.model,
-                base_url=args.base_url,
-                api_key=api_key,
-            )
-
-            if "error" in response:
-                scenario.result = "error"
-                scenario.explanation = response["error"]
-            else:
-                actual_calls = extract_tool_calls(response)
-                scenario.actual_tools = actual_calls
-                scenario.result, scenario.explanation = score_scenario(scenario, actual_calls)
-
+            tools = live_server.start()
         except Exception as e:
-            scenario.result = "error"
-            scenario.explanation = str(e)
-
-        print_result(scenario)
+            print(f"Error: MCP server did not start: {e or type(e).__name__}", file=sys.stderr)
+            if args.server_log:
+                print(f"See {args.server_log} for the server output", file=sys.stderr)
+            sys.exit(1)
+        print(f"Loaded {len(tools)} live tool definitions from tools/list "
+              f"(server ready in {live_server.startup_ms / 1000:.1f}s, stand-in {live_server.standin.base_url})")
 
-        if i < len(all_scenarios) - 1 and args.delay > 0:
-            time.sleep(args.delay)
+    # Run evals
+    current_file = None
+    try:
+        if args.workers > 1:
+            # Results are printed in scenario order as they complete; --delay does not apply
+            with ThreadPoolExecutor(max_workers=args.workers) as executor:
+                done = executor.map(lambda s: run_scenario(s, tools, args, api_key), all_scenarios)
+                for scenario in done:
+                    if scenario.source_file != current_file:
+                        current_file = scenario.source_file
+                        print(f"\n--- {current_file} ---")
+                    print_result(scenario)
+        else:
+            for i, scenario in enumerate(all_scenarios):
+                if scenario.source_file != current_file:
+                    current_file = scenario.source_file
+                    print(f"\n--- {current_file} ---")
+
+                run_scenario(scenario, tools, args, api_key, live_server)
+                print_result(scenario)
+
+                if i < len(all_scenarios) - 1 and args.delay > 0:
+                    time.sleep(args.delay)
+    finally:
+        if live_server:
+            live_server.close()
+
+    # Judge natural-language assertions
+    if args.judge:
+        judge_model = args.judge_model or args.model
+        print(f"\n--- Judging assertions with model: {judge_model} ---")
+        stats = judge_scenarios(
+            all_scenarios,
+            model=judge_model,
+            base_url=args.base_url,
+            api_key=api_key,
+            batch_size=args.judge_batch_size,
+            cache_path=Path(args.judge_cache),
+            delay=args.delay,
+        )
+        print(f"  {stats['assertions']} assertions: {stats['cached']} cached, "
+              f"{stats['requests']} judge requests, {stats['unjudged']} unjudged")
+        for scenario in all_scenarios:
+            before = scenario.result
+            apply_judge_verdicts(scenario)
+            if scenario.result != before:
+                print(f"  {scenario.eval_id}: {before} → {scenario.result}")
 
     # Report
-    score = print_summary(all_scenarios)
+    score = print_summary(all_scenarios, args.resamples)
+    if not args.live:
+        # --live sums every turn's usage, so only single-request runs compare like for like
+        token_budget.print_accuracy([(s.estimated_prompt_tokens, s.prompt_tokens) for s in all_scenarios], estimator)
     save_results(all_scenarios, Path(args.output))
+    if live_server:
+        tool_summary = live_server.summary()
+        live_tools.print_tool_summary(tool_summary)
+        summary_path = Path(args.output).with_suffix(".tools.json")
+        summary_path.write_text(json.dumps({"startup_ms": round(live_server.startup_ms or 0, 1),
+                                            "tools": tool_summary}, indent=2))
+        print(f"Per-tool execution summary saved to {summary_path}")
+    if deployment_pool.ACTIVE:
+        deployments = deployment_pool.ACTIVE.summary()
+        deployment_pool.print_summary(deployments)
+        summary_path = Path(args.output).with_suffix(".deployments.json")
+        summary_path.write_text(json.dumps(deployments, indent=2))
+        print(f"Per-deployment summary saved to {summary_path}")
+    if not args.no_history:
+        record_history(all_scenarios, args.model, score, Path(args.history_db),
+                       mode="live" if args.live else "default")
 
     # Exit non-zero if all scenarios errored
     error_count = sum(1 for s in all_scenarios if s.result == "error")
@@ -0,0 +1,175 @@
+"""
+Offline prompt token estimates and the --max-prompt-tokens pre-flight shared by the eval runners.
+
+Counts come from tiktoken when it is installed (the encoding of --model, o200k_base for
+models it does not know) and otherwise from ~4 characters per token, the rule of thumb
+deployment_pool.py uses. The tokenizer is loaded once per model, and the counts of the
+large prompt parts every scenario shares — system prompt, skill files, tool definitions —
+are memoized by name and content, so estimating a run only tokenizes each scenario's own
+prompt and context.
+
+Message framing follows the chat format (a few tokens per message and for the reply
+primer). Tool definitions are counted as compact JSON; providers render them in their own
+format, so estimates of tool-heavy prompts are approximate either way.
+"""
+
+import json
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Optional
+
+
+# Chat format framing: tokens per message, and the primer of the assistant reply
+MESSAGE_OVERHEAD = 3
+REPLY_OVERHEAD = 3
+CHARS_PER_TOKEN = 4
+DEFAULT_ENCODING = "o200k_base"
+OVER_BUDGET_LISTED = 20
+
+# List prices in USD per million (input, output) tokens; the longest matching prefix of
+# --model wins. Override with --price-per-mtok for other models or negotiated prices.
+PRICES: dict[str, tuple[float, float]] = {
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1-nano": (0.10, 0.40),
+}
+
+
+@lru_cache(maxsize=None)
+def get_tokenizer(model: str) -> tuple[str, Callable[[str], int]]:
+    """(name, count function) for the model: tiktoken's encoding, or the chars/4 heuristic."""
+    try:
+        import tiktoken
+    except ImportError:
+        return f"~{CHARS_PER_TOKEN} chars/token", _approximate_count
+    try:
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            encoding = tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception:
+        # The encoding files are downloaded on first use; stay offline-capable without them
+        return f"~{CHARS_PER_TOKEN} chars/token", _approximate_count
+    return f"tiktoken {encoding.name}", lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+def _approximate_count(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def parse_price(value: Optional[str]) -> Optional[tuple[float, float]]:
+    """--price-per-mtok "IN,OUT" (USD per million tokens); a single value prices both."""
+    if not value:
+        return None
+    parts = [float(p) for p in value.split(",") if p.strip()]
+    if not 1 <= len(parts) <= 2:
+        raise ValueError(f"expected IN,OUT prices per million tokens, got {value!r}")
+    return parts[0], parts[-1]
+
+
+def model_price(model: str) -> Optional[tuple[float, float]]:
+    matches = [prefix for prefix in PRICES if model.lower().startswith(prefix)]
+    return PRICES[max(matches, key=len)] if matches else None
+
+
+class TokenEstimator:
+    """Prompt token counts for one model, with memoized counts of the shared prompt parts."""
+
+    def __init__(self, model: str, price: Optional[tuple[float, float]] = None):
+        self.model = model
+        self.tokenizer, self._count = get_tokenizer(model)
+        self.price = price or model_price(model)
+        # key -> (text, tokens); a changed text under the same key is counted again
+        self._parts: dict[str, tuple[str, int]] = {}
+
+    def count(self, text: str) -> int:
+        return self._count(text) if text else 0
+
+    def part(self, key: str, text: str) -> int:
+        """Tokens of a prompt part shared across scenarios (skill file, tool, system prompt)."""
+        cached = self._parts.get(key)
+        if cached is None or cached[0] != text:
+            cached = self._parts[key] = (text, self.count(text))
+        return cached[1]
+
+    def chat(self, message_tokens: list[int]) -> int:
+        """Prompt tokens of chat messages with the given content token counts."""
+        return sum(message_tokens) + MESSAGE_OVERHEAD * len(message_tokens) + REPLY_OVERHEAD
+
+    def tools(self, tools: list[dict]) -> int:
+        return sum(self.part(f"tool:{t.get('function', {}).get('name', i)}",
+                             json.dumps(t, separators=(",", ":")))
+                   for i, t in enumerate(tools))
+
+    def cost(self, prompt_tokens: int, completion_tokens: int = 0) -> Optional[float]:
+        if self.price is None:
+            return None
+        return (prompt_tokens * self.price[0] + completion_tokens * self.price[1]) / 1_000_000
+
+
+@dataclass
+class PromptEstimate:
+    label: str  # scenario id, plus the mode or variant when a scenario sends several prompts
+    prompt_tokens: int
+    completion_tokens: int  # assumed completion length, for the cost projection
+    cost: Optional[float] = None
+
+
+def estimate(estimator: TokenEstimator, label: str, prompt_tokens: int, completion_tokens: int) -> PromptEstimate:
+    return PromptEstimate(label, prompt_tokens, completion_tokens,
+                          estimator.cost(prompt_tokens, completion_tokens))
+
+
+def format_cost(cost: Optional[float]) -> str:
+    return "n/a" if cost is None else f"${cost:,.4f}" if cost < 1 else f"${cost:,.2f}"
+
+
+def preflight(estimates: list[PromptEstimate], estimator: TokenEstimator, max_prompt_tokens: int = 0,
+              top: int = 5) -> list[PromptEstimate]:
+    """Print the projected prompt tokens and cost of a run; returns the requests over budget."""
+    if not estimates:
+        return []
+    total = sum(e.prompt_tokens for e in estimates)
+    largest = sorted(estimates, key=lambda e: e.prompt_tokens, reverse=True)
+    costs = [e.cost for e in estimates]
+    cost = None if None in costs else sum(costs)
+    print(f"Prompt estimate ({estimator.tokenizer}): {len(estimates)} requests, {total:,} prompt tokens "
+          f"(mean {total // len(estimates):,}, max {largest[0].prompt_tokens:,} {largest[0].label})")
+    print(f"Projected cost: {format_cost(cost)}"
+          + (f" at ${estimator.price[0]:g}/${estimator.price[1]:g} per 1M input/output tokens, "
+             f"assuming {estimates[0].completion_tokens:,} completion tokens per request"
+             if estimator.price else f" (no price known for {estimator.model}; pass --price-per-mtok)"))
+    print("Largest prompts:")
+    for e in largest[:top]:
+        print(f"  {e.label:<48} {e.prompt_tokens:>8,} tokens  {format_cost(e.cost):>9}")
+
+    over = [e for e in largest if max_prompt_tokens and e.prompt_tokens > max_prompt_tokens]
+    if over:
+        print(f"\n{len(over)} requests over --max-prompt-tokens {max_prompt_tokens:,}:")
+        for e in over[:OVER_BUDGET_LISTED]:
+            print(f"  {e.label:<48} {e.prompt_tokens:>8,} tokens  (+{e.prompt_tokens - max_prompt_tokens:,})")
+        if len(over) > OVER_BUDGET_LISTED:
+            print(f"  ... and {len(over) - OVER_BUDGET_LISTED} more")
+    print()
+    return over
+
+
+def exit_if_over(over: list[PromptEstimate], max_prompt_tokens: int):
+    if over:
+        print(f"\nFAILED: {len(over)} prompts exceed --max-prompt-tokens {max_prompt_tokens:,} "
+              f"(largest {over[0].prompt_tokens:,}, {over[0].label}); no requests were sent", file=sys.stderr)
+        sys.exit(1)
+
+
+def print_accuracy(pairs: list[tuple[int, int]], estimator: TokenEstimator):
+    """Compare estimates with the prompt_tokens the API reported, to calibrate the budget."""
+    pairs = [(est, actual) for est, actual in pairs if actual]
+    if not pairs:
+        return
+    estimated = sum(est for est, _ in pairs)
+    reported = sum(actual for _, actual in pairs)
+    print(f"\nPrompt tokens: estimated {estimated:,} ({estimator.tokenizer}), reported {reported:,} "
+          f"over {len(pairs)} requests (estimate {(estimated - reported) / reported:+.1%})")
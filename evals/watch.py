@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Watch Mode for Eval Authoring
+
+Long-lived runner that keeps parsed scenarios, the loaded tool schema, skill texts and a
+keep-alive HTTP connection in memory. It polls evals/, evals/integration/, claude-skills/ and
+tools_schema.json, and on every save re-runs only the affected scenarios, in parallel, so
+results come back within about one model round-trip.
+
+What counts as affected:
+    *.eval.md            - scenarios whose definition changed (added or edited blocks)
+    tools_schema.json    - tool-selection scenarios expecting (or last calling) a changed tool;
+                           every scenario in scope if a tool was added or removed
+    claude-skills/*.md   - integration scenarios that load the changed skill (with-skills mode)
+
+Usage:
+    python watch.py                            # Watch, run only what changes
+    python watch.py --eval EVAL-DF-023         # Also run this scenario on start
+    python watch.py --file dataflows           # Limit the initial run / schema re-runs to a file
+
+Environment variables:
+    OPENAI_API_KEY, EVAL_MODEL, EVAL_BASE_URL, EVAL_DEPLOYMENTS  - as for run_evals.py
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
+from pathlib import Path
+from typing import Optional, Union
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "integration"))
+import deployment_pool  # noqa: E402
+import http_pool  # noqa: E402
+import run_evals  # noqa: E402
+import run_integration_evals as integration  # noqa: E402
+
+
+EVALS_DIR = Path(__file__).resolve().parent
+INTEGRATION_DIR = EVALS_DIR / "integration"
+SCHEMA_PATH = EVALS_DIR / "tools_schema.json"
+SKILLS_DIR = integration.SKILLS_DIR
+
+# Scenario fields that define a scenario (everything else is a result of running it).
+DEFINITION_FIELDS = {
+    "eval_id", "title", "category", "difficulty", "user_prompt", "context",
+    "expected_tools", "assertions", "notes", "skills", "validation_rules",
+}
+
+Scenario = Union[run_evals.EvalScenario, integration.IntegrationScenario]
+
+
+def _fingerprint(scenario: Scenario) -> str:
+    definition = {f.name: getattr(scenario, f.name) for f in fields(scenario) if f.name in DEFINITION_FIELDS}
+    return json.dumps(definition, default=lambda o: o.__dict__, sort_keys=True)
+
+
+class WarmState:
+    """Everything a run needs, loaded once and refreshed per changed file."""
+
+    def __init__(self):
+        self.mtimes: dict[Path, float] = {}
+        self.tool_scenarios: dict[Path, dict[str, run_evals.EvalScenario]] = {}
+        self.int_scenarios: dict[Path, dict[str, integration.IntegrationScenario]] = {}
+        self.fingerprints: dict[str, str] = {}
+        self.tools: list[dict] = []
+        self.tool_defs: dict[str, str] = {}
+        self.skill_texts: dict[Path, str] = {}
+        self.last_results: dict[str, str] = {}
+        self.last_calls: dict[str, list[str]] = {}
+
+    # -- loading ----------------------------------------------------------
+
+    def watched_files(self) -> list[Path]:
+        files = sorted(EVALS_DIR.glob("*.eval.md")) + sorted(INTEGRATION_DIR.glob("*.eval.md"))
+        files.append(SCHEMA_PATH)
+        if SKILLS_DIR.exists():
+            files += sorted(SKILLS_DIR.rglob("*.md"))
+        return files
+
+    def load_schema(self) -> tuple[set[str], bool]:
+        """(Re)load the tool schema.
+
+        Returns (names of changed tools, whether the set of tool names changed).
+        """
+        tools = json.loads(SCHEMA_PATH.read_text())["tools"]
+        defs = {t["function"]["name"]: json.dumps(t, sort_keys=True) for t in tools}
+        changed = {n for n in defs.keys() | self.tool_defs.keys() if defs.get(n) != self.tool_defs.get(n)}
+        added_or_removed = bool(self.tool_defs) and defs.keys() != self.tool_defs.keys()
+        self.tools, self.tool_defs = tools, defs
+        return changed, added_or_removed
+
+    def load_eval_file(self, path: Path) -> list[Scenario]:
+        """(Re)parse one eval file. Returns scenarios that are new or whose definition changed."""
+        is_integration = path.parent == INTEGRATION_DIR
+        parsed = (integration.parse_integration_eval_file(path) if is_integration
+                  else run_evals.parse_eval_file(path))
+        store = self.int_scenarios if is_integration else self.tool_scenarios
+        previous = store.get(path, {})
+        store[path] = {s.eval_id: s for s in parsed}
+
+        for removed in previous.keys() - store[path].keys():
+            print(f"  removed {removed}")
+            self.fingerprints.pop(removed, None)
+
+        changed = []
+        for s in parsed:
+            fp = _fingerprint(s)
+            if self.fingerprints.get(s.eval_id) != fp:
+                changed.append(s)
+            self.fingerprints[s.eval_id] = fp
+        return changed
+
+    def load_skill_file(self, path: Path) -> bool:
+        """Refresh a skill text. Returns True if its content actually changed."""
+        text = path.read_text()
+        changed = path in self.skill_texts and self.skill_texts[path] != text
+        self.skill_texts[path] = text
+        return changed
+
+    def all_tool_scenarios(self) -> list[run_evals.EvalScenario]:
+        return [s for per_file in self.tool_scenarios.values() for s in per_file.values()]
+
+    def all_int_scenarios(self) -> list[integration.IntegrationScenario]:
+        return [s for per_file in self.int_scenarios.values() for s in per_file.values()]
+
+    def poll(self) -> list[Path]:
+        changed = []
+        for path in self.watched_files():
+            try:
+                mtime = path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if self.mtimes.get(path) != mtime:
+                self.mtimes[path] = mtime
+                changed.append(path)
+        return changed
+
+
+# ---------------------------------------------------------------------------
+# Running
+# ---------------------------------------------------------------------------
+
+def run_tool_scenario(state: WarmState, scenario: run_evals.EvalScenario, args, api_key: str):
+    """One tool-selection call with the tool schema loaded at startup (or on its last save)."""
+    body = {
+        "model": args.model,
+        "messages": run_evals.build_messages(scenario.user_prompt, scenario.context),
+        "tools": state.tools,
+        "tool_choice": "auto",
+        "temperature": 0,
+    }
+    data = json.dumps(body).encode()
+
+    started = time.perf_counter()
+    response = run_evals._post_chat_completion(data, model=args.model, base_url=args.base_url, api_key=api_key)
+    scenario.latency_ms = (time.perf_counter() - started) * 1000
+    if "error" in response:
+        scenario.result, scenario.explanation = "error", response["error"]
+        return
+    scenario.actual_tools = run_evals.extract_tool_calls(response)
+    scenario.response_text = run_evals.extract_response_text(response)
+    scenario.result, scenario.explanation = run_evals.score_scenario(scenario, scenario.actual_tools)
+
+
+def run_integration_scenario(scenario: integration.IntegrationScenario, mode: str, args, api_key: str):
+    skills = scenario.skills if mode == "with_skills" else []
+    call = integration.call_llm(scenario.user_prompt, integration.build_system_prompt(skills),
+                                model=args.model, base_url=args.base_url, api_key=api_key)
+    passed, failed = integration.score_output(scenario, call.content)
+    label = "error" if call.content.startswith("[ERROR]") else integration.result_label(passed, failed)
+    if mode == "with_skills":
+        scenario.skills_call, scenario.skills_output = call, call.content
+        scenario.skills_passed, scenario.skills_failed, scenario.skills_result = passed, failed, label
+    else:
+        scenario.baseline_call, scenario.baseline_output = call, call.content
+        scenario.baseline_passed, scenario.baseline_failed, scenario.baseline_result = passed, failed, label
+
+
+def run_batch(state: WarmState, pool: ThreadPoolExecutor, args, api_key: str,
+              tool_scenarios: list[run_evals.EvalScenario],
+              int_jobs: list[tuple[integration.IntegrationScenario, str]]):
+    if not tool_scenarios and not int_jobs:
+        return
+    started = time.perf_counter()
+    futures = [pool.submit(run_tool_scenario, state, s, args, api_key) for s in tool_scenarios]
+    futures += [pool.submit(run_integration_scenario, s, mode, args, api_key) for s, mode in int_jobs]
+    for f in futures:
+        f.result()
+    elapsed = time.perf_counter() - started
+
+    for s in tool_scenarios:
+        before = state.last_results.get(s.eval_id)
+        run_evals.print_result(s)
+        if before and before != s.result:
+            print(f"         ({before} → {s.result})")
+        state.last_results[s.eval_id] = s.result
+        state.last_calls[s.eval_id] = [c["name"] for c in s.actual_tools]
+
+    for s, mode in int_jobs:
+        passed, failed, result = ((s.skills_passed, s.skills_failed, s.skills_result) if mode == "with_skills"
+                                  else (s.baseline_passed, s.baseline_failed, s.baseline_result))
+        key = f"{s.eval_id}[{mode}]"
+        before = state.last_results.get(key)
+        badge = integration.COLORS.get(result, result)
+        transition = f"  ({before} → {result})" if before and before != result else ""
+        print(f"  {badge} {s.eval_id} [{mode}]: {len(passed)}/{len(passed) + len(failed)} rules{transition}")
+        for rule in failed[:3]:
+            print(f"         ✗ {rule}")
+        state.last_results[key] = result
+
+    print(f"  — {len(tool_scenarios) + len(int_jobs)} run(s) in {elapsed:.1f}s")
+
+
+def _in_scope(scenario: Scenario, args) -> bool:
+    if args.eval and scenario.eval_id != args.eval:
+        return False
+    if args.file and args.file not in scenario.source_file:
+        return False
+    return True
+
+
+def _skill_name(path: Path) -> Optional[str]:
+    """Skill a changed file belongs to: the skill file itself, or a file in the skill's directory."""
+    for name, filename in integration.SKILL_FILES.items():
+        target = (SKILLS_DIR / filename).resolve()
+        if target == path.resolve() or (target.is_dir() and target == path.resolve().parent):
+            return name
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch eval files and re-run affected scenarios")
+    parser.add_argument("--eval", help="Run this scenario on start (and limit schema re-runs to it)")
+    parser.add_argument("--file", help="Run scenarios from this file on start (e.g., 'dataflows')")
+    parser.add_argument("--model", default=os.environ.get("EVAL_MODEL", "gpt-4o"))
+    parser.add_argument("--base-url", default=os.environ.get("EVAL_BASE_URL", "https://api.openai.com/v1"))
+    parser.add_argument("--interval", type=float, default=0.5, help="Polling interval (seconds)")
+    parser.add_argument("--workers", type=int, default=8, help="Max concurrent model calls")
+    parser.add_argument("--deployments", default=os.environ.get("EVAL_DEPLOYMENTS"),
+                        help="JSON file of equivalent deployments to spread requests over (see deployment_pool.py)")
+    args = parser.parse_args()
+
+    api_key = os.environ.get("OPENAI_API_KEY", "")
+    if args.deployments:
+        try:
+            deployment_pool.configure(args.deployments, args.model)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error: cannot load deployments from {args.deployments}: {e}", file=sys.stderr)
+            sys.exit(1)
+    elif not api_key:
+        print("Error: OPENAI_API_KEY environment variable not set", file=sys.stderr)
+        sys.exit(1)
+
+    state = WarmState()
+    started = time.perf_counter()
+    state.load_schema()
+    for path in state.poll():
+        if path.name.endswith(".eval.md"):
+            state.load_eval_file(path)
+        elif path != SCHEMA_PATH:
+            state.load_skill_file(path)
+    if deployment_pool.ACTIVE:
+        deployment_pool.ACTIVE.warm()
+    else:
+        http_pool.DEFAULT_CLIENT.warm(
+            integration._build_azure_url(args.base_url, args.model)
+            if integration._is_azure_openai(args.base_url) else f"{args.base_url}/chat/completions"
+        )
+    print(f"Warm: {len(state.all_tool_scenarios())} tool-selection + {len(state.all_int_scenarios())} "
+          f"integration scenarios, {len(state.tools)} tools, connection open "
+          f"({(time.perf_counter() - started) * 1000:.0f} ms)")
+
+    pool = ThreadPoolExecutor(max_workers=args.workers)
+    if args.eval or args.file:
+        run_batch(state, pool, args, api_key,
+                  [s for s in state.all_tool_scenarios() if _in_scope(s, args)],
+                  [(s, m) for s in state.all_int_scenarios() if _in_scope(s, args)
+                   for m in ("baseline", "with_skills")])
+
+    print(f"\nWatching {EVALS_DIR} and {SKILLS_DIR} (Ctrl-C to stop)")
+    try:
+        while True:
+            time.sleep(args.interval)
+            changed = state.poll()
+            if not changed:
+                continue
+
+            tool_jobs: dict[str, run_evals.EvalScenario] = {}
+            int_jobs: dict[tuple[str, str], tuple[integration.IntegrationScenario, str]] = {}
+
+            for path in changed:
+                print(f"\n~ {path.relative_to(EVALS_DIR.parent)}")
+                if path == SCHEMA_PATH:
+                    try:
+                        changed_tools, added_or_removed = state.load_schema()
+                    except (json.JSONDecodeError, KeyError) as e:
+                        print(f"  schema not loadable yet: {e}")
+                        continue
+                    for s in state.all_tool_scenarios():
+                        names = {t.tool_name for t in s.expected_tools} | set(state.last_calls.get(s.eval_id, []))
+                        if (added_or_removed and _in_scope(s, args)) or names & changed_tools:
+                            tool_jobs[s.eval_id] = s
+                elif path.name.endswith(".eval.md"):
+                    for s in state.load_eval_file(path):
+                        if isinstance(s, integration.IntegrationScenario):
+                            for mode in ("baseline", "with_skills"):
+                                int_jobs[(s.eval_id, mode)] = (s, mode)
+                        else:
+                            tool_jobs[s.eval_id] = s
+                else:
+                    if not state.load_skill_file(path):
+                        continue
+                    integration.load_skill.cache_clear()
+                    integration.load_tips.cache_clear()
+                    name = _skill_name(path)
+                    for s in state.all_int_scenarios():
+                        tips_changed = name is None and path.name == integration.SKILL_TIPS_FILE
+                        if s.skills and (tips_changed or name in s.skills):
+                            int_jobs[(s.eval_id, "with_skills")] = (s, "with_skills")
+
+            run_batch(state, pool, args, api_key, list(tool_jobs.values()), list(int_jobs.values()))
+    except KeyboardInterrupt:
+        print("\nStopped.")
+        if deployment_pool.ACTIVE:
+            deployment_pool.print_summary(deployment_pool.ACTIVE.summary())
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+        http_pool.DEFAULT_CLIENT.close()
+
+
+if __name__ == "__main__":
+    main()